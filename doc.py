@@ -551,7 +551,7 @@ def str_plain(string: str) -> str:
 def main():
     print(f"Generate documentation for module {tools.__name__} from {tools.__file__}")
     main_dir = "docs"
-    tool_classes = sorted(cli.CliApp.__subclasses__(), key=lambda tool: tool.get_executable_name())
+    tool_classes = tools.get_tools()
     MainPageDocumentationGenerator("CLI tools", main_dir).generate(tool_classes)
     for tool_class in tool_classes:
         print(f"Generate documentation for tool {tool_class.get_executable_name()}")
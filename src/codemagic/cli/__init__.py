@@ -12,5 +12,6 @@ from .cli_app import CliApp
 from .cli_app import CliAppException
 from .cli_app import common_arguments
 from .cli_process import CliProcess
+from .cli_process_output import CliProcessOutput
 from .cli_types import CommandArg
 from .colors import Colors
@@ -2,30 +2,45 @@
 
 from __future__ import annotations
 
+import os
+import queue
+import selectors
 import shlex
 import subprocess
 import sys
+import tempfile
+import threading
 import time
 from typing import IO
+from typing import ClassVar
 from typing import Dict
+from typing import Generator
+from typing import List
 from typing import Optional
 from typing import Sequence
+from typing import Tuple
 from typing import Union
 
 from codemagic.utilities import log
 
+from .cli_process_output import CliProcessOutput
 from .cli_process_stream import CliProcessStream
 from .cli_types import CommandArg
 from .cli_types import ObfuscatedCommand
 
 
 class CliProcess:
+    # Output pipes are waited for without timeout while the process is running, except that process
+    # exit is checked with this interval in case its child processes hold the pipes open after it exits
+    EXIT_CHECK_INTERVAL: ClassVar[float] = 1.0
+
     def __init__(
         self,
         command_args: Sequence[CommandArg],
         safe_form: Optional[ObfuscatedCommand] = None,
         print_streams: bool = True,
         dry: bool = False,
+        output_memory_limit: Optional[int] = None,
     ):
         self.logger = log.get_logger(self.__class__)
         self.duration: float = 0
@@ -39,18 +54,23 @@ class CliProcess:
             self.safe_form = ObfuscatedCommand(full_command)
         else:
             self.safe_form = safe_form
-        self._stdout = ""
-        self._stderr = ""
+        # Only the most recent output is kept in memory, older output is spilled to disk
+        self.stdout_capture = CliProcessOutput(output_memory_limit)
+        self.stderr_capture = CliProcessOutput(output_memory_limit)
         self._stdout_stream: Optional[CliProcessStream] = None
         self._stderr_stream: Optional[CliProcessStream] = None
 
     @property
     def stdout(self) -> str:
-        return self._stdout
+        """
+        Complete standard output of the process. Use `stdout_capture` to
+        iterate over large outputs without loading them into memory at once.
+        """
+        return self.stdout_capture.getvalue()
 
     @property
     def stderr(self) -> str:
-        return self._stderr
+        return self.stderr_capture.getvalue()
 
     @property
     def returncode(self) -> int:
@@ -62,26 +82,124 @@ class CliProcess:
         else:
             self.logger.debug(f'Execute "{self.safe_form}"')
 
+    @classmethod
+    def _get_output_log_text(cls, output: CliProcessOutput, limit: Optional[int] = None) -> str:
+        tail = output.get_tail()
+        if limit is not None and len(tail) > limit:
+            tail = tail[len(tail) - limit :]
+        omitted_size = len(output) - len(tail)
+        if not omitted_size:
+            return tail
+        return f"[{omitted_size} characters omitted]\n{tail}"
+
+    def _get_stdout_log_text(self, limit: Optional[int] = None) -> str:
+        return self._get_output_log_text(self.stdout_capture, limit)
+
+    def _get_stderr_log_text(self, limit: Optional[int] = None) -> str:
+        return self._get_output_log_text(self.stderr_capture, limit)
+
     def _log_exec_completed(self):
         duration = time.strftime("%M:%S", time.gmtime(self.duration))
-        file_logger = log.get_file_logger(self.__class__)
-        file_logger.debug("STDOUT: %s", self.stdout)
-        file_logger.debug("STDERR: %s", self.stderr)
+        output_log_limit = log.get_process_output_log_limit()
+        if output_log_limit != 0:
+            file_logger = log.get_file_logger(self.__class__)
+            file_logger.debug("STDOUT: %s", self._get_stdout_log_text(output_log_limit))
+            file_logger.debug("STDERR: %s", self._get_stderr_log_text(output_log_limit))
         self.logger.debug(f'Completed "{self.safe_form}" with returncode {self.returncode} in {duration}')
 
+    def _get_streams(self) -> List[CliProcessStream]:
+        return [stream for stream in (self._stdout_stream, self._stderr_stream) if stream is not None]
+
+    def _process_chunk(self, stream: CliProcessStream, bytes_chunk: bytes, final: bool = False):
+        chunk = stream.process_chunk(bytes_chunk, self._print_streams, final=final)
+        if not chunk:
+            return
+        elif stream is self._stdout_stream:
+            self.stdout_capture.write(chunk)
+        else:
+            self.stderr_capture.write(chunk)
+
     def _handle_streams(self, buffer_size: Optional[int] = None):
         if self._process is None:
             return
-        if self._stdout_stream:
-            self._stdout += self._stdout_stream.process_buffer(buffer_size, self._print_streams)
-        if self._stderr_stream:
-            self._stderr += self._stderr_stream.process_buffer(buffer_size, self._print_streams)
+        for stream in self._get_streams():
+            self._process_chunk(stream, stream.read(buffer_size) if buffer_size else stream.read_all())
 
     def _configure_process_streams(self):
+        # Windows pipes are read in blocking mode from dedicated threads
+        blocking = os.name == "nt"
         if self._process.stdout:
-            self._stdout_stream = CliProcessStream.create(self._process.stdout, sys.stdout, blocking=False)
+            self._stdout_stream = CliProcessStream.create(self._process.stdout, sys.stdout, blocking=blocking)
         if self._process.stderr:
-            self._stderr_stream = CliProcessStream.create(self._process.stderr, sys.stderr, blocking=False)
+            self._stderr_stream = CliProcessStream.create(self._process.stderr, sys.stderr, blocking=blocking)
+
+    def _pump_streams_with_selector(self, streams: Sequence[CliProcessStream]):
+        with selectors.DefaultSelector() as selector:
+            for stream in streams:
+                selector.register(stream.fileno(), selectors.EVENT_READ, stream)
+
+            while selector.get_map():
+                events = selector.select(timeout=self.EXIT_CHECK_INTERVAL)
+                if not events and self._process and self._process.poll() is not None:
+                    break
+                for key, _mask in events:
+                    bytes_chunk = key.data.read_available(self._buffer_size)
+                    if bytes_chunk:
+                        self._process_chunk(key.data, bytes_chunk)
+                    elif bytes_chunk is not None:
+                        selector.unregister(key.fd)
+
+    def _pump_streams_with_threads(self, streams: Sequence[CliProcessStream]):
+        chunks: queue.Queue[Tuple[CliProcessStream, bytes]] = queue.Queue()
+
+        def read_stream(stream: CliProcessStream):
+            while True:
+                bytes_chunk = stream.read(self._buffer_size)
+                chunks.put((stream, bytes_chunk))
+                if not bytes_chunk:
+                    break
+
+        for stream in streams:
+            threading.Thread(target=read_stream, args=(stream,), daemon=True).start()
+
+        open_streams_count = len(streams)
+        while open_streams_count:
+            try:
+                stream, bytes_chunk = chunks.get(timeout=self.EXIT_CHECK_INTERVAL)
+            except queue.Empty:
+                if self._process and self._process.poll() is not None:
+                    break
+                continue
+            if bytes_chunk:
+                self._process_chunk(stream, bytes_chunk)
+            else:
+                open_streams_count -= 1
+
+    def _pump_streams(self):
+        """
+        Process output as soon as it is written to the pipes of the process
+        """
+        streams = self._get_streams()
+        if os.name == "nt":
+            self._pump_streams_with_threads(streams)
+        else:
+            self._pump_streams_with_selector(streams)
+        for stream in streams:
+            self._process_chunk(stream, b"", final=True)
+
+    def _wait_process(self, poll_interval: float):
+        """
+        Wait for the process that does not write its output to pipes. Output
+        can still be handled periodically while the process is running.
+        """
+        assert self._process is not None
+        while True:
+            try:
+                self._process.wait(timeout=poll_interval)
+                break
+            except subprocess.TimeoutExpired:
+                self._handle_streams(self._buffer_size)
+        self._handle_streams()
 
     def execute(
         self,
@@ -101,15 +219,53 @@ class CliProcess:
                     env=env,
                 )
                 self._configure_process_streams()
-                while self._process.poll() is None:
-                    self._handle_streams(self._buffer_size)
-                    time.sleep(poll_interval)
-                self._handle_streams()
+                if self._get_streams():
+                    self._pump_streams()
+                    self._process.wait()
+                else:
+                    self._wait_process(poll_interval)
         finally:
             self.duration = time.time() - start
             self._log_exec_completed()
         return self
 
+    def iter_stdout_lines(self, env: Optional[Dict[str, str]] = None) -> Generator[str, None, None]:
+        """
+        Execute the process and yield lines from its standard output as soon as they are written
+        instead of capturing the output. Standard error is captured once the process has exited.
+        The process is terminated if the caller stops consuming the output before it ends.
+        """
+        self._log_exec_started()
+        start = time.time()
+        try:
+            if self._dry_run:
+                return
+            # Standard error is spooled to disk so that the process never blocks on a full pipe
+            with tempfile.TemporaryFile("w+", errors="replace") as stderr:
+                self._process = subprocess.Popen(
+                    self._command_args,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr,
+                    env=env,
+                    text=True,
+                )
+                assert self._process.stdout is not None
+                output_consumed = False
+                try:
+                    yield from self._process.stdout
+                    output_consumed = True
+                finally:
+                    if not output_consumed:
+                        self._process.terminate()
+                    self._process.stdout.close()
+                    self._process.wait()
+                    stderr.seek(0)
+                    for chunk in iter(lambda: stderr.read(self._buffer_size), ""):
+                        self.stderr_capture.write(chunk)
+        finally:
+            self.duration = time.time() - start
+            self._log_exec_completed()
+
     def raise_for_returncode(self, success_code: int = 0, include_logs: bool = True):
         if self.returncode == success_code:
             return
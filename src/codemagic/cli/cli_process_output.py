@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import collections
+import os
+import tempfile
+from typing import IO
+from typing import ClassVar
+from typing import Deque
+from typing import Iterator
+from typing import Optional
+
+
+class CliProcessOutput:
+    """
+    Captured output of a process stream. Only the most recent output is kept in memory,
+    up to the configured number of characters. Older output is spilled to a temporary
+    file that is removed once the output is closed or garbage collected.
+    """
+
+    DEFAULT_MEMORY_LIMIT: ClassVar[int] = 8 * 1024 * 1024
+    MEMORY_LIMIT_ENVIRONMENT_VARIABLE: ClassVar[str] = "CODEMAGIC_CLI_PROCESS_OUTPUT_MEMORY_LIMIT"
+    READ_CHUNK_SIZE: ClassVar[int] = 1024 * 1024
+
+    def __init__(self, memory_limit: Optional[int] = None):
+        if memory_limit is None:
+            memory_limit = self.get_default_memory_limit()
+        if memory_limit < 1:
+            raise ValueError("Output memory limit must be positive")
+        self.memory_limit = memory_limit
+        self._chunks: Deque[str] = collections.deque()
+        self._memory_size = 0
+        self._spill_file: Optional[IO[str]] = None
+        self.spilled_size = 0
+
+    @classmethod
+    def get_default_memory_limit(cls) -> int:
+        try:
+            return int(os.environ[cls.MEMORY_LIMIT_ENVIRONMENT_VARIABLE])
+        except (KeyError, ValueError):
+            return cls.DEFAULT_MEMORY_LIMIT
+
+    def __len__(self) -> int:
+        return self.spilled_size + self._memory_size
+
+    @property
+    def is_spilled(self) -> bool:
+        return self.spilled_size > 0
+
+    def _spill(self, chunk: str):
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile("w+", encoding="utf-8", newline="")
+        self._spill_file.write(chunk)
+        self.spilled_size += len(chunk)
+
+    def write(self, chunk: str):
+        if not chunk:
+            return
+        self._chunks.append(chunk)
+        self._memory_size += len(chunk)
+
+        excess_size = self._memory_size - self.memory_limit
+        while excess_size > 0:
+            oldest_chunk = self._chunks.popleft()
+            if len(oldest_chunk) > excess_size:
+                # Keep the end of the chunk in memory
+                self._chunks.appendleft(oldest_chunk[excess_size:])
+                oldest_chunk = oldest_chunk[:excess_size]
+            self._spill(oldest_chunk)
+            self._memory_size -= len(oldest_chunk)
+            excess_size -= len(oldest_chunk)
+
+    def get_tail(self) -> str:
+        """
+        Get the most recent output that is kept in memory
+        """
+        if len(self._chunks) > 1:
+            tail = "".join(self._chunks)
+            self._chunks.clear()
+            self._chunks.append(tail)
+        return self._chunks[0] if self._chunks else ""
+
+    def iter_chunks(self) -> Iterator[str]:
+        """
+        Iterate over the complete output without loading the spilled part into memory
+        """
+        if self._spill_file is not None:
+            self._spill_file.flush()
+            self._spill_file.seek(0)
+            try:
+                while chunk := self._spill_file.read(self.READ_CHUNK_SIZE):
+                    yield chunk
+            finally:
+                self._spill_file.seek(0, os.SEEK_END)
+        yield from list(self._chunks)
+
+    def iter_lines(self) -> Iterator[str]:
+        """
+        Iterate over lines of the complete output. Lines include line endings.
+        """
+        partial_line = ""
+        for chunk in self.iter_chunks():
+            lines = (partial_line + chunk).splitlines(keepends=True)
+            partial_line = lines.pop() if lines and not lines[-1].endswith("\n") else ""
+            yield from lines
+        if partial_line:
+            yield partial_line
+
+    def getvalue(self) -> str:
+        if not self.is_spilled:
+            return self.get_tail()
+        return "".join(self.iter_chunks())
+
+    def close(self):
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+        self._chunks.clear()
+        self._memory_size = 0
+        self.spilled_size = 0
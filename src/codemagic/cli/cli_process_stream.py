@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import codecs
 import os
 from abc import ABCMeta
 from abc import abstractmethod
@@ -18,6 +19,11 @@ class CliProcessStream(StringConverterMixin, metaclass=ABCMeta):
         self._descriptor = input_stream_descriptor
         self._fileno = input_stream_descriptor.fileno()
         self._output_stream = output_stream
+        # Multibyte characters can be split between chunks that are read from the stream
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+
+    def fileno(self) -> int:
+        return self._fileno
 
     @classmethod
     def create(cls, stream_descriptor: IO, output_stream: IO, blocking: bool = False) -> CliProcessStream:
@@ -47,16 +53,25 @@ class CliProcessStream(StringConverterMixin, metaclass=ABCMeta):
         Read all remaining bytes from the stream
         """
 
+    def read_available(self, buffer_size: int) -> Optional[bytes]:
+        """
+        Read up to specified number of bytes that are available from the stream without blocking.
+        Returns empty bytes once the stream has ended and None if there is nothing to read yet.
+        """
+        return self.read(buffer_size)
+
+    def process_chunk(self, bytes_chunk: bytes, multiplex_output: bool = True, final: bool = False) -> str:
+        chunk = self._decoder.decode(bytes_chunk, final)
+        if multiplex_output and chunk:
+            self._output_stream.write(chunk)
+        return chunk
+
     def process_buffer(self, buffer_size: Optional[int] = None, multiplex_output: bool = True) -> str:
         if buffer_size:
             bytes_chunk = self.read(buffer_size)
         else:
             bytes_chunk = self.read_all()
-
-        chunk = bytes_chunk.decode(encoding="utf-8", errors="ignore")
-        if multiplex_output:
-            self._output_stream.write(chunk)
-        return chunk
+        return self.process_chunk(bytes_chunk, multiplex_output)
 
 
 class _PosixCliProcessStream(CliProcessStream):
@@ -74,6 +89,12 @@ class _PosixCliProcessStream(CliProcessStream):
     def read_all(self) -> bytes:
         return self.read(-1)
 
+    def read_available(self, buffer_size: int) -> Optional[bytes]:
+        try:
+            return os.read(self._fileno, buffer_size)
+        except BlockingIOError:
+            return None
+
 
 class _WindowsCliProcessStream(CliProcessStream):
     PIPE_NOWAIT = 0x00000001
@@ -1,22 +1,33 @@
 from __future__ import annotations
 
+import itertools
+import pathlib
+import time
 from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
 from typing import ClassVar
+from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Type
 from typing import cast
 
+from codemagic.google.errors import GoogleClientError
+from codemagic.google.errors import GoogleHttpError
 from codemagic.google.resources.firebase import OrderBy
 from codemagic.google.resources.firebase import Release
 from codemagic.google.services.resource_service import ResourceService
+from codemagic.google.services.streaming_media_upload import StreamingMediaUpload
 
 if TYPE_CHECKING:
     from googleapiclient._apis.firebaseappdistribution.v1 import GoogleFirebaseAppdistroV1ListReleasesResponse
     from googleapiclient._apis.firebaseappdistribution.v1 import (
         GoogleFirebaseAppdistroV1ListReleasesResponseHttpRequest,
     )
-    from googleapiclient._apis.firebaseappdistribution.v1 import GoogleFirebaseAppdistroV1Release
+    from googleapiclient._apis.firebaseappdistribution.v1 import GoogleLongrunningOperation
+    from googleapiclient._apis.firebaseappdistribution.v1 import GoogleLongrunningOperationHttpRequest
     from googleapiclient._apis.firebaseappdistribution.v1.resources import FirebaseAppDistributionResource
 
 
@@ -27,44 +38,160 @@ class ReleasesService(ResourceService[Release, "FirebaseAppDistributionResource"
 
     resource_type: ClassVar[Type[Release]] = Release
 
+    # https://firebase.google.com/docs/reference/app-distribution/rest/v1/projects.apps.releases/list#query-parameters
+    MAX_PAGE_SIZE: ClassVar[int] = 100
+
+    # Bounds for adaptive polling interval of long-running upload operations
+    OPERATION_POLL_INITIAL_INTERVAL: ClassVar[float] = 0.5
+    OPERATION_POLL_MAX_INTERVAL: ClassVar[float] = 10.0
+    OPERATION_POLL_BACKOFF_FACTOR: ClassVar[float] = 1.5
+
     @property
     def _releases(self) -> FirebaseAppDistributionResource.ProjectsResource.AppsResource.ReleasesResource:
         return self._google_service.projects().apps().releases()
 
-    def list(
+    @property
+    def _media(self) -> FirebaseAppDistributionResource.MediaResource:
+        return self._google_service.media()
+
+    @property
+    def _operations(
+        self,
+    ) -> FirebaseAppDistributionResource.ProjectsResource.AppsResource.ReleasesResource.OperationsResource:
+        return self._releases.operations()
+
+    def iterate(
         self,
         project_number: str,
         app_id: str,
         order_by: OrderBy = OrderBy.CREATE_TIME_DESC,
         limit: Optional[int] = None,
         page_size: int = 25,
-    ) -> List[Release]:
+        fields: Optional[str] = None,
+        filter_expression: Optional[str] = None,
+    ) -> Iterator[Release]:
         """
+        Lazily yield releases page by page. Next page is requested only once all releases
+        from the previous page are consumed, and page size is doubled for each following
+        page up to the maximum allowed by the API.
         https://firebase.google.com/docs/reference/app-distribution/rest/v1/projects.apps.releases/list
         """
 
-        self._logger.debug("List Firebase releases for project %r app %r", project_number, app_id)
+        self._logger.debug("Iterate Firebase releases for project %r app %r", project_number, app_id)
+        if fields and "nextPageToken" not in fields:
+            # Page token is required for pagination regardless of the fields consumed by the caller
+            fields = f"nextPageToken,{fields}"
 
-        firebase_releases: List[GoogleFirebaseAppdistroV1Release] = []
+        releases_count = 0
         next_page_token = ""
         while True:
             list_request: GoogleFirebaseAppdistroV1ListReleasesResponseHttpRequest = self._releases.list(
                 orderBy=order_by.value,
                 parent=f"projects/{project_number}/apps/{app_id}",
-                pageSize=min(limit, page_size) if limit else page_size,
+                pageSize=min(limit - releases_count, page_size) if limit else page_size,
                 pageToken=next_page_token,
+                fields=fields,
+                filter=filter_expression,
             )
             response = cast(
                 "GoogleFirebaseAppdistroV1ListReleasesResponse",
                 self._execute_request(list_request, "list"),
             )
             # In case no matches are found, then the relevant key is missing from response
-            firebase_releases.extend(response.get("releases", []))
+            for firebase_release in response.get("releases", []):
+                yield Release.from_api_response(firebase_release)
+                releases_count += 1
+                if limit and releases_count >= limit:
+                    return
+
             if not response.get("nextPageToken"):
-                break
-            elif limit and len(firebase_releases) > limit:
-                break
+                return
             next_page_token = response["nextPageToken"]
+            page_size = min(2 * page_size, self.MAX_PAGE_SIZE)
+
+    def list(
+        self,
+        project_number: str,
+        app_id: str,
+        order_by: OrderBy = OrderBy.CREATE_TIME_DESC,
+        limit: Optional[int] = None,
+        page_size: int = 25,
+        fields: Optional[str] = None,
+        filter_expression: Optional[str] = None,
+        predicate: Optional[Callable[[Release], bool]] = None,
+    ) -> List[Release]:
+        """
+        List releases, optionally only those that match the predicate. Releases are
+        matched on client side, and further pages are requested only until the limit
+        of matching releases is reached.
+        https://firebase.google.com/docs/reference/app-distribution/rest/v1/projects.apps.releases/list
+        """
+
+        self._logger.debug("List Firebase releases for project %r app %r", project_number, app_id)
+        releases_iterator = self.iterate(
+            project_number,
+            app_id,
+            order_by=order_by,
+            limit=None if predicate else limit,
+            page_size=page_size,
+            fields=fields,
+            filter_expression=filter_expression,
+        )
+        if predicate:
+            releases_iterator = filter(predicate, releases_iterator)
+        releases = [*itertools.islice(releases_iterator, limit)]
+        self._logger.debug("Listed %d Firebase releases for app %r", len(releases), app_id)
+        return releases
+
+    def upload(
+        self,
+        project_number: str,
+        app_id: str,
+        binary_path: pathlib.Path,
+        timeout: float = 10 * 60,
+        chunk_size: int = StreamingMediaUpload.DEFAULT_CHUNK_SIZE,
+    ) -> Release:
+        """
+        https://firebase.google.com/docs/reference/app-distribution/rest/v1/media/upload
+        """
+
+        self._logger.debug("Upload %s to Firebase project %r app %r", binary_path, project_number, app_id)
+        upload_request: GoogleLongrunningOperationHttpRequest = self._media.upload(  # type: ignore[call-arg]
+            app=f"projects/{project_number}/apps/{app_id}",
+            media_body=StreamingMediaUpload(binary_path, chunk_size=chunk_size),
+        )
+        operation = cast(
+            "GoogleLongrunningOperation",
+            self._execute_streaming_upload_request(upload_request),
+        )
+        self._logger.debug("Uploaded %s, waiting for operation %s", binary_path, operation["name"])
+
+        operation_response = self._wait_for_operation(operation, timeout)
+        release = Release.from_api_response(operation_response["release"])
+        self._logger.debug("Upload of %s resulted in %s", binary_path, operation_response.get("result"))
+        return release
+
+    def _wait_for_operation(self, operation: GoogleLongrunningOperation, timeout: float) -> Dict[str, Any]:
+        """
+        Poll long-running operation until it is done. Polling interval grows
+        with each check so that fast operations complete with little latency
+        while slow operations do not flood the API with requests.
+        https://firebase.google.com/docs/reference/app-distribution/rest/v1/projects.apps.releases.operations/get
+        """
+
+        deadline = time.monotonic() + timeout
+        poll_interval = self.OPERATION_POLL_INITIAL_INTERVAL
+        while not operation.get("done"):
+            remaining_time = deadline - time.monotonic()
+            if remaining_time <= 0:
+                raise GoogleClientError(f"Operation {operation['name']} did not complete in {timeout:.0f} seconds")
+
+            time.sleep(min(poll_interval, remaining_time))
+            poll_interval = min(poll_interval * self.OPERATION_POLL_BACKOFF_FACTOR, self.OPERATION_POLL_MAX_INTERVAL)
+            get_request: GoogleLongrunningOperationHttpRequest = self._operations.get(name=operation["name"])
+            operation = cast("GoogleLongrunningOperation", self._execute_request(get_request, "get"))
 
-        self._logger.debug("Listed %d Firebase releases for app %r", len(firebase_releases[:limit]), app_id)
-        return [Release.from_api_response(firebase_release) for firebase_release in firebase_releases[:limit]]
+        if "error" in operation:
+            error = operation["error"]
+            raise GoogleHttpError(error.get("message") or f"Operation {operation['name']} failed")
+        return cast(Dict[str, Any], operation["response"])
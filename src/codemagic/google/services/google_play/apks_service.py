@@ -4,6 +4,7 @@ import pathlib
 from typing import TYPE_CHECKING
 from typing import Final
 from typing import List
+from typing import Optional
 from typing import cast
 
 from codemagic.google.resources.google_play import Apk
@@ -24,7 +25,7 @@ class ApksService(ResourceService[Apk, "android_publisher_resources.AndroidPubli
     def _apks(self) -> android_publisher_resources.AndroidPublisherResource.EditsResource.ApksResource:
         return self._google_service.edits().apks()
 
-    def list(self, package_name: str, edit_id: str) -> List[Apk]:
+    def list(self, package_name: str, edit_id: str, fields: Optional[str] = None) -> List[Apk]:
         """
         https://developers.google.com/android-publisher/api-ref/rest/v3/edits.apks/list
         """
@@ -32,6 +33,7 @@ class ApksService(ResourceService[Apk, "android_publisher_resources.AndroidPubli
         list_request: android_publisher_resources.ApksListResponseHttpRequest = self._apks.list(
             packageName=package_name,
             editId=edit_id,
+            fields=fields,
         )
         response = cast(
             "android_publisher_resources.ApksListResponse",
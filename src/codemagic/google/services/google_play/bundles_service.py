@@ -4,6 +4,7 @@ import pathlib
 from typing import TYPE_CHECKING
 from typing import Final
 from typing import List
+from typing import Optional
 from typing import cast
 
 from codemagic.google.resources.google_play import Bundle
@@ -24,7 +25,7 @@ class BundlesService(ResourceService[Bundle, "android_publisher_resources.Androi
     def _bundles(self) -> android_publisher_resources.AndroidPublisherResource.EditsResource.BundlesResource:
         return self._google_service.edits().bundles()
 
-    def list(self, package_name: str, edit_id: str) -> List[Bundle]:
+    def list(self, package_name: str, edit_id: str, fields: Optional[str] = None) -> List[Bundle]:
         """
         https://developers.google.com/android-publisher/api-ref/rest/v3/edits.bundles/list
         """
@@ -32,6 +33,7 @@ class BundlesService(ResourceService[Bundle, "android_publisher_resources.Androi
         list_request: android_publisher_resources.BundlesListResponseHttpRequest = self._bundles.list(
             packageName=package_name,
             editId=edit_id,
+            fields=fields,
         )
         response = cast(
             "android_publisher_resources.BundlesListResponse",
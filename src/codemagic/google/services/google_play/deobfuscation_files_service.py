@@ -8,6 +8,7 @@ from typing import cast
 from codemagic.google.resources.google_play import DeobfuscationFile
 from codemagic.google.resources.google_play import DeobfuscationFileType
 from codemagic.google.services.resource_service import ResourceService
+from codemagic.google.services.streaming_media_upload import StreamingMediaUpload
 
 if TYPE_CHECKING:
     from googleapiclient._apis.androidpublisher.v3 import resources as android_publisher_resources
@@ -52,13 +53,12 @@ class DeobfuscationFilesService(
                 editId=edit_id,
                 apkVersionCode=apk_version_code,
                 deobfuscationFileType=deobfuscation_file_type.value,
-                media_body=str(deobfuscation_file_path),
-                media_mime_type="application/octet-stream",
+                media_body=StreamingMediaUpload(deobfuscation_file_path),
             )
         )
         response = cast(
             "android_publisher_resources.DeobfuscationFilesUploadResponse",
-            self._execute_request(upload_request, "upload"),
+            self._execute_streaming_upload_request(upload_request),
         )
         self._logger.debug("Uploaded deobfuscation file for %r", package_name)
         return DeobfuscationFile(**cast(dict, response["deobfuscationFile"]))
@@ -2,10 +2,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 from typing import Final
+from typing import List
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
 from typing import Union
 from typing import cast
 
+from codemagic.google.errors import GoogleError
 from codemagic.google.resources.google_play import AppEdit
 from codemagic.google.services.resource_service import ResourceService
 
@@ -46,6 +50,41 @@ class EditsService(ResourceService[AppEdit, "android_publisher_resources.Android
         self._logger.debug("Created edit %s", response["id"])
         return AppEdit(**response)
 
+    def create_many(self, package_names: Sequence[str]) -> List[Union[AppEdit, GoogleError]]:
+        """
+        Create edits for given packages using a single batch request. Failures do not
+        prevent creating edits for other packages, and the created edit or the error
+        is returned for each package in the given order.
+        https://developers.google.com/android-publisher/api-ref/rest/v3/edits/insert
+        """
+        self._logger.debug("Create edits for %s", ", ".join(map(repr, package_names)))
+        insert_requests: List[android_publisher_resources.AppEditHttpRequest] = [
+            self._edits.insert(body={}, packageName=package_name) for package_name in package_names
+        ]
+        results = self._execute_batch_request_with_errors(insert_requests, "insert")
+        edits: List[Union[AppEdit, GoogleError]] = [
+            result if isinstance(result, GoogleError) else AppEdit(**result) for result in results
+        ]
+        self._logger.debug("Created edits %s", ", ".join(edit.id for edit in edits if isinstance(edit, AppEdit)))
+        return edits
+
+    def get(self, edit: Union[AppEdit, str], package_name: str) -> AppEdit:
+        """
+        https://developers.google.com/android-publisher/api-ref/rest/v3/edits/get
+        """
+        edit_id = self._resolve_id(edit)
+        self._logger.debug("Get edit %s for %r", edit_id, package_name)
+        get_request: android_publisher_resources.AppEditHttpRequest = self._edits.get(
+            packageName=package_name,
+            editId=edit_id,
+        )
+        response = cast(
+            "android_publisher_resources.AppEdit",
+            self._execute_request(get_request, "get"),
+        )
+        self._logger.debug("Got edit %s", response["id"])
+        return AppEdit(**response)
+
     def commit(
         self,
         edit: Union[AppEdit, str],
@@ -87,3 +126,17 @@ class EditsService(ResourceService[AppEdit, "android_publisher_resources.Android
         )
         self._execute_request(delete_request, "delete")
         self._logger.debug("Deleted edit %s", edit_id)
+
+    def delete_many(self, package_edits: Sequence[Tuple[Union[AppEdit, str], str]]) -> None:
+        """
+        Delete edits given as (edit, package name) pairs using a single batch request
+        https://developers.google.com/android-publisher/api-ref/rest/v3/edits/delete
+        """
+        edit_ids = [self._resolve_id(edit) for edit, _package_name in package_edits]
+        self._logger.debug("Delete edits %s", ", ".join(edit_ids))
+        delete_requests = [
+            self._edits.delete(packageName=package_name, editId=edit_id)
+            for edit_id, (_edit, package_name) in zip(edit_ids, package_edits)
+        ]
+        self._execute_batch_request(delete_requests, "delete")
+        self._logger.debug("Deleted edits %s", ", ".join(edit_ids))
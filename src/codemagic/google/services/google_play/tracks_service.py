@@ -3,6 +3,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from typing import Final
 from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
 from typing import cast
 
 from codemagic.google.resources.google_play import Track
@@ -23,7 +26,7 @@ class TracksService(ResourceService[Track, "android_publisher_resources.AndroidP
     def _tracks(self) -> android_publisher_resources.AndroidPublisherResource.EditsResource.TracksResource:
         return self._google_service.edits().tracks()
 
-    def get(self, package_name: str, track_name: str, edit_id: str) -> Track:
+    def get(self, package_name: str, track_name: str, edit_id: str, fields: Optional[str] = None) -> Track:
         """
         https://developers.google.com/android-publisher/api-ref/rest/v3/edits.tracks/get
         """
@@ -32,6 +35,7 @@ class TracksService(ResourceService[Track, "android_publisher_resources.AndroidP
             packageName=package_name,
             editId=edit_id,
             track=track_name,
+            fields=fields,
         )
         response = cast(
             "android_publisher_resources.Track",
@@ -40,7 +44,7 @@ class TracksService(ResourceService[Track, "android_publisher_resources.AndroidP
         self._logger.debug("Got track %r for %r", track_name, package_name)
         return Track(**cast(dict, response))
 
-    def list(self, package_name: str, edit_id: str) -> List[Track]:
+    def list(self, package_name: str, edit_id: str, fields: Optional[str] = None) -> List[Track]:
         """
         https://developers.google.com/android-publisher/api-ref/rest/v3/edits.tracks/list
         """
@@ -48,13 +52,36 @@ class TracksService(ResourceService[Track, "android_publisher_resources.AndroidP
         get_request: android_publisher_resources.TracksListResponseHttpRequest = self._tracks.list(
             packageName=package_name,
             editId=edit_id,
+            fields=fields,
         )
         response = cast(
             "android_publisher_resources.TracksListResponse",
             self._execute_request(get_request, "list"),
         )
         self._logger.debug("Listed %d tracks list for %r", len(response), package_name)
-        return [Track(**cast(dict, track)) for track in response["tracks"]]
+        return [Track(**cast(dict, track)) for track in response.get("tracks", [])]
+
+    def list_many(
+        self,
+        package_edits: Sequence[Tuple[str, str]],
+        fields: Optional[str] = None,
+    ) -> List[List[Track]]:
+        """
+        List tracks for (package name, edit ID) pairs using a single batch request
+        https://developers.google.com/android-publisher/api-ref/rest/v3/edits.tracks/list
+        """
+        package_names = ", ".join(repr(package_name) for package_name, _edit_id in package_edits)
+        self._logger.debug("List tracks for %s", package_names)
+        list_requests: List[android_publisher_resources.TracksListResponseHttpRequest] = [
+            self._tracks.list(packageName=package_name, editId=edit_id, fields=fields)
+            for package_name, edit_id in package_edits
+        ]
+        responses = cast(
+            "List[android_publisher_resources.TracksListResponse]",
+            self._execute_batch_request(list_requests, "list"),
+        )
+        self._logger.debug("Listed tracks for %s", package_names)
+        return [[Track(**cast(dict, track)) for track in response.get("tracks", [])] for response in responses]
 
     def update(self, track: Track, package_name: str, edit_id: str) -> Track:
         """
@@ -1,30 +1,47 @@
 from __future__ import annotations
 
+import contextlib
 from abc import ABC
 from abc import abstractmethod
 from typing import Any
+from typing import ClassVar
 from typing import Dict
 from typing import Generic
+from typing import Iterator
+from typing import List
 from typing import Literal
+from typing import Optional
+from typing import Sequence
 from typing import Type
 from typing import TypeVar
+from typing import Union
+from typing import cast
 
+import httplib2
 from googleapiclient import discovery
 from googleapiclient import errors
+from googleapiclient.http import BatchHttpRequest
 from googleapiclient.http import HttpRequest
 from oauth2client.client import Error as OAuth2ClientError
 
 from codemagic.google.errors import GoogleAuthenticationError
 from codemagic.google.errors import GoogleClientError
+from codemagic.google.errors import GoogleError
 from codemagic.google.errors import GoogleHttpError
 from codemagic.google.resources import Resource
+from codemagic.google.services.streaming_media_upload import RewindingHttp
+from codemagic.google.services.streaming_media_upload import UploadStream
 from codemagic.utilities import log
 
 ResourceT = TypeVar("ResourceT", bound=Resource)
 GoogleServiceT = TypeVar("GoogleServiceT", bound=discovery.Resource)
+RequestType = Literal["commit", "delete", "get", "insert", "list", "update", "upload"]
 
 
 class ResourceService(Generic[ResourceT, GoogleServiceT], ABC):
+    # https://developers.google.com/android-publisher/batch#overview
+    BATCH_REQUEST_SIZE_LIMIT: ClassVar[int] = 1000
+
     def __init__(self, google_service: GoogleServiceT):
         self._google_service = google_service
         self._logger = log.get_file_logger(self.__class__)
@@ -34,19 +51,16 @@ class ResourceService(Generic[ResourceT, GoogleServiceT], ABC):
     def resource_type(self) -> Type[ResourceT]:
         raise NotImplementedError()
 
-    def _execute_request(
-        self,
-        request: HttpRequest,
-        request_type: Literal["commit", "delete", "get", "insert", "list", "update", "upload"],
-        retries: int = 3,
-    ) -> Dict[str, Any]:
+    def _log_request(self, request: HttpRequest):
         if isinstance(request.body, bytes):
             self._logger.info(f">>> {request.method} {request.uri} <{len(request.body)} bytes>")
         else:
             self._logger.info(f">>> {request.method} {request.uri} {request.body}")
 
+    @contextlib.contextmanager
+    def _handle_request_errors(self, request_type: RequestType) -> Iterator[None]:
         try:
-            response = request.execute(num_retries=retries)
+            yield
         except OAuth2ClientError as e:
             self._logger.exception(f"Failed to {request_type} {self.resource_type.__name__}")
             raise GoogleAuthenticationError(str(e)) from e
@@ -57,5 +71,84 @@ class ResourceService(Generic[ResourceT, GoogleServiceT], ABC):
         except errors.Error as e:
             self._logger.exception(f"Failed to {request_type} {self.resource_type.__name__}")
             raise GoogleClientError(str(e)) from e
+
+    def _execute_request(
+        self,
+        request: HttpRequest,
+        request_type: RequestType,
+        retries: int = 3,
+    ) -> Dict[str, Any]:
+        self._log_request(request)
+        with self._handle_request_errors(request_type):
+            response = request.execute(num_retries=retries)
+        self._logger.info(f"<<< {response}")
+        return response
+
+    def _execute_streaming_upload_request(self, request: HttpRequest, retries: int = 3) -> Dict[str, Any]:
+        """
+        Execute upload request whose body is streamed from disk. The body is rewound before
+        each attempt so that failed uploads can be retried, and it is closed once done.
+        """
+        self._log_request(request)
+        upload_stream = cast(UploadStream, request.body)
+        http = cast(httplib2.Http, RewindingHttp(request.http))
+        with contextlib.closing(upload_stream), self._handle_request_errors("upload"):
+            response = request.execute(http=http, num_retries=retries)
         self._logger.info(f"<<< {response}")
         return response
+
+    def _execute_batch_request(
+        self,
+        requests: Sequence[HttpRequest],
+        request_type: RequestType,
+    ) -> List[Dict[str, Any]]:
+        """
+        Send independent requests to Google API as a single batch HTTP request and
+        return the responses in the same order as the requests were given.
+        https://googleapis.github.io/google-api-python-client/docs/batch.html
+        """
+        results = self._execute_batch_request_with_errors(requests, request_type)
+        for result in results:
+            if isinstance(result, GoogleError):
+                raise result
+        return cast(List[Dict[str, Any]], results)
+
+    def _execute_batch_request_with_errors(
+        self,
+        requests: Sequence[HttpRequest],
+        request_type: RequestType,
+    ) -> List[Union[Dict[str, Any], GoogleError]]:
+        """
+        Send independent requests to Google API as a single batch HTTP request and return
+        the responses, or errors of failed requests, in the same order as the requests were given.
+        https://googleapis.github.io/google-api-python-client/docs/batch.html
+        """
+        results: Dict[str, Union[Dict[str, Any], GoogleError]] = {}
+
+        def callback(request_id: str, response: Any, exception: Optional[errors.HttpError]):
+            if exception is not None:
+                self._logger.error(f"Failed to {request_type} {self.resource_type.__name__}", exc_info=exception)
+                request_error = GoogleHttpError(exception.reason)  # type: ignore
+                request_error.__cause__ = exception
+                results[request_id] = request_error
+            else:
+                self._logger.info(f"<<< [{request_id}] {response}")
+                results[request_id] = response or {}
+
+        request_ids = [str(i) for i in range(len(requests))]
+        for chunk_start in range(0, len(requests), self.BATCH_REQUEST_SIZE_LIMIT):
+            chunk_end = chunk_start + self.BATCH_REQUEST_SIZE_LIMIT
+            batch: BatchHttpRequest = self._google_service.new_batch_http_request(  # type: ignore
+                callback=callback,
+            )
+            for request_id, request in zip(request_ids[chunk_start:chunk_end], requests[chunk_start:chunk_end]):
+                self._log_request(request)
+                batch.add(request, request_id=request_id)
+            try:
+                with self._handle_request_errors(request_type):
+                    batch.execute()
+            except GoogleError as batch_error:
+                for request_id in request_ids[chunk_start:chunk_end]:
+                    results.setdefault(request_id, batch_error)
+
+        return [results[request_id] for request_id in request_ids]
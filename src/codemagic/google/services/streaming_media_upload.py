@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import io
+import pathlib
+from typing import Any
+from typing import BinaryIO
+from typing import Optional
+
+from googleapiclient.http import MediaUpload
+
+
+class UploadStream(io.RawIOBase):
+    """
+    Read-only file-like request body. The file contents are read from disk in chunks
+    while the request is being sent instead of loading the whole file into memory.
+    """
+
+    def __init__(self, path: pathlib.Path, chunk_size: int):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.bytes_read = 0
+        self._size = path.stat().st_size
+        self._fd: Optional[BinaryIO] = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __str__(self) -> str:
+        return f"<{self._size} bytes from {self.path}>"
+
+    @property
+    def _file(self) -> BinaryIO:
+        if self._fd is None:
+            self._fd = self.path.open("rb")
+        return self._fd
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if size is None or size < 0 or size > self.chunk_size:
+            size = self.chunk_size
+        chunk = self._file.read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+    def readinto(self, buffer) -> int:
+        chunk = self.read(len(buffer))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._file.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def close(self):
+        if self._fd is not None:
+            self._fd.close()
+            self._fd = None
+        super().close()
+
+
+class StreamingMediaUpload(MediaUpload):
+    """
+    Media upload for the "simple" upload protocol that sends the file contents
+    as a stream. Default `googleapiclient.http.MediaFileUpload` reads the whole
+    file into memory for non-resumable uploads.
+    """
+
+    DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        path: pathlib.Path,
+        mimetype: str = "application/octet-stream",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        self._path = path
+        self._mimetype = mimetype
+        self._chunk_size = chunk_size
+        self._size = path.stat().st_size
+
+    def chunksize(self) -> int:
+        return self._chunk_size
+
+    def mimetype(self) -> str:
+        return self._mimetype
+
+    def size(self) -> int:
+        return self._size
+
+    def resumable(self) -> bool:
+        return False
+
+    def getbytes(self, begin: int, end: int) -> UploadStream:  # type: ignore[override]
+        # Used by googleapiclient as the request body for simple uploads
+        return UploadStream(self._path, self._chunk_size)
+
+    def has_stream(self) -> bool:
+        return False
+
+
+class RewindingHttp:
+    """
+    HTTP client wrapper that rewinds seekable request bodies before each request.
+    `googleapiclient` sends the same body object again when it retries a request, so
+    streamed request bodies have to be rewound for the retried requests to be complete.
+    """
+
+    def __init__(self, http: Any):
+        self._http = http
+
+    def request(self, uri: str, method: str = "GET", body: Any = None, *args, **kwargs):
+        if body is not None and hasattr(body, "seek"):
+            body.seek(0)
+        return self._http.request(uri, method, body, *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._http, name)
@@ -1,19 +1,79 @@
-from .altool import Altool
-from .android_signing_info import AndroidSigningInfo
-from .bundle_id_detector import BundleIdDetector
-from .certificate import Certificate
-from .certificate_attributes import CertificateAttributes
-from .code_sign_entitlements import CodeSignEntitlements
-from .code_signing_settings_manager import CodeSigningSettingsManager
-from .dict_serializable import DictSerializable
-from .export_options import ArchiveMethod
-from .export_options import ExportOptions
-from .json_serializable import JsonSerializable
-from .json_serializable import JsonSerializableMeta
-from .keystore import Keystore
-from .pbx_project import PbxProject
-from .private_key import PrivateKey
-from .provisioning_profile import ProvisioningProfile
-from .xcode import Xcode
-from .xcodebuild import Xcodebuild
-from .xcpretty import Xcpretty
+"""
+Models are loaded lazily on first attribute access as some of them depend on
+heavy third party packages that most CLI tools do not need.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Dict
+from typing import List
+
+if TYPE_CHECKING:
+    from .altool import Altool
+    from .android_signing_info import AndroidSigningInfo
+    from .bundle_id_detector import BundleIdDetector
+    from .certificate import Certificate
+    from .certificate_attributes import CertificateAttributes
+    from .code_sign_entitlements import CodeSignEntitlements
+    from .code_signing_settings_manager import CodeSigningSettingsManager
+    from .dict_serializable import DictSerializable
+    from .export_options import ArchiveMethod
+    from .export_options import ExportOptions
+    from .json_serializable import JsonSerializable
+    from .json_serializable import JsonSerializableMeta
+    from .keystore import Keystore
+    from .pbx_project import PbxProject
+    from .private_key import PrivateKey
+    from .provisioning_profile import ProvisioningProfile
+    from .xcode import Xcode
+    from .xcodebuild import Xcodebuild
+    from .xcodebuild_formatter import XcodebuildCompactFormatter
+    from .xcodebuild_formatter import XcodebuildJUnitFormatter
+    from .xcodebuild_formatter import XcodebuildOutputFormat
+    from .xcodebuild_formatter import XcodebuildOutputFormatter
+    from .xcpretty import Xcpretty
+
+_MODEL_MODULES: Dict[str, str] = {
+    "Altool": ".altool",
+    "AndroidSigningInfo": ".android_signing_info",
+    "BundleIdDetector": ".bundle_id_detector",
+    "Certificate": ".certificate",
+    "CertificateAttributes": ".certificate_attributes",
+    "CodeSignEntitlements": ".code_sign_entitlements",
+    "CodeSigningSettingsManager": ".code_signing_settings_manager",
+    "DictSerializable": ".dict_serializable",
+    "ArchiveMethod": ".export_options",
+    "ExportOptions": ".export_options",
+    "JsonSerializable": ".json_serializable",
+    "JsonSerializableMeta": ".json_serializable",
+    "Keystore": ".keystore",
+    "PbxProject": ".pbx_project",
+    "PrivateKey": ".private_key",
+    "ProvisioningProfile": ".provisioning_profile",
+    "Xcode": ".xcode",
+    "Xcodebuild": ".xcodebuild",
+    "XcodebuildCompactFormatter": ".xcodebuild_formatter",
+    "XcodebuildJUnitFormatter": ".xcodebuild_formatter",
+    "XcodebuildOutputFormat": ".xcodebuild_formatter",
+    "XcodebuildOutputFormatter": ".xcodebuild_formatter",
+    "Xcpretty": ".xcpretty",
+}
+
+__all__ = list(_MODEL_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _MODEL_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    model = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = model  # Cache the model so that next lookups skip __getattr__
+    return model
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
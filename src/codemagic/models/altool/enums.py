@@ -28,8 +28,8 @@ class PlatformType(StringConverterMixin, str, enum.Enum):
         if artifact_path.suffix == ".pkg":
             return PlatformType.MAC_OS
         elif artifact_path.suffix == ".ipa":
-            if Ipa(artifact_path).is_for_tvos():
-                return PlatformType.APPLE_TV_OS
-            return PlatformType.IOS
+            with Ipa(artifact_path) as ipa:
+                is_for_tvos = ipa.is_for_tvos()
+            return PlatformType.APPLE_TV_OS if is_for_tvos else PlatformType.IOS
         else:
             raise ValueError(f"Unknown artifact type from path {artifact_path}")
@@ -1,23 +1,29 @@
 from __future__ import annotations
 
+import contextlib
 import pathlib
 import subprocess
 import zipfile
 from functools import cached_property
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import AnyStr
 from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Union
 
 from cryptography import x509
+from cryptography.hazmat.primitives.serialization import Encoding
 from cryptography.hazmat.primitives.serialization.pkcs7 import load_der_pkcs7_certificates
 
 from .abstract_package import AbstractPackage
 from .android import AndroidManifest
 from .android import AppBundleResources
 from .android import Strings
+from .android.aapt2_proto import decode_xml_node
+from .zip_archive import ZipArchive
 
 if TYPE_CHECKING:
     from codemagic.models import Certificate
@@ -25,7 +31,42 @@ if TYPE_CHECKING:
 
 
 class AabPackage(AbstractPackage):
+    """
+    Android App Bundle. Manifest and resources are decoded directly from the compiled
+    protocol buffer files inside the bundle, so that Java and bundletool are only needed
+    if the bundle is explicitly validated with bundletool.
+    """
+
+    MANIFEST_PATH = "base/manifest/AndroidManifest.xml"
+    RESOURCE_TABLE_PATH = "base/resources.pb"
+
+    def __init__(self, path: Union[pathlib.Path, AnyStr], validate_with_bundletool: bool = False):
+        super().__init__(path)
+        if validate_with_bundletool:
+            try:
+                self.validate_with_bundletool()
+            except Exception:
+                self.close()
+                raise
+
+    @cached_property
+    def _archive(self) -> ZipArchive:
+        return ZipArchive(self.path)
+
+    def close(self):
+        """
+        Release the file handle that is shared for reading files from the package
+        """
+        if "_archive" in self.__dict__:
+            self._archive.close()
+
     def _validate_package(self):
+        try:
+            return bool(self._manifest)
+        except (zipfile.BadZipFile, FileNotFoundError, ValueError) as error:
+            raise IOError(f"Not a valid Android App Bundle at {self.path}") from error
+
+    def validate_with_bundletool(self):
         try:
             self._bundletool.validate(
                 bundle=self.path,
@@ -35,13 +76,17 @@ class AabPackage(AbstractPackage):
             raise IOError(f"Not a valid Android App Bundle at {self.path}") from cpe
 
     def _extract_file(self, filename_filter: Callable[[str], bool]) -> bytes:
-        with zipfile.ZipFile(self.path) as zf:
-            try:
-                found_file_name = next(filter(filename_filter, zf.namelist()))
-            except StopIteration:
-                raise FileNotFoundError(f"File not found for {filename_filter.__name__}", self.path)
-            with zf.open(found_file_name, "r") as fd:
-                return fd.read()
+        try:
+            found_file_name = next(filter(filename_filter, self._archive.namelist()))
+        except StopIteration:
+            raise FileNotFoundError(f"File not found for {filename_filter.__name__}", self.path)
+        return self._archive.read(found_file_name)
+
+    def _read_file(self, filename: str) -> bytes:
+        try:
+            return self._archive.read(filename)
+        except KeyError:
+            raise FileNotFoundError(f"File {filename!r} not found", self.path)
 
     @cached_property
     def _bundletool(self) -> Bundletool:
@@ -51,31 +96,21 @@ class AabPackage(AbstractPackage):
 
     @cached_property
     def _manifest(self) -> AndroidManifest:
-        manifest_xml = self._bundletool.dump(
-            "manifest",
-            self.path,
-            show_output=False,
-        )
-        return AndroidManifest(manifest_xml)
+        manifest_element = decode_xml_node(self._read_file(self.MANIFEST_PATH))
+        return AndroidManifest.from_element(manifest_element)
 
     @cached_property
     def _resources(self) -> AppBundleResources:
-        # Disable bundletool error checks as even valid aabs might have some resource
-        # declarations missing, which will cause the overall command to exit with error code 1
-        # while all valid resources are printed out to STDOUT stream.
         try:
-            resources_dump = self._bundletool.dump(
-                "resources",
-                self.path,
-                values=True,
-                show_output=False,
-            )
-        except subprocess.CalledProcessError as cpe:
-            resources_dump = self._str(cpe.stdout)
+            resource_table = self._read_file(self.RESOURCE_TABLE_PATH)
+        except FileNotFoundError:
+            self._logger.debug("Resource table is missing from %s", self.path)
+            resource_table = b""
 
-        if not resources_dump.strip():
-            raise IOError("Failed to dump resources from aab")
-        return AppBundleResources(resources_dump)
+        try:
+            return AppBundleResources.from_resource_table(resource_table)
+        except ValueError as error:
+            raise IOError(f"Failed to read resources from {self.path}") from error
 
     @cached_property
     def _strings(self) -> Strings:
@@ -94,21 +129,17 @@ class AabPackage(AbstractPackage):
         return Strings(xml)
 
     def _get_signature(self) -> Optional[pathlib.Path]:
-        with zipfile.ZipFile(self.path) as zf:
-            namelist = zf.namelist()
-            for path_in_zip in map(pathlib.Path, namelist):
-                # Signatures are stored in ./META-INF/<signature-name>.(RSA|EC|DSA)
-                # Full signature also has ./META-INF/<signature-name>.SF next to it
-                is_signature = path_in_zip.parent.name == "META-INF" and path_in_zip.suffix in (".RSA", ".EC", ".DSA")
-                sf_file_path = path_in_zip.parent / f"{path_in_zip.stem}.SF"
-                if is_signature and str(sf_file_path) in namelist:
-                    return path_in_zip
+        namelist = self._archive.namelist()
+        for path_in_zip in map(pathlib.Path, namelist):
+            # Signatures are stored in ./META-INF/<signature-name>.(RSA|EC|DSA)
+            # Full signature also has ./META-INF/<signature-name>.SF next to it
+            is_signature = path_in_zip.parent.name == "META-INF" and path_in_zip.suffix in (".RSA", ".EC", ".DSA")
+            sf_file_path = path_in_zip.parent / f"{path_in_zip.stem}.SF"
+            if is_signature and str(sf_file_path) in namelist:
+                return path_in_zip
         return None
 
-    @cached_property
-    def certificate(self) -> Optional[Certificate]:
-        from codemagic.models import Certificate
-
+    def _get_certificate_der(self) -> Optional[bytes]:
         certificate_path = self._get_signature()
         if not certificate_path:
             return None
@@ -122,11 +153,33 @@ class AabPackage(AbstractPackage):
         certificates: List[x509.Certificate] = load_der_pkcs7_certificates(cert_pkcs7_message)
         if not certificates:
             return None
-        return Certificate(certificates[0])
+        return certificates[0].public_bytes(Encoding.DER)
+
+    @cached_property
+    def certificate(self) -> Optional[Certificate]:
+        from codemagic.models import Certificate
+
+        certificate_der = self._get_cached_bytes("certificate", self._get_certificate_der)
+        if not certificate_der:
+            return None
+        return Certificate(x509.load_der_x509_certificate(certificate_der))
+
+    def _get_resource_value(self, resource_name: str) -> Optional[str]:
+        try:
+            resources = self._resources
+        except IOError:
+            # Resource table could not be decoded, dump only the required resources using bundletool
+            self._logger.debug("Dump resource %s from %s using bundletool", resource_name, self.path, exc_info=True)
+            try:
+                with contextlib.closing(self._bundletool.iter_dump_resources(self.path)) as dump_output:
+                    resources = AppBundleResources.from_bundletool_output(dump_output, [resource_name])
+            except subprocess.CalledProcessError as cpe:
+                raise IOError(f"Failed to read resources from {self.path}") from cpe
+        return resources.get_resolved_resource(resource_name)
 
     def get_app_name(self) -> str:
         label = self._manifest.app_label
-        if label.startswith("@") and (resource_value := self._resources.get_resource(label[1:])):
+        if label.startswith("@") and (resource_value := self._get_resource_value(label[1:])):
             label = resource_value
         if label.startswith("@string/"):
             string_reference = label[8:]
@@ -151,7 +204,7 @@ class AabPackage(AbstractPackage):
     def is_debuggable(self) -> bool:
         return self._manifest.debuggable == "true"
 
-    def get_summary(self) -> Dict[str, Any]:
+    def _get_summary(self) -> Dict[str, Any]:
         return {
             "app_name": self.get_app_name(),
             "package_name": self.get_package_name(),
@@ -1,33 +1,118 @@
 import abc
+import base64
 import pathlib
 from typing import Any
 from typing import AnyStr
+from typing import Callable
+from typing import ClassVar
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
+from typing import TypeVar
 from typing import Union
 
 from codemagic.mixins import StringConverterMixin
 from codemagic.utilities import log
 
+from .package_digests import PackageDigests
+from .package_digests import get_digests
+from .package_metadata_cache import PackageMetadataCache
+
+T = TypeVar("T")
+P = TypeVar("P", bound="AbstractPackage")
+
 
 class AbstractPackage(StringConverterMixin, metaclass=abc.ABCMeta):
+    # Metadata cache for all packages. If not set, cache is configured from environment.
+    metadata_cache: ClassVar[Optional[PackageMetadataCache]] = None
+
     def __init__(self, path: Union[pathlib.Path, AnyStr]):
         self._logger = log.get_file_logger(self.__class__)
         if isinstance(path, (bytes, str)):
             self.path = pathlib.Path(self._str(path))
         else:
             self.path = path
-        self._validate_package()
+        self._metadata_cache = self.metadata_cache or PackageMetadataCache.from_environment()
+        self._cached_metadata: Dict[str, Any] = self._load_cached_metadata()
+        if not self._cached_metadata:
+            # Packages that have cached metadata have been successfully validated before
+            try:
+                self._validate_package()
+            except Exception:
+                self.close()
+                raise
+
+    def __enter__(self: P) -> P:
+        return self
+
+    def __exit__(self, *_exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Release file handles that are kept open for reading the package. Package
+        is opened again in case its contents are accessed after closing.
+        """
 
     @abc.abstractmethod
     def _validate_package(self):
         pass
 
+    def _load_cached_metadata(self) -> Dict[str, Any]:
+        if self._metadata_cache is None:
+            return {}
+        return self._metadata_cache.load(self.__class__.__name__, self.path) or {}
+
+    def _get_cached_metadata(self, key: str, load: Callable[[], T]) -> T:
+        """
+        Get JSON serializable package metadata value from the metadata cache,
+        or load it from the package and save it to the cache if it is not cached yet.
+        Loaded metadata is kept with the package instance even if the cache is disabled.
+        """
+        if key not in self._cached_metadata:
+            self._cached_metadata[key] = load()
+            if self._metadata_cache is not None:
+                self._metadata_cache.save(self.__class__.__name__, self.path, self._cached_metadata)
+        return self._cached_metadata[key]
+
+    def _get_cached_bytes(self, key: str, load: Callable[[], Optional[bytes]]) -> Optional[bytes]:
+        def load_encoded() -> Optional[str]:
+            contents = load()
+            return None if contents is None else base64.b64encode(contents).decode()
+
+        encoded_contents = self._get_cached_metadata(key, load_encoded)
+        return None if encoded_contents is None else base64.b64decode(encoded_contents)
+
+    def get_digests(self, use_mmap: bool = False) -> PackageDigests:
+        """
+        Get SHA-256, SHA-1 and MD5 digests of the package file. All digests are computed
+        in one pass over the package contents and are reused by upload integrity checks
+        and package caches until the package file is changed.
+        """
+        digests = self._get_cached_metadata("digests", lambda: get_digests(self.path, use_mmap=use_mmap).dict())
+        return PackageDigests(**digests)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Parsed package contents and open file handles are not transferred when packages
+        # are loaded in worker processes, but metadata that was read from the package is.
+        return {name: value for name, value in self.__dict__.items() if name in self._get_state_attributes()}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._logger = log.get_file_logger(self.__class__)
+        self._metadata_cache = self.metadata_cache or PackageMetadataCache.from_environment()
+
+    def _get_state_attributes(self) -> Tuple[str, ...]:
+        return ("path", "_cached_metadata")
+
     @abc.abstractmethod
-    def get_summary(self) -> Dict[str, Any]:
+    def _get_summary(self) -> Dict[str, Any]:
         pass
 
+    def get_summary(self) -> Dict[str, Any]:
+        return self._get_cached_metadata("summary", self._get_summary)
+
     def get_text_summary(self) -> str:
         summary: List[str] = []
         for property_name, property_value in self.get_summary().items():
@@ -0,0 +1,284 @@
+"""
+Decoders for the protocol buffer formats that Android App Bundles use to store compiled
+resources and XML files. Message definitions are from aapt2 `Resources.proto`:
+https://android.googlesource.com/platform/frameworks/base/+/refs/heads/main/tools/aapt2/Resources.proto
+"""
+
+from __future__ import annotations
+
+import struct
+from collections import defaultdict
+from typing import DefaultDict
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+from xml.etree.ElementTree import Element
+
+FieldValue = Union[int, memoryview]
+
+# Primitive message field numbers for packed color and complex (dimension, fraction) values
+_COLOR_PRIMITIVE_TYPES = ((9, "COLOR_ARGB8"), (10, "COLOR_RGB8"), (11, "COLOR_ARGB4"), (12, "COLOR_RGB4"))
+_COMPLEX_PRIMITIVE_TYPES = ((13, "DIMENSION"), (14, "FRACTION"))
+
+
+class ProtobufMessage:
+    """
+    Minimal decoder for protocol buffer wire format messages. Only the top level fields
+    of the message are decoded, nested messages are decoded once they are accessed.
+    https://protobuf.dev/programming-guides/encoding/
+    """
+
+    WIRE_TYPE_VARINT = 0
+    WIRE_TYPE_I64 = 1
+    WIRE_TYPE_LEN = 2
+    WIRE_TYPE_I32 = 5
+
+    def __init__(self, data: Union[bytes, memoryview]):
+        self._fields: DefaultDict[int, List[FieldValue]] = defaultdict(list)
+        self._decode(memoryview(data))
+
+    @classmethod
+    def _read_varint(cls, data: memoryview, position: int) -> Tuple[int, int]:
+        value = 0
+        shift = 0
+        while True:
+            try:
+                byte = data[position]
+            except IndexError:
+                raise ValueError("Truncated protocol buffer varint")
+            position += 1
+            value |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return value, position
+            shift += 7
+
+    def _decode(self, data: memoryview):
+        position = 0
+        data_length = len(data)
+        while position < data_length:
+            key, position = self._read_varint(data, position)
+            field_number, wire_type = key >> 3, key & 0x07
+            value: FieldValue
+            if wire_type == self.WIRE_TYPE_VARINT:
+                value, position = self._read_varint(data, position)
+            elif wire_type == self.WIRE_TYPE_LEN:
+                length, position = self._read_varint(data, position)
+                value = data[position : position + length]
+                position += length
+            elif wire_type == self.WIRE_TYPE_I64:
+                value = data[position : position + 8]
+                position += 8
+            elif wire_type == self.WIRE_TYPE_I32:
+                value = data[position : position + 4]
+                position += 4
+            else:
+                raise ValueError(f"Unsupported protocol buffer wire type {wire_type}")
+            if position > data_length:
+                raise ValueError("Truncated protocol buffer message")
+            self._fields[field_number].append(value)
+
+    def has_field(self, field_number: int) -> bool:
+        return field_number in self._fields
+
+    def get_int(self, field_number: int, default: int = 0) -> int:
+        values = self._fields.get(field_number)
+        if not values or not isinstance(values[-1], int):
+            return default
+        return values[-1]
+
+    def get_signed_int(self, field_number: int, default: int = 0) -> int:
+        value = self.get_int(field_number, default)
+        return value - 2**64 if value >= 2**63 else value
+
+    def get_bool(self, field_number: int) -> bool:
+        return bool(self.get_int(field_number))
+
+    def get_float(self, field_number: int, default: float = 0.0) -> float:
+        values = self._fields.get(field_number)
+        if not values or isinstance(values[-1], int) or len(values[-1]) != 4:
+            return default
+        return struct.unpack("<f", values[-1])[0]
+
+    def get_bytes(self, field_number: int) -> Optional[memoryview]:
+        values = self._fields.get(field_number)
+        if not values or isinstance(values[-1], int):
+            return None
+        return values[-1]
+
+    def get_string(self, field_number: int, default: str = "") -> str:
+        value = self.get_bytes(field_number)
+        return default if value is None else str(value, "utf-8")
+
+    def get_message(self, field_number: int) -> Optional[ProtobufMessage]:
+        value = self.get_bytes(field_number)
+        return None if value is None else ProtobufMessage(value)
+
+    def get_messages(self, field_number: int) -> List[ProtobufMessage]:
+        return [ProtobufMessage(value) for value in self._fields.get(field_number, []) if not isinstance(value, int)]
+
+
+def format_reference(reference: ProtobufMessage) -> str:
+    # Reference: 1 type (0 reference, 1 attribute), 2 id, 3 name
+    prefix = "?" if reference.get_int(1) == 1 else "@"
+    name = reference.get_string(3)
+    return f"{prefix}{name}" if name else f"{prefix}0x{reference.get_int(2):08x}"
+
+
+def _format_primitive(primitive: ProtobufMessage) -> Tuple[str, str]:
+    if primitive.has_field(1):
+        return "NULL", "@null"
+    elif primitive.has_field(2):
+        return "EMPTY", ""
+    elif primitive.has_field(3):
+        return "FLOAT", repr(primitive.get_float(3))
+    elif primitive.has_field(6):
+        return "INT_DEC", str(primitive.get_signed_int(6))
+    elif primitive.has_field(7):
+        return "INT_HEX", f"0x{primitive.get_int(7):08x}"
+    elif primitive.has_field(8):
+        return "BOOL", "true" if primitive.get_bool(8) else "false"
+    for field_number, primitive_type in _COLOR_PRIMITIVE_TYPES:
+        if primitive.has_field(field_number):
+            return primitive_type, f"#{primitive.get_int(field_number):08x}"
+    for field_number, primitive_type in _COMPLEX_PRIMITIVE_TYPES:
+        if primitive.has_field(field_number):
+            return primitive_type, f"0x{primitive.get_int(field_number):08x}"
+    return "PRIMITIVE", ""
+
+
+def format_item(item: ProtobufMessage) -> Tuple[str, str]:
+    """
+    Get type and textual value of a compiled resource Item
+    """
+    if reference := item.get_message(1):
+        return "REF", format_reference(reference)
+    for field_number, item_type in ((2, "STR"), (3, "RAW_STR"), (4, "STYLED_STR")):
+        if string := item.get_message(field_number):
+            return item_type, string.get_string(1)
+    if file_reference := item.get_message(5):
+        return "FILE", file_reference.get_string(1)
+    if item.has_field(6):
+        return "ID", ""
+    if primitive := item.get_message(7):
+        return _format_primitive(primitive)
+    return "UNKNOWN", ""
+
+
+def _format_compound_value(compound_value: ProtobufMessage) -> Tuple[str, str]:
+    if styleable := compound_value.get_message(3):
+        # Styleable.Entry: 3 attr reference
+        attributes = [entry.get_message(3) for entry in styleable.get_messages(1)]
+        formatted_attributes = ", ".join(format_reference(a) for a in attributes if a is not None)
+        return "STYLEABLE", f"[{formatted_attributes}]"
+    elif array := compound_value.get_message(4):
+        # Array.Element: 3 item
+        items = [element.get_message(3) for element in array.get_messages(1)]
+        formatted_items = ", ".join(format_item(item)[1] for item in items if item is not None)
+        return "ARRAY", f"[{formatted_items}]"
+    elif compound_value.has_field(1):
+        return "ATTR", "{}"
+    elif compound_value.has_field(2):
+        return "STYLE", "{}"
+    elif compound_value.has_field(5):
+        return "PLURAL", "{}"
+    return "COMPOUND", ""
+
+
+def decode_xml_node(data: Union[bytes, memoryview]) -> Element:
+    """
+    Convert XmlNode message, such as `base/manifest/AndroidManifest.xml` from
+    Android App Bundle, to an XML element. Attributes values are taken in their
+    textual form if it is available, otherwise compiled attribute value is used.
+    """
+    # XmlNode: 1 element, 2 text
+    node = ProtobufMessage(data)
+    xml_element = node.get_message(1)
+    if xml_element is None:
+        raise ValueError("XML node does not contain an element")
+    return _decode_xml_element(xml_element)
+
+
+def _decode_xml_element(xml_element: ProtobufMessage) -> Element:
+    # XmlElement: 1 namespace declarations, 2 namespace uri, 3 name, 4 attributes, 5 children
+    element = Element(_get_qualified_name(xml_element.get_string(2), xml_element.get_string(3)))
+    for attribute in xml_element.get_messages(4):
+        # XmlAttribute: 1 namespace uri, 2 name, 3 value, 5 resource id, 6 compiled item
+        value = attribute.get_string(3)
+        compiled_item = attribute.get_message(6)
+        if not value and compiled_item is not None:
+            _item_type, value = format_item(compiled_item)
+        element.set(_get_qualified_name(attribute.get_string(1), attribute.get_string(2)), value)
+
+    previous_child: Optional[Element] = None
+    for child_node in xml_element.get_messages(5):
+        if child_element := child_node.get_message(1):
+            previous_child = _decode_xml_element(child_element)
+            element.append(previous_child)
+        elif previous_child is not None:
+            previous_child.tail = (previous_child.tail or "") + child_node.get_string(2)
+        else:
+            element.text = (element.text or "") + child_node.get_string(2)
+    return element
+
+
+def _get_qualified_name(namespace_uri: str, name: str) -> str:
+    return f"{{{namespace_uri}}}{name}" if namespace_uri else name
+
+
+class ResourceTable:
+    """
+    Lazy decoder for the compiled resource table `base/resources.pb` from Android App Bundle.
+    Resource entries are decoded per resource type when values of that type are first requested.
+    """
+
+    def __init__(self, data: Union[bytes, memoryview]):
+        self._types: DefaultDict[str, List[ProtobufMessage]] = defaultdict(list)
+        self._entries: Dict[str, Dict[str, List[Tuple[str, str, str]]]] = {}
+        # ResourceTable: 2 packages; Package: 2 package name, 3 types; Type: 2 name, 3 entries
+        for package in ProtobufMessage(data).get_messages(2):
+            for resource_type in package.get_messages(3):
+                self._types[resource_type.get_string(2)].append(resource_type)
+
+    def _decode_type_entries(self, type_name: str) -> Dict[str, List[Tuple[str, str, str]]]:
+        entries: Dict[str, List[Tuple[str, str, str]]] = {}
+        for resource_type in self._types.get(type_name, []):
+            # Entry: 2 name, 6 config values; ConfigValue: 1 configuration, 2 value
+            for entry in resource_type.get_messages(3):
+                values = entries.setdefault(entry.get_string(2), [])
+                for config_value in entry.get_messages(6):
+                    value = config_value.get_message(2)
+                    if value is None:
+                        continue
+                    values.append((self._format_configuration(config_value), *self._format_value(value)))
+        return entries
+
+    @classmethod
+    def _format_configuration(cls, config_value: ProtobufMessage) -> str:
+        configuration_data = config_value.get_bytes(1)
+        if not configuration_data:
+            return "default"
+        # Configuration: 3 locale
+        return ProtobufMessage(configuration_data).get_string(3) or "qualified"
+
+    @classmethod
+    def _format_value(cls, value: ProtobufMessage) -> Tuple[str, str]:
+        # Value: 4 item, 5 compound value
+        if item := value.get_message(4):
+            item_type, item_value = format_item(item)
+            if item_type in ("STR", "RAW_STR", "STYLED_STR"):
+                item_value = f'"{item_value}"'
+            return item_type, item_value
+        elif compound_value := value.get_message(5):
+            return _format_compound_value(compound_value)
+        return "UNKNOWN", ""
+
+    def get_values(self, resource_name: str) -> List[Tuple[str, str, str]]:
+        """
+        Get (locale, value type, value) tuples for resource in `<type>/<name>` format
+        """
+        type_name, _, entry_name = resource_name.partition("/")
+        if type_name not in self._entries:
+            self._entries[type_name] = self._decode_type_entries(type_name)
+        return self._entries[type_name].get(entry_name, [])
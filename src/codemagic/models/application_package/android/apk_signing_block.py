@@ -0,0 +1,113 @@
+"""
+Reader for APK Signing Block that holds APK Signature Scheme v2 and v3 signatures.
+https://source.android.com/docs/security/features/apksigning/v2#apk-signing-block
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import BinaryIO
+from typing import Dict
+from typing import List
+from typing import Optional
+
+APK_SIGNING_BLOCK_MAGIC = b"APK Sig Block 42"
+APK_SIGNATURE_SCHEME_V2_BLOCK_ID = 0x7109871A
+APK_SIGNATURE_SCHEME_V3_BLOCK_ID = 0xF05368C0
+APK_SIGNATURE_SCHEME_V31_BLOCK_ID = 0x1B93AD61
+
+END_OF_CENTRAL_DIRECTORY_SIGNATURE = b"PK\x05\x06"
+END_OF_CENTRAL_DIRECTORY_SIZE = 22
+MAX_COMMENT_SIZE = 0xFFFF
+
+
+def _find_central_directory_offset(fd: BinaryIO) -> int:
+    file_size = fd.seek(0, 2)
+    search_size = min(file_size, END_OF_CENTRAL_DIRECTORY_SIZE + MAX_COMMENT_SIZE)
+    fd.seek(file_size - search_size)
+    tail = fd.read(search_size)
+    eocd_index = tail.rfind(END_OF_CENTRAL_DIRECTORY_SIGNATURE)
+    if eocd_index == -1 or eocd_index + END_OF_CENTRAL_DIRECTORY_SIZE > len(tail):
+        raise ValueError("End of central directory record not found")
+    (central_directory_offset,) = struct.unpack_from("<L", tail, eocd_index + 16)
+    return central_directory_offset
+
+
+def _read_signing_block_pairs(fd: BinaryIO) -> Dict[int, bytes]:
+    central_directory_offset = _find_central_directory_offset(fd)
+    if central_directory_offset < 32:
+        return {}
+    fd.seek(central_directory_offset - 24)
+    block_size, magic = struct.unpack("<Q16s", fd.read(24))
+    if magic != APK_SIGNING_BLOCK_MAGIC:
+        return {}
+
+    # Block size excludes the size field in the beginning of the block
+    block_start = central_directory_offset - block_size - 8
+    if block_start < 0:
+        raise ValueError("Invalid APK Signing Block size")
+    fd.seek(block_start)
+    (leading_block_size,) = struct.unpack("<Q", fd.read(8))
+    if leading_block_size != block_size:
+        raise ValueError("APK Signing Block sizes do not match")
+
+    pairs_data = fd.read(block_size - 24)
+    pairs: Dict[int, bytes] = {}
+    position = 0
+    while position + 12 <= len(pairs_data):
+        pair_length, pair_id = struct.unpack_from("<QL", pairs_data, position)
+        if pair_length < 4 or position + 8 + pair_length > len(pairs_data):
+            raise ValueError("Invalid APK Signing Block entry")
+        pairs[pair_id] = pairs_data[position + 12 : position + 8 + pair_length]
+        position += 8 + pair_length
+    return pairs
+
+
+def _read_length_prefixed_items(data: bytes) -> List[bytes]:
+    items = []
+    position = 0
+    while position + 4 <= len(data):
+        (length,) = struct.unpack_from("<L", data, position)
+        if position + 4 + length > len(data):
+            raise ValueError("Invalid length prefixed item in APK signature")
+        items.append(data[position + 4 : position + 4 + length])
+        position += 4 + length
+    return items
+
+
+def _read_length_prefixed_item(data: bytes) -> bytes:
+    items = _read_length_prefixed_items(data[: 4 + struct.unpack_from("<L", data)[0]])
+    if not items:
+        raise ValueError("Missing length prefixed item in APK signature")
+    return items[0]
+
+
+def _get_first_signer_certificate(signature_scheme_block: bytes) -> Optional[bytes]:
+    # Signature scheme block is a length-prefixed sequence of length-prefixed signers.
+    # Signer starts with length-prefixed signed data that consists of length-prefixed
+    # digests and length-prefixed sequence of length-prefixed X.509 certificates.
+    signers = _read_length_prefixed_items(_read_length_prefixed_item(signature_scheme_block))
+    for signer in signers:
+        signed_data = _read_length_prefixed_item(signer)
+        digests_length = struct.unpack_from("<L", signed_data)[0]
+        certificates = _read_length_prefixed_items(_read_length_prefixed_item(signed_data[4 + digests_length :]))
+        if certificates:
+            return certificates[0]
+    return None
+
+
+def read_signing_certificate(fd: BinaryIO) -> Optional[bytes]:
+    """
+    Get DER encoded certificate of the first signer from APK Signature Scheme v3 or v2
+    block. Returns None if APK is not signed using either of those signature schemes.
+    APK Signature Scheme v3.1 block is not read, so that for APKs with signing key
+    rotation the original signer is returned, same as from v1 JAR signature.
+    """
+    try:
+        pairs = _read_signing_block_pairs(fd)
+        for block_id in (APK_SIGNATURE_SCHEME_V3_BLOCK_ID, APK_SIGNATURE_SCHEME_V2_BLOCK_ID):
+            if block_id in pairs:
+                return _get_first_signer_certificate(pairs[block_id])
+    except struct.error as error:
+        raise ValueError(f"Invalid APK Signing Block: {error}") from error
+    return None
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import re
-from collections import defaultdict
 from functools import cached_property
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
-from typing import cast
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+from .aapt2_proto import ResourceTable
 
 
 class _ResourceValue:
@@ -56,10 +62,67 @@ class AppBundleResources:
     0x7f02000d - color/vector_tint_theme_color
         (default) - [FILE] res/color/vector_tint_theme_color.xml
     ...
+
+    Alternatively resources can be read directly from the compiled resource table
+    `base/resources.pb` of the bundle using `AppBundleResources.from_resource_table`.
     """
 
     def __init__(self, dump_output: str):
         self._dump_output = dump_output
+        self._resource_table: Optional[ResourceTable] = None
+        self._parsed_values: Optional[Dict[str, str]] = None
+
+    @classmethod
+    def from_resource_table(cls, resource_table: Union[bytes, memoryview]) -> AppBundleResources:
+        resources = cls("")
+        resources._resource_table = ResourceTable(resource_table)
+        return resources
+
+    @classmethod
+    def from_bundletool_output(cls, lines: Iterable[str], resource_names: Sequence[str]) -> AppBundleResources:
+        """
+        Parse resource values incrementally from `bundletool dump resources --values` output lines.
+        Resources that the requested resources refer to are resolved too, and lines are consumed
+        only until all requested and referred resources are found. References to resources that
+        precede the requested resource in the output are resolved from the already parsed values.
+        """
+        resources = cls("")
+        values: Dict[str, str] = {}
+        pending_resource_names: Set[str] = set(resource_names)
+
+        for resource_name, resource_values in cls._iter_resources(lines):
+            value = cls._choose_default_values({resource_name: resource_values}).get(resource_name)
+            if value is not None:
+                values[resource_name] = value
+            if resource_name not in pending_resource_names:
+                continue
+            pending_resource_names.discard(resource_name)
+            unresolved_reference = cls._get_unresolved_reference(value, values)
+            if unresolved_reference is not None:
+                pending_resource_names.add(unresolved_reference)
+            if not pending_resource_names:
+                break
+
+        resources._parsed_values = values
+        return resources
+
+    @classmethod
+    def _get_unresolved_reference(cls, value: Optional[str], values: Dict[str, str]) -> Optional[str]:
+        """
+        Follow references through given values and return the name of the first
+        referred resource of the package whose value is not known yet
+        """
+        seen_resource_names: Set[str] = set()
+        while value is not None and value.startswith("@"):
+            referred_resource_name = value[1:]
+            if ":" in referred_resource_name or referred_resource_name in seen_resource_names:
+                # Framework resources such as "@android:string/ok" are not included in the dump
+                return None
+            elif referred_resource_name not in values:
+                return referred_resource_name
+            seen_resource_names.add(referred_resource_name)
+            value = values[referred_resource_name]
+        return None
 
     @classmethod
     def _is_resource_name_line(cls, line):
@@ -69,19 +132,27 @@ class AppBundleResources:
             return False
         return True
 
-    def _parse_all_values(self) -> Dict[str, List[_ResourceValue]]:
-        all_values = defaultdict(list)
-        current_resource_name = None
-        for line in self._dump_output.splitlines():
-            if self._is_resource_name_line(line):
+    @classmethod
+    def _iter_resources(cls, lines: Iterable[str]) -> Iterator[Tuple[str, List[_ResourceValue]]]:
+        current_resource_name: Optional[str] = None
+        current_values: List[_ResourceValue] = []
+        for line in lines:
+            line = line.rstrip("\r\n")
+            if cls._is_resource_name_line(line):
+                if current_resource_name is not None:
+                    yield current_resource_name, current_values
                 current_resource_name = line.split(" - ")[-1]
-            else:
+                current_values = []
+            elif current_resource_name is not None:
                 try:
-                    value = _ResourceValue.from_bundletool_output(line)
-                    all_values[current_resource_name].append(value)
+                    current_values.append(_ResourceValue.from_bundletool_output(line))
                 except ValueError:
                     pass
-        return cast(dict, all_values)
+        if current_resource_name is not None:
+            yield current_resource_name, current_values
+
+    def _parse_all_values(self) -> Dict[str, List[_ResourceValue]]:
+        return dict(self._iter_resources(self._dump_output.splitlines()))
 
     @classmethod
     def _choose_default_values(cls, all_values: Dict[str, List[_ResourceValue]]) -> Dict[str, str]:
@@ -95,8 +166,29 @@ class AppBundleResources:
 
     @cached_property
     def _values(self) -> Dict[str, str]:
+        if self._parsed_values is not None:
+            return self._parsed_values
         all_values = self._parse_all_values()
         return self._choose_default_values(all_values)
 
     def get_resource(self, resource_name: str) -> Optional[str]:
-        return self._values.get(resource_name)
+        if self._resource_table is None:
+            return self._values.get(resource_name)
+
+        resource_values = [_ResourceValue(*v) for v in self._resource_table.get_values(resource_name)]
+        return self._choose_default_values({resource_name: resource_values}).get(resource_name)
+
+    def get_resolved_resource(self, resource_name: str) -> Optional[str]:
+        """
+        Get resource value and follow references to other resources of the
+        package until a value that is not a resolvable reference is found
+        """
+        value = self.get_resource(resource_name)
+        seen_resource_names = {resource_name}
+        while value is not None and value.startswith("@") and value[1:] not in seen_resource_names:
+            seen_resource_names.add(value[1:])
+            referred_value = self.get_resource(value[1:])
+            if referred_value is None:
+                break
+            value = referred_value
+        return value
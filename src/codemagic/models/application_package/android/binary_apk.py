@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import pathlib
+import re
+import zipfile
+from functools import cached_property
+from typing import List
+from typing import Optional
+
+from cryptography import x509
+from cryptography.hazmat.primitives.serialization import Encoding
+from cryptography.hazmat.primitives.serialization.pkcs7 import load_der_pkcs7_certificates
+
+from ..zip_archive import ZipArchive
+from .android_manifest import AndroidManifest
+from .apk_signing_block import read_signing_certificate
+from .binary_resource_table import BinaryResourceTable
+from .binary_xml import decode_binary_xml
+from .binary_xml import get_reference_id
+from .binary_xml import is_reference
+
+
+class BinaryApk:
+    """
+    Read APK details from binary `AndroidManifest.xml`, `resources.arsc` and signatures
+    using built-in decoders. Only the archive members that are needed are read. Implements
+    the subset of `androguard.core.apk.APK` interface that is used by `ApkPackage`.
+    """
+
+    MANIFEST_PATH = "AndroidManifest.xml"
+    RESOURCE_TABLE_PATH = "resources.arsc"
+    # Signatures for APK Signature Scheme v1 are stored in ./META-INF/<signature-name>.(RSA|EC|DSA)
+    V1_SIGNATURE_PATTERN = re.compile(r"META-INF/[^/]+\.(RSA|EC|DSA)")
+    MAX_REFERENCE_DEPTH = 10
+
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+        self._archive = ZipArchive(path)
+        try:
+            self._manifest = AndroidManifest.from_element(decode_binary_xml(self._read_manifest()))
+        except Exception:
+            self._archive.close()
+            raise
+
+    def _read_manifest(self) -> bytes:
+        try:
+            return self._archive.read(self.MANIFEST_PATH)
+        except KeyError as error:
+            raise ValueError(f"{self.MANIFEST_PATH} is missing from {self.path}") from error
+
+    def close(self):
+        self._archive.close()
+
+    @cached_property
+    def _resources(self) -> Optional[BinaryResourceTable]:
+        try:
+            return BinaryResourceTable(self._archive.read(self.RESOURCE_TABLE_PATH))
+        except KeyError:
+            return None
+
+    def _resolve(self, value: str) -> str:
+        for _ in range(self.MAX_REFERENCE_DEPTH):
+            if not is_reference(value) or self._resources is None:
+                break
+            resolved_value = self._resources.get_value(get_reference_id(value))
+            if resolved_value is None:
+                break
+            value = resolved_value
+        return value
+
+    def is_valid_APK(self) -> bool:  # noqa: N802
+        return bool(self.get_package())
+
+    def get_package(self) -> str:
+        return self._manifest.package_name
+
+    def get_app_name(self) -> str:
+        return self._resolve(self._manifest.app_label)
+
+    def get_min_sdk_version(self) -> str:
+        return self._resolve(self._manifest.min_sdk_version)
+
+    def get_androidversion_name(self) -> str:
+        return self._resolve(self._manifest.version_name)
+
+    def get_androidversion_code(self) -> str:
+        return self._manifest.version_code
+
+    def get_attribute_value(self, tag_name: str, attribute_name: str) -> str:
+        return self._resolve(self._manifest.get_tag_attribute_value(tag_name, attribute_name))
+
+    def _get_v1_signing_certificate(self) -> Optional[bytes]:
+        signature = self._archive.find(self.V1_SIGNATURE_PATTERN)
+        if signature is None:
+            return None
+        certificates: List[x509.Certificate] = load_der_pkcs7_certificates(self._archive.read(signature))
+        return certificates[0].public_bytes(Encoding.DER) if certificates else None
+
+    def get_certificate_der(self) -> Optional[bytes]:
+        """
+        Get DER encoded signing certificate from APK Signature Scheme v3 or v2
+        signing block, or from v1 JAR signature if the former are not available
+        or the signing block cannot be read
+        """
+        signing_block_error: Optional[ValueError] = None
+        with self.path.open("rb") as fd:
+            try:
+                certificate = read_signing_certificate(fd)
+            except ValueError as error:
+                signing_block_error = error
+                certificate = None
+        if certificate is None:
+            try:
+                certificate = self._get_v1_signing_certificate()
+            except zipfile.BadZipFile as error:
+                raise ValueError(f"Failed to read APK v1 signature from {self.path}") from error
+        if certificate is None and signing_block_error:
+            raise ValueError(f"Failed to read APK signing block from {self.path}") from signing_block_error
+        return certificate
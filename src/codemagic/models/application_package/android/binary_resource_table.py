@@ -0,0 +1,162 @@
+"""
+Decoder for compiled Android resource table `resources.arsc` from APK.
+Chunk structures are defined in Android framework `ResourceTypes.h`:
+https://android.googlesource.com/platform/frameworks/base/+/refs/heads/main/libs/androidfw/include/androidfw/ResourceTypes.h
+"""
+
+from __future__ import annotations
+
+import struct
+from collections import defaultdict
+from typing import DefaultDict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from .binary_xml import CHUNK_HEADER
+from .binary_xml import NO_INDEX
+from .binary_xml import RES_STRING_POOL_TYPE
+from .binary_xml import RES_TABLE_TYPE
+from .binary_xml import StringPool
+from .binary_xml import format_value
+from .binary_xml import iter_chunks
+
+RES_TABLE_PACKAGE_TYPE = 0x0200
+RES_TABLE_TYPE_TYPE = 0x0201
+
+# ResTable_type flags
+FLAG_SPARSE = 0x01
+FLAG_OFFSET16 = 0x02
+
+# ResTable_entry flags
+FLAG_COMPLEX = 0x0001
+FLAG_COMPACT = 0x0008
+
+
+class _TypeChunk:
+    HEADER = struct.Struct("<BBHLL")
+
+    def __init__(self, data: memoryview, chunk_start: int, header_size: int):
+        self.data = data
+        self.chunk_start = chunk_start
+        self.entries_index_start = chunk_start + header_size
+        self.type_id, self.flags, _reserved, self.entry_count, self.entries_start = self.HEADER.unpack_from(
+            data,
+            chunk_start + CHUNK_HEADER.size,
+        )
+        # ResTable_config starts with its size, followed by MCC, MNC, language and country codes
+        config_start = chunk_start + CHUNK_HEADER.size + self.HEADER.size
+        (config_size,) = struct.unpack_from("<L", data, config_start)
+        config = bytes(data[config_start + 4 : config_start + config_size])
+        self.is_default = not any(config)
+        self.locale = self._get_locale(config[4:8]) if len(config) >= 8 else ""
+
+    @classmethod
+    def _get_locale(cls, locale: bytes) -> str:
+        language = locale[:2].rstrip(b"\x00").decode("ascii", errors="replace")
+        country = locale[2:4].rstrip(b"\x00").decode("ascii", errors="replace")
+        if language and country:
+            return f"{language}-r{country}"
+        return language
+
+    def get_entry_offset(self, entry_index: int) -> Optional[int]:
+        if self.flags & FLAG_SPARSE:
+            # Sorted (entry index, offset / 4) pairs for present entries
+            low, high = 0, self.entry_count
+            while low < high:
+                middle = (low + high) // 2
+                index, offset = struct.unpack_from("<HH", self.data, self.entries_index_start + 4 * middle)
+                if index == entry_index:
+                    return self.chunk_start + self.entries_start + 4 * offset
+                elif index < entry_index:
+                    low = middle + 1
+                else:
+                    high = middle
+            return None
+        elif entry_index >= self.entry_count:
+            return None
+        elif self.flags & FLAG_OFFSET16:
+            (offset,) = struct.unpack_from("<H", self.data, self.entries_index_start + 2 * entry_index)
+            return None if offset == 0xFFFF else self.chunk_start + self.entries_start + 4 * offset
+        (offset,) = struct.unpack_from("<L", self.data, self.entries_index_start + 4 * entry_index)
+        return None if offset == NO_INDEX else self.chunk_start + self.entries_start + offset
+
+
+class BinaryResourceTable:
+    """
+    Lookup for resource values by resource ID from `resources.arsc`. Only chunk headers
+    are read when the table is loaded, entries are decoded once they are looked up.
+    """
+
+    def __init__(self, data: Union[bytes, memoryview]):
+        self._data = memoryview(data)
+        self._string_pool: Optional[StringPool] = None
+        self._type_chunks: DefaultDict[Tuple[int, int], List[_TypeChunk]] = defaultdict(list)
+        try:
+            self._index()
+        except (struct.error, IndexError) as error:
+            raise ValueError(f"Invalid resource table: {error}") from error
+
+    def _index(self):
+        if len(self._data) < CHUNK_HEADER.size:
+            raise ValueError("Not a resource table")
+        chunk_type, header_size, size = CHUNK_HEADER.unpack_from(self._data, 0)
+        if chunk_type != RES_TABLE_TYPE or size > len(self._data):
+            raise ValueError("Not a resource table")
+
+        for chunk_type, chunk_header_size, chunk_start, chunk_end in iter_chunks(self._data, header_size, size):
+            if chunk_type == RES_STRING_POOL_TYPE:
+                self._string_pool = StringPool(self._data, chunk_start, chunk_end)
+            elif chunk_type == RES_TABLE_PACKAGE_TYPE:
+                self._index_package(chunk_header_size, chunk_start, chunk_end)
+
+    def _index_package(self, header_size: int, chunk_start: int, chunk_end: int):
+        (package_id,) = struct.unpack_from("<L", self._data, chunk_start + CHUNK_HEADER.size)
+        for chunk_type, chunk_header_size, type_start, _type_end in iter_chunks(
+            self._data,
+            chunk_start + header_size,
+            chunk_end,
+        ):
+            if chunk_type == RES_TABLE_TYPE_TYPE:
+                type_chunk = _TypeChunk(self._data, type_start, chunk_header_size)
+                self._type_chunks[(package_id, type_chunk.type_id)].append(type_chunk)
+
+    def _decode_entry(self, entry_offset: int) -> Tuple[str, str]:
+        size, flags = struct.unpack_from("<HH", self._data, entry_offset)
+        if flags & FLAG_COMPACT:
+            # Compact entries hold the value type in high byte of flags and value data in place of key index
+            (data,) = struct.unpack_from("<L", self._data, entry_offset + 4)
+            return format_value(flags >> 8, data, self._string_pool)
+        elif flags & FLAG_COMPLEX:
+            return "COMPLEX", ""
+        _value_size, _res0, data_type, data = struct.unpack_from("<HBBL", self._data, entry_offset + size)
+        return format_value(data_type, data, self._string_pool)
+
+    def get_values(self, resource_id: int) -> List[Tuple[str, str, str]]:
+        """
+        Get (locale, value type, value) tuples for all configurations of given resource
+        """
+        package_id, type_id, entry_index = resource_id >> 24, (resource_id >> 16) & 0xFF, resource_id & 0xFFFF
+        values = []
+        try:
+            for type_chunk in self._type_chunks.get((package_id, type_id), []):
+                entry_offset = type_chunk.get_entry_offset(entry_index)
+                if entry_offset is None:
+                    continue
+                locale = "default" if type_chunk.is_default else type_chunk.locale or "qualified"
+                values.append((locale, *self._decode_entry(entry_offset)))
+        except (struct.error, IndexError) as error:
+            raise ValueError(f"Invalid resource 0x{resource_id:08x}: {error}") from error
+        return values
+
+    def get_value(self, resource_id: int) -> Optional[str]:
+        """
+        Get resource value for default configuration, or for the first available
+        configuration if the resource does not have a default value
+        """
+        values = self.get_values(resource_id)
+        if not values:
+            return None
+        _locale, _value_type, value = next((v for v in values if v[0] == "default"), values[0])
+        return value
@@ -0,0 +1,259 @@
+"""
+Decoder for Android binary XML files, such as `AndroidManifest.xml` from APK.
+Chunk structures are defined in Android framework `ResourceTypes.h`:
+https://android.googlesource.com/platform/frameworks/base/+/refs/heads/main/libs/androidfw/include/androidfw/ResourceTypes.h
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+from xml.etree.ElementTree import Element
+
+CHUNK_HEADER = struct.Struct("<HHL")
+
+RES_STRING_POOL_TYPE = 0x0001
+RES_TABLE_TYPE = 0x0002
+RES_XML_TYPE = 0x0003
+RES_XML_START_NAMESPACE_TYPE = 0x0100
+RES_XML_END_NAMESPACE_TYPE = 0x0101
+RES_XML_START_ELEMENT_TYPE = 0x0102
+RES_XML_END_ELEMENT_TYPE = 0x0103
+RES_XML_CDATA_TYPE = 0x0104
+RES_XML_RESOURCE_MAP_TYPE = 0x0180
+
+NO_INDEX = 0xFFFFFFFF
+
+# Res_value data types
+TYPE_NULL = 0x00
+TYPE_REFERENCE = 0x01
+TYPE_ATTRIBUTE = 0x02
+TYPE_STRING = 0x03
+TYPE_FLOAT = 0x04
+TYPE_DIMENSION = 0x05
+TYPE_FRACTION = 0x06
+TYPE_INT_DEC = 0x10
+TYPE_INT_HEX = 0x11
+TYPE_INT_BOOLEAN = 0x12
+TYPE_FIRST_COLOR_INT = 0x1C
+TYPE_LAST_COLOR_INT = 0x1F
+
+# Names for framework attributes that are used by `AndroidManifest` in case
+# attribute names are stripped from the string pool by obfuscation tools
+ANDROID_ATTRIBUTE_NAMES = {
+    0x01010001: "label",
+    0x01010003: "name",
+    0x0101000F: "debuggable",
+    0x0101020C: "minSdkVersion",
+    0x0101021B: "versionCode",
+    0x0101021C: "versionName",
+    0x01010270: "targetSdkVersion",
+}
+
+
+def iter_chunks(data: memoryview, start: int, end: int) -> Iterator[Tuple[int, int, int, int]]:
+    """
+    Yield (chunk type, header size, chunk start, chunk end) for consecutive chunks in given range
+    """
+    position = start
+    while position + CHUNK_HEADER.size <= end:
+        chunk_type, header_size, chunk_size = CHUNK_HEADER.unpack_from(data, position)
+        if chunk_size < CHUNK_HEADER.size or position + chunk_size > end:
+            raise ValueError(f"Invalid resource chunk size {chunk_size} at offset {position}")
+        yield chunk_type, header_size, position, position + chunk_size
+        position += chunk_size
+
+
+class StringPool:
+    """
+    ResStringPool chunk. Strings are decoded when they are first accessed.
+    """
+
+    HEADER = struct.Struct("<LLLLL")
+    UTF8_FLAG = 1 << 8
+
+    def __init__(self, data: memoryview, chunk_start: int, chunk_end: int):
+        string_count, _style_count, flags, strings_start, _styles_start = self.HEADER.unpack_from(
+            data,
+            chunk_start + CHUNK_HEADER.size,
+        )
+        _chunk_type, header_size, _chunk_size = CHUNK_HEADER.unpack_from(data, chunk_start)
+        offsets_start = chunk_start + header_size
+        self._data = data
+        self._offsets = struct.unpack_from(f"<{string_count}L", data, offsets_start)
+        self._strings_start = chunk_start + strings_start
+        self._chunk_end = chunk_end
+        self._is_utf8 = bool(flags & self.UTF8_FLAG)
+        self._strings: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def _decode_utf8(self, position: int) -> str:
+        # UTF-8 strings are prefixed by their length in UTF-16 code units and then in bytes
+        for _ in range(2):
+            length = self._data[position]
+            position += 1
+            if length & 0x80:
+                length = (length & 0x7F) << 8 | self._data[position]
+                position += 1
+        return str(self._data[position : position + length], "utf-8", errors="replace")
+
+    def _decode_utf16(self, position: int) -> str:
+        (length,) = struct.unpack_from("<H", self._data, position)
+        position += 2
+        if length & 0x8000:
+            (low_bits,) = struct.unpack_from("<H", self._data, position)
+            length = (length & 0x7FFF) << 16 | low_bits
+            position += 2
+        return str(self._data[position : position + 2 * length], "utf-16-le", errors="replace")
+
+    def get(self, index: int) -> str:
+        if index == NO_INDEX:
+            return ""
+        if index not in self._strings:
+            position = self._strings_start + self._offsets[index]
+            if position >= self._chunk_end:
+                raise ValueError(f"String {index} is out of string pool bounds")
+            decode = self._decode_utf8 if self._is_utf8 else self._decode_utf16
+            self._strings[index] = decode(position)
+        return self._strings[index]
+
+
+def format_value(data_type: int, data: int, string_pool: Optional[StringPool]) -> Tuple[str, str]:
+    """
+    Get type and textual value for Res_value structure
+    """
+    if data_type == TYPE_NULL:
+        return "NULL", "@null" if data == 0 else ""
+    elif data_type == TYPE_REFERENCE:
+        return "REF", f"@0x{data:08x}"
+    elif data_type == TYPE_ATTRIBUTE:
+        return "ATTR", f"?0x{data:08x}"
+    elif data_type == TYPE_STRING:
+        return "STR", string_pool.get(data) if string_pool is not None else ""
+    elif data_type == TYPE_FLOAT:
+        return "FLOAT", repr(struct.unpack("<f", struct.pack("<L", data))[0])
+    elif data_type == TYPE_INT_DEC:
+        return "INT_DEC", str(data - 2**32 if data >= 2**31 else data)
+    elif data_type == TYPE_INT_HEX:
+        return "INT_HEX", f"0x{data:08x}"
+    elif data_type == TYPE_INT_BOOLEAN:
+        return "BOOL", "true" if data else "false"
+    elif TYPE_FIRST_COLOR_INT <= data_type <= TYPE_LAST_COLOR_INT:
+        return "COLOR", f"#{data:08x}"
+    elif data_type in (TYPE_DIMENSION, TYPE_FRACTION):
+        return "COMPLEX", f"0x{data:08x}"
+    return "UNKNOWN", f"0x{data:08x}"
+
+
+def is_reference(value: str) -> bool:
+    return value.startswith("@0x")
+
+
+def get_reference_id(reference: str) -> int:
+    return int(reference[3:], 16)
+
+
+class _BinaryXmlDecoder:
+    NODE_HEADER = struct.Struct("<LL")
+    ELEMENT_HEADER = struct.Struct("<LLHHHHHH")
+    ATTRIBUTE = struct.Struct("<LLLHBBL")
+
+    def __init__(self, data: memoryview):
+        self._data = data
+        self._string_pool: Optional[StringPool] = None
+        self._resource_ids: Tuple[int, ...] = ()
+        self._root: Optional[Element] = None
+        self._elements: List[Element] = []
+
+    def _get_string(self, index: int) -> str:
+        if self._string_pool is None:
+            raise ValueError("Binary XML string pool is missing")
+        return self._string_pool.get(index)
+
+    def _get_name(self, namespace_index: int, name_index: int) -> str:
+        name = self._get_string(name_index)
+        if not name and name_index < len(self._resource_ids):
+            name = ANDROID_ATTRIBUTE_NAMES.get(self._resource_ids[name_index], "")
+        if namespace_index == NO_INDEX:
+            return name
+        return f"{{{self._get_string(namespace_index)}}}{name}"
+
+    def _start_element(self, chunk_start: int, header_size: int):
+        extension_start = chunk_start + header_size
+        namespace, name, attributes_start, attribute_size, attribute_count, *_ = self.ELEMENT_HEADER.unpack_from(
+            self._data,
+            extension_start,
+        )
+        element = Element(self._get_name(namespace, name))
+        for i in range(attribute_count):
+            attribute_offset = extension_start + attributes_start + i * attribute_size
+            attribute = self.ATTRIBUTE.unpack_from(self._data, attribute_offset)
+            attribute_namespace, attribute_name, raw_value, _size, _res0, data_type, data = attribute
+            if raw_value != NO_INDEX:
+                value = self._get_string(raw_value)
+            else:
+                _value_type, value = format_value(data_type, data, self._string_pool)
+            element.set(self._get_name(attribute_namespace, attribute_name), value)
+
+        if self._elements:
+            self._elements[-1].append(element)
+        elif self._root is None:
+            self._root = element
+        else:
+            raise ValueError("Binary XML has multiple root elements")
+        self._elements.append(element)
+
+    def _add_text(self, chunk_start: int, header_size: int):
+        (text_index,) = struct.unpack_from("<L", self._data, chunk_start + header_size)
+        if not self._elements:
+            return
+        element = self._elements[-1]
+        if len(element):
+            element[-1].tail = (element[-1].tail or "") + self._get_string(text_index)
+        else:
+            element.text = (element.text or "") + self._get_string(text_index)
+
+    def decode(self) -> Element:
+        if len(self._data) < CHUNK_HEADER.size:
+            raise ValueError("Not a binary XML file")
+        chunk_type, header_size, size = CHUNK_HEADER.unpack_from(self._data, 0)
+        if chunk_type != RES_XML_TYPE or size > len(self._data):
+            raise ValueError("Not a binary XML file")
+
+        for chunk_type, chunk_header_size, chunk_start, chunk_end in iter_chunks(self._data, header_size, size):
+            if chunk_type == RES_STRING_POOL_TYPE:
+                self._string_pool = StringPool(self._data, chunk_start, chunk_end)
+            elif chunk_type == RES_XML_RESOURCE_MAP_TYPE:
+                count = (chunk_end - chunk_start - chunk_header_size) // 4
+                self._resource_ids = struct.unpack_from(f"<{count}L", self._data, chunk_start + chunk_header_size)
+            elif chunk_type == RES_XML_START_ELEMENT_TYPE:
+                self._start_element(chunk_start, chunk_header_size)
+            elif chunk_type == RES_XML_END_ELEMENT_TYPE:
+                if not self._elements:
+                    raise ValueError("Unexpected end of binary XML element")
+                self._elements.pop()
+            elif chunk_type == RES_XML_CDATA_TYPE:
+                self._add_text(chunk_start, chunk_header_size)
+
+        if self._root is None:
+            raise ValueError("Binary XML does not contain elements")
+        return self._root
+
+
+def decode_binary_xml(data: Union[bytes, memoryview]) -> Element:
+    """
+    Convert Android binary XML document to an XML element. Attribute values are
+    taken in their raw string form if it is available, otherwise typed value is
+    formatted. References to resources are formatted as `@0x<resource id>`.
+    """
+    try:
+        return _BinaryXmlDecoder(memoryview(data)).decode()
+    except (struct.error, IndexError) as error:
+        raise ValueError(f"Invalid binary XML: {error}") from error
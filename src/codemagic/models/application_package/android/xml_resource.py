@@ -1,13 +1,25 @@
+from __future__ import annotations
+
 from typing import AnyStr
 from typing import Optional
+from typing import Type
+from typing import TypeVar
 from xml.etree import ElementTree
 from xml.etree.ElementTree import Element
 
+XmlResourceT = TypeVar("XmlResourceT", bound="XmlResource")
+
 
 class XmlResource:
     def __init__(self, xml: AnyStr):
         self._et = ElementTree.fromstring(xml)
 
+    @classmethod
+    def from_element(cls: Type[XmlResourceT], element: Element) -> XmlResourceT:
+        resource = cls.__new__(cls)
+        resource._et = element
+        return resource
+
     @classmethod
     def _get_attribute_value(cls, element, attribute_name, *, default: str = "") -> str:
         for attribute, value in element.attrib.items():
@@ -22,3 +34,9 @@ class XmlResource:
 
     def _find_tag(self, tag_name) -> Optional[Element]:
         return next(self._iter_tags(tag_name), None)
+
+    def get_tag_attribute_value(self, tag_name: str, attribute_name: str) -> str:
+        tag = self._find_tag(tag_name)
+        if tag is None:
+            return ""
+        return self._get_attribute_value(tag, attribute_name)
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import pathlib
+import zipfile
 from functools import cached_property
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import AnyStr
 from typing import Dict
 from typing import Optional
+from typing import Tuple
+from typing import Union
 
 from cryptography import x509
 from cryptography.x509 import load_der_x509_certificate
@@ -13,6 +17,7 @@ from cryptography.x509 import load_der_x509_certificate
 from codemagic.utilities.decorators import run_once
 
 from .abstract_package import AbstractPackage
+from .android.binary_apk import BinaryApk
 
 if TYPE_CHECKING:
     from androguard.core.apk import APK
@@ -49,6 +54,19 @@ def _get_androguard_apk(apk_path: pathlib.Path) -> APK:
 
 
 class ApkPackage(AbstractPackage):
+    """
+    Android application package. Package details are read using built-in decoders for
+    binary Android resources and APK signatures. Androguard is used only if the built-in
+    decoders fail to read the package, or if it is explicitly requested.
+    """
+
+    def __init__(self, path: Union[pathlib.Path, AnyStr], use_androguard: bool = False):
+        self._use_androguard = use_androguard
+        super().__init__(path)
+
+    def _get_state_attributes(self) -> Tuple[str, ...]:
+        return (*super()._get_state_attributes(), "_use_androguard")
+
     def _validate_package(self):
         try:
             _ = self._apk
@@ -60,17 +78,50 @@ class ApkPackage(AbstractPackage):
             raise IOError(f"Not a valid APK at {self.path}")
 
     @cached_property
-    def _apk(self) -> "APK":
+    def _apk(self) -> Union[APK, BinaryApk]:
+        if not self._use_androguard:
+            try:
+                return BinaryApk(self.path)
+            except zipfile.BadZipFile as error:
+                raise ValueError(f"Not a zip archive at {self.path}") from error
+            except ValueError as error:
+                self._logger.debug("Failed to read %s using built-in decoders, use androguard: %s", self.path, error)
         return _get_androguard_apk(self.path)
 
+    def close(self):
+        """
+        Release the file handle that is shared for reading files from the package
+        """
+        # Package that was never read, for example one that was served from metadata cache, is not opened to close it
+        if isinstance(self.__dict__.get("_apk"), BinaryApk):
+            self._apk.close()
+
+    def _get_certificate_der(self) -> Optional[bytes]:
+        if not isinstance(self._apk, BinaryApk):
+            return self._get_androguard_certificate_der(self._apk)
+
+        try:
+            return self._apk.get_certificate_der()
+        except ValueError as error:
+            self._logger.debug(
+                "Failed to read %s signature using built-in decoders, use androguard: %s",
+                self.path,
+                error,
+            )
+        return self._get_androguard_certificate_der(_get_androguard_apk(self.path))
+
+    @classmethod
+    def _get_androguard_certificate_der(cls, apk: APK) -> Optional[bytes]:
+        certificate_name = apk.get_signature_name()
+        if certificate_name is None:
+            return None
+        return apk.get_certificate_der(certificate_name)
+
     @cached_property
     def certificate(self) -> Optional[Certificate]:
         from codemagic.models import Certificate
 
-        certificate_name = self._apk.get_signature_name()
-        if certificate_name is None:
-            return None
-        der_x509_certificate = self._apk.get_certificate_der(certificate_name)
+        der_x509_certificate = self._get_cached_bytes("certificate", self._get_certificate_der)
         if not der_x509_certificate:
             return None
         certificate: x509.Certificate = load_der_x509_certificate(der_x509_certificate)
@@ -112,7 +163,7 @@ class ApkPackage(AbstractPackage):
         """
         return self.get_version_name() or self.get_version_code()
 
-    def get_summary(self) -> Dict[str, Any]:
+    def _get_summary(self) -> Dict[str, Any]:
         return {
             "app_name": self.get_app_name(),
             "package_name": self.get_package_name(),
@@ -1,15 +1,15 @@
 import pathlib
 import plistlib
-import shlex
-import shutil
-import subprocess
+import re
 import zipfile
+from functools import cached_property
 from functools import lru_cache
 from typing import Any
-from typing import Callable
+from typing import AnyStr
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Pattern
 from typing import Tuple
 from typing import Union
 
@@ -18,99 +18,82 @@ from codemagic.models.export_options import ArchiveMethod
 from codemagic.models.provisioning_profile import ProvisioningProfile
 
 from .abstract_package import AbstractPackage
+from .zip_archive import ZipArchive
 
 
 class Ipa(AbstractPackage):
-    def _validate_package(self):
-        try:
-            return bool(self.info_plist)
-        except (subprocess.CalledProcessError, zipfile.BadZipFile) as error:
-            raise IOError(f"Not a valid iOS application package at {self.path}") from error
+    def __init__(self, path: Union[pathlib.Path, AnyStr], use_mmap: bool = False):
+        self._use_mmap = use_mmap
+        super().__init__(path)
 
-    def _extract_file(self, filename_filter: Callable[[str], bool]) -> bytes:
-        with zipfile.ZipFile(self.path) as zf:
-            try:
-                found_file_name = next(filter(filename_filter, zf.namelist()))
-            except StopIteration:
-                raise FileNotFoundError(filename_filter.__name__, self.path)
+    def _get_state_attributes(self) -> Tuple[str, ...]:
+        return (*super()._get_state_attributes(), "_use_mmap")
 
-            try:
-                with zf.open(found_file_name, "r") as fd:
-                    return fd.read()
-            except zipfile.BadZipFile as e:
-                self._logger.error(f"Failed to extract {found_file_name!r} from {self.path!r}: {e}")
-                if str(e) in ("Truncated file header", "Bad magic number for file header"):
-                    # Those errors are known to be salvageable by either 7-zip or unzip
-                    return self._extract_file_fallback(found_file_name)
-                raise
+    @cached_property
+    def _archive(self) -> ZipArchive:
+        return ZipArchive(self.path, use_mmap=self._use_mmap)
 
-    def _extract_file_fallback(self, file_path_in_archive: Union[str, pathlib.Path]) -> bytes:
+    def close(self):
         """
-        Attempt to extract file from ipa
-        1. If the archive size exceeds 4GB then macOS created "corrupt" zip files as it doesn't
-           use zip64 specification.
-        2. Big ipas are compressed using lzfse compression format which adds extra bytes to Info-Zip
-           Unfortunately Python's built-in zip library is not capable to handle those
-
-        7-Zip is capable of overcoming both cases while extracting such archives.
-        Let's try that as a first fallback if it is present. Otherwise, give it a shot with
-        basic UNIX `unzip`
+        Release the file handle that is shared for reading files from the package
         """
+        if "_archive" in self.__dict__:
+            self._archive.close()
 
-        command_args: Tuple[Union[str, pathlib.Path], ...]
-        if shutil.which("7z"):
-            command_args = ("7z", "x", "-so", self.path, file_path_in_archive)
-        else:
-            command_args = ("unzip", "-p", self.path, file_path_in_archive)
+    def _validate_package(self):
+        try:
+            return bool(self.info_plist)
+        except zipfile.BadZipFile as error:
+            raise IOError(f"Not a valid iOS application package at {self.path}") from error
 
-        command = " ".join(shlex.quote(str(arg)) for arg in command_args)
-        self._logger.debug(f"Running {command!r}")
+    def _extract_file(self, filename_pattern: Pattern[str]) -> bytes:
+        """
+        Read file contents from the package. Packages larger than 4GB that are created by
+        macOS do not use zip64 extensions and can contain padding between the files, in
+        which case the file is recovered from the archive by `ZipArchive`.
+        """
+        found_file = self._archive.find(filename_pattern)
+        if found_file is None:
+            raise FileNotFoundError(filename_pattern.pattern, self.path)
 
         try:
-            completed_process = subprocess.run(
-                command_args,
-                capture_output=True,
-                check=True,
-            )
-        except subprocess.CalledProcessError as cpe:
-            self._logger.error(f"Executing {command!r} failed with exit code {cpe.returncode}")
-            self._logger.error(f"STDERR: {cpe.stderr}")
-            self._logger.exception(f"Failed to extract {file_path_in_archive} from {self.path}")
-            raise IOError(f'Failed to extract "{file_path_in_archive}" from "{self.path}"')
-
-        self._logger.debug(f"Running {command!r} completed successfully with exit code {completed_process.returncode}")
-        return completed_process.stdout
+            return self._archive.read(found_file)
+        except zipfile.BadZipFile as e:
+            self._logger.error(f"Failed to extract {found_file.filename!r} from {self.path!r}: {e}")
+            raise IOError(f'Failed to extract "{found_file.filename}" from "{self.path}"') from e
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_app_file_pattern(filename: str) -> Pattern[str]:
+        return re.compile(rf"(?:.*/)?Payload/[^/]*\.app/{re.escape(filename)}")
 
     def _get_app_file_contents(self, filename: str) -> bytes:
         """
-        Return file descriptor for file in the zip container at ./Payload/<App-name>.app/<filename>
+        Return contents of the file in the zip container at ./Payload/<App-name>.app/<filename>
         """
-
-        def filename_filter(path_name):
-            return pathlib.Path(path_name).match(f"Payload/*.app/{filename}")
-
-        filename_filter.__name__ = f"Payload/*.app/{filename}"
-        return self._extract_file(filename_filter)
+        return self._extract_file(self._get_app_file_pattern(filename))
 
     def extract_app(self, target_directory: pathlib.Path) -> pathlib.Path:
-        with zipfile.ZipFile(self.path) as zf:
-            for zi in zf.filelist:
-                path = pathlib.Path(zi.filename)
-                try:
-                    p1, p2, *_rest = path.parts
-                except ValueError:
-                    continue
-                if p1 == "Payload" and p2.endswith(".app"):
-                    zf.extract(zi, path=target_directory)
-
+        app_members = []
+        for zi in self._archive.members:
+            path = pathlib.Path(zi.filename)
             try:
-                return next(pathlib.Path(target_directory).glob("Payload/*.app"))
-            except StopIteration:
-                raise IOError(f"Failed to extract Payload/*.app from {self.path}")
+                p1, p2, *_rest = path.parts
+            except ValueError:
+                continue
+            if p1 == "Payload" and p2.endswith(".app"):
+                app_members.append(zi)
+        self._archive.extract_all(app_members, target_directory)
+
+        try:
+            return next(pathlib.Path(target_directory).glob("Payload/*.app"))
+        except StopIteration:
+            raise IOError(f"Failed to extract Payload/*.app from {self.path}")
 
     @lru_cache(1)
     def _get_info_plist(self) -> Dict[str, Any]:
-        info_plist_contents = self._get_app_file_contents("Info.plist")
+        info_plist_contents = self._get_cached_bytes("info_plist", lambda: self._get_app_file_contents("Info.plist"))
+        assert info_plist_contents is not None
         return plistlib.loads(info_plist_contents)
 
     @property
@@ -118,12 +101,20 @@ class Ipa(AbstractPackage):
         # Mypy does not support decorated properties. Use cached getter to load the properties.
         return self._get_info_plist()
 
-    @lru_cache(1)
-    def _get_embedded_provisioning_profile(self) -> Optional[ProvisioningProfile]:
+    def _get_embedded_provisioning_profile_contents(self) -> Optional[bytes]:
         try:
-            embedded_mobileprovision_contents = self._get_app_file_contents("embedded.mobileprovision")
+            return self._get_app_file_contents("embedded.mobileprovision")
         except FileNotFoundError:
             return None
+
+    @lru_cache(1)
+    def _get_embedded_provisioning_profile(self) -> Optional[ProvisioningProfile]:
+        embedded_mobileprovision_contents = self._get_cached_bytes(
+            "embedded_provisioning_profile",
+            self._get_embedded_provisioning_profile_contents,
+        )
+        if embedded_mobileprovision_contents is None:
+            return None
         return ProvisioningProfile.from_content(embedded_mobileprovision_contents)
 
     @property
@@ -196,7 +187,7 @@ class Ipa(AbstractPackage):
     def provisions_all_devices(self) -> bool:
         return bool(self.embedded_provisioning_profile and self.embedded_provisioning_profile.provisions_all_devices)
 
-    def get_summary(self) -> Dict[str, Union[bool, Optional[str], List[str]]]:
+    def _get_summary(self) -> Dict[str, Union[bool, Optional[str], List[str]]]:
         certificate_expires = None
         if self.certificate:
             certificate_expires = self.certificate.expires_at.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "+0000"
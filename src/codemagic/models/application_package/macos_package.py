@@ -1,60 +1,33 @@
-import pathlib
-import shutil
-import subprocess
-import tempfile
 from functools import lru_cache
 from typing import Any
 from typing import Dict
-from typing import Sequence
-from typing import Union
 from xml.etree import ElementTree
 from xml.etree.ElementTree import Element
 
-from codemagic.mixins import RunningCliAppMixin
-
 from .abstract_package import AbstractPackage
+from .xar_archive import XarArchive
 
 
-class MacOsPackage(RunningCliAppMixin, AbstractPackage):
+class MacOsPackage(AbstractPackage):
     def _validate_package(self):
         try:
             return bool(self.package_info)
-        except (FileNotFoundError, IOError) as package_error:
+        except (FileNotFoundError, IOError, ValueError) as package_error:
             raise IOError(f"Not a valid macOS application package at {self.path}") from package_error
 
-    @classmethod
-    def _ensure_pkgutil(cls):
-        if shutil.which("pkgutil") is None:
-            raise IOError("pkgutil executable is not present on system")
-
-    def _run_pkgutil_command(self, command: Sequence[Union[str, pathlib.Path]]):
-        process = None
-        cli_app = self.get_current_cli_app()
-        try:
-            if cli_app:
-                process = cli_app.execute(command)
-                process.raise_for_returncode()
-            else:
-                subprocess.check_output(command, stderr=subprocess.PIPE)
-        except subprocess.CalledProcessError:
-            raise IOError("Processing package failed", process)
-
     def _extract_file(self, filename_pattern: str) -> bytes:
-        self._ensure_pkgutil()
-        with tempfile.TemporaryDirectory() as td:
-            expanded_package_path = pathlib.Path(td, "pkg")
-            extract_args = ("pkgutil", "--expand", self.path, expanded_package_path)
-            self._run_pkgutil_command(extract_args)
-
-            try:
-                file_path = next(expanded_package_path.glob(filename_pattern))
-            except StopIteration:
+        # Installer packages are xar archives. Only the table of contents and the requested
+        # file are read from the archive instead of expanding the whole package.
+        with XarArchive(self.path) as xar_archive:
+            member = xar_archive.find(filename_pattern)
+            if member is None:
                 raise FileNotFoundError(filename_pattern, self.path)
-            return file_path.read_bytes()
+            return xar_archive.read(member)
 
     @lru_cache(1)
     def _get_package_info(self) -> Element:
-        package_info_contents = self._extract_file("*.pkg/PackageInfo")
+        package_info_contents = self._get_cached_bytes("package_info", lambda: self._extract_file("*.pkg/PackageInfo"))
+        assert package_info_contents is not None
         return ElementTree.fromstring(package_info_contents)
 
     @lru_cache()
@@ -97,7 +70,7 @@ class MacOsPackage(RunningCliAppMixin, AbstractPackage):
     def version_code(self) -> str:
         return self._bundle.attrib.get("CFBundleVersion") or self.package_info.attrib.get("format-version") or ""
 
-    def get_summary(self) -> Dict[str, Any]:
+    def _get_summary(self) -> Dict[str, Any]:
         return {
             "bundle_identifier": self.bundle_identifier,
             "install_size": self.install_size,
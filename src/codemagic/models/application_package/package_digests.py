@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import mmap
+import pathlib
+import threading
+from typing import Dict
+from typing import Tuple
+
+# Resolved path, size and modification time of the digested file
+FileIdentity = Tuple[str, int, int]
+
+DIGEST_CHUNK_SIZE = 1024 * 1024
+
+_digests: Dict[FileIdentity, PackageDigests] = {}
+_digests_lock = threading.Lock()
+
+
+@dataclasses.dataclass(frozen=True)
+class PackageDigests:
+    sha256: str
+    sha1: str
+    md5: str
+
+    def dict(self) -> Dict[str, str]:
+        return dataclasses.asdict(self)
+
+
+def _get_file_identity(path: pathlib.Path) -> FileIdentity:
+    stat = path.stat()
+    return str(path.resolve()), stat.st_size, stat.st_mtime_ns
+
+
+def _compute_digests(path: pathlib.Path, use_mmap: bool) -> PackageDigests:
+    sha256 = hashlib.sha256()
+    sha1 = hashlib.sha1()
+    md5 = hashlib.md5()
+
+    with path.open("rb") as fd:
+        if use_mmap and path.stat().st_size > 0:
+            with mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                view = memoryview(mapped_file)
+                try:
+                    for offset in range(0, len(view), DIGEST_CHUNK_SIZE):
+                        chunk = view[offset : offset + DIGEST_CHUNK_SIZE]
+                        sha256.update(chunk)
+                        sha1.update(chunk)
+                        md5.update(chunk)
+                        chunk.release()
+                finally:
+                    view.release()
+        else:
+            buffer = bytearray(DIGEST_CHUNK_SIZE)
+            view = memoryview(buffer)
+            while True:
+                read_size = fd.readinto(buffer)
+                if not read_size:
+                    break
+                sha256.update(view[:read_size])
+                sha1.update(view[:read_size])
+                md5.update(view[:read_size])
+
+    return PackageDigests(sha256=sha256.hexdigest(), sha1=sha1.hexdigest(), md5=md5.hexdigest())
+
+
+def get_digests(path: pathlib.Path, use_mmap: bool = False, refresh: bool = False) -> PackageDigests:
+    """
+    Compute SHA-256, SHA-1 and MD5 digests of the file in a single pass over its contents.
+    Digests are memoized for the lifetime of the process by file path, size and modification
+    time, so that the same file is not read again unless it has been changed on disk.
+    Use `refresh` to recompute memoized digests when the file contents must be verified.
+    """
+    identity = _get_file_identity(path)
+    with _digests_lock:
+        if identity in _digests and not refresh:
+            return _digests[identity]
+
+    digests = _compute_digests(path, use_mmap)
+    with _digests_lock:
+        # Discard digests of the file that were computed before it was modified
+        for stale_identity in [i for i in _digests if i[0] == identity[0]]:
+            del _digests[stale_identity]
+        _digests[identity] = digests
+    return digests
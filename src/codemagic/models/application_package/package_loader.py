@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import multiprocessing
+import pathlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from logging.handlers import QueueListener
+from typing import Callable
+from typing import Generic
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Type
+from typing import TypeVar
+
+from codemagic.utilities import log
+
+from .abstract_package import AbstractPackage
+
+P = TypeVar("P", bound=AbstractPackage)
+
+
+@dataclass
+class PackageLoadResult(Generic[P]):
+    path: pathlib.Path
+    package: Optional[P] = None
+    error: Optional[Exception] = None
+
+
+def _load_package(package_type: Type[P], path: pathlib.Path) -> Tuple[Optional[P], Optional[Exception]]:
+    # Packages are validated on initialization, and invalid packages fail loading altogether
+    # Packages are closed once summarized, and are opened again if their contents are accessed later
+    with package_type(path) as package:
+        try:
+            package.get_summary()
+        except Exception as error:
+            return None, error
+    return package, None
+
+
+class PackageLoader(Generic[P]):
+    """
+    Validate and summarize application packages, optionally in parallel using a pool of
+    worker processes. Packages are returned in the same order as the paths were given. Errors
+    from validating the packages are raised, while packages whose summary cannot be
+    read are reported using the error of the respective result.
+
+    Packages are loaded in the current process unless more than one worker is requested.
+    Worker processes are spawned instead of forked, as forking a process that writes
+    its log file from a background thread would lose the log records of the workers.
+    Log records of the workers are written to the log file of the current process.
+    """
+
+    def __init__(self, get_package_type: Callable[[pathlib.Path], Type[P]], max_workers: Optional[int] = None):
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("Package loader needs at least one worker")
+        self._get_package_type = get_package_type
+        self._max_workers = max_workers
+        self._logger = log.get_file_logger(self.__class__)
+
+    def _get_worker_count(self, package_count: int) -> int:
+        max_workers = self._max_workers or 1
+        return max(1, min(max_workers, package_count))
+
+    def load(self, paths: Sequence[pathlib.Path]) -> List[PackageLoadResult[P]]:
+        # Package types are resolved beforehand so that unsupported paths fail fast
+        package_types = [self._get_package_type(path) for path in paths]
+        worker_count = self._get_worker_count(len(paths))
+
+        if worker_count == 1:
+            loaded_packages = [_load_package(package_type, path) for package_type, path in zip(package_types, paths)]
+        else:
+            self._logger.debug("Load %d packages using %d worker processes", len(paths), worker_count)
+            loaded_packages = self._load_in_worker_processes(package_types, paths, worker_count)
+
+        return [
+            PackageLoadResult(path=path, package=package, error=error)
+            for path, (package, error) in zip(paths, loaded_packages)
+        ]
+
+    @classmethod
+    def _load_in_worker_processes(
+        cls,
+        package_types: Sequence[Type[P]],
+        paths: Sequence[pathlib.Path],
+        worker_count: int,
+    ) -> List[Tuple[Optional[P], Optional[Exception]]]:
+        context = multiprocessing.get_context("spawn")
+        worker_log_queue = context.Queue()
+        worker_log_listener = QueueListener(worker_log_queue, log.LogHandlers.get_file_handler())
+        worker_log_listener.start()
+        try:
+            with ProcessPoolExecutor(
+                max_workers=worker_count,
+                mp_context=context,
+                initializer=log.LogHandlers.configure_worker_file_handler,
+                initargs=(worker_log_queue,),
+            ) as executor:
+                futures = [executor.submit(_load_package, t, p) for t, p in zip(package_types, paths)]
+                return [future.result() for future in futures]
+        finally:
+            worker_log_listener.stop()
+            worker_log_queue.close()
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pathlib
+import tempfile
+from typing import Any
+from typing import ClassVar
+from typing import Dict
+from typing import Optional
+
+from codemagic.__version__ import __version__
+from codemagic.utilities import log
+from codemagic.utilities.private_files import ensure_private_directory
+from codemagic.utilities.private_files import write_private_file
+
+from .package_digests import get_digests
+
+
+class PackageMetadataCache:
+    """
+    Stores metadata that is read from application packages on disk so that repeated
+    inspections of the same package do not need to parse the package archive again.
+    Cache entries are keyed by package path, size and modification time, and can
+    optionally be verified against the SHA-256 hash of the package contents.
+
+    Cache is enabled by setting environment variable `CODEMAGIC_PACKAGE_METADATA_CACHE`
+    to `true`. Content hash verification is enabled by additionally setting
+    `CODEMAGIC_PACKAGE_METADATA_CACHE_VERIFY_CONTENT` to `true`.
+
+    Cached metadata is trusted without validating the package, so the cache directory
+    is accessible only to the current user and directories owned by others are not used.
+    """
+
+    DEFAULT_DIRECTORY: ClassVar[pathlib.Path] = (
+        pathlib.Path(tempfile.gettempdir()) / ".codemagic-cli-tools" / "cache" / "application_packages"
+    )
+    ENABLE_ENVIRONMENT_VARIABLE: ClassVar[str] = "CODEMAGIC_PACKAGE_METADATA_CACHE"
+    VERIFY_CONTENT_ENVIRONMENT_VARIABLE: ClassVar[str] = "CODEMAGIC_PACKAGE_METADATA_CACHE_VERIFY_CONTENT"
+
+    def __init__(self, directory: Optional[pathlib.Path] = None, verify_content_hash: bool = False):
+        self._directory = directory or self.DEFAULT_DIRECTORY
+        self.verify_content_hash = verify_content_hash
+        self._content_hashes: Dict[pathlib.Path, str] = {}
+        self._logger = log.get_file_logger(self.__class__)
+
+    @classmethod
+    def from_environment(cls) -> Optional[PackageMetadataCache]:
+        def is_set(key: str) -> bool:
+            return os.environ.get(key, "").strip().lower() in ("1", "true", "yes")
+
+        if not is_set(cls.ENABLE_ENVIRONMENT_VARIABLE):
+            return None
+        return PackageMetadataCache(verify_content_hash=is_set(cls.VERIFY_CONTENT_ENVIRONMENT_VARIABLE))
+
+    @classmethod
+    def _get_identity(cls, package_type: str, package_path: pathlib.Path) -> Dict[str, Any]:
+        stat = package_path.stat()
+        return {
+            "package_type": package_type,
+            "path": str(package_path.resolve()),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "version": __version__,
+        }
+
+    def _get_cache_path(self, identity: Dict[str, Any]) -> pathlib.Path:
+        key = hashlib.sha256(json.dumps(identity, sort_keys=True).encode()).hexdigest()
+        return self._directory / f"{key}.json"
+
+    def _get_content_hash(self, package_path: pathlib.Path) -> str:
+        # Contents are digested once per cache instance as verification has to detect
+        # changes that keep the size and modification time of the package intact
+        if package_path not in self._content_hashes:
+            self._content_hashes[package_path] = get_digests(package_path, refresh=True).sha256
+        return self._content_hashes[package_path]
+
+    def load(self, package_type: str, package_path: pathlib.Path) -> Optional[Dict[str, Any]]:
+        try:
+            identity = self._get_identity(package_type, package_path)
+            cache_path = self._get_cache_path(identity)
+            ensure_private_directory(self._directory)
+            cache = json.loads(cache_path.read_text())
+            cached_identity, metadata = cache["identity"], cache["metadata"]
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError, OSError):
+            self._logger.exception("Invalid package metadata cache for %s", package_path)
+            return None
+
+        if cached_identity != identity or not isinstance(metadata, dict):
+            return None
+        if self.verify_content_hash and cache.get("content_hash") != self._get_content_hash(package_path):
+            self._logger.debug("Package metadata cache for %s does not match package contents", package_path)
+            return None
+
+        self._logger.debug("Loaded package metadata for %s from cache %s", package_path, cache_path)
+        return metadata
+
+    def save(self, package_type: str, package_path: pathlib.Path, metadata: Dict[str, Any]):
+        try:
+            identity = self._get_identity(package_type, package_path)
+        except OSError:
+            return
+        cache_path = self._get_cache_path(identity)
+        cache = {
+            "identity": identity,
+            "content_hash": self._get_content_hash(package_path) if self.verify_content_hash else None,
+            "metadata": metadata,
+        }
+        self._logger.debug("Cache package metadata for %s to %s", package_path, cache_path)
+        try:
+            ensure_private_directory(self._directory)
+            # Replace cache file atomically as the same package can be inspected by concurrent processes
+            write_private_file(cache_path, json.dumps(cache))
+        except (OSError, TypeError, ValueError):
+            self._logger.exception("Failed to cache package metadata for %s", package_path)
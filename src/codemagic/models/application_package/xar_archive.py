@@ -0,0 +1,202 @@
+"""
+Reader for xar archives that are used as macOS installer packages.
+https://github.com/apple-oss-distributions/xar/blob/main/xar/include/xar.h.in
+"""
+
+from __future__ import annotations
+
+import bz2
+import dataclasses
+import hashlib
+import lzma
+import pathlib
+import struct
+import zlib
+from typing import IO
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Union
+from xml.etree import ElementTree
+from xml.etree.ElementTree import Element
+
+XAR_MAGIC = b"xar!"
+# Magic, header size, format version, compressed and uncompressed TOC lengths, checksum algorithm
+XAR_HEADER = struct.Struct(">4sHHQQL")
+
+_CHECKSUM_ALGORITHMS = {
+    "md5": hashlib.md5,
+    "sha1": hashlib.sha1,
+    "sha256": hashlib.sha256,
+    "sha512": hashlib.sha512,
+}
+
+
+@dataclasses.dataclass
+class XarMember:
+    name: str
+    type: str
+    offset: int = 0
+    length: int = 0
+    size: int = 0
+    encoding: str = "application/octet-stream"
+    archived_checksum_style: Optional[str] = None
+    archived_checksum: Optional[str] = None
+
+    def is_dir(self) -> bool:
+        return self.type == "directory"
+
+
+class XarArchive:
+    """
+    Read files from xar archive without expanding the whole archive. Only the archive
+    header and the table of contents are read when the archive is opened, contents
+    of the files are read from the heap once requested.
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+        self._fd: Optional[IO[bytes]] = None
+        self._heap_offset = 0
+        self._members: Optional[Dict[str, XarMember]] = None
+
+    def __enter__(self) -> XarArchive:
+        return self
+
+    def __exit__(self, *_exc_info):
+        self.close()
+
+    @property
+    def _file(self) -> IO[bytes]:
+        if self._fd is None:
+            self._fd = self.path.open("rb")
+        return self._fd
+
+    def _read_toc(self) -> Element:
+        header = self._file.read(XAR_HEADER.size)
+        if len(header) < XAR_HEADER.size:
+            raise ValueError("Not a xar archive")
+        magic, header_size, _version, toc_length, _toc_uncompressed_length, _checksum_algorithm = XAR_HEADER.unpack(
+            header,
+        )
+        if magic != XAR_MAGIC or header_size < XAR_HEADER.size:
+            raise ValueError("Not a xar archive")
+
+        self._file.seek(header_size)
+        compressed_toc = self._file.read(toc_length)
+        if len(compressed_toc) < toc_length:
+            raise ValueError("Truncated xar table of contents")
+        self._heap_offset = header_size + toc_length
+        try:
+            return ElementTree.fromstring(zlib.decompress(compressed_toc))
+        except (zlib.error, ElementTree.ParseError) as error:
+            raise ValueError(f"Invalid xar table of contents: {error}") from error
+
+    @classmethod
+    def _get_int(cls, element: Optional[Element], tag: str) -> int:
+        value = None if element is None else element.findtext(tag)
+        try:
+            return int(value or 0)
+        except ValueError:
+            raise ValueError(f"Invalid xar {tag} {value!r}")
+
+    @classmethod
+    def _create_member(cls, file_element: Element, name: str) -> XarMember:
+        data = file_element.find("data")
+        member = XarMember(
+            name=name,
+            type=file_element.findtext("type") or "file",
+            offset=cls._get_int(data, "offset"),
+            length=cls._get_int(data, "length"),
+            size=cls._get_int(data, "size"),
+        )
+        if data is not None:
+            encoding = data.find("encoding")
+            if encoding is not None:
+                member.encoding = encoding.attrib.get("style", member.encoding)
+            archived_checksum = data.find("archived-checksum")
+            if archived_checksum is not None:
+                member.archived_checksum_style = archived_checksum.attrib.get("style")
+                member.archived_checksum = (archived_checksum.text or "").strip().lower()
+        return member
+
+    def _index_members(self, parent: Element, parent_name: str, members: Dict[str, XarMember]):
+        for file_element in parent.findall("file"):
+            name = file_element.findtext("name") or ""
+            if not name or name in (".", "..") or "/" in name:
+                raise ValueError(f"Invalid xar file name {name!r}")
+            full_name = f"{parent_name}/{name}" if parent_name else name
+            members[full_name] = self._create_member(file_element, full_name)
+            self._index_members(file_element, full_name, members)
+
+    @property
+    def members(self) -> List[XarMember]:
+        if self._members is None:
+            toc = self._read_toc().find("toc")
+            if toc is None:
+                raise ValueError("Invalid xar table of contents: toc element is missing")
+            members: Dict[str, XarMember] = {}
+            self._index_members(toc, "", members)
+            self._members = members
+        return list(self._members.values())
+
+    def namelist(self) -> List[str]:
+        return [member.name for member in self.members]
+
+    def find(self, pattern: str) -> Optional[XarMember]:
+        """
+        Find the first file whose path matches given glob pattern, for example
+        `*.pkg/PackageInfo`. Pattern has to match all components of the path.
+        """
+        pattern_parts = pathlib.PurePosixPath(pattern).parts
+        for member in self.members:
+            path = pathlib.PurePosixPath(member.name)
+            if not member.is_dir() and len(path.parts) == len(pattern_parts) and path.match(pattern):
+                return member
+        return None
+
+    def _get_member(self, member: Union[str, XarMember]) -> XarMember:
+        if isinstance(member, XarMember):
+            return member
+        for candidate in self.members:
+            if candidate.name == member:
+                return candidate
+        raise FileNotFoundError(member, self.path)
+
+    def _decode(self, member: XarMember, data: bytes) -> bytes:
+        try:
+            if member.encoding == "application/octet-stream":
+                return data
+            elif member.encoding == "application/x-gzip":
+                # Despite the name, gzip encoded xar files are zlib streams
+                return zlib.decompress(data)
+            elif member.encoding == "application/x-bzip2":
+                return bz2.decompress(data)
+            elif member.encoding in ("application/x-lzma", "application/x-xz"):
+                return lzma.decompress(data)
+        except (zlib.error, OSError, lzma.LZMAError) as error:
+            raise ValueError(f"Failed to decode {member.name} from xar archive: {error}") from error
+        raise ValueError(f"Unsupported encoding {member.encoding} for {member.name} in xar archive")
+
+    def _verify_checksum(self, member: XarMember, data: bytes):
+        checksum_algorithm = _CHECKSUM_ALGORITHMS.get(member.archived_checksum_style or "")
+        if checksum_algorithm is None or not member.archived_checksum:
+            return
+        if checksum_algorithm(data).hexdigest() != member.archived_checksum:
+            raise ValueError(f"Checksum mismatch for {member.name} in xar archive")
+
+    def read(self, member: Union[str, XarMember]) -> bytes:
+        member = self._get_member(member)
+        if member.is_dir():
+            raise IsADirectoryError(member.name, self.path)
+        self._file.seek(self._heap_offset + member.offset)
+        data = self._file.read(member.length)
+        if len(data) < member.length:
+            raise ValueError(f"Truncated {member.name} in xar archive")
+        self._verify_checksum(member, data)
+        return self._decode(member, data)
+
+    def close(self):
+        if self._fd is not None:
+            self._fd.close()
+            self._fd = None
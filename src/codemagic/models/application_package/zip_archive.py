@@ -0,0 +1,363 @@
+from __future__ import annotations
+
+import io
+import mmap
+import os
+import pathlib
+import shutil
+import struct
+import threading
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Pattern
+from typing import Sequence
+from typing import Union
+
+from codemagic.utilities import log
+
+
+class _MemoryMappedFile(io.RawIOBase):
+    """
+    Minimal read-only file object on top of a memory map. Memory maps
+    do not implement the complete file object interface required by `zipfile`.
+    """
+
+    def __init__(self, memory_map: mmap.mmap):
+        self._memory_map = memory_map
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        chunk = self._memory_map.read(len(buffer))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._memory_map.seek(offset, whence)  # type: ignore[arg-type]
+        return self._memory_map.tell()
+
+    def tell(self) -> int:
+        return self._memory_map.tell()
+
+    def close(self):
+        self._memory_map.close()
+        super().close()
+
+
+class _RecoveredMemberFile(io.RawIOBase):
+    """
+    Decompressing reader for archive member data that starts at given offset.
+    Used for members whose local file header could not be located by `zipfile`.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, fp: IO[bytes], lock: threading.RLock, member: zipfile.ZipInfo, data_offset: int):
+        if member.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            raise zipfile.BadZipFile(f"Unsupported compression method {member.compress_type} for {member.filename}")
+        self._fp = fp
+        self._lock = lock
+        self._member = member
+        self._position = data_offset
+        self._compressed_bytes_left = member.compress_size
+        self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS) if member.compress_type else None
+        self._buffer = b""
+        self._crc = 0
+        self._eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    def _read_compressed_chunk(self) -> bytes:
+        chunk_size = min(self.CHUNK_SIZE, self._compressed_bytes_left)
+        with self._lock:
+            self._fp.seek(self._position)
+            chunk = self._fp.read(chunk_size)
+        if len(chunk) < chunk_size:
+            raise zipfile.BadZipFile(f"Truncated data for {self._member.filename}")
+        self._position += len(chunk)
+        self._compressed_bytes_left -= len(chunk)
+        return chunk
+
+    def _fill_buffer(self):
+        while not self._buffer and not self._eof:
+            chunk = self._read_compressed_chunk() if self._compressed_bytes_left else b""
+            if self._decompressor is not None:
+                data = self._decompressor.decompress(chunk)
+                if not self._compressed_bytes_left:
+                    data += self._decompressor.flush()
+            else:
+                data = chunk
+            self._crc = zlib.crc32(data, self._crc)
+            self._buffer = data
+            self._eof = not self._compressed_bytes_left
+
+        if self._eof and not self._buffer and self._crc != self._member.CRC:
+            raise zipfile.BadZipFile(f"Bad CRC-32 for file {self._member.filename!r}")
+
+    def readinto(self, buffer) -> int:
+        self._fill_buffer()
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+class ZipArchive:
+    """
+    Read-only access to zip archive members. The central directory of the archive
+    is parsed only once and member contents are read by offset using a single file
+    handle that is shared between all reads. Reads by offset are synchronized with
+    `zipfile` using the lock of the `ZipFile` instance, as `zipfile` moves the position
+    of the same shared file handle when member contents are read.
+
+    Archives larger than 4GB that are created by macOS tooling do not use zip64
+    extensions, so member offsets in the central directory overflow, and big archives
+    can contain padding bytes between the members. Members whose local file headers are
+    not found from the recorded offsets are recovered by looking for the header near
+    all offsets that the overflowed value can stand for.
+    """
+
+    # Errors raised by `zipfile` if member local file header is not at expected offset
+    RECOVERABLE_ERRORS = ("Truncated file header", "Bad magic number for file header")
+    LOCAL_FILE_HEADER_SIGNATURE = b"PK\x03\x04"
+    LOCAL_FILE_HEADER_STRUCT = struct.Struct("<4s2B4HL2L2H")
+    # How far from the recorded offset the local file header is looked for
+    HEADER_SEARCH_DISTANCE = 64 * 1024
+    COPY_CHUNK_SIZE = 1024 * 1024
+    DEFAULT_EXTRACT_WORKERS = min(8, os.cpu_count() or 1)
+
+    def __init__(self, path: pathlib.Path, use_mmap: bool = False):
+        self.path = path
+        self._use_mmap = use_mmap
+        self._file: Optional[IO[bytes]] = None
+        self._zip_file: Optional[zipfile.ZipFile] = None
+        self._pattern_matches: Dict[str, Optional[zipfile.ZipInfo]] = {}
+        self._logger = log.get_file_logger(self.__class__)
+
+    def __enter__(self) -> ZipArchive:
+        return self
+
+    def __exit__(self, *_exc_info):
+        self.close()
+
+    def _open_file(self) -> IO[bytes]:
+        fd = self.path.open("rb")
+        if not self._use_mmap:
+            return fd
+        try:
+            with fd:
+                memory_map = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+            return io.BufferedReader(_MemoryMappedFile(memory_map))
+        except (ValueError, OSError):
+            # Empty files and some special file systems cannot be memory mapped
+            self._logger.debug("Failed to memory map %s, use regular file handle instead", self.path)
+            return self.path.open("rb")
+
+    @property
+    def zip_file(self) -> zipfile.ZipFile:
+        if self._zip_file is None:
+            self._file = self._open_file()
+            try:
+                self._zip_file = zipfile.ZipFile(self._file)
+            except Exception:
+                self.close()
+                raise
+            self._logger.debug("Indexed %d members from %s", len(self._zip_file.filelist), self.path)
+        return self._zip_file
+
+    @property
+    def _lock(self) -> threading.RLock:
+        # `zipfile` seeks and reads the shared file handle while holding this lock
+        return self.zip_file._lock  # type: ignore[attr-defined]
+
+    @property
+    def members(self) -> List[zipfile.ZipInfo]:
+        return self.zip_file.filelist
+
+    def namelist(self) -> List[str]:
+        return self.zip_file.namelist()
+
+    def find(self, pattern: Pattern[str]) -> Optional[zipfile.ZipInfo]:
+        """
+        Find the first archive member whose name fully matches given pattern.
+        Lookup results are memoized per pattern.
+        """
+        if pattern.pattern not in self._pattern_matches:
+            match = next((m for m in self.members if pattern.fullmatch(m.filename)), None)
+            self._pattern_matches[pattern.pattern] = match
+        return self._pattern_matches[pattern.pattern]
+
+    def _get_member(self, member: Union[str, zipfile.ZipInfo]) -> zipfile.ZipInfo:
+        if isinstance(member, zipfile.ZipInfo):
+            return member
+        return self.zip_file.getinfo(member)
+
+    @classmethod
+    def is_recoverable_error(cls, error: zipfile.BadZipFile) -> bool:
+        return str(error) in cls.RECOVERABLE_ERRORS
+
+    def open(self, member: Union[str, zipfile.ZipInfo]) -> IO[bytes]:
+        member = self._get_member(member)
+        try:
+            return self.zip_file.open(member)
+        except zipfile.BadZipFile as error:
+            if not self.is_recoverable_error(error):
+                raise
+            self._logger.debug("Failed to open %r from %s: %s", member.filename, self.path, error)
+        return io.BufferedReader(self._open_recovered(member))
+
+    def read(self, member: Union[str, zipfile.ZipInfo]) -> bytes:
+        with self.open(member) as fd:
+            return fd.read()
+
+    @classmethod
+    def _get_target_path(cls, member: zipfile.ZipInfo, target_directory: pathlib.Path) -> pathlib.Path:
+        relative_path_parts = [p for p in member.filename.split("/") if p not in ("", ".", "..")]
+        return target_directory.joinpath(*relative_path_parts)
+
+    def _copy_stored_member(self, member: zipfile.ZipInfo, target: IO[bytes]):
+        """
+        Copy member that is stored without compression directly from the archive file
+        in bounded chunks using a dedicated file handle, so that stored members can be
+        copied concurrently with other reads from the archive.
+        """
+        data_offset = self._get_member_data_offset(member, member.header_offset)
+        if data_offset is None:
+            data_offset = self._find_member_data_offset(member)
+
+        crc = 0
+        bytes_left = member.compress_size
+        with self.path.open("rb") as source:
+            source.seek(data_offset)
+            while bytes_left:
+                chunk = source.read(min(self.COPY_CHUNK_SIZE, bytes_left))
+                if not chunk:
+                    raise zipfile.BadZipFile(f"Truncated data for {member.filename}")
+                crc = zlib.crc32(chunk, crc)
+                target.write(chunk)
+                bytes_left -= len(chunk)
+        if crc != member.CRC:
+            raise zipfile.BadZipFile(f"Bad CRC-32 for file {member.filename!r}")
+
+    def extract_file(self, member: Union[str, zipfile.ZipInfo], target_path: pathlib.Path) -> pathlib.Path:
+        """
+        Write archive member contents to given path. Member data is streamed in bounded
+        chunks, and members that are not compressed are copied without using `zipfile`.
+        """
+        member = self._get_member(member)
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        is_encrypted = member.flag_bits & 0x1
+        with target_path.open("wb") as target:
+            if member.compress_type == zipfile.ZIP_STORED and not is_encrypted:
+                self._copy_stored_member(member, target)
+            else:
+                with self.open(member) as source:
+                    shutil.copyfileobj(source, target, self.COPY_CHUNK_SIZE)
+        return target_path
+
+    def extract(self, member: Union[str, zipfile.ZipInfo], target_directory: pathlib.Path) -> pathlib.Path:
+        member = self._get_member(member)
+        target_path = self._get_target_path(member, target_directory)
+
+        if member.is_dir():
+            target_path.mkdir(parents=True, exist_ok=True)
+            return target_path
+        return self.extract_file(member, target_path)
+
+    def extract_all(
+        self,
+        members: Sequence[Union[str, zipfile.ZipInfo]],
+        target_directory: pathlib.Path,
+        max_workers: Optional[int] = None,
+    ) -> List[pathlib.Path]:
+        """
+        Extract given members to target directory. File members are extracted using
+        a pool of threads as decompression and file I/O release the GIL.
+        Extracted paths are returned in the same order as the members were given.
+        """
+        zip_infos = [self._get_member(member) for member in members]
+        for zip_info in zip_infos:
+            if zip_info.is_dir():
+                self._get_target_path(zip_info, target_directory).mkdir(parents=True, exist_ok=True)
+
+        with ThreadPoolExecutor(max_workers=max_workers or self.DEFAULT_EXTRACT_WORKERS) as executor:
+            futures = [executor.submit(self.extract, zip_info, target_directory) for zip_info in zip_infos]
+            return [future.result() for future in futures]
+
+    def _open_recovered(self, member: zipfile.ZipInfo) -> _RecoveredMemberFile:
+        data_offset = self._find_member_data_offset(member)
+        self._logger.debug("Recovered %r from %s at offset %d", member.filename, self.path, data_offset)
+        assert self._file is not None
+        return _RecoveredMemberFile(self._file, self._lock, member, data_offset)
+
+    def _iter_header_offset_candidates(self, member: zipfile.ZipInfo) -> Iterator[int]:
+        archive_size = self.path.stat().st_size
+        offset = member.header_offset % 2**32
+        while offset < archive_size:
+            yield offset
+            offset += 2**32
+
+    def _read_at(self, offset: int, size: int) -> bytes:
+        lock = self._lock
+        assert self._file is not None
+        with lock:
+            self._file.seek(offset)
+            return self._file.read(size)
+
+    def _get_member_data_offset(self, member: zipfile.ZipInfo, header_offset: int) -> Optional[int]:
+        header_size = self.LOCAL_FILE_HEADER_STRUCT.size
+        header = self._read_at(header_offset, header_size)
+        if len(header) < header_size or not header.startswith(self.LOCAL_FILE_HEADER_SIGNATURE):
+            return None
+
+        *_, flags, _method, _time, _date, _crc, _compressed_size, _size, name_length, extra_length = (
+            self.LOCAL_FILE_HEADER_STRUCT.unpack(header)
+        )
+        raw_name = self._read_at(header_offset + header_size, name_length)
+        name = raw_name.decode("utf-8" if flags & 0x800 else "cp437", errors="replace")
+        if name != member.orig_filename:
+            return None
+        return header_offset + header_size + name_length + extra_length
+
+    def _find_member_data_offset(self, member: zipfile.ZipInfo) -> int:
+        candidates = list(self._iter_header_offset_candidates(member))
+        for header_offset in candidates:
+            data_offset = self._get_member_data_offset(member, header_offset)
+            if data_offset is not None:
+                return data_offset
+
+        # Look for the member local file header around candidate offsets to skip possible padding
+        for candidate in candidates:
+            window_start = max(candidate - self.HEADER_SEARCH_DISTANCE, 0)
+            window = self._read_at(window_start, 2 * self.HEADER_SEARCH_DISTANCE)
+            header_offsets = []
+            index = window.find(self.LOCAL_FILE_HEADER_SIGNATURE)
+            while index != -1:
+                header_offsets.append(window_start + index)
+                index = window.find(self.LOCAL_FILE_HEADER_SIGNATURE, index + 1)
+            for header_offset in sorted(header_offsets, key=lambda offset: abs(offset - candidate)):
+                data_offset = self._get_member_data_offset(member, header_offset)
+                if data_offset is not None:
+                    return data_offset
+
+        raise zipfile.BadZipFile(f"Failed to locate {member.filename!r} from {self.path}")
+
+    def close(self):
+        if self._zip_file is not None:
+            self._zip_file.close()
+            self._zip_file = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._pattern_matches.clear()
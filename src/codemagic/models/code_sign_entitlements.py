@@ -83,7 +83,8 @@ class CodeSignEntitlements(RunningCliAppMixin, StringConverterMixin):
     def from_ipa(cls, ipa_path: pathlib.Path) -> CodeSignEntitlements:
         with tempfile.TemporaryDirectory() as td:
             try:
-                app_path = Ipa(ipa_path).extract_app(pathlib.Path(td))
+                with Ipa(ipa_path) as ipa:
+                    app_path = ipa.extract_app(pathlib.Path(td))
             except IOError:
                 raise IOError(f"Failed to obtain entitlements from {ipa_path}, .app not found")
             return cls.from_app(app_path)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import itertools
+import mmap
 import os
 import pathlib
 import re
@@ -12,9 +13,11 @@ import time
 from functools import reduce
 from operator import add
 from typing import IO
-from typing import Dict
+from typing import ClassVar
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Pattern
 from typing import Union
 
 from packaging.version import Version
@@ -29,7 +32,8 @@ from .export_options import ExportOptions
 from .simulator import CoreSimulatorService
 from .simulator import Simulator
 from .xcode import Xcode
-from .xcpretty import Xcpretty
+from .xcodebuild_formatter import XcodebuildOutputFormatter
+from .xcodebuild_log_analyzer import XcodebuildLogAnalyzer
 
 
 class Xcodebuild(RunningCliAppMixin):
@@ -40,7 +44,7 @@ class Xcodebuild(RunningCliAppMixin):
         target_name: Optional[str] = None,
         configuration_name: Optional[str] = None,
         scheme_name: Optional[str] = None,
-        xcpretty: Optional[Xcpretty] = None,
+        xcpretty: Optional[XcodebuildOutputFormatter] = None,
     ):
         self.logger = log.get_logger(self.__class__)
         self.xcpretty = xcpretty
@@ -247,7 +251,10 @@ class Xcodebuild(RunningCliAppMixin):
             if not self.xcpretty:
                 raise
             message, process = error.args
-            errors = _XcodebuildLogErrorFinder(self.logs_path).find_failure_logs()
+            if not isinstance(process, XcodebuildCliProcess):
+                raise
+            # Failed commands and their logs were indexed while xcodebuild was running
+            errors = process.log_analyzer.find_failure_logs()
             if not errors:
                 raise
             raise IOError("\n".join([f"{message}. The following build commands failed:", "", errors]), process)
@@ -333,24 +340,86 @@ class Xcodebuild(RunningCliAppMixin):
             raise IOError(error_message, process) from cpe
         finally:
             self._log_process(process)
+            if process:
+                self.logger.debug(process.log_analyzer.get_report())
 
 
 class XcodebuildCliProcess(CliProcess):
-    def __init__(self, *args, xcpretty: Optional[Xcpretty] = None, **kwargs):
+    FILE_LOG_TAIL_LINE_COUNT: ClassVar[int] = 1000
+
+    def __init__(self, *args, xcpretty: Optional[XcodebuildOutputFormatter] = None, **kwargs):
         super().__init__(*args, **kwargs)
         with tempfile.NamedTemporaryFile(prefix="xcodebuild_", suffix=".log", delete=False) as tf:
             self.log_path = pathlib.Path(tf.name)
         self._buffer: Optional[IO] = None
         self.xcpretty = xcpretty
+        self.log_analyzer = XcodebuildLogAnalyzer()
 
     @property
     def stdout(self) -> str:
+        """
+        Complete xcodebuild output. Prefer streaming accessors `iter_log_lines`,
+        `tail` and `search_log` as xcodebuild logs can be hundreds of megabytes.
+        """
         return self.log_path.read_text()
 
     @property
     def stderr(self) -> str:
         return ""
 
+    def iter_log_lines(self) -> Iterator[str]:
+        """
+        Iterate over lines of xcodebuild output. Lines include line endings.
+        """
+        with self.log_path.open("r", encoding="utf-8", errors="ignore") as fd:
+            yield from fd
+
+    def iter_log_lines_backwards(self) -> Iterator[str]:
+        """
+        Iterate over lines of xcodebuild output starting from the last line. Lines do not include line endings.
+        """
+        backwards_lines = iter(iter_backwards(self.log_path))
+        last_line = next(backwards_lines, None)
+        if last_line:
+            # Output that ends with a line break does not have an empty last line
+            yield last_line
+        yield from backwards_lines
+
+    def tail(self, line_count: int) -> List[str]:
+        """
+        Get up to given number of last lines from xcodebuild output without reading the whole log
+        """
+        return list(reversed(list(itertools.islice(self.iter_log_lines_backwards(), line_count))))
+
+    def search_log(self, pattern: Union[bytes, Pattern[bytes]]) -> Iterator[str]:
+        """
+        Find lines of xcodebuild output that match given bytes pattern. The log is memory-mapped
+        and searched in place, and only the matching lines are decoded.
+        """
+        compiled_pattern = re.compile(pattern, re.MULTILINE) if isinstance(pattern, bytes) else pattern
+        with self.log_path.open("rb") as fd:
+            if not os.fstat(fd.fileno()).st_size:
+                return
+            with mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ) as log:
+                line_end = -1
+                for match in compiled_pattern.finditer(log):
+                    if match.start() <= line_end:
+                        # Match is on the line that was already found
+                        continue
+                    line_start = log.rfind(b"\n", 0, match.start()) + 1
+                    line_end = log.find(b"\n", match.end())
+                    if line_end == -1:
+                        line_end = len(log)
+                    yield log[line_start:line_end].decode(errors="ignore")
+
+    def _get_stdout_log_text(self, limit: Optional[int] = None) -> str:
+        # Complete output is kept in the xcodebuild log, include only the end of it in the file log
+        tail = self.tail(self.FILE_LOG_TAIL_LINE_COUNT)
+        tail_text = "\n".join(tail)
+        if limit is not None and len(tail_text) > limit:
+            return f"[Last {limit} characters of {self.log_path}]\n{tail_text[len(tail_text) - limit :]}"
+        return "\n".join([f"[Last {len(tail)} lines of {self.log_path}]", *tail])
+
     def _print_stream(self, chunk: str):
         if not self._print_streams:
             return
@@ -364,6 +433,7 @@ class XcodebuildCliProcess(CliProcess):
             self._buffer = self.log_path.open("r")
         lines = self._buffer.readlines(buffer_size or -1)
         chunk = "".join(lines)
+        self.log_analyzer.feed(chunk)
         self._print_stream(chunk)
 
     def execute(self, *args, **kwargs) -> XcodebuildCliProcess:
@@ -373,73 +443,9 @@ class XcodebuildCliProcess(CliProcess):
                 super(XcodebuildCliProcess, self).execute(*args, **kwargs)
                 return self
         finally:
+            self.log_analyzer.finish()
             if self._buffer:
                 self._buffer.close()
                 self._buffer = None
             if self.xcpretty:
                 self.xcpretty.flush()
-
-
-class _XcodebuildLogErrorFinder:
-    def __init__(self, log_path: Union[pathlib.Path, str]):
-        self._log_path = pathlib.Path(log_path)
-        self._backwards_log_iterator = iter_backwards(log_path)
-
-    def _get_failed_commands(self):
-        capture_lines = False
-        error_lines = []
-        for line in self._backwards_log_iterator:
-            line = line.strip()
-            if re.match(r"^\(\d+ failures?\)$", line):
-                capture_lines = True
-                continue
-            elif line == "The following build commands failed:":
-                break
-            elif capture_lines and line:
-                error_lines.append(line)
-
-        return error_lines
-
-    def _get_failed_command_logs(self, failed_commands, max_lines) -> Dict[str, List[str]]:
-        lines_cache: List[str] = []
-        capture_lines = False
-        logs: Dict[str, List[str]] = {}
-        for line in self._backwards_log_iterator:
-            line = line.strip()
-            if not line:
-                continue
-            elif re.match(r"^\*\* [^ ]+ FAILED \*\*", line):  # Match lines like '** ARCHIVE FAILED **'
-                # From here on upwards we can start looking for error logs
-                capture_lines = True
-                continue
-            elif line in failed_commands:
-                # Found a line that refers to a failed command, save its logs
-                if line not in logs:
-                    # Capture up to 10 last lines of the logs
-                    log_lines = reversed(lines_cache[:max_lines])
-                    logs[line] = ["...", *log_lines] if len(lines_cache) > max_lines else list(log_lines)
-                if set(logs.keys()) == set(failed_commands):
-                    # All errors are processed, stop
-                    break
-                lines_cache = []
-            elif capture_lines:
-                lines_cache.append(line)
-
-        return logs
-
-    @classmethod
-    def _format_errors(cls, failed_command_logs: Dict[str, List[str]]) -> str:
-        lines = []
-        for error in sorted(failed_command_logs.keys()):
-            lines.append(error)
-            for log_line in failed_command_logs[error]:
-                lines.append(f"\t{log_line}")
-            lines.append("")
-        return "\n".join(lines[:-1])
-
-    def find_failure_logs(self, max_lines_per_error=6) -> Optional[str]:
-        failed_commands = self._get_failed_commands()
-        failed_command_logs = self._get_failed_command_logs(failed_commands, max_lines_per_error)
-        if not failed_command_logs:
-            return None
-        return self._format_errors(failed_command_logs)
@@ -0,0 +1,471 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import re
+import shlex
+import sys
+from abc import ABCMeta
+from abc import abstractmethod
+from typing import IO
+from typing import AnyStr
+from typing import ClassVar
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Pattern
+from typing import Tuple
+from xml.etree import ElementTree
+from xml.sax.saxutils import quoteattr
+
+from codemagic.cli import Colors
+from codemagic.mixins import StringConverterMixin
+
+from .enums import ResourceEnum
+from .junit import Failure
+from .junit import Skipped
+from .junit import TestCase
+from .junit import TestSuite
+
+
+class XcodebuildOutputFormat(ResourceEnum):
+    COMPACT = "compact"
+    JUNIT = "junit"
+    XCPRETTY = "xcpretty"
+
+
+class XcodebuildOutputFormatter(StringConverterMixin, metaclass=ABCMeta):
+    @abstractmethod
+    def format(self, chunk: AnyStr):
+        """
+        Format next chunk of xcodebuild output
+        """
+
+    @abstractmethod
+    def flush(self):
+        """
+        Complete formatting once xcodebuild has exited
+        """
+
+
+class _StreamingXcodebuildFormatter(XcodebuildOutputFormatter):
+    """
+    Parses xcodebuild output line by line as it is written. Only the last incomplete
+    line and results of the currently running test are kept in memory.
+    """
+
+    # Build step name -> (description verb, index of the argument that describes the step)
+    STEP_DESCRIPTIONS: ClassVar[Dict[str, Tuple[str, int]]] = {
+        "CodeSign": ("Signing", 0),
+        "CompileAssetCatalog": ("Compiling", -1),
+        "CompileStoryboard": ("Compiling", -1),
+        "CompileXIB": ("Compiling", -1),
+        "CopySwiftLibs": ("Copying Swift libraries for", 0),
+        "CpResource": ("Copying", -1),
+        "GenerateDSYMFile": ("Generating", 0),
+        "Ld": ("Linking", 0),
+        "Libtool": ("Building library", 0),
+        "ProcessInfoPlistFile": ("Processing", -1),
+        "Touch": ("Touching", 0),
+    }
+    COMPILE_SOURCE_STEPS: ClassVar[Tuple[str, ...]] = ("CompileC", "CompileSwift", "SwiftCompile")
+    SPECIAL_STEPS: ClassVar[Tuple[str, ...]] = (*COMPILE_SOURCE_STEPS, "PhaseScriptExecution")
+
+    _ARGUMENT_SEPARATOR: ClassVar[Pattern] = re.compile(r"(?<!\\) ")
+    _SOURCE_FILE_PATTERN: ClassVar[Pattern] = re.compile(r"(?:\\ |\S)+\.(?:swift|m|mm|c|cc|cpp|cxx|metal)(?= |$)")
+    _TARGET_SUFFIX_PATTERN: ClassVar[Pattern] = re.compile(
+        r" \(in target '(?P<target>[^']+)' from project '(?P<project>[^']+)'\)$",
+    )
+    _LEGACY_TARGET_PATTERN: ClassVar[Pattern] = re.compile(
+        r"^=== BUILD TARGET (?P<target>.+?) OF PROJECT (?P<project>.+?) WITH (?:THE DEFAULT )?CONFIGURATION "
+        r"(?P<configuration>.+?) ===$",
+    )
+    _ISSUE_PATTERN: ClassVar[Pattern] = re.compile(
+        r"^(?:(?P<location>\S.*?): )?(?P<severity>(?:fatal )?error|warning): (?P<message>.*)$",
+    )
+    _TEST_FAILURE_PATTERN: ClassVar[Pattern] = re.compile(
+        r"^(?P<location>.+?:\d+): error: (?:-\[(?P<suite>\S+) (?P<test>[^\]]+)\]|(?P<suite_name>[\w.]+)\."
+        r"(?P<test_name>\w+)\(\)) : (?P<message>.*)$",
+    )
+    _TEST_CASE_PATTERN: ClassVar[Pattern] = re.compile(
+        r"^Test [Cc]ase (?:'-\[(?P<suite>\S+) (?P<test>[^\]]+)\]'|'(?P<suite_name>[\w.]+)\.(?P<test_name>\w+)\(\)') "
+        r"(?P<result>passed|failed|skipped)(?: on '[^']*')? \((?P<time>\d+(?:\.\d+)?) seconds\)\.?$",
+    )
+    _TEST_SUITE_PATTERN: ClassVar[Pattern] = re.compile(
+        r"^Test Suite '(?P<suite>[^']+)' (?P<event>started|passed|failed) at ",
+    )
+    _TESTS_SUMMARY_PATTERN: ClassVar[Pattern] = re.compile(
+        r"^Executed \d+ tests?, with \d+ failures? \(\d+ unexpected\) in \d+\.\d+ \(\d+\.\d+\) seconds$",
+    )
+    _RESULT_PATTERN: ClassVar[Pattern] = re.compile(r"^\*\* (?P<action>[^ ]+) (?P<result>SUCCEEDED|FAILED) \*\*")
+    _FAILED_COMMANDS_HEADER: ClassVar[str] = "The following build commands failed:"
+
+    def __init__(self, stdout: Optional[IO[str]] = None):
+        self._stdout = stdout
+        self._partial_line = ""
+        self._test_failures: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        self._test_suites_depth = 0
+        self._issue_context_lines = 0
+        self._in_failed_commands = False
+
+    @property
+    def stdout(self) -> IO[str]:
+        return self._stdout or sys.stdout
+
+    def _write(self, text: str):
+        self.stdout.write(text)
+
+    def format(self, chunk: AnyStr):
+        if not chunk:
+            return
+        lines = (self._partial_line + self._str(chunk)).split("\n")
+        self._partial_line = lines.pop()
+        for line in lines:
+            self._process_line(line.rstrip("\r"))
+        self.stdout.flush()
+
+    def flush(self):
+        if self._partial_line:
+            self._process_line(self._partial_line.rstrip("\r"))
+            self._partial_line = ""
+        self._on_end()
+        self._test_failures.clear()
+        self._test_suites_depth = 0
+        self._issue_context_lines = 0
+        self._in_failed_commands = False
+        self.stdout.flush()
+
+    def _process_line(self, line: str):
+        if not line:
+            return
+        elif self._issue_context_lines:
+            self._issue_context_lines -= 1
+            if line[0].isspace():
+                self._on_issue_context(line)
+                return
+            self._issue_context_lines = 0
+
+        stripped_line = line.strip()
+        if self._in_failed_commands:
+            self._on_failed_command(stripped_line)
+            self._in_failed_commands = not stripped_line.startswith("(")
+        elif line.startswith("Test "):
+            self._process_test_line(line)
+        elif "error: " in line or "warning: " in line:
+            self._process_issue_line(stripped_line)
+        elif line[0].isspace():
+            if stripped_line.startswith("Executed ") and self._TESTS_SUMMARY_PATTERN.match(stripped_line):
+                self._on_tests_summary(stripped_line)
+        elif line == self._FAILED_COMMANDS_HEADER:
+            self._in_failed_commands = True
+            self._on_failed_command(line)
+        elif line.startswith("** "):
+            result_match = self._RESULT_PATTERN.match(line)
+            if result_match:
+                self._on_result(result_match.group("action"), result_match.group("result") == "SUCCEEDED")
+        elif line.startswith("=== "):
+            target_match = self._LEGACY_TARGET_PATTERN.match(line)
+            if target_match:
+                self._on_target(*target_match.group("target", "project", "configuration"))
+        elif line.startswith("Executed ") and self._TESTS_SUMMARY_PATTERN.match(line):
+            self._on_tests_summary(line)
+        else:
+            self._process_step_line(line)
+
+    def _process_step_line(self, line: str):
+        step_name, _, arguments = line.partition(" ")
+        if step_name not in self.STEP_DESCRIPTIONS and step_name not in self.SPECIAL_STEPS:
+            return
+
+        target_match = self._TARGET_SUFFIX_PATTERN.search(arguments)
+        if target_match:
+            self._on_target(target_match.group("target"), target_match.group("project"), None)
+            arguments = arguments[: target_match.start()]
+
+        if step_name in self.COMPILE_SOURCE_STEPS:
+            source_files = self._SOURCE_FILE_PATTERN.findall(arguments)
+            if not source_files:
+                return
+            verb, subject = "Compiling", source_files[-1]
+        elif step_name == "PhaseScriptExecution":
+            # Script phase name is followed by the path to the generated script
+            script_name = self._ARGUMENT_SEPARATOR.split(arguments)[0].replace("\\ ", " ")
+            self._on_step("Running script", f"'{script_name}'")
+            return
+        else:
+            verb, argument_index = self.STEP_DESCRIPTIONS[step_name]
+            step_arguments = self._ARGUMENT_SEPARATOR.split(arguments)
+            subject = step_arguments[argument_index]
+        self._on_step(verb, os.path.basename(subject.replace("\\ ", " ")))
+
+    def _process_issue_line(self, line: str):
+        test_failure_match = self._TEST_FAILURE_PATTERN.match(line)
+        if test_failure_match:
+            suite = test_failure_match.group("suite") or test_failure_match.group("suite_name")
+            test = test_failure_match.group("test") or test_failure_match.group("test_name")
+            location, message = test_failure_match.group("location", "message")
+            self._test_failures[(suite, test)] = (location, message)
+            return
+
+        issue_match = self._ISSUE_PATTERN.match(line)
+        if issue_match:
+            # Compiler diagnostics are followed by the source line and a marker under the issue
+            self._issue_context_lines = 2
+            self._on_issue(*issue_match.group("severity", "location", "message"))
+
+    def _process_test_line(self, line: str):
+        if line.startswith("Test Suite "):
+            suite_match = self._TEST_SUITE_PATTERN.match(line)
+            if not suite_match:
+                return
+            elif suite_match.group("event") == "started":
+                self._test_suites_depth += 1
+                self._on_test_suite_started(suite_match.group("suite"))
+            else:
+                self._test_suites_depth = max(0, self._test_suites_depth - 1)
+                self._on_test_suite_finished(suite_match.group("suite"))
+            return
+
+        test_case_match = self._TEST_CASE_PATTERN.match(line)
+        if test_case_match:
+            suite = test_case_match.group("suite") or test_case_match.group("suite_name")
+            test = test_case_match.group("test") or test_case_match.group("test_name")
+            failure = self._test_failures.pop((suite, test), None)
+            result = test_case_match.group("result")
+            if result == "failed" and failure is None:
+                failure = ("", "Test failed")
+            self._on_test_case(suite, test, result, float(test_case_match.group("time")), failure)
+
+    @property
+    def _is_top_level_test_suite_finished(self) -> bool:
+        return self._test_suites_depth == 0
+
+    def _on_target(self, target: str, project: str, configuration: Optional[str]):
+        pass
+
+    def _on_step(self, verb: str, subject: str):
+        pass
+
+    def _on_issue(self, severity: str, location: Optional[str], message: str):
+        pass
+
+    def _on_issue_context(self, line: str):
+        pass
+
+    def _on_failed_command(self, line: str):
+        pass
+
+    def _on_result(self, action: str, succeeded: bool):
+        pass
+
+    def _on_test_suite_started(self, suite: str):
+        pass
+
+    def _on_test_suite_finished(self, suite: str):
+        pass
+
+    def _on_test_case(self, suite: str, test: str, result: str, time: float, failure: Optional[Tuple[str, str]]):
+        pass
+
+    def _on_tests_summary(self, summary: str):
+        pass
+
+    def _on_end(self):
+        pass
+
+
+class XcodebuildCompactFormatter(_StreamingXcodebuildFormatter):
+    """
+    Shows build steps, compiler diagnostics and test results in compact form
+    similar to the default output of xcpretty
+    """
+
+    def __init__(self, stdout: Optional[IO[str]] = None, colored: bool = True, use_unicode: bool = True):
+        super().__init__(stdout)
+        self.colored = colored
+        self._step_mark = "▸" if use_unicode else ">"
+        self._error_mark = "❌" if use_unicode else "[x]"
+        self._warning_mark = "⚠️ " if use_unicode else "[!]"
+        self._passed_mark = "✓" if use_unicode else "."
+        self._failed_mark = "✗" if use_unicode else "x"
+        self._skipped_mark = "↷" if use_unicode else "-"
+        self._current_target: Optional[str] = None
+
+    # The compact output corresponds to xcpretty's default "--simple" format
+    SUPPORTED_OPTIONS: ClassVar[Tuple[str, ...]] = ("--color", "--no-color", "--no-utf", "--simple")
+
+    @classmethod
+    def get_unsupported_options(cls, options: str) -> List[str]:
+        """
+        Get xcpretty command line options that have no effect on this formatter
+        """
+        return [option for option in shlex.split(options) if option not in cls.SUPPORTED_OPTIONS]
+
+    @classmethod
+    def from_options(cls, options: str, stdout: Optional[IO[str]] = None) -> XcodebuildCompactFormatter:
+        """
+        Configure the formatter using xcpretty command line options
+        """
+        flags = shlex.split(options)
+        colored = "--color" in flags and "--no-color" not in flags
+        return cls(stdout, colored=colored, use_unicode="--no-utf" not in flags)
+
+    def _color(self, text: str, color: Colors) -> str:
+        if not self.colored:
+            return text
+        return f"{color.value}{text}{Colors.RESET.value}"
+
+    def _write_line(self, line: str):
+        self._write(f"{line}\n")
+
+    def _on_target(self, target: str, project: str, configuration: Optional[str]):
+        if target == self._current_target:
+            return
+        self._current_target = target
+        configuration_suffix = f" [{configuration}]" if configuration else ""
+        target_line = f"{self._step_mark} Building {project}/{target}{configuration_suffix}"
+        self._write_line(self._color(target_line, Colors.BOLD))
+
+    def _on_step(self, verb: str, subject: str):
+        self._write_line(f"{self._step_mark} {verb} {subject}")
+
+    def _on_issue(self, severity: str, location: Optional[str], message: str):
+        location_prefix = f"{location}: " if location else ""
+        if severity == "warning":
+            self._write_line(self._color(f"{self._warning_mark} {location_prefix}{message}", Colors.YELLOW))
+        else:
+            self._write_line(self._color(f"{self._error_mark} {location_prefix}{message}", Colors.RED))
+
+    def _on_issue_context(self, line: str):
+        self._write_line(line)
+
+    def _on_failed_command(self, line: str):
+        self._write_line(self._color(line, Colors.RED))
+
+    def _on_result(self, action: str, succeeded: bool):
+        result = f"{self._step_mark} {action.capitalize()} {'Succeeded' if succeeded else 'Failed'}"
+        self._write_line(self._color(result, Colors.GREEN if succeeded else Colors.RED))
+
+    def _on_test_suite_started(self, suite: str):
+        self._write_line(self._color(suite, Colors.BOLD))
+
+    def _on_test_case(self, suite: str, test: str, result: str, time: float, failure: Optional[Tuple[str, str]]):
+        if result == "passed":
+            self._write_line(f"    {self._color(self._passed_mark, Colors.GREEN)} {test} ({time:.3f} seconds)")
+        elif result == "skipped":
+            self._write_line(f"    {self._color(self._skipped_mark, Colors.YELLOW)} {test} (skipped)")
+        else:
+            location, message = failure or ("", "")
+            self._write_line(self._color(f"    {self._failed_mark} {test}, {message}", Colors.RED))
+            if location:
+                self._write_line(self._color(f"      {location}", Colors.BRIGHT_BLACK))
+
+    def _on_tests_summary(self, summary: str):
+        if not self._is_top_level_test_suite_finished:
+            return
+        self._write_line(self._color(summary, Colors.GREEN if ", with 0 failures " in summary else Colors.RED))
+
+    def _on_end(self):
+        self._current_target = None
+
+
+class XcodebuildJUnitFormatter(_StreamingXcodebuildFormatter):
+    """
+    Writes test results from xcodebuild output as JUnit XML. Test suites are written as soon
+    as they finish, and nothing is written if xcodebuild did not run any tests. If output path
+    is given, the results are saved to that file instead of the output stream. Results of all
+    xcodebuild invocations formatted by the same formatter are saved to the same document,
+    and xcodebuild output can be shown on the console using another formatter meanwhile.
+    """
+
+    def __init__(
+        self,
+        stdout: Optional[IO[str]] = None,
+        name: str = "xcodebuild",
+        output_path: Optional[pathlib.Path] = None,
+        console_formatter: Optional[XcodebuildOutputFormatter] = None,
+    ):
+        super().__init__(stdout)
+        self.name = name
+        self.output_path = output_path
+        self.console_formatter = console_formatter
+        self._output_file: Optional[IO[bytes]] = None
+        self._results_end_offset: Optional[int] = None
+        self._test_suite: Optional[TestSuite] = None
+        self._document_started = False
+
+    def format(self, chunk: AnyStr):
+        super().format(chunk)
+        if self.console_formatter:
+            self.console_formatter.format(chunk)
+
+    def flush(self):
+        super().flush()
+        if self.console_formatter:
+            self.console_formatter.flush()
+
+    def _open_output_file(self, output_path: pathlib.Path) -> IO[bytes]:
+        if self._results_end_offset is None:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            return output_path.open("wb")
+        # Test results of following xcodebuild invocations are added to the end of the same document
+        output_file = output_path.open("r+b")
+        output_file.seek(self._results_end_offset)
+        output_file.truncate()
+        return output_file
+
+    def _write(self, text: str):
+        if self.output_path is None:
+            super()._write(text)
+            return
+        if self._output_file is None:
+            self._output_file = self._open_output_file(self.output_path)
+        self._output_file.write(text.encode("utf-8"))
+
+    def _write_test_suite(self):
+        if self._test_suite is None:
+            return
+        if not self._document_started and self._results_end_offset is None:
+            self._write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            self._write(f"<testsuites name={quoteattr(self.name)}>\n")
+        self._document_started = True
+        self._write(f"{ElementTree.tostring(self._test_suite.as_xml(), 'unicode')}\n")
+        self._test_suite = None
+
+    def _on_test_case(self, suite: str, test: str, result: str, time: float, failure: Optional[Tuple[str, str]]):
+        if self._test_suite is not None and self._test_suite.name != suite:
+            self._write_test_suite()
+        if self._test_suite is None:
+            self._test_suite = TestSuite(name=suite, tests=0, failures=0, skipped=0, time=0.0, testcases=[])
+
+        test_case = TestCase(classname=suite, name=test, time=time)
+        if failure is not None:
+            location, message = failure
+            test_case.failure = Failure(message=message, type="Failure", failure_description=location or None)
+        elif result == "skipped":
+            test_case.skipped = Skipped()
+        self._add_test_case(self._test_suite, test_case)
+
+    @classmethod
+    def _add_test_case(cls, test_suite: TestSuite, test_case: TestCase):
+        test_suite.testcases.append(test_case)
+        test_suite.tests += 1
+        test_suite.time = round((test_suite.time or 0.0) + (test_case.time or 0.0), 3)
+        if test_case.failure:
+            test_suite.failures = (test_suite.failures or 0) + 1
+        elif test_case.skipped:
+            test_suite.skipped = (test_suite.skipped or 0) + 1
+
+    def _on_test_suite_finished(self, suite: str):
+        self._write_test_suite()
+
+    def _on_end(self):
+        self._write_test_suite()
+        if self._document_started:
+            if self._output_file is not None:
+                self._results_end_offset = self._output_file.tell()
+            self._write("</testsuites>\n")
+            self._document_started = False
+        if self._output_file is not None:
+            self._output_file.close()
+            self._output_file = None
@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import collections
+import pathlib
+import re
+import time
+from dataclasses import dataclass
+from dataclasses import field
+from typing import ClassVar
+from typing import Counter
+from typing import Deque
+from typing import Dict
+from typing import FrozenSet
+from typing import List
+from typing import Optional
+from typing import Pattern
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+
+@dataclass(frozen=True)
+class XcodebuildIssue:
+    severity: str
+    message: str
+    location: Optional[str]
+    line_number: int
+    step: Optional[str] = field(default=None, compare=False)
+
+    def __str__(self) -> str:
+        prefix = f"{self.location}: " if self.location else ""
+        return f"{prefix}{self.severity}: {self.message}"
+
+
+@dataclass
+class XcodebuildStep:
+    description: str
+    step_type: str
+    target: Optional[str]
+    line_number: int
+    started_at: float
+    duration: Optional[float] = None
+
+
+@dataclass
+class XcodebuildTargetSummary:
+    name: str
+    step_counts: Counter[str] = field(default_factory=collections.Counter)
+    duration: float = 0.0
+
+
+@dataclass
+class _StepOutput:
+    lines: Deque[str]
+    lines_count: int = 0
+    has_errors: bool = False
+
+
+class XcodebuildLogAnalyzer:
+    """
+    Builds an index of xcodebuild output in a single pass while the output is being written.
+    Errors, warnings, failed commands, build steps and their durations are available right
+    after the build without reading the log again.
+
+    Step durations are observed from the log: a step lasts until the next step appears in
+    the output. Output of parallel builds is written once tasks complete, so the durations
+    are approximations unless build timing summary is included in the output.
+    """
+
+    COMPILE_STEP_TYPES: ClassVar[FrozenSet[str]] = frozenset({"CompileC", "CompileSwift", "SwiftCompile"})
+    KNOWN_STEP_TYPES: ClassVar[FrozenSet[str]] = COMPILE_STEP_TYPES | {
+        "CodeSign",
+        "CompileAssetCatalog",
+        "CompileStoryboard",
+        "CompileSwiftSources",
+        "CompileXIB",
+        "CopySwiftLibs",
+        "CpResource",
+        "GenerateDSYMFile",
+        "Ld",
+        "Libtool",
+        "LinkStoryboards",
+        "PhaseScriptExecution",
+        "ProcessInfoPlistFile",
+        "ProcessPCH",
+        "ProcessProductPackaging",
+        "SwiftEmitModule",
+        "Touch",
+        "Validate",
+    }
+
+    _STEP_PATTERN: ClassVar[Pattern] = re.compile(
+        r"^(?P<type>[A-Z][A-Za-z0-9]+) \S.*?(?: \(in target '(?P<target>[^']+)' from project '[^']+'\))?$",
+    )
+    _LEGACY_TARGET_PATTERN: ClassVar[Pattern] = re.compile(r"^=== BUILD TARGET (?P<target>.+?) OF PROJECT .+ ===$")
+    _ISSUE_PATTERN: ClassVar[Pattern] = re.compile(
+        r"^(?:(?P<location>\S.*?): )?(?P<severity>(?:fatal )?error|warning): (?P<message>.*)$",
+    )
+    _RESULT_PATTERN: ClassVar[Pattern] = re.compile(r"^\*\* (?P<action>[^ ]+) (?P<result>SUCCEEDED|FAILED) \*\*")
+    _FAILURES_COUNT_PATTERN: ClassVar[Pattern] = re.compile(r"^\(\d+ failures?\)$")
+    _TIMING_SUMMARY_PATTERN: ClassVar[Pattern] = re.compile(
+        r"^(?P<phase>\S.*?) \((?P<count>\d+) tasks?\) \| (?P<seconds>\d+(?:\.\d+)?) seconds$",
+    )
+    _FAILED_COMMANDS_HEADER: ClassVar[str] = "The following build commands failed:"
+
+    def __init__(self, failure_log_line_count: int = 6):
+        self.failure_log_line_count = failure_log_line_count
+        self.issues: List[XcodebuildIssue] = []
+        self.failed_commands: List[str] = []
+        self.steps: List[XcodebuildStep] = []
+        self.targets: Dict[str, XcodebuildTargetSummary] = {}
+        self.timing_summary: Dict[str, float] = {}
+        self.result: Optional[str] = None
+        self.lines_count = 0
+
+        self._issue_keys: Set[Tuple[str, Optional[str], str]] = set()
+        self._failure_logs: Dict[str, Tuple[List[str], bool]] = {}
+        self._partial_line = ""
+        self._current_target: Optional[str] = None
+        self._current_step: Optional[XcodebuildStep] = None
+        self._current_step_output: Optional[_StepOutput] = None
+        self._in_failed_commands = False
+
+    @classmethod
+    def from_log(cls, log_path: Union[pathlib.Path, str], **analyzer_options) -> XcodebuildLogAnalyzer:
+        analyzer = cls(**analyzer_options)
+        with open(log_path, "r", encoding="utf-8", errors="ignore") as fd:
+            for line in fd:
+                analyzer.feed(line)
+        analyzer.finish()
+        return analyzer
+
+    @property
+    def errors(self) -> List[XcodebuildIssue]:
+        return [issue for issue in self.issues if issue.severity != "warning"]
+
+    @property
+    def warnings(self) -> List[XcodebuildIssue]:
+        return [issue for issue in self.issues if issue.severity == "warning"]
+
+    def feed(self, chunk: str, timestamp: Optional[float] = None):
+        """
+        Index next chunk of xcodebuild output. Chunks do not have to end at line boundaries.
+        """
+        if not chunk:
+            return
+        if timestamp is None:
+            timestamp = time.monotonic()
+        lines = (self._partial_line + chunk).split("\n")
+        self._partial_line = lines.pop()
+        for line in lines:
+            self._process_line(line, timestamp)
+
+    def finish(self, timestamp: Optional[float] = None):
+        """
+        Index remaining incomplete output line and close the last build step
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+        if self._partial_line:
+            self._process_line(self._partial_line, timestamp)
+            self._partial_line = ""
+        self._end_current_step(timestamp)
+
+    def _process_line(self, line: str, timestamp: float):
+        self.lines_count += 1
+        stripped_line = line.strip()
+        if not stripped_line:
+            return
+
+        if self._in_failed_commands:
+            if self._FAILURES_COUNT_PATTERN.match(stripped_line):
+                self._in_failed_commands = False
+            else:
+                self.failed_commands.append(stripped_line)
+            return
+
+        if "error: " in stripped_line or "warning: " in stripped_line:
+            self._process_issue(stripped_line)
+        elif stripped_line.endswith(" seconds") and self._process_timing_summary(stripped_line):
+            return
+
+        if not line[0].isspace() and self._process_unindented_line(stripped_line, timestamp):
+            return
+
+        step_output = self._current_step_output
+        if step_output is not None:
+            step_output.lines.append(stripped_line)
+            step_output.lines_count += 1
+            if " failed" in stripped_line:
+                step_output.has_errors = True
+
+    def _process_unindented_line(self, line: str, timestamp: float) -> bool:
+        if line == self._FAILED_COMMANDS_HEADER:
+            self._in_failed_commands = True
+            return True
+        elif line.startswith("** "):
+            result_match = self._RESULT_PATTERN.match(line)
+            if result_match:
+                self.result = result_match.group("result")
+                self._end_current_step(timestamp)
+                return True
+        elif line.startswith("=== "):
+            target_match = self._LEGACY_TARGET_PATTERN.match(line)
+            if target_match:
+                self._current_target = target_match.group("target")
+                return True
+
+        step_match = self._STEP_PATTERN.match(line)
+        if not step_match:
+            return False
+        step_type = step_match.group("type")
+        target = step_match.group("target")
+        if not target and step_type not in self.KNOWN_STEP_TYPES:
+            return False
+        self._start_step(XcodebuildStep(line, step_type, target or self._current_target, self.lines_count, timestamp))
+        return True
+
+    def _process_issue(self, line: str):
+        issue_match = self._ISSUE_PATTERN.match(line)
+        if not issue_match:
+            return
+        severity, location, message = issue_match.group("severity", "location", "message")
+        if severity != "warning" and self._current_step_output is not None:
+            self._current_step_output.has_errors = True
+
+        issue_key = (severity, location, message)
+        if issue_key in self._issue_keys:
+            return  # The same issue can be reported multiple times
+        self._issue_keys.add(issue_key)
+        step = self._current_step.description if self._current_step else None
+        self.issues.append(XcodebuildIssue(severity, message, location, self.lines_count, step))
+
+    def _process_timing_summary(self, line: str) -> bool:
+        timing_match = self._TIMING_SUMMARY_PATTERN.match(line)
+        if not timing_match:
+            return False
+        self.timing_summary[timing_match.group("phase")] = float(timing_match.group("seconds"))
+        return True
+
+    def _start_step(self, step: XcodebuildStep):
+        self._end_current_step(step.started_at)
+        self.steps.append(step)
+        self._current_step = step
+        self._current_step_output = _StepOutput(collections.deque(maxlen=self.failure_log_line_count))
+
+    def _end_current_step(self, timestamp: float):
+        step = self._current_step
+        step_output = self._current_step_output
+        if step is None or step_output is None:
+            return
+
+        step.duration = timestamp - step.started_at
+        target_name = step.target or ""
+        if target_name not in self.targets:
+            self.targets[target_name] = XcodebuildTargetSummary(target_name)
+        target_summary = self.targets[target_name]
+        target_summary.step_counts[step.step_type] += 1
+        target_summary.duration += step.duration
+
+        # Keep output only for steps that can be failed commands to bound memory usage
+        if step_output.has_errors:
+            is_truncated = step_output.lines_count > len(step_output.lines)
+            self._failure_logs[step.description] = (list(step_output.lines), is_truncated)
+        self._current_step = None
+        self._current_step_output = None
+
+    def get_slowest_compile_steps(self, count: int = 10) -> List[XcodebuildStep]:
+        compile_steps = (step for step in self.steps if step.step_type in self.COMPILE_STEP_TYPES)
+        return sorted(compile_steps, key=lambda step: step.duration or 0.0, reverse=True)[:count]
+
+    def find_failure_logs(self) -> Optional[str]:
+        """
+        Format last lines of output for each failed command
+        """
+        if not self.failed_commands:
+            return None
+
+        lines = []
+        for failed_command in sorted(set(self.failed_commands)):
+            lines.append(failed_command)
+            log_lines, is_truncated = self._failure_logs.get(failed_command, ([], False))
+            if is_truncated:
+                lines.append("\t...")
+            lines.extend(f"\t{log_line}" for log_line in log_lines)
+            lines.append("")
+        return "\n".join(lines[:-1])
+
+    def get_report(self, slowest_steps_count: int = 5) -> str:
+        lines = [
+            f"Build result: {self.result or 'unknown'}",
+            f"Errors: {len(self.errors)}, warnings: {len(self.warnings)}, build steps: {len(self.steps)}",
+        ]
+        slowest_steps = self.get_slowest_compile_steps(slowest_steps_count)
+        if slowest_steps:
+            lines.append("Slowest compile steps:")
+            lines.extend(f"\t{step.duration or 0:.2f}s {step.description}" for step in slowest_steps)
+        if self.timing_summary:
+            lines.append("Build timing summary:")
+            lines.extend(f"\t{seconds:.2f}s {phase}" for phase, seconds in self.timing_summary.items())
+        return "\n".join(lines)
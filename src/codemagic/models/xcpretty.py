@@ -7,12 +7,12 @@ from typing import AnyStr
 from typing import Optional
 from typing import Union
 
-from codemagic.mixins import StringConverterMixin
+from .xcodebuild_formatter import XcodebuildOutputFormatter
 
 _IO = Union[int, IO]
 
 
-class Xcpretty(StringConverterMixin):
+class Xcpretty(XcodebuildOutputFormatter):
     def __init__(self, custom_options: str = "", stdout: _IO = sys.stdout, stderr: _IO = sys.stderr):
         self._ensure_xcpretty()
         self._command = ["xcpretty"] + shlex.split(custom_options)
@@ -1,5 +1,6 @@
 import pathlib
 from functools import lru_cache
+from typing import Generator
 from typing import Literal
 from typing import Optional
 
@@ -90,6 +91,30 @@ class Bundletool(JavaJarTool):
         completed_process = self._run_command(cmd, show_output=show_output)
         return self._get_stdout(completed_process)
 
+    def iter_dump_resources(
+        self,
+        bundle: pathlib.Path,
+        *,
+        resource: Optional[str] = None,
+        values: bool = True,
+    ) -> Generator[str, None, None]:
+        """
+        Get resources of the bundle in a human-readable form line by line as bundletool
+        writes them. Bundletool process is stopped if iteration ends before the output does.
+
+        See full usage instructions with `java -jar bundletool.jar help dump`.
+        """
+        cmd = [
+            *(self.java, "-jar", self.jar),
+            *("dump", "resources"),
+            *("--bundle", bundle),
+        ]
+        if resource:
+            cmd.extend(("--resource", resource))
+        if values:
+            cmd.append("--values")
+        return self._iter_stdout_lines(cmd)
+
     def validate(
         self,
         bundle: pathlib.Path,
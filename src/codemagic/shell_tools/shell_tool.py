@@ -1,6 +1,7 @@
 import subprocess
 from abc import ABCMeta
 from typing import Dict
+from typing import Generator
 from typing import Optional
 from typing import Sequence
 from typing import Union
@@ -45,6 +46,20 @@ class ShellTool(
             completed_process.check_returncode()
             return completed_process
 
+    def _iter_stdout_lines(
+        self,
+        command: Sequence[CommandArg],
+        *,
+        command_env: Optional[Dict[str, str]] = None,
+    ) -> Generator[str, None, None]:
+        """
+        Run the command and yield lines from its standard output as soon as they are written.
+        The process is terminated if the caller stops consuming the output before it ends.
+        """
+        process = CliProcess(command, print_streams=False)
+        yield from process.iter_stdout_lines(env=command_env)
+        process.raise_for_returncode()
+
     @classmethod
     def _get_stdout(cls, completed_process: Union[subprocess.CompletedProcess, CliProcess]) -> str:
         if isinstance(completed_process, subprocess.CompletedProcess):
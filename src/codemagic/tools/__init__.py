@@ -1,10 +1,62 @@
-from .android_app_bundle import AndroidAppBundle
-from .android_keystore import AndroidKeystore
-from .app_store_connect import AppStoreConnect
-from .codemagic_cli_tools import CodemagicCliTools
-from .firebase_app_distribution import FirebaseAppDistribution
-from .git_changelog import GitChangelog
-from .google_play import GooglePlay
-from .keychain import Keychain
-from .universal_apk_generator import UniversalApkGenerator
-from .xcode_project import XcodeProject
+"""
+Tools are loaded lazily on first attribute access so that console scripts
+import only the tool they run instead of all tools and their dependencies.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Type
+
+if TYPE_CHECKING:
+    from codemagic.cli import CliApp
+
+    from .android_app_bundle import AndroidAppBundle
+    from .android_keystore import AndroidKeystore
+    from .app_store_connect import AppStoreConnect
+    from .codemagic_cli_tools import CodemagicCliTools
+    from .firebase_app_distribution import FirebaseAppDistribution
+    from .git_changelog import GitChangelog
+    from .google_play import GooglePlay
+    from .keychain import Keychain
+    from .universal_apk_generator import UniversalApkGenerator
+    from .xcode_project import XcodeProject
+
+_TOOL_MODULES: Dict[str, str] = {
+    "AndroidAppBundle": ".android_app_bundle",
+    "AndroidKeystore": ".android_keystore",
+    "AppStoreConnect": ".app_store_connect",
+    "CodemagicCliTools": ".codemagic_cli_tools",
+    "FirebaseAppDistribution": ".firebase_app_distribution",
+    "GitChangelog": ".git_changelog",
+    "GooglePlay": ".google_play",
+    "Keychain": ".keychain",
+    "UniversalApkGenerator": ".universal_apk_generator",
+    "XcodeProject": ".xcode_project",
+}
+
+__all__ = [*_TOOL_MODULES, "get_tools"]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _TOOL_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    tool = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = tool  # Cache the tool so that next lookups skip __getattr__
+    return tool
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+def get_tools() -> List[Type[CliApp]]:
+    """Import all tools and return them sorted by executable name"""
+    tools = (__getattr__(tool_name) for tool_name in _TOOL_MODULES)
+    return sorted(tools, key=lambda tool: tool.get_executable_name())
@@ -10,6 +10,7 @@ from codemagic.cli import Colors
 from codemagic.models import ArchiveMethod
 from codemagic.models import ExportOptions
 from codemagic.models import ProvisioningProfile
+from codemagic.models import XcodebuildOutputFormat
 from codemagic.models.simulator import Runtime
 
 
@@ -390,15 +391,49 @@ class XcprettyArgument(cli.Argument):
         key="disable_xcpretty",
         flags=("--disable-xcpretty",),
         type=bool,
-        description="Do not use XCPretty formatter to process log output",
+        description="Do not format xcodebuild log output",
         argparse_kwargs={"required": False, "action": "store_true"},
     )
     OPTIONS = cli.ArgumentProperties(
         key="xcpretty_options",
         flags=("--xcpretty-options",),
-        description='Command line options for xcpretty formatter. For example "--no-color" or "--simple  --no-utf".',
+        description=(
+            'Command line options for xcpretty formatter. For example "--no-color" or "--simple  --no-utf". '
+            'Options "--color", "--no-color" and "--no-utf" are also applied to the built-in compact formatter. '
+            "If other options are given and formatter is not specified, xcpretty is used when it is available"
+        ),
         argparse_kwargs={"required": False, "default": "--color"},
     )
+    FORMATTER = cli.ArgumentProperties(
+        key="xcodebuild_formatter",
+        flags=("--xcodebuild-formatter",),
+        type=XcodebuildOutputFormat,
+        description=(
+            "Formatter used to process xcodebuild log output. "
+            f"`{XcodebuildOutputFormat.COMPACT}` shows build steps, issues and test results in compact form, "
+            f"`{XcodebuildOutputFormat.JUNIT}` shows compact output and writes test results as JUnit XML, and "
+            f"`{XcodebuildOutputFormat.XCPRETTY}` uses external xcpretty formatter. "
+            f"If not given, `{XcodebuildOutputFormat.COMPACT}` is used unless xcpretty options other than "
+            '"--simple", "--color", "--no-color" and "--no-utf" are given and xcpretty is available'
+        ),
+        argparse_kwargs={
+            "required": False,
+            "choices": list(XcodebuildOutputFormat),
+        },
+    )
+    JUNIT_OUTPUT_PATH = cli.ArgumentProperties(
+        key="xcodebuild_junit_output_path",
+        flags=("--xcodebuild-junit-output-path",),
+        type=pathlib.Path,
+        description=(
+            f"Path where JUnit XML test results are saved when `{XcodebuildOutputFormat.JUNIT}` "
+            "xcodebuild formatter is used"
+        ),
+        argparse_kwargs={
+            "required": False,
+            "default": pathlib.Path("build/ios/xcodebuild-junit.xml"),
+        },
+    )
 
 
 class XcodeArgument(cli.Argument):
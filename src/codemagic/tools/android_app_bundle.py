@@ -3,7 +3,6 @@ from __future__ import annotations
 import json
 import pathlib
 import subprocess
-import zipfile
 from typing import List
 from typing import Literal
 from typing import Optional
@@ -13,6 +12,7 @@ from typing import overload
 from codemagic import cli
 from codemagic.mixins import PathFinderMixin
 from codemagic.models import AndroidSigningInfo
+from codemagic.models.application_package.zip_archive import ZipArchive
 from codemagic.shell_tools import Bundletool
 from codemagic.shell_tools.jarsigner import Jarsigner
 
@@ -586,8 +586,8 @@ class AndroidAppBundle(cli.CliApp, PathFinderMixin):
     def _extract_universal_apk(self, apks_path: pathlib.Path) -> pathlib.Path:
         self.logger.info(f"Extracting universal APK from {apks_path}")
         apk_path = apks_path.parent / f"{apks_path.stem}-universal.apk"
-        with zipfile.ZipFile(apks_path, "r") as zf, apk_path.open("wb+") as of:
-            of.write(zf.read("universal.apk"))
+        with ZipArchive(apks_path) as apks_archive:
+            apks_archive.extract_file("universal.apk", apk_path)
         self.logger.info(f"Extracted {apk_path}")
         return apk_path
 
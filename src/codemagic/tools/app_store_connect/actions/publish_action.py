@@ -11,6 +11,7 @@ from typing import List
 from typing import Optional
 from typing import Sequence
 from typing import Tuple
+from typing import Type
 from typing import Union
 
 from codemagic import cli
@@ -26,6 +27,7 @@ from codemagic.cli import Colors
 from codemagic.models import Altool
 from codemagic.models.application_package import Ipa
 from codemagic.models.application_package import MacOsPackage
+from codemagic.models.application_package.package_loader import PackageLoader
 
 from ..abstract_base_action import AbstractBaseAction
 from ..arguments import AppStoreVersionArgument
@@ -90,6 +92,7 @@ ACTION_ARGUMENTS = (
     PublishArgument.APPLE_ID,
     PublishArgument.APP_SPECIFIC_PASSWORD,
     *ArgumentGroups.PACKAGE_UPLOAD_ARGUMENTS,
+    PublishArgument.PACKAGE_LOADER_WORKERS,
     PublishArgument.MAX_BUILD_FIND_WAIT,
     PublishArgument.MAX_BUILD_PROCESSING_WAIT,
     *PublishArgument.with_custom_argument_group(
@@ -307,6 +310,7 @@ class PublishAction(AbstractBaseAction, metaclass=ABCMeta):
         altool_retry_wait: Optional[float | Types.AltoolRetryWait] = None,
         altool_verbose_logging: Optional[bool] = None,
         altool_additional_arguments: Optional[Tuple[str] | Types.AltoolAdditionalAdditionalArguments] = None,
+        package_loader_workers: Optional[int | Types.PackageLoaderWorkers] = None,
         max_find_build_wait: Union[int | Types.MaxFindBuildWait] = PublishArgument.MAX_BUILD_FIND_WAIT.get_default(),
         max_build_processing_wait: Optional[int | Types.MaxBuildProcessingWait] = None,
         **app_store_connect_submit_options,
@@ -325,7 +329,14 @@ class PublishAction(AbstractBaseAction, metaclass=ABCMeta):
             **app_store_connect_submit_options,
         )
 
-        application_packages = self._get_publishing_application_packages(application_package_path_patterns)
+        application_packages = self._get_publishing_application_packages(
+            application_package_path_patterns,
+            max_workers=(
+                package_loader_workers.value
+                if isinstance(package_loader_workers, Types.PackageLoaderWorkers)
+                else package_loader_workers
+            ),
+        )
         altool = self._get_altool(apple_id, app_specific_password, altool_verbose_logging)
         failed_packages: List[str] = []
 
@@ -354,6 +365,8 @@ class PublishAction(AbstractBaseAction, metaclass=ABCMeta):
             except (AppStoreConnectError, IOError, ValueError) as error:
                 failed_packages.append(str(application_package.path))
                 self.logger.error(Colors.RED(error.args[0]))
+            finally:
+                application_package.close()
 
         if failed_packages:
             raise AppStoreConnectError(f"Failed to publish {', '.join(failed_packages)}")
@@ -567,9 +580,18 @@ class PublishAction(AbstractBaseAction, metaclass=ABCMeta):
         self.printer.print_resource(build, True)
         return build
 
+    @staticmethod
+    def _get_publishing_application_package_type(path: pathlib.Path) -> Type[Union[Ipa, MacOsPackage]]:
+        if path.suffix == ".ipa":
+            return Ipa
+        elif path.suffix == ".pkg":
+            return MacOsPackage
+        raise AppStoreConnectError(f"Unsupported package type for App Store Connect publishing: {path}")
+
     def _get_publishing_application_packages(
         self,
         path_patterns: Sequence[pathlib.Path],
+        max_workers: Optional[int] = None,
     ) -> List[Union[Ipa, MacOsPackage]]:
         _path_patterns = list(path_patterns)
         if len(_path_patterns) == 1 and _path_patterns[0].exists():
@@ -578,25 +600,24 @@ class PublishAction(AbstractBaseAction, metaclass=ABCMeta):
         else:
             found_application_paths = list(self.find_paths(*path_patterns))
 
+        package_loader = PackageLoader(self._get_publishing_application_package_type, max_workers=max_workers)
         application_packages: List[Union[Ipa, MacOsPackage]] = []
-        for path in found_application_paths:
-            if path.suffix == ".ipa":
-                application_package: Union[Ipa, MacOsPackage] = Ipa(path)
-            elif path.suffix == ".pkg":
-                application_package = MacOsPackage(path)
-            else:
-                raise AppStoreConnectError(f"Unsupported package type for App Store Connect publishing: {path}")
-
-            try:
-                application_package.get_summary()
-            except FileNotFoundError as fnf:
-                message = f"Invalid package for App Store Connect publishing: {fnf.args[0]} not found from {path}"
+        for result in package_loader.load(found_application_paths):
+            if result.package is not None:
+                application_packages.append(result.package)
+            elif isinstance(result.error, FileNotFoundError):
+                message = (
+                    "Invalid package for App Store Connect publishing: "
+                    f"{result.error.args[0]} not found from {result.path}"
+                )
                 self.logger.warning(Colors.YELLOW(message))
-            except (ValueError, IOError) as error:
-                message = f"Unable to process package {path} for App Store Connect publishing: {error.args[0]}"
+            elif isinstance(result.error, (ValueError, IOError)):
+                message = (
+                    f"Unable to process package {result.path} for App Store Connect publishing: {result.error.args[0]}"
+                )
                 self.logger.warning(Colors.YELLOW(message))
-            else:
-                application_packages.append(application_package)
+            elif result.error is not None:
+                raise result.error
 
         if not application_packages:
             patterns = ", ".join(f'"{pattern}"' for pattern in path_patterns)
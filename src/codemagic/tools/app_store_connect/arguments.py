@@ -170,6 +170,14 @@ class Types:
         def _is_valid(cls, value: int) -> bool:
             return value > 0
 
+    class PackageLoaderWorkers(cli.TypedCliArgument[int]):
+        argument_type = int
+        environment_variable_key = "APP_STORE_CONNECT_PACKAGE_LOADER_WORKERS"
+
+        @classmethod
+        def _is_valid(cls, value: int) -> bool:
+            return value > 0
+
     class MaxBuildProcessingWait(cli.TypedCliArgument[int]):
         argument_type = int
         environment_variable_key = "APP_STORE_CONNECT_MAX_BUILD_PROCESSING_WAIT"
@@ -1008,6 +1016,19 @@ class PublishArgument(cli.Argument):
             "required": False,
         },
     )
+    PACKAGE_LOADER_WORKERS = cli.ArgumentProperties(
+        key="package_loader_workers",
+        flags=("--package-loader-workers",),
+        type=Types.PackageLoaderWorkers,
+        description=(
+            "The maximum number of worker processes that are used to validate and read information "
+            "from application packages in parallel before publishing. If not given, packages are "
+            "loaded one by one in the main process."
+        ),
+        argparse_kwargs={
+            "required": False,
+        },
+    )
     MAX_BUILD_FIND_WAIT = cli.ArgumentProperties(
         key="max_find_build_wait",
         flags=("--max-find-build-wait",),
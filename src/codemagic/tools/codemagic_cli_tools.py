@@ -27,7 +27,9 @@ class CodemagicCliTools(cli.CliApp):
         """
         Show installed Codemagic CLI tools
         """
-        for tool_class in cli.CliApp.__subclasses__():
+        from codemagic.tools import get_tools
+
+        for tool_class in get_tools():
             executable = tool_class.get_executable_name()
             self.echo(f"{executable} installed at {shutil.which(executable) or executable}")
 
@@ -1,5 +1,7 @@
+import pathlib
 from abc import ABC
 from typing import List
+from typing import Optional
 
 from codemagic import cli
 from codemagic.cli import Colors
@@ -20,6 +22,7 @@ class ReleasesActionGroup(FirebaseAppDistributionAction, ABC):
         ReleasesArgument.APP_ID,
         ResourcesArgument.LIMIT,
         ResourcesArgument.ORDER_BY,
+        ReleasesArgument.BUILD_VERSION,
         action_group=FirebaseActionGroups.RELEASES,
     )
     def list_releases(
@@ -27,14 +30,24 @@ class ReleasesActionGroup(FirebaseAppDistributionAction, ABC):
         app_id: str,
         limit: int = ResourcesArgument.LIMIT.get_default(),
         order_by: OrderBy = ResourcesArgument.ORDER_BY.get_default(),
+        build_version: Optional[str] = None,
         should_print: bool = True,
     ) -> List[Release]:
         """
         List releases for the Firebase application
         """
 
+        def has_build_version(release: Release) -> bool:
+            return release.buildVersion == build_version
+
         try:
-            releases = self.client.releases.list(self.project_number, app_id, order_by, limit)
+            releases = self.client.releases.list(
+                self.project_number,
+                app_id,
+                order_by,
+                limit,
+                predicate=has_build_version if build_version else None,
+            )
         except GoogleError as e:
             raise FirebaseAppDistributionError(str(e))
 
@@ -44,3 +57,37 @@ class ReleasesActionGroup(FirebaseAppDistributionAction, ABC):
             self.printer.print_resources(releases, should_print)
 
         return releases
+
+    @cli.action(
+        "upload",
+        ReleasesArgument.APP_ID,
+        ReleasesArgument.BINARY_PATH,
+        ReleasesArgument.UPLOAD_TIMEOUT,
+        action_group=FirebaseActionGroups.RELEASES,
+    )
+    def upload_release(
+        self,
+        app_id: str,
+        binary_path: pathlib.Path,
+        upload_timeout: float = ReleasesArgument.UPLOAD_TIMEOUT.get_default(),
+        should_print: bool = True,
+    ) -> Release:
+        """
+        Upload application binary to Firebase App Distribution and wait until the release is created
+        """
+
+        self.logger.info(Colors.BLUE(f'Upload "{binary_path}" to Firebase App Distribution'))
+        try:
+            release = self.client.releases.upload(
+                self.project_number,
+                app_id,
+                binary_path,
+                timeout=upload_timeout,
+            )
+        except GoogleError as e:
+            self.logger.warning(Colors.RED(f"Uploading {binary_path} to Firebase App Distribution failed."))
+            raise FirebaseAppDistributionError(str(e))
+
+        self.logger.info(Colors.GREEN(f"\nUploaded {binary_path} to Firebase App Distribution"))
+        self.printer.print_resource(release, should_print)
+        return release
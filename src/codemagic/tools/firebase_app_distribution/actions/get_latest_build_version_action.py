@@ -1,4 +1,5 @@
 from abc import ABC
+from typing import ClassVar
 
 from codemagic import cli
 from codemagic.google.errors import GoogleError
@@ -9,6 +10,13 @@ from ..firebase_app_distribution_action import FirebaseAppDistributionAction
 
 
 class GetLatestBuildVersionAction(FirebaseAppDistributionAction, ABC):
+    # Partial response field mask to only include the release fields that are required
+    # to construct Release resources. Optional fields such as release notes are omitted.
+    # https://cloud.google.com/apis/docs/system-parameters#definitions
+    RELEASE_LIST_FIELDS: ClassVar[str] = (
+        "releases(name,createTime,firebaseConsoleUri,testingUri,binaryDownloadUri,buildVersion)"
+    )
+
     @cli.action(
         "get-latest-build-version",
         ReleasesArgument.APP_ID,
@@ -18,7 +26,12 @@ class GetLatestBuildVersionAction(FirebaseAppDistributionAction, ABC):
         Get latest build version from Firebase
         """
         try:
-            releases = self.client.releases.list(self.project_number, app_id, limit=1)
+            releases = self.client.releases.list(
+                self.project_number,
+                app_id,
+                limit=1,
+                fields=self.RELEASE_LIST_FIELDS,
+            )
         except GoogleError as e:
             raise FirebaseAppDistributionError(str(e))
         if not releases:
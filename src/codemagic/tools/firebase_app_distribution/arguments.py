@@ -69,3 +69,27 @@ class ReleasesArgument(cli.Argument):
         ),
         argparse_kwargs={"required": True},
     )
+    BUILD_VERSION = cli.ArgumentProperties(
+        key="build_version",
+        flags=("--build-version",),
+        description=(
+            "Only list releases with exactly the given build version. Firebase does not support "
+            "filtering releases by build version, so releases are paginated until enough matching "
+            "releases are found"
+        ),
+        argparse_kwargs={"required": False},
+    )
+    BINARY_PATH = cli.ArgumentProperties(
+        key="binary_path",
+        flags=("--binary", "-b"),
+        type=cli.CommonArgumentTypes.existing_path,
+        description="Path to application binary (*.apk, *.aab or *.ipa) that is uploaded to Firebase App Distribution",
+        argparse_kwargs={"required": True},
+    )
+    UPLOAD_TIMEOUT = cli.ArgumentProperties(
+        key="upload_timeout",
+        flags=("--upload-timeout",),
+        type=cli.CommonArgumentTypes.bounded_number(float, 0, float("inf"), inclusive=False),
+        description="Maximum time in seconds to wait for Firebase to finish processing the uploaded binary",
+        argparse_kwargs={"required": False, "default": 600},
+    )
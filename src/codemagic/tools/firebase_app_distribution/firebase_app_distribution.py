@@ -29,7 +29,7 @@ class FirebaseAppDistribution(
     ReleasesActionGroup,
 ):
     """
-    Utility to list releases and retrieve the latest release build version number from Firebase
+    Utility to upload and list releases and retrieve the latest release build version number from Firebase
     """
 
     def __init__(
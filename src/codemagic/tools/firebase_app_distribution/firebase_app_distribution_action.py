@@ -1,7 +1,9 @@
 import logging
+import pathlib
 from abc import ABC
 from abc import abstractmethod
 from typing import List
+from typing import Optional
 
 from codemagic.google.firebase_client import FirebaseClient
 from codemagic.google.resources import ResourcePrinter
@@ -38,9 +40,23 @@ class FirebaseAppDistributionAction(ABC):
         app_id: str,
         limit: int = 25,
         order_by: OrderBy = OrderBy.CREATE_TIME_DESC,
+        build_version: Optional[str] = None,
         should_print: bool = True,
     ) -> List[Release]:
         from .action_groups.releases_action_group import ReleasesActionGroup
 
         _ = ReleasesActionGroup.list_releases  # Implementation
         raise NotImplementedError()
+
+    @abstractmethod
+    def upload_release(
+        self,
+        app_id: str,
+        binary_path: pathlib.Path,
+        upload_timeout: float = 600,
+        should_print: bool = True,
+    ) -> Release:
+        from .action_groups.releases_action_group import ReleasesActionGroup
+
+        _ = ReleasesActionGroup.upload_release  # Implementation
+        raise NotImplementedError()
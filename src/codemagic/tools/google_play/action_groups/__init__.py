@@ -1,6 +1,7 @@
 from .apks_action_group import ApksActionGroup
 from .bundles_action_group import BundlesActionGroup
 from .deobfuscation_files_action_group import DeobfuscationFilesActionGroup
+from .edits_action_group import EditsActionGroup
 from .expansion_files_action_group import ExpansionFilesActionGroup
 from .internal_app_sharing_action_group import InternalAppSharingActionGroup
 from .tracks_action_group import TracksActionGroup
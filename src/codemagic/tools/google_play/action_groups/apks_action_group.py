@@ -76,9 +76,10 @@ class ApksActionGroup(GooglePlayBaseAction, metaclass=ABCMeta):
                 raise ApksArgument.APK_PATH.raise_argument_error("Not a valid APK")
 
         self.logger.info(Colors.BLUE(f'Upload APK "{apk_path}" to Google Play'))
-        self.logger.info(apk_package.get_text_summary())
+        with apk_package:
+            self.logger.info(apk_package.get_text_summary())
+            package_name = apk_package.get_package_name()
 
-        package_name = apk_package.get_package_name()
         try:
             with self.using_app_edit(package_name, edit) as edit:
                 apk = self.client.apks.upload(
@@ -91,6 +92,7 @@ class ApksActionGroup(GooglePlayBaseAction, metaclass=ABCMeta):
             self.logger.warning(Colors.RED(error_message))
             raise GooglePlayError(str(ge))
 
+        self.verify_uploaded_package(apk_package, apk.binary.sha256)
         self.logger.info(Colors.GREEN(f"\nUploaded APK {apk_path} to Google Play"))
         self.printer.print_resource(apk, should_print=should_print)
         return apk
@@ -135,9 +137,10 @@ class ApksActionGroup(GooglePlayBaseAction, metaclass=ABCMeta):
 
         self.logger.info(Colors.BLUE(f'Publishing APK "{apk_path}" to Google Play track {track_name}\n'))
 
-        package_name = apk_package.get_package_name()
+        with apk_package:
+            package_name = apk_package.get_package_name()
         try:
-            edit = self.client.edits.create(package_name)
+            edit = self.create_app_edit(package_name)
             apk = self.upload_apk(
                 apk_path,
                 edit=edit,
@@ -75,9 +75,10 @@ class BundlesActionGroup(GooglePlayBaseAction, metaclass=ABCMeta):
                 raise BundlesArgument.BUNDLE_PATH.raise_argument_error("Not a valid App Bundle")
 
         self.logger.info(Colors.BLUE(f'Upload App Bundle "{bundle_path}" to Google Play'))
-        self.logger.info(aab_package.get_text_summary())
+        with aab_package:
+            self.logger.info(aab_package.get_text_summary())
+            package_name = aab_package.get_package_name()
 
-        package_name = aab_package.get_package_name()
         try:
             with self.using_app_edit(package_name, edit) as edit:
                 bundle = self.client.bundles.upload(
@@ -90,6 +91,7 @@ class BundlesActionGroup(GooglePlayBaseAction, metaclass=ABCMeta):
             self.logger.warning(Colors.RED(error_message))
             raise GooglePlayError(str(ge))
 
+        self.verify_uploaded_package(aab_package, bundle.sha256)
         self.logger.info(Colors.GREEN(f"\nUploaded App Bundle {bundle_path} to Google Play"))
         self.printer.print_resource(bundle, should_print=should_print)
         return bundle
@@ -128,9 +130,10 @@ class BundlesActionGroup(GooglePlayBaseAction, metaclass=ABCMeta):
 
         self.logger.info(Colors.BLUE(f'Publishing App Bundle "{bundle_path}" to Google Play track {track_name}\n'))
 
-        package_name = aab_package.get_package_name()
+        with aab_package:
+            package_name = aab_package.get_package_name()
         try:
-            edit = self.client.edits.create(package_name)
+            edit = self.create_app_edit(package_name)
             bundle = self.upload_bundle(
                 bundle_path,
                 edit=edit,
@@ -1,5 +1,10 @@
+import contextlib
 import pathlib
+import tempfile
+import time
+import zipfile
 from abc import ABCMeta
+from typing import Iterator
 from typing import Optional
 
 from codemagic import cli
@@ -41,19 +46,80 @@ class DeobfuscationFilesActionGroup(GooglePlayBaseAction, metaclass=ABCMeta):
         upload_message = f'Upload {deobfuscation_file_type} deobfuscation file "{deobfuscation_file_path}'
         self.logger.info(Colors.BLUE(upload_message))
         try:
-            with self.using_app_edit(package_name, edit) as edit:
-                deobfuscation_file = self.client.deobfuscation_files.upload(
-                    package_name,
-                    edit.id,
-                    apk_version_code=apk_version_code,
-                    deobfuscation_file_path=deobfuscation_file_path,
-                    deobfuscation_file_type=deobfuscation_file_type,
-                )
+            with self._get_deobfuscation_upload_path(deobfuscation_file_path, deobfuscation_file_type) as upload_path:
+                upload_size = upload_path.stat().st_size
+                upload_started_at = time.monotonic()
+                with self.using_app_edit(package_name, edit) as edit:
+                    deobfuscation_file = self.client.deobfuscation_files.upload(
+                        package_name,
+                        edit.id,
+                        apk_version_code=apk_version_code,
+                        deobfuscation_file_path=upload_path,
+                        deobfuscation_file_type=deobfuscation_file_type,
+                    )
+                upload_duration = time.monotonic() - upload_started_at
         except GoogleError as ge:
             error_message = f"Uploading deobfuscation file {deobfuscation_file_path} to Google Play failed."
             self.logger.warning(Colors.RED(error_message))
             raise GooglePlayError(str(ge))
 
         self.logger.info(Colors.GREEN(f"\nUploaded {deobfuscation_file_type} deobfuscation file"))
+        upload_speed = upload_size / max(upload_duration, 1e-6)
+        self.logger.info(
+            f"Uploaded {self._format_size(upload_size)} in {upload_duration:.1f} seconds "
+            f"({self._format_size(upload_speed)}/s)",
+        )
         self.printer.print_resource(deobfuscation_file, should_print=should_print)
         return deobfuscation_file
+
+    @contextlib.contextmanager
+    def _get_deobfuscation_upload_path(
+        self,
+        deobfuscation_file_path: pathlib.Path,
+        deobfuscation_file_type: DeobfuscationFileType,
+    ) -> Iterator[pathlib.Path]:
+        """
+        Native debug symbols are accepted by Google Play as a zip archive. Symbol files
+        or directories of symbol files are compressed into a temporary archive before
+        upload, other deobfuscation files are uploaded as is.
+        """
+        if deobfuscation_file_type is not DeobfuscationFileType.NATIVE_CODE:
+            yield deobfuscation_file_path
+        elif deobfuscation_file_path.is_file() and zipfile.is_zipfile(deobfuscation_file_path):
+            yield deobfuscation_file_path
+        else:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                archive_path = pathlib.Path(temp_dir) / "native-debug-symbols.zip"
+                original_size = self._archive_native_debug_symbols(deobfuscation_file_path, archive_path)
+                archive_size = archive_path.stat().st_size
+                self.logger.info(
+                    f"Compressed native debug symbols from {self._format_size(original_size)} "
+                    f"to {self._format_size(archive_size)}, "
+                    f"saved {self._format_size(max(original_size - archive_size, 0))}",
+                )
+                yield archive_path
+
+    @classmethod
+    def _archive_native_debug_symbols(cls, symbols_path: pathlib.Path, archive_path: pathlib.Path) -> int:
+        if symbols_path.is_dir():
+            symbol_files = sorted(path for path in symbols_path.rglob("*") if path.is_file())
+            base_directory = symbols_path
+        else:
+            symbol_files = [symbols_path]
+            base_directory = symbols_path.parent
+
+        original_size = 0
+        with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for symbol_file in symbol_files:
+                # Files are copied to the archive in chunks, they are never fully read to memory
+                archive.write(symbol_file, arcname=str(symbol_file.relative_to(base_directory)))
+                original_size += symbol_file.stat().st_size
+        return original_size
+
+    @classmethod
+    def _format_size(cls, size: float) -> str:
+        for unit in ("B", "KB", "MB"):
+            if size < 1024:
+                return f"{size:.1f} {unit}"
+            size /= 1024
+        return f"{size:.1f} GB"
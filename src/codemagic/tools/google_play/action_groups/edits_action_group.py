@@ -0,0 +1,109 @@
+from abc import ABCMeta
+from typing import Optional
+
+from codemagic import cli
+from codemagic.cli import Colors
+from codemagic.google import GoogleError
+from codemagic.google.resources.google_play import AppEdit
+from codemagic.tools.google_play.app_edit_session import AppEditSession
+from codemagic.tools.google_play.arguments import GooglePlayArgument
+from codemagic.tools.google_play.arguments import ReleaseArgument
+from codemagic.tools.google_play.errors import GooglePlayError
+from codemagic.tools.google_play.google_play_base_action import GooglePlayBaseAction
+from codemagic.tools.google_play.track_cache import TrackCache
+
+from .google_play_action_groups import GooglePlayActionGroups
+
+
+class EditsActionGroup(GooglePlayBaseAction, metaclass=ABCMeta):
+    @cli.action(
+        "start",
+        GooglePlayArgument.PACKAGE_NAME,
+        action_group=GooglePlayActionGroups.EDITS,
+    )
+    def start_edit_session(self, package_name: str, should_print: bool = True) -> AppEdit:
+        """
+        Start an edit session for an app. Until the session is committed or discarded,
+        all subsequent actions for the app stage their changes in the same edit
+        instead of creating and committing edits of their own
+        """
+
+        try:
+            edit = self.get_session_edit(package_name)
+            if edit is None:
+                edit = self.client.edits.create(package_name)
+                self.get_edit_session(package_name).save(edit)
+                self.logger.info(Colors.GREEN(f'Started edit session for package "{package_name}"'))
+            else:
+                self.logger.info(Colors.BLUE(f'Resumed edit session for package "{package_name}"'))
+        except GoogleError as ge:
+            error_message = f'Starting edit session for package "{package_name}" failed.'
+            self.logger.warning(Colors.RED(error_message))
+            raise GooglePlayError(str(ge))
+
+        self.printer.print_resource(edit, should_print)
+        return edit
+
+    @cli.action(
+        "commit",
+        GooglePlayArgument.PACKAGE_NAME,
+        ReleaseArgument.CHANGES_NOT_SENT_FOR_REVIEW,
+        action_group=GooglePlayActionGroups.EDITS,
+    )
+    def commit_edit_session(
+        self,
+        package_name: str,
+        changes_not_sent_for_review: Optional[bool] = None,
+        should_print: bool = True,
+    ) -> AppEdit:
+        """
+        Commit changes staged in the edit session of an app and end the session
+        """
+
+        session = self.get_edit_session(package_name)
+        edit = session.load()
+        if edit is None:
+            raise GooglePlayError(f'No edit session is active for package "{package_name}"')
+
+        try:
+            committed_edit = self.client.edits.commit(
+                edit,
+                package_name,
+                changes_not_sent_for_review=changes_not_sent_for_review,
+            )
+        except GoogleError as ge:
+            error_message = f'Committing edit session {edit.id} for package "{package_name}" failed.'
+            self.logger.warning(Colors.RED(error_message))
+            raise GooglePlayError(str(ge))
+
+        session.clear()
+        TrackCache.clear_package(package_name)
+        self.logger.info(Colors.GREEN(f'Committed edit session for package "{package_name}"'))
+        self.printer.print_resource(committed_edit, should_print)
+        return committed_edit
+
+    @cli.action(
+        "discard",
+        GooglePlayArgument.PACKAGE_NAME,
+        action_group=GooglePlayActionGroups.EDITS,
+    )
+    def discard_edit_session(self, package_name: str) -> None:
+        """
+        Delete the edit of the edit session for an app without committing staged changes
+        """
+
+        session = self.get_edit_session(package_name)
+        edit = session.load()
+        if edit is None:
+            self.logger.info(Colors.YELLOW(f'No edit session is active for package "{package_name}"'))
+            return
+
+        try:
+            if not AppEditSession.is_expired(edit):
+                self.client.edits.delete(edit, package_name=package_name)
+        except GoogleError as ge:
+            self.logger.warning(Colors.YELLOW(f"Deleting edit {edit.id} failed: {ge}"))
+        finally:
+            session.clear()
+
+        self.logger.info(Colors.GREEN(f'Discarded edit session for package "{package_name}"'))
@@ -14,6 +14,12 @@ class GooglePlayActionGroups(cli.ActionGroup):
         name="bundles",
         description="Work with App Bundles in Google Play",
     )
+    EDITS = cli.ActionGroupProperties(
+        name="edits",
+        description=(
+            "Manage Google Play edit sessions that are shared between multiple invocations and committed explicitly"
+        ),
+    )
     DEOBFUSCATION_FILES = cli.ActionGroupProperties(
         name="deobfuscation-files",
         description="Manage APK deobfuscation files in Google Play",
@@ -59,11 +59,13 @@ class InternalAppSharingActionGroup(GooglePlayBaseAction, metaclass=ABCMeta):
             raise ApksArgument.APK_PATH.raise_argument_error("Not a valid APK")
 
         self.logger.info(Colors.BLUE(f'Upload APK "{apk_path}" to Google Play internal app sharing'))
-        self.logger.info(apk_package.get_text_summary())
+        with apk_package:
+            self.logger.info(apk_package.get_text_summary())
+            package_name = apk_package.get_package_name()
 
         try:
             internal_app_sharing_artifact = self.client.internal_app_sharing_artifacts.upload_apk(
-                apk_package.get_package_name(),
+                package_name,
                 apk_path=apk_path,
             )
         except GoogleError as ge:
@@ -71,6 +73,7 @@ class InternalAppSharingActionGroup(GooglePlayBaseAction, metaclass=ABCMeta):
             self.logger.warning(Colors.RED(error_message))
             raise GooglePlayError(str(ge))
 
+        self.verify_uploaded_package(apk_package, internal_app_sharing_artifact.sha256)
         self.logger.info(Colors.GREEN("\nUploaded APK to Google Play internal app sharing"))
         self.printer.print_resource(internal_app_sharing_artifact, should_print=should_print)
         return internal_app_sharing_artifact
@@ -95,11 +98,13 @@ class InternalAppSharingActionGroup(GooglePlayBaseAction, metaclass=ABCMeta):
             raise BundlesArgument.BUNDLE_PATH.raise_argument_error("Not a valid App Bundle")
 
         self.logger.info(Colors.BLUE(f'Upload App Bundle "{bundle_path}" to Google Play internal app sharing'))
-        self.logger.info(aab_package.get_text_summary())
+        with aab_package:
+            self.logger.info(aab_package.get_text_summary())
+            package_name = aab_package.get_package_name()
 
         try:
             internal_app_sharing_artifact = self.client.internal_app_sharing_artifacts.upload_bundle(
-                aab_package.get_package_name(),
+                package_name,
                 bundle_path=bundle_path,
             )
         except GoogleError as ge:
@@ -41,6 +41,12 @@ class TracksActionGroup(GooglePlayBaseAction, metaclass=ABCMeta):
         Get information about release track from Google Play for an app
         """
 
+        cached_tracks = self.get_cached_tracks(package_name) if edit is None else None
+        cached_track = next((t for t in cached_tracks or [] if t.track == track_name), None)
+        if cached_track is not None:
+            self.printer.print_resource(cached_track, should_print)
+            return cached_track
+
         try:
             with self.using_app_edit(package_name, edit) as edit:
                 track = self.client.tracks.get(package_name, track_name, edit.id)
@@ -61,20 +67,34 @@ class TracksActionGroup(GooglePlayBaseAction, metaclass=ABCMeta):
         self,
         package_name: str,
         edit: Optional[AppEdit] = None,
+        fields: Optional[str] = None,
         should_print: bool = True,
     ) -> List[Track]:
         """
         List information about release tracks from Google Play for an app
         """
 
+        cached_tracks = self.get_cached_tracks(package_name) if edit is None else None
+        if cached_tracks is not None:
+            self.printer.print_resources(cached_tracks, should_print)
+            return cached_tracks
+
+        should_cache_tracks = edit is None and self.track_cache_ttl is not None
+        if should_cache_tracks:
+            # Partial responses are not cached as other invocations might require all track details
+            fields = None
+
         try:
             with self.using_app_edit(package_name, edit) as edit:
-                tracks = self.client.tracks.list(package_name, edit.id)
+                tracks = self.client.tracks.list(package_name, edit.id, fields=fields)
         except GoogleError as ge:
             error_message = f'Listing tracks from Google Play for package "{package_name}" failed.'
             self.logger.warning(Colors.RED(error_message))
             raise GooglePlayError(str(ge))
 
+        if should_cache_tracks:
+            self.cache_tracks(package_name, tracks)
+
         self.printer.print_resources(tracks, should_print)
         return tracks
 
@@ -105,8 +125,15 @@ class TracksActionGroup(GooglePlayBaseAction, metaclass=ABCMeta):
         track release are not specified, then the latest release will be promoted
         """
 
-        source_track = self.get_track(package_name, source_track_name, should_print=False)
-        target_track = self.get_track(package_name, target_track_name, should_print=False)
+        try:
+            edit = self.create_app_edit(package_name)
+        except GoogleError as ge:
+            self.logger.warning(Colors.RED(f'Creating edit for package "{package_name}" failed.'))
+            raise GooglePlayError(str(ge))
+
+        # Tracks are read within the edit that is committed to bypass cached track information
+        source_track = self.get_track(package_name, source_track_name, edit=edit, should_print=False)
+        target_track = self.get_track(package_name, target_track_name, edit=edit, should_print=False)
 
         source_releases: List[Release] = source_track.releases or []
         if promote_version_code:
@@ -134,9 +161,8 @@ class TracksActionGroup(GooglePlayBaseAction, metaclass=ABCMeta):
 
         update_track = dataclasses.replace(target_track, releases=[release_to_promote])
         try:
-            edit = self.client.edits.create(package_name)
             updated_track = self.client.tracks.update(update_track, package_name, edit.id)
-            self.client.edits.commit(edit, package_name)
+            self.commit_app_edit(edit, package_name)
         except GoogleError as ge:
             error_message = (
                 f"Promoting release {release_to_promote.name} from "
@@ -208,9 +234,9 @@ class TracksActionGroup(GooglePlayBaseAction, metaclass=ABCMeta):
 
         try:
             if not edit:
-                edit = self.client.edits.create(package_name)
+                edit = self.create_app_edit(package_name)
             self.client.tracks.update(track, package_name, edit.id)
-            self.client.edits.commit(edit, package_name, changes_not_sent_for_review=changes_not_sent_for_review)
+            self.commit_app_edit(edit, package_name, changes_not_sent_for_review=changes_not_sent_for_review)
         except GoogleError as ge:
             error_message = f"Setting release for Google Play track {track_name} failed."
             self.logger.warning(Colors.RED(error_message))
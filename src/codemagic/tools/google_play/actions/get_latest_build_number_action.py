@@ -1,46 +1,124 @@
+import json
 from abc import ABCMeta
 from itertools import chain
+from typing import ClassVar
 from typing import Dict
+from typing import List
 from typing import Optional
 from typing import Sequence
+from typing import Union
 
 from codemagic import cli
 from codemagic.cli import Colors
+from codemagic.google import GoogleError
 from codemagic.google.resources.google_play import Track
-from codemagic.tools.google_play.arguments import GooglePlayArgument
 from codemagic.tools.google_play.arguments import LatestBuildNumberArgument
 from codemagic.tools.google_play.errors import GooglePlayError
 from codemagic.tools.google_play.google_play_base_action import GooglePlayBaseAction
 
 
 class GetLatestBuildNumberAction(GooglePlayBaseAction, metaclass=ABCMeta):
+    # Partial response field mask to only include the track fields that are used to resolve
+    # the version codes. Release status is included as it is required for Release resources.
+    # https://developers.google.com/android-publisher/performance#partial-response
+    TRACK_LIST_FIELDS: ClassVar[str] = "tracks(track,releases(status,versionCodes))"
+
     @cli.action(
         "get-latest-build-number",
-        GooglePlayArgument.PACKAGE_NAME,
+        LatestBuildNumberArgument.PACKAGE_NAMES,
         LatestBuildNumberArgument.TRACKS,
     )
     def get_latest_build_number(
         self,
-        package_name: str,
+        package_name: Union[str, Sequence[str]],
         tracks: Optional[Sequence[str]] = None,
         should_print: bool = True,
-    ) -> Optional[int]:
+    ) -> Union[int, Dict[str, int]]:
         """
         Get latest build number from Google Play matching given constraints
         """
 
+        package_names = [package_name] if isinstance(package_name, str) else list(dict.fromkeys(package_name))
+        if len(package_names) > 1:
+            return self.get_latest_build_numbers(package_names, tracks, should_print=should_print)
+
         requested_track_names = tuple(tracks or [])
-        self._log_get_package_action_started(package_name, requested_track_names)
-        package_tracks = self.list_tracks(package_name, should_print=False)
-        track_version_codes = self._get_max_track_version_codes(requested_track_names, package_tracks)
-        self._show_missing_tracks_warnings(requested_track_names, tuple(track_version_codes.keys()))
-        latest_build_number = self._get_latest_build_number(package_name, requested_track_names, track_version_codes)
+        self._log_get_package_action_started(package_names[0], requested_track_names)
+        package_tracks = self.list_tracks(package_names[0], fields=self.TRACK_LIST_FIELDS, should_print=False)
+        latest_build_number = self._resolve_latest_build_number(package_names[0], requested_track_names, package_tracks)
 
         if should_print:
             self.echo(str(latest_build_number))
 
         return latest_build_number
 
+    def get_latest_build_numbers(
+        self,
+        package_names: Sequence[str],
+        tracks: Optional[Sequence[str]] = None,
+        should_print: bool = True,
+    ) -> Dict[str, int]:
+        """
+        Get latest build numbers for multiple packages from Google Play. Tracks of all the
+        packages are fetched using batch requests, so that the number of HTTP round trips
+        does not depend on the number of packages.
+        """
+
+        requested_track_names = tuple(tracks or [])
+        packages_tracks: Dict[str, List[Track]] = {}
+        for package_name in package_names:
+            self._log_get_package_action_started(package_name, requested_track_names)
+            cached_tracks = self.get_cached_tracks(package_name)
+            if cached_tracks is not None:
+                packages_tracks[package_name] = cached_tracks
+
+        if uncached_package_names := [name for name in package_names if name not in packages_tracks]:
+            packages_tracks.update(self._list_packages_tracks(uncached_package_names))
+
+        latest_build_numbers = {
+            package_name: self._resolve_latest_build_number(
+                package_name,
+                requested_track_names,
+                packages_tracks[package_name],
+            )
+            for package_name in package_names
+        }
+
+        if should_print and self.printer.print_json:
+            self.echo(json.dumps(latest_build_numbers, indent=4))
+        elif should_print:
+            for package_name, latest_build_number in latest_build_numbers.items():
+                self.echo(f"{package_name} {latest_build_number}")
+
+        return latest_build_numbers
+
+    def _list_packages_tracks(self, package_names: Sequence[str]) -> Dict[str, List[Track]]:
+        # Partial responses are not cached as other invocations might require all track details
+        fields = None if self.track_cache_ttl is not None else self.TRACK_LIST_FIELDS
+        try:
+            with self.using_app_edits(package_names) as edits:
+                package_edits = [(package_name, edit.id) for package_name, edit in zip(package_names, edits)]
+                packages_tracks = self.client.tracks.list_many(package_edits, fields=fields)
+        except GoogleError as ge:
+            formatted_package_names = ", ".join(f'"{package_name}"' for package_name in package_names)
+            error_message = f"Listing tracks from Google Play for packages {formatted_package_names} failed."
+            self.logger.warning(Colors.RED(error_message))
+            raise GooglePlayError(str(ge))
+
+        for package_name, package_tracks in zip(package_names, packages_tracks):
+            self.cache_tracks(package_name, package_tracks)
+        return dict(zip(package_names, packages_tracks))
+
+    def _resolve_latest_build_number(
+        self,
+        package_name: str,
+        requested_track_names: Sequence[str],
+        package_tracks: List[Track],
+    ) -> int:
+        track_version_codes = self._get_max_track_version_codes(requested_track_names, package_tracks)
+        self._show_missing_tracks_warnings(requested_track_names, tuple(track_version_codes.keys()))
+        return self._get_latest_build_number(package_name, requested_track_names, track_version_codes)
+
     def _log_get_package_action_started(self, package_name: str, requested_tracks: Sequence[str]):
         if not requested_tracks:
             message = f'Get package "{package_name}" latest build number across all tracks'
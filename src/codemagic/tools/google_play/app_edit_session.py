@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import pathlib
+import tempfile
+import time
+from typing import ClassVar
+from typing import Optional
+
+from codemagic.google.resources.google_play import AppEdit
+from codemagic.utilities import log
+from codemagic.utilities.private_files import ensure_private_directory
+from codemagic.utilities.private_files import write_private_file
+
+
+class AppEditSession:
+    """
+    Persists Google Play app edit ID on disk so that the same edit can be
+    used by multiple `google-play` invocations until it is explicitly committed.
+    Sessions are kept separately for each service account, and the session
+    directories are accessible only to the current user.
+    """
+
+    DEFAULT_DIRECTORY: ClassVar[pathlib.Path] = (
+        pathlib.Path(tempfile.gettempdir()) / ".codemagic-cli-tools" / "google_play_edit_sessions"
+    )
+
+    def __init__(self, package_name: str, client_email: str, directory: Optional[pathlib.Path] = None):
+        self.package_name = package_name
+        self.client_email = client_email
+        self._directory = directory or self.DEFAULT_DIRECTORY
+        self._logger = log.get_file_logger(self.__class__)
+
+    @property
+    def path(self) -> pathlib.Path:
+        client_email_digest = hashlib.sha256(self.client_email.encode()).hexdigest()[:32]
+        return self._directory / self.package_name / f"{client_email_digest}.json"
+
+    def _ensure_directory(self):
+        ensure_private_directory(self._directory)
+        ensure_private_directory(self.path.parent)
+
+    def is_active(self) -> bool:
+        return self.path.is_file()
+
+    def load(self) -> Optional[AppEdit]:
+        if not self.is_active():
+            return None
+        try:
+            self._ensure_directory()
+            session = json.loads(self.path.read_text())
+            return AppEdit(id=session["id"], expiryTimeSeconds=session["expiryTimeSeconds"])
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError, OSError):
+            self._logger.exception("Invalid Google Play edit session state in %s", self.path)
+            return None
+
+    def save(self, edit: AppEdit):
+        self._logger.debug("Save Google Play edit %s session for %r to %s", edit.id, self.package_name, self.path)
+        self._ensure_directory()
+        # Replace session state atomically as it can be read by concurrent invocations
+        write_private_file(self.path, json.dumps(edit.dict()))
+
+    def clear(self):
+        self._logger.debug("Clear Google Play edit session for %r from %s", self.package_name, self.path)
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    @classmethod
+    def is_expired(cls, edit: AppEdit) -> bool:
+        try:
+            return int(edit.expiryTimeSeconds) <= time.time()
+        except ValueError:
+            return True
@@ -24,6 +24,15 @@ class CredentialsArgument(cli.EnvironmentArgumentValue[dict]):
         raise argparse.ArgumentTypeError("Provided value is not a service account object")
 
 
+class TrackCacheTtlArgument(cli.TypedCliArgument[float]):
+    argument_type = float
+    environment_variable_key = "GOOGLE_PLAY_TRACK_CACHE_TTL"
+
+    @classmethod
+    def _is_valid(cls, value: float) -> bool:
+        return value > 0
+
+
 class ReleaseNotesArgument(cli.EnvironmentArgumentValue[List[LocalizedText]]):
     argument_type = List[LocalizedText]
     environment_variable_key = "GOOGLE_PLAY_RELEASE_NOTES"
@@ -31,6 +31,18 @@ class GooglePlayArgument(cli.Argument):
         description="Whether to show the request response in JSON format",
         argparse_kwargs={"required": False, "action": "store_true"},
     )
+    TRACK_CACHE_TTL = cli.ArgumentProperties(
+        key="track_cache_ttl",
+        flags=("--track-cache-ttl",),
+        type=argument_types.TrackCacheTtlArgument,
+        description=(
+            "Cache release track information of the app to disk for given number of seconds. "
+            "Cached tracks are reused by following invocations to list tracks or to get the latest "
+            "build number instead of requesting them from Google Play API again. The cache is "
+            "invalidated when an edit for the app is committed. Caching is disabled by default"
+        ),
+        argparse_kwargs={"required": False},
+    )
     PACKAGE_NAME = cli.ArgumentProperties(
         key="package_name",
         flags=("--package-name", "-p"),
@@ -108,6 +120,21 @@ class PromoteArgument(cli.Argument):
 
 
 class LatestBuildNumberArgument(cli.Argument):
+    PACKAGE_NAMES = cli.ArgumentProperties(
+        key="package_name",
+        flags=("--package-name", "-p"),
+        type=cli.CommonArgumentTypes.non_empty_string,
+        description=(
+            f"Package name of the app in Google Play Console. For example `{Colors.WHITE('com.example.app')}`. "
+            "Repeat the argument to get the latest build numbers for multiple packages at once, in which case "
+            "the build number is shown for each package separately"
+        ),
+        argparse_kwargs={
+            "required": True,
+            "action": "append",
+            "type": cli.CommonArgumentTypes.non_empty_string,
+        },
+    )
     TRACKS = cli.ArgumentProperties(
         key="tracks",
         flags=("--tracks", "-t"),
@@ -186,7 +213,10 @@ class DeobfuscationsArgument(cli.Argument):
         key="deobfuscation_file_path",
         flags=("--deobfuscation-file", "-d"),
         type=cli.CommonArgumentTypes.existing_path,
-        description="Path to deobfuscation file",
+        description=(
+            "Path to deobfuscation file. For native code debug symbols the path can also be a directory "
+            "of symbol files or a single symbol file, which are compressed to a zip archive before upload"
+        ),
         argparse_kwargs={"required": True},
     )
     DEOBFUSCATION_FILE_TYPE = cli.ArgumentProperties(
@@ -4,29 +4,43 @@ from __future__ import annotations
 
 import argparse
 import contextlib
+from typing import Dict
 from typing import Generator
+from typing import List
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
 from typing import cast
 
 from codemagic import cli
+from codemagic.cli import Colors
 from codemagic.google import GooglePlayClient
+from codemagic.google.errors import GoogleError
+from codemagic.google.errors import GoogleHttpError
 from codemagic.google.resources import ResourcePrinter
 from codemagic.google.resources.google_play import AppEdit
+from codemagic.google.resources.google_play import Track
+from codemagic.models.application_package.abstract_package import AbstractPackage
 
 from . import action_groups
 from . import actions
+from .app_edit_session import AppEditSession
 from .arguments import GooglePlayArgument
+from .errors import GooglePlayError
+from .track_cache import TrackCache
 
 
 @cli.common_arguments(
     GooglePlayArgument.GOOGLE_PLAY_SERVICE_ACCOUNT_CREDENTIALS,
     GooglePlayArgument.JSON_OUTPUT,
+    GooglePlayArgument.TRACK_CACHE_TTL,
 )
 class GooglePlay(
     cli.CliApp,
     action_groups.ApksActionGroup,
     action_groups.BundlesActionGroup,
     action_groups.DeobfuscationFilesActionGroup,
+    action_groups.EditsActionGroup,
     action_groups.InternalAppSharingActionGroup,
     action_groups.ExpansionFilesActionGroup,
     action_groups.TracksActionGroup,
@@ -40,29 +54,126 @@ class GooglePlay(
         self,
         credentials: dict,
         json_output: bool = False,
+        track_cache_ttl: Optional[float] = None,
         **kwargs,
     ):
         super().__init__(**kwargs)
         self.client = GooglePlayClient(credentials)
+        self.client_email = str(credentials.get("client_email", ""))
         self.printer = ResourcePrinter(json_output, self.echo)
+        self.track_cache_ttl = track_cache_ttl
 
     @classmethod
     def from_cli_args(cls, cli_args: argparse.Namespace) -> GooglePlay:
         credentials_argument = GooglePlayArgument.GOOGLE_PLAY_SERVICE_ACCOUNT_CREDENTIALS.from_args(cli_args)
         if credentials_argument is None:
             raise GooglePlayArgument.GOOGLE_PLAY_SERVICE_ACCOUNT_CREDENTIALS.raise_argument_error()
+        track_cache_ttl_argument = GooglePlayArgument.TRACK_CACHE_TTL.from_args(cli_args)
 
         return GooglePlay(
             credentials=credentials_argument.value,
             json_output=bool(cli_args.json_output),
+            track_cache_ttl=track_cache_ttl_argument.value if track_cache_ttl_argument else None,
             **cls._parent_class_kwargs(cli_args),
         )
 
+    def get_edit_session(self, package_name: str) -> AppEditSession:
+        return AppEditSession(package_name, self.client_email)
+
+    def get_session_edit(self, package_name: str) -> Optional[AppEdit]:
+        """
+        Get the edit from active edit session for given package. In case the stored edit
+        has expired or was invalidated by a commit elsewhere, then a new edit is created
+        in its place and persisted for the session.
+        """
+        session = self.get_edit_session(package_name)
+        session_edit = session.load()
+        if session_edit is None:
+            return None
+
+        if not AppEditSession.is_expired(session_edit):
+            try:
+                return self.client.edits.get(session_edit, package_name)
+            except GoogleHttpError as e:
+                self.logger.debug("Session edit %s for %r is not usable: %s", session_edit.id, package_name, e)
+
+        message = (
+            f'Google Play edit session for package "{package_name}" has gone stale as edit {session_edit.id} '
+            "is no longer valid. Changes staged in previous invocations were discarded. Starting a new edit."
+        )
+        self.logger.warning(Colors.YELLOW(message))
+        new_edit = self.client.edits.create(package_name=package_name)
+        session.save(new_edit)
+        return new_edit
+
+    def create_app_edit(self, package_name: str) -> AppEdit:
+        session_edit = self.get_session_edit(package_name)
+        if session_edit is not None:
+            return session_edit
+        return self.client.edits.create(package_name)
+
+    def commit_app_edit(
+        self,
+        edit: AppEdit,
+        package_name: str,
+        changes_not_sent_for_review: Optional[bool] = None,
+    ) -> Optional[AppEdit]:
+        session_edit = self.get_edit_session(package_name).load()
+        if session_edit is not None and session_edit.id == edit.id:
+            executable = self.get_executable_name()
+            message = (
+                f"Changes are staged in edit session {edit.id}. "
+                f'Use "{executable} edits commit --package-name {package_name}" to commit them'
+            )
+            self.logger.info(Colors.BLUE(message))
+            return None
+        committed_edit = self.client.edits.commit(
+            edit,
+            package_name,
+            changes_not_sent_for_review=changes_not_sent_for_review,
+        )
+        TrackCache.clear_package(package_name)
+        return committed_edit
+
+    def get_cached_tracks(self, package_name: str) -> Optional[List[Track]]:
+        """
+        Get tracks of the package from disk cache in case caching is enabled. Cache is not
+        used while an edit session is active as the session edit can contain staged changes.
+        """
+        if self.track_cache_ttl is None or self.get_edit_session(package_name).is_active():
+            return None
+        tracks = TrackCache(package_name, self.client_email).load(self.track_cache_ttl)
+        if tracks is not None:
+            self.logger.info(Colors.BLUE(f'Using cached Google Play tracks for package "{package_name}"'))
+        return tracks
+
+    def cache_tracks(self, package_name: str, tracks: Sequence[Track]) -> None:
+        if self.track_cache_ttl is None or self.get_edit_session(package_name).is_active():
+            return
+        TrackCache(package_name, self.client_email).save(tracks)
+
+    def verify_uploaded_package(self, package: AbstractPackage, uploaded_sha256: Optional[str]) -> None:
+        """
+        Check that the SHA-256 digest reported by Google Play for the uploaded binary
+        matches the local package. Package is not read if Google Play did not report a digest.
+        """
+        if uploaded_sha256 is None:
+            return
+        local_sha256 = package.get_digests().sha256
+        self.logger.debug("Package %s SHA-256 digest: %s", package.path, local_sha256)
+        if uploaded_sha256.lower() != local_sha256:
+            raise GooglePlayError(
+                f"Uploaded binary SHA-256 digest {uploaded_sha256} does not match "
+                f"digest {local_sha256} of {package.path}",
+            )
+
     @contextlib.contextmanager
     def using_app_edit(self, package_name: str, edit: Optional[AppEdit] = None) -> Generator[AppEdit, None, None]:
         created_edit: Optional[AppEdit] = None
         try:
-            if edit is None:
+            if edit is None and (session_edit := self.get_session_edit(package_name)):
+                yield session_edit
+            elif edit is None:
                 created_edit = self.client.edits.create(package_name=package_name)
                 yield cast(AppEdit, created_edit)
             else:
@@ -71,6 +182,32 @@ class GooglePlay(
             if created_edit is not None:
                 self.client.edits.delete(created_edit, package_name=package_name)
 
+    @contextlib.contextmanager
+    def using_app_edits(self, package_names: Sequence[str]) -> Generator[List[AppEdit], None, None]:
+        """
+        Use edits of active edit sessions for the packages that have one. Edits for the
+        rest of the packages are created using a batch request and deleted afterwards.
+        """
+        edits: Dict[str, AppEdit] = {}
+        created_edits: List[Tuple[AppEdit, str]] = []
+        try:
+            for package_name in package_names:
+                if session_edit := self.get_session_edit(package_name):
+                    edits[package_name] = session_edit
+            new_edit_package_names = [package_name for package_name in package_names if package_name not in edits]
+            results = self.client.edits.create_many(new_edit_package_names) if new_edit_package_names else []
+            created_edits = [
+                (edit, name) for edit, name in zip(results, new_edit_package_names) if isinstance(edit, AppEdit)
+            ]
+            for result in results:
+                if isinstance(result, GoogleError):
+                    raise result
+            edits.update((package_name, edit) for edit, package_name in created_edits)
+            yield [edits[package_name] for package_name in package_names]
+        finally:
+            if created_edits:
+                self.client.edits.delete_many(created_edits)
+
 
 if __name__ == "__main__":
     GooglePlay.invoke_cli()
@@ -3,6 +3,7 @@ import logging
 import pathlib
 from abc import ABCMeta
 from abc import abstractmethod
+from typing import Dict
 from typing import Generator
 from typing import List
 from typing import Optional
@@ -18,6 +19,8 @@ from codemagic.google.resources.google_play import ExpansionFile
 from codemagic.google.resources.google_play import ExpansionFileType
 from codemagic.google.resources.google_play import LocalizedText
 from codemagic.google.resources.google_play import Track
+from codemagic.models.application_package.abstract_package import AbstractPackage
+from codemagic.tools.google_play.app_edit_session import AppEditSession
 from codemagic.tools.google_play.argument_types import ReleaseNotesArgument
 from codemagic.tools.google_play.arguments import DeobfuscationsArgument
 from codemagic.tools.google_play.arguments import ExpansionFileArgument
@@ -27,6 +30,7 @@ class GooglePlayBaseAction(metaclass=ABCMeta):
     client: GooglePlayClient
     logger: logging.Logger
     printer: ResourcePrinter
+    track_cache_ttl: Optional[float]
 
     # Define signatures for self-reference to other action groups
 
@@ -37,6 +41,60 @@ class GooglePlayBaseAction(metaclass=ABCMeta):
         _ = GooglePlay.using_app_edit  # Implementation
         raise NotImplementedError()
 
+    @contextlib.contextmanager
+    def using_app_edits(self, package_names: Sequence[str]) -> Generator[List[AppEdit], None, None]:
+        from ..google_play import GooglePlay
+
+        _ = GooglePlay.using_app_edits  # Implementation
+        raise NotImplementedError()
+
+    def get_edit_session(self, package_name: str) -> AppEditSession:
+        from ..google_play import GooglePlay
+
+        _ = GooglePlay.get_edit_session  # Implementation
+        raise NotImplementedError()
+
+    def get_session_edit(self, package_name: str) -> Optional[AppEdit]:
+        from ..google_play import GooglePlay
+
+        _ = GooglePlay.get_session_edit  # Implementation
+        raise NotImplementedError()
+
+    def create_app_edit(self, package_name: str) -> AppEdit:
+        from ..google_play import GooglePlay
+
+        _ = GooglePlay.create_app_edit  # Implementation
+        raise NotImplementedError()
+
+    def commit_app_edit(
+        self,
+        edit: AppEdit,
+        package_name: str,
+        changes_not_sent_for_review: Optional[bool] = None,
+    ) -> Optional[AppEdit]:
+        from ..google_play import GooglePlay
+
+        _ = GooglePlay.commit_app_edit  # Implementation
+        raise NotImplementedError()
+
+    def get_cached_tracks(self, package_name: str) -> Optional[List[Track]]:
+        from ..google_play import GooglePlay
+
+        _ = GooglePlay.get_cached_tracks  # Implementation
+        raise NotImplementedError()
+
+    def cache_tracks(self, package_name: str, tracks: Sequence[Track]) -> None:
+        from ..google_play import GooglePlay
+
+        _ = GooglePlay.cache_tracks  # Implementation
+        raise NotImplementedError()
+
+    def verify_uploaded_package(self, package: AbstractPackage, uploaded_sha256: Optional[str]) -> None:
+        from ..google_play import GooglePlay
+
+        _ = GooglePlay.verify_uploaded_package  # Implementation
+        raise NotImplementedError()
+
     @classmethod
     def echo(cls, message: str, *args, **kwargs) -> None: ...
 
@@ -45,9 +103,10 @@ class GooglePlayBaseAction(metaclass=ABCMeta):
     @abstractmethod
     def get_latest_build_number(
         self,
-        package_name: str,
+        package_name: Union[str, Sequence[str]],
         tracks: Optional[Sequence[str]] = None,
-    ) -> Optional[int]:
+        should_print: bool = True,
+    ) -> Union[int, Dict[str, int]]:
         from .actions import GetLatestBuildNumberAction
 
         _ = GetLatestBuildNumberAction.get_latest_build_number  # Implementation
@@ -71,6 +130,7 @@ class GooglePlayBaseAction(metaclass=ABCMeta):
         self,
         package_name: str,
         edit: Optional[AppEdit] = None,
+        fields: Optional[str] = None,
         should_print: bool = True,
     ) -> List[Track]:
         from .action_groups import TracksActionGroup
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import pathlib
+import tempfile
+import time
+from typing import ClassVar
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from codemagic.google.resources.google_play import Track
+from codemagic.utilities import log
+from codemagic.utilities.private_files import ensure_private_directory
+from codemagic.utilities.private_files import write_private_file
+
+
+class TrackCache:
+    """
+    Stores Google Play track information on disk so that repeated read-only
+    `google-play` invocations for the same package can be served locally.
+    Tracks are cached separately for each service account, and the cache
+    directories are accessible only to the current user.
+    """
+
+    DEFAULT_DIRECTORY: ClassVar[pathlib.Path] = (
+        pathlib.Path(tempfile.gettempdir()) / ".codemagic-cli-tools" / "cache" / "google_play_tracks"
+    )
+
+    def __init__(self, package_name: str, client_email: str, directory: Optional[pathlib.Path] = None):
+        self.package_name = package_name
+        self.client_email = client_email
+        self._directory = directory or self.DEFAULT_DIRECTORY
+        self._logger = log.get_file_logger(self.__class__)
+
+    @classmethod
+    def _get_package_directory(cls, package_name: str, directory: Optional[pathlib.Path] = None) -> pathlib.Path:
+        return (directory or cls.DEFAULT_DIRECTORY) / package_name
+
+    @property
+    def path(self) -> pathlib.Path:
+        client_email_digest = hashlib.sha256(self.client_email.encode()).hexdigest()[:32]
+        return self._get_package_directory(self.package_name, self._directory) / f"{client_email_digest}.json"
+
+    def _ensure_directory(self):
+        ensure_private_directory(self._directory)
+        ensure_private_directory(self.path.parent)
+
+    def load(self, ttl: float) -> Optional[List[Track]]:
+        try:
+            self._ensure_directory()
+            cache = json.loads(self.path.read_text())
+            cache_age = time.time() - float(cache["cached_at"])
+            tracks = [Track(**track) for track in cache["tracks"]]
+        except FileNotFoundError:
+            return None
+        except OSError:
+            self._logger.exception("Failed to read Google Play track cache from %s", self.path)
+            return None
+        except (ValueError, KeyError, TypeError):
+            self._logger.exception("Invalid Google Play track cache in %s", self.path)
+            self.clear()
+            return None
+
+        if not 0 <= cache_age <= ttl:
+            self._logger.debug("Google Play track cache for %r has expired", self.package_name)
+            return None
+
+        self._logger.debug("Loaded Google Play tracks for %r from cache %s", self.package_name, self.path)
+        return tracks
+
+    def save(self, tracks: Sequence[Track]):
+        self._logger.debug("Cache Google Play tracks for %r to %s", self.package_name, self.path)
+        cache = {
+            "cached_at": time.time(),
+            "tracks": [track.dict() for track in tracks],
+        }
+        try:
+            self._ensure_directory()
+            # Replace cache file atomically as the tracks can be read by concurrent processes
+            write_private_file(self.path, json.dumps(cache))
+        except OSError:
+            self._logger.exception("Failed to save Google Play track cache to %s", self.path)
+
+    def clear(self):
+        self._logger.debug("Clear Google Play track cache for %r from %s", self.package_name, self.path)
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    @classmethod
+    def clear_package(cls, package_name: str, directory: Optional[pathlib.Path] = None):
+        """
+        Remove cached tracks of the package for all service accounts
+        """
+        package_directory = cls._get_package_directory(package_name, directory)
+        log.get_file_logger(cls).debug("Clear Google Play track caches for %r from %s", package_name, package_directory)
+        for path in package_directory.glob("*.json"):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
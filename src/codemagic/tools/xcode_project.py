@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import pathlib
 import re
+import shlex
 import shutil
 from collections import defaultdict
 from typing import Counter
@@ -27,6 +28,10 @@ from codemagic.models import ExportOptions
 from codemagic.models import ProvisioningProfile
 from codemagic.models import Xcode
 from codemagic.models import Xcodebuild
+from codemagic.models import XcodebuildCompactFormatter
+from codemagic.models import XcodebuildJUnitFormatter
+from codemagic.models import XcodebuildOutputFormat
+from codemagic.models import XcodebuildOutputFormatter
 from codemagic.models import Xcpretty
 from codemagic.models.application_package import Ipa
 from codemagic.models.application_package import MacOsPackage
@@ -170,6 +175,8 @@ class XcodeProject(cli.CliApp, PathFinderMixin):
         XcodeProjectArgument.SCHEME_NAME,
         XcprettyArgument.DISABLE,
         XcprettyArgument.OPTIONS,
+        XcprettyArgument.FORMATTER,
+        XcprettyArgument.JUNIT_OUTPUT_PATH,
     )
     def clean(
         self,
@@ -180,13 +187,20 @@ class XcodeProject(cli.CliApp, PathFinderMixin):
         scheme_name: Optional[str] = None,
         disable_xcpretty: bool = False,
         xcpretty_options: str = XcprettyArgument.OPTIONS.get_default(),
+        xcodebuild_formatter: Optional[XcodebuildOutputFormat] = XcprettyArgument.FORMATTER.get_default(),
+        xcodebuild_junit_output_path: pathlib.Path = XcprettyArgument.JUNIT_OUTPUT_PATH.get_default(),
     ):
         """
         Clean Xcode project
         """
 
         self._ensure_project_or_workspace(xcode_project_path, xcode_workspace_path)
-        xcpretty = self._get_xcpretty(disable_xcpretty, xcpretty_options)
+        xcpretty = self._get_xcodebuild_formatter(
+            disable_xcpretty,
+            xcpretty_options,
+            xcodebuild_formatter,
+            xcodebuild_junit_output_path,
+        )
         xcodebuild = self._get_xcodebuild(**locals())
         self._clean(xcodebuild)
 
@@ -231,6 +245,8 @@ class XcodeProject(cli.CliApp, PathFinderMixin):
         ExportIpaArgument.REMOVE_XCARCHIVE,
         XcprettyArgument.DISABLE,
         XcprettyArgument.OPTIONS,
+        XcprettyArgument.FORMATTER,
+        XcprettyArgument.JUNIT_OUTPUT_PATH,
     )
     def build_ipa(
         self,
@@ -251,6 +267,8 @@ class XcodeProject(cli.CliApp, PathFinderMixin):
         remove_xcarchive: bool = False,
         disable_xcpretty: bool = False,
         xcpretty_options: str = XcprettyArgument.OPTIONS.get_default(),
+        xcodebuild_formatter: Optional[XcodebuildOutputFormat] = XcprettyArgument.FORMATTER.get_default(),
+        xcodebuild_junit_output_path: pathlib.Path = XcprettyArgument.JUNIT_OUTPUT_PATH.get_default(),
     ) -> pathlib.Path:
         """
         Build ipa by archiving the Xcode project and then exporting it
@@ -259,7 +277,12 @@ class XcodeProject(cli.CliApp, PathFinderMixin):
 
         show_build_settings = not disable_show_build_settings
         export_options = self._get_export_options_from_path(export_options_plist)
-        xcpretty = self._get_xcpretty(disable_xcpretty, xcpretty_options)
+        xcpretty = self._get_xcodebuild_formatter(
+            disable_xcpretty,
+            xcpretty_options,
+            xcodebuild_formatter,
+            xcodebuild_junit_output_path,
+        )
         xcodebuild = self._get_xcodebuild(**locals())
 
         xcode = Xcode.get_selected()
@@ -441,6 +464,8 @@ class XcodeProject(cli.CliApp, PathFinderMixin):
         XcodeArgument.TEST_XCARGS,
         XcprettyArgument.DISABLE,
         XcprettyArgument.OPTIONS,
+        XcprettyArgument.FORMATTER,
+        XcprettyArgument.JUNIT_OUTPUT_PATH,
     )
     def run_test(
         self,
@@ -460,6 +485,8 @@ class XcodeProject(cli.CliApp, PathFinderMixin):
         test_flags: Optional[str] = XcodeArgument.TEST_FLAGS.get_default(),
         disable_xcpretty: bool = False,
         xcpretty_options: str = XcprettyArgument.OPTIONS.get_default(),
+        xcodebuild_formatter: Optional[XcodebuildOutputFormat] = XcprettyArgument.FORMATTER.get_default(),
+        xcodebuild_junit_output_path: pathlib.Path = XcprettyArgument.JUNIT_OUTPUT_PATH.get_default(),
         output_dir: pathlib.Path = TestResultArgument.OUTPUT_DIRECTORY.get_default(),
         output_extension: str = TestResultArgument.OUTPUT_EXTENSION.get_default(),
         graceful_exit: bool = False,
@@ -470,7 +497,12 @@ class XcodeProject(cli.CliApp, PathFinderMixin):
         """
         self._ensure_project_or_workspace(xcode_project_path, xcode_workspace_path)
         simulators = self._get_test_destinations(test_sdk, devices)
-        xcpretty = self._get_xcpretty(disable_xcpretty, xcpretty_options)
+        xcpretty = self._get_xcodebuild_formatter(
+            disable_xcpretty,
+            xcpretty_options,
+            xcodebuild_formatter,
+            xcodebuild_junit_output_path,
+        )
         xcodebuild = self._get_xcodebuild(**locals())
         clean and self._clean(xcodebuild)
 
@@ -712,19 +744,46 @@ class XcodeProject(cli.CliApp, PathFinderMixin):
         self.echo("")
         return simulators
 
-    def _get_xcpretty(self, disable_xcpretty: bool = False, xcpretty_options: str = "") -> Optional[Xcpretty]:
+    def _get_xcodebuild_formatter(
+        self,
+        disable_xcpretty: bool = False,
+        xcpretty_options: str = "",
+        xcodebuild_formatter: Optional[XcodebuildOutputFormat] = None,
+        junit_output_path: Optional[pathlib.Path] = None,
+    ) -> Optional[XcodebuildOutputFormatter]:
         if disable_xcpretty:
             return None
+        elif xcodebuild_formatter is XcodebuildOutputFormat.JUNIT:
+            output_path = junit_output_path or XcprettyArgument.JUNIT_OUTPUT_PATH.get_default()
+            self.logger.info(f"Save xcodebuild test results as JUnit XML to {output_path}")
+            console_formatter = XcodebuildCompactFormatter.from_options(xcpretty_options)
+            return XcodebuildJUnitFormatter(output_path=output_path, console_formatter=console_formatter)
+
+        unsupported_options = XcodebuildCompactFormatter.get_unsupported_options(xcpretty_options)
+        if xcodebuild_formatter is XcodebuildOutputFormat.COMPACT:
+            return self._get_compact_xcodebuild_formatter(xcpretty_options, unsupported_options)
+        elif xcodebuild_formatter is None and not unsupported_options:
+            return XcodebuildCompactFormatter.from_options(xcpretty_options)
 
         if Xcpretty.is_available():
             return Xcpretty(xcpretty_options)
 
         message = (
-            "Cannot use xcpretty formatter to process Xcode log output. Showing verbatim Xcode logs.\n"
-            f"To see formatted logs install xcpretty with {Colors.BOLD('[sudo] gem install xcpretty')}\n"
+            "Cannot use xcpretty formatter to process Xcode log output. Using built-in compact formatter instead.\n"
+            f"To use xcpretty install it with {Colors.BOLD('[sudo] gem install xcpretty')}\n"
         )
         self.logger.info(Colors.YELLOW(message))
-        return None
+        return self._get_compact_xcodebuild_formatter(xcpretty_options, unsupported_options)
+
+    def _get_compact_xcodebuild_formatter(
+        self,
+        xcpretty_options: str,
+        unsupported_options: Sequence[str],
+    ) -> XcodebuildCompactFormatter:
+        if unsupported_options:
+            options = " ".join(shlex.quote(option) for option in unsupported_options)
+            self.logger.warning(Colors.YELLOW(f"Built-in compact formatter ignores xcpretty options {options}"))
+        return XcodebuildCompactFormatter.from_options(xcpretty_options)
 
     @classmethod
     def _get_xcodebuild(
@@ -734,7 +793,7 @@ class XcodeProject(cli.CliApp, PathFinderMixin):
         target_name: Optional[str] = None,
         configuration_name: Optional[str] = None,
         scheme_name: Optional[str] = None,
-        xcpretty: Optional[Xcpretty] = None,
+        xcpretty: Optional[XcodebuildOutputFormatter] = None,
         **_,
     ) -> Xcodebuild:
         try:
@@ -824,12 +883,13 @@ class XcodeProject(cli.CliApp, PathFinderMixin):
         except IOError as error:
             raise XcodeProjectException(str(error)) from error
 
-        if should_print:
-            if json_output:
-                summary = json.dumps(application_package.get_summary(), indent=4)
-            else:
-                summary = application_package.get_text_summary()
-            self.echo(summary)
+        with application_package:
+            if should_print:
+                if json_output:
+                    summary = json.dumps(application_package.get_summary(), indent=4)
+                else:
+                    summary = application_package.get_text_summary()
+                self.echo(summary)
 
         return application_package
 
@@ -1,16 +1,20 @@
+from __future__ import annotations
+
 import re
 import urllib.parse
 from datetime import datetime
 from datetime import timezone
+from typing import TYPE_CHECKING
 from typing import Dict
 from typing import Optional
 
-from requests import Response
-
 from codemagic import __version__
 
 from .base_auditor import BaseAuditor
 
+if TYPE_CHECKING:
+    from requests import Response
+
 
 class HttpRequestAuditor(BaseAuditor):
     def __init__(
@@ -1,10 +1,12 @@
 import io
+import mmap
 from abc import ABC
 from abc import abstractmethod
 from pathlib import Path
 from typing import BinaryIO
 from typing import Generic
 from typing import Iterable
+from typing import Iterator
 from typing import TextIO
 from typing import TypeVar
 from typing import Union
@@ -22,9 +24,11 @@ class BackwardsIterator(Generic[T], ABC):
         self.buffer_size = buffer_size
 
     @classmethod
-    def create(cls, file_descriptor: Union[TextIO, BinaryIO], buffer_size: int):
+    def create(cls, file_descriptor: Union[TextIO, BinaryIO], buffer_size: int, use_mmap: bool = True):
         if hasattr(file_descriptor, "encoding"):
             return _BackwardsTextIterator(cast(TextIO, file_descriptor), buffer_size)
+        elif use_mmap:
+            return _BackwardsMmapIterator(cast(BinaryIO, file_descriptor), buffer_size)
         return _BackwardsBytesIterator(cast(BinaryIO, file_descriptor), buffer_size)
 
     @abstractmethod
@@ -73,16 +77,73 @@ class _BackwardsBytesIterator(BackwardsIterator[bytes]):
         yield from (line.decode(errors="ignore") for line in self._iter_backwards())
 
 
+class _BackwardsMmapIterator(_BackwardsBytesIterator):
+    """
+    Finds line boundaries directly from memory-mapped file contents. The file is split into
+    blocks that end at line boundaries, and each block is decoded and split into lines only once
+    iteration reaches it. Streams that cannot be memory-mapped, such as pipes and in-memory files,
+    are read using seek-based reader instead. Unlike the seek-based reader, only LF and CRLF
+    line endings are treated as line boundaries.
+    """
+
+    block_size = 256 * 1024
+
+    def __iter__(self) -> Iterable[str]:
+        try:
+            blocks = self._iter_blocks()
+            first_block = next(blocks, None)
+        except (OSError, ValueError):
+            # Not a regular file (io.UnsupportedOperation is both OSError and ValueError)
+            yield from super().__iter__()
+            return
+
+        if first_block is not None:
+            yield from self._iter_block_lines(first_block)
+        for block in blocks:
+            yield from self._iter_block_lines(block)
+
+    @classmethod
+    def _iter_block_lines(cls, block: memoryview) -> Iterator[str]:
+        text = str(block, "utf-8", "ignore")
+        lines = text.split("\n")
+        if "\r" in text:
+            lines = [line[:-1] if line.endswith("\r") else line for line in lines]
+        yield from reversed(lines)
+
+    def _iter_blocks(self) -> Iterator[memoryview]:
+        """
+        Yield views to memory-mapped file contents in reverse order. Every block starts at
+        the beginning of a line, and line breaks between blocks are left out from the views.
+        A view is released once the next block is requested.
+        """
+        file_size = self.file_descriptor.seek(0, io.SEEK_END)
+        if file_size == 0:
+            return  # Empty files cannot be memory-mapped
+
+        with mmap.mmap(self.file_descriptor.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            with memoryview(mapped_file) as contents:
+                block_end = len(mapped_file)
+                while True:
+                    block_start = mapped_file.rfind(b"\n", 0, max(0, block_end - self.block_size)) + 1
+                    with contents[block_start:block_end] as block:
+                        yield block
+                    if block_start == 0:
+                        break
+                    block_end = block_start - 1
+
+
 def iter_backwards(
     file_or_path: Union[TextIO, BinaryIO, Path, str],
     buffer_size=8192,
+    use_mmap: bool = True,
 ) -> Iterable[str]:
     """
-    A generator that returns the lines of a file in reverse order
+    A generator that returns the lines of a file in reverse order.
+    Binary files are memory-mapped unless `use_mmap` is disabled.
     """
 
     if isinstance(file_or_path, (Path, str)):
         with open(file_or_path, "rb") as fd:
-            yield from BackwardsIterator.create(fd, buffer_size)
+            yield from BackwardsIterator.create(fd, buffer_size, use_mmap)
     else:
-        yield from BackwardsIterator.create(file_or_path, buffer_size)
+        yield from BackwardsIterator.create(file_or_path, buffer_size, use_mmap)
@@ -1,23 +1,63 @@
+import atexit
+import gzip
 import logging
 import os
 import pathlib
+import queue
+import shutil
 import sys
 import tempfile
 from datetime import datetime
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
+from logging.handlers import RotatingFileHandler
 from typing import IO
+from typing import TYPE_CHECKING
 from typing import Optional
 from typing import Type
 
+if TYPE_CHECKING:
+    import multiprocessing
+
 Logger = logging.Logger
 
 
+def _get_int_from_environment(variable_name: str, default: Optional[int]) -> Optional[int]:
+    try:
+        value = int(os.environ[variable_name])
+    except (KeyError, ValueError):
+        return default
+    return value if value >= 0 else default
+
+
+def _compressed_log_name(name: str) -> str:
+    return f"{name}.gz"
+
+
+def _compress_rotated_log(source: str, destination: str):
+    with open(source, "rb") as source_fd, gzip.open(destination, "wb") as destination_fd:
+        shutil.copyfileobj(source_fd, destination_fd)
+    os.remove(source)
+
+
 class LogHandlers:
     stream_fmt = "%(message)s"
     stream_fmt_verbose = "[%(asctime)s] %(levelname)-5s > %(message)s"
     file_fmt = "[%(asctime)s] %(levelname)-5s %(filename)s:%(lineno)d > %(message)s"
 
+    # Size based rotation of the log file is opt-in. The same log file is appended to by all
+    # CLI invocations of the day, and processes rotating it independently can lose records.
+    file_max_bytes_variable = "CODEMAGIC_LOG_FILE_MAX_BYTES"
+    file_max_bytes_default = 0
+    file_backup_count_variable = "CODEMAGIC_LOG_FILE_BACKUP_COUNT"
+    file_backup_count_default = 3
+    file_compress_variable = "CODEMAGIC_LOG_FILE_COMPRESS"
+
     _stream_handler: Optional[logging.StreamHandler] = None
-    _file_handler: Optional[logging.FileHandler] = None
+    _file_handler: Optional[QueueHandler] = None
+    _file_listener: Optional[QueueListener] = None
+    _file_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _is_worker_process: bool = False
 
     @classmethod
     def configure_stream_handler(
@@ -42,16 +82,64 @@ class LogHandlers:
         return cls._stream_handler
 
     @classmethod
-    def configure_file_handler(cls) -> logging.FileHandler:
+    def _create_rotating_file_handler(cls) -> RotatingFileHandler:
+        max_bytes = _get_int_from_environment(cls.file_max_bytes_variable, cls.file_max_bytes_default)
+        backup_count = _get_int_from_environment(cls.file_backup_count_variable, cls.file_backup_count_default)
+        file_handler = RotatingFileHandler(get_log_path(), maxBytes=max_bytes or 0, backupCount=backup_count or 0)
+        if os.environ.get(cls.file_compress_variable, "").lower() in ("1", "true", "yes"):
+            file_handler.namer = _compressed_log_name
+            file_handler.rotator = _compress_rotated_log
+        return file_handler
+
+    @classmethod
+    def configure_file_handler(cls) -> QueueHandler:
+        """
+        Log records are written to the log file from a background thread so that logging
+        calls never wait for disk. Loggers share the same queue handler, and reconfiguring
+        only replaces the file handler the queued records are written to.
+        """
         file_formatter = logging.Formatter(cls.file_fmt, "%H:%M:%S %d-%m-%Y")
-        cls._file_handler = logging.FileHandler(get_log_path())
+        file_handler = cls._create_rotating_file_handler()
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(file_formatter)
+
+        cls.stop_file_logging()
+        if cls._file_handler is None:
+            cls._file_handler = QueueHandler(cls._file_log_queue)
+            cls._file_handler.setLevel(logging.DEBUG)
+            atexit.register(cls.stop_file_logging)
+        cls._file_listener = QueueListener(cls._file_log_queue, file_handler, respect_handler_level=True)
+        cls._file_listener.start()
+        return cls._file_handler
+
+    @classmethod
+    def stop_file_logging(cls):
+        """
+        Write all queued log records to the log file and close it
+        """
+        if cls._file_listener is None:
+            return
+        cls._file_listener.stop()
+        for handler in cls._file_listener.handlers:
+            handler.close()
+        cls._file_listener = None
+
+    @classmethod
+    def configure_worker_file_handler(cls, log_queue: "multiprocessing.Queue[logging.LogRecord]") -> QueueHandler:
+        """
+        Send log records of a worker process to given queue instead of writing them to the
+        log file. The queue is drained to the log file by the process that started the worker.
+        """
+        cls._file_handler = QueueHandler(log_queue)
         cls._file_handler.setLevel(logging.DEBUG)
-        cls._file_handler.setFormatter(file_formatter)
+        cls._is_worker_process = True
         return cls._file_handler
 
     @classmethod
-    def get_file_handler(cls) -> logging.FileHandler:
-        return cls._file_handler or cls.configure_file_handler()
+    def get_file_handler(cls) -> QueueHandler:
+        if cls._file_handler is None or (cls._file_listener is None and not cls._is_worker_process):
+            return cls.configure_file_handler()
+        return cls._file_handler
 
     @classmethod
     def get_stream_handler(cls) -> logging.StreamHandler:
@@ -71,6 +159,14 @@ def get_log_path() -> pathlib.Path:
     return log_path
 
 
+def get_process_output_log_limit() -> Optional[int]:
+    """
+    Maximum number of characters of output that is written to the log file
+    for each executed process. Process output is not logged if the limit is 0.
+    """
+    return _get_int_from_environment("CODEMAGIC_LOG_PROCESS_OUTPUT_LIMIT", None)
+
+
 def _get_logger_name(base_name: str, file_logging: bool, stream_logging: bool) -> str:
     choices = ((file_logging, "File"), (stream_logging, "Stream"))
     middle = "".join(name for log, name in choices if log)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import contextlib
+import os
+import pathlib
+import stat
+import tempfile
+
+
+def ensure_private_directory(directory: pathlib.Path) -> None:
+    """
+    Create the directory so that only the current user can access it. Permissions of an
+    existing directory are restricted too, and directories that are not owned by the
+    current user, for example ones pre-created by someone else in a shared temporary
+    directory, are refused.
+    """
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    directory_stat = directory.lstat()
+    if not stat.S_ISDIR(directory_stat.st_mode):
+        raise PermissionError(f"Path {directory} is not a directory")
+    if hasattr(os, "getuid") and directory_stat.st_uid != os.getuid():
+        raise PermissionError(f"Directory {directory} is owned by another user")
+    if stat.S_IMODE(directory_stat.st_mode) != 0o700:
+        directory.chmod(0o700)
+
+
+def write_private_file(path: pathlib.Path, contents: str) -> None:
+    """
+    Replace file contents atomically so that concurrent readers never see a partially
+    written file. The file is readable and writable only by the current user.
+    """
+    # Temporary files are created with 0600 permissions
+    with tempfile.NamedTemporaryFile("w", dir=path.parent, suffix=".tmp", delete=False) as fd:
+        try:
+            fd.write(contents)
+        except BaseException:
+            fd.close()
+            with contextlib.suppress(OSError):
+                os.remove(fd.name)
+            raise
+    os.replace(fd.name, path)
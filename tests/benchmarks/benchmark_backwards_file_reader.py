@@ -0,0 +1,76 @@
+"""
+Benchmark reading lines in reverse order from a large synthetic xcodebuild log
+using memory-mapped and seek-based backwards file readers.
+
+Usage: python tests/benchmarks/benchmark_backwards_file_reader.py [--size-mb N] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import tempfile
+import time
+from typing import Callable
+
+from codemagic.utilities.backwards_file_reader import iter_backwards
+
+LOG_LINES = (
+    "CompileSwift normal arm64 /Users/builder/project/App/Sources/Feature{i}/View{i}.swift\n",
+    "    cd /Users/builder/project\n",
+    "    /Applications/Xcode.app/Contents/Developer/usr/bin/swift-frontend -c -primary-file View{i}.swift\n",
+    "/Users/builder/project/App/Sources/Feature{i}/View{i}.swift:12:5: warning: variable was never used\n",
+    "\n",
+)
+
+
+def create_synthetic_log(path: pathlib.Path, size_mb: int) -> pathlib.Path:
+    target_size = size_mb * 1024 * 1024
+    written_size = 0
+    with path.open("w") as fd:
+        i = 0
+        while written_size < target_size:
+            chunk = "".join(line.format(i=i) for line in LOG_LINES)
+            fd.write(chunk)
+            written_size += len(chunk)
+            i += 1
+    return path
+
+
+def read_all_lines(log_path: pathlib.Path, use_mmap: bool):
+    for _ in iter_backwards(log_path, use_mmap=use_mmap):
+        pass
+
+
+def read_last_lines(log_path: pathlib.Path, use_mmap: bool, line_count: int = 1000):
+    for i, _ in enumerate(iter_backwards(log_path, use_mmap=use_mmap)):
+        if i == line_count:
+            break
+
+
+def measure(name: str, repeat: int, function: Callable[[], None]):
+    durations = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - started_at)
+    print(f"{name:<30} best {min(durations):8.3f}s  mean {sum(durations) / len(durations):8.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=200, help="Size of the synthetic log in megabytes")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of times each measurement is repeated")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        log_path = create_synthetic_log(pathlib.Path(temp_dir) / "xcodebuild.log", args.size_mb)
+        print(f"Synthetic log with {log_path.stat().st_size} bytes")
+        measure("Seek-based, all lines", args.repeat, lambda: read_all_lines(log_path, use_mmap=False))
+        measure("Memory mapped, all lines", args.repeat, lambda: read_all_lines(log_path, use_mmap=True))
+        measure("Seek-based, last lines", args.repeat, lambda: read_last_lines(log_path, use_mmap=False))
+        measure("Memory mapped, last lines", args.repeat, lambda: read_last_lines(log_path, use_mmap=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Benchmark import time of Codemagic CLI tools console script entry points.
+Each entry point is imported in a fresh interpreter and the interpreter startup
+time is subtracted from the measured duration. Heavy third party dependencies
+that got imported by the entry point are listed next to the timings.
+
+With --check the benchmark fails if an entry point loads heavy dependencies that
+it does not need, or if importing a frequently used short command takes longer
+than --max-import-time.
+
+Usage: python tests/benchmarks/benchmark_cli_startup.py [--repeat N] [--check] [--max-import-time MS]
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import re
+import subprocess
+import sys
+import time
+from typing import Dict
+from typing import List
+from typing import Sequence
+from typing import Tuple
+
+PYPROJECT_PATH = pathlib.Path(__file__).parents[2] / "pyproject.toml"
+
+HEAVY_DEPENDENCIES = (
+    "cryptography",
+    "googleapiclient",
+    "httplib2",
+    "jwt",
+    "oauth2client",
+    "requests",
+)
+
+GOOGLE_API_DEPENDENCIES = ("cryptography", "googleapiclient", "httplib2", "oauth2client")
+
+# Dependencies that entry points are allowed to load at import time
+ALLOWED_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    "android-app-bundle": ("cryptography",),
+    "android-keystore": ("cryptography",),
+    "app-store-connect": ("cryptography", "jwt", "requests"),
+    "codemagic-cli-tools": (),
+    "firebase-app-distribution": GOOGLE_API_DEPENDENCIES,
+    "git-changelog": (),
+    "google-play": GOOGLE_API_DEPENDENCIES,
+    "keychain": ("cryptography",),
+    "universal-apk": (),
+    "xcode-project": ("cryptography",),
+}
+
+# Short commands that are invoked many times during a single build
+STARTUP_CRITICAL_SCRIPTS = ("codemagic-cli-tools", "git-changelog", "keychain", "universal-apk")
+
+
+def get_entry_points() -> List[Tuple[str, str]]:
+    pyproject = PYPROJECT_PATH.read_text()
+    pattern = re.compile(r'^(?P<script>[\w-]+) = "codemagic\.tools:(?P<tool>\w+)\.invoke_cli"$', re.MULTILINE)
+    return [(match.group("script"), match.group("tool")) for match in pattern.finditer(pyproject)]
+
+
+def run_python(code: str) -> Tuple[float, str]:
+    started_at = time.perf_counter()
+    process = subprocess.run((sys.executable, "-c", code), capture_output=True, check=True, text=True)
+    return time.perf_counter() - started_at, process.stdout.strip()
+
+
+def measure(code: str, repeat: int) -> Tuple[float, str]:
+    results = [run_python(code) for _ in range(repeat)]
+    return min(duration for duration, _ in results), results[-1][1]
+
+
+def get_import_code(tool: str) -> str:
+    return (
+        "import sys\n"
+        f"from codemagic.tools import {tool}\n"
+        f"print(' '.join(name for name in {HEAVY_DEPENDENCIES!r} if name in sys.modules))\n"
+    )
+
+
+def check_entry_point(script: str, import_time: float, dependencies: Sequence[str], max_import_time: float) -> bool:
+    passed = True
+    unexpected_dependencies = sorted(set(dependencies) - set(ALLOWED_DEPENDENCIES.get(script, ())))
+    if unexpected_dependencies:
+        print(f"ERROR: {script} imports {', '.join(unexpected_dependencies)} on startup")
+        passed = False
+    if script in STARTUP_CRITICAL_SCRIPTS and import_time > max_import_time:
+        print(f"ERROR: {script} import time {import_time * 1000:.0f}ms exceeds {max_import_time * 1000:.0f}ms")
+        passed = False
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Number of times each measurement is repeated")
+    parser.add_argument("--check", action="store_true", help="Exit with non-zero status if some checks fail")
+    parser.add_argument(
+        "--max-import-time",
+        type=float,
+        default=300,
+        help="Maximum import time in milliseconds for short commands that are invoked many times during a build",
+    )
+    args = parser.parse_args()
+
+    interpreter_startup, _ = measure("import sys", args.repeat)
+    print(f"{'Interpreter startup':<30} {interpreter_startup * 1000:8.1f}ms")
+
+    passed = True
+    for script, tool in get_entry_points():
+        duration, output = measure(get_import_code(tool), args.repeat)
+        import_time = duration - interpreter_startup
+        dependencies = output.split()
+        print(f"{script:<30} {import_time * 1000:8.1f}ms  {' '.join(dependencies)}")
+        if args.check:
+            passed = check_entry_point(script, import_time, dependencies, args.max_import_time / 1000) and passed
+
+    if not passed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark reading application files from a synthetic iOS application package
+with a large number of archive members.
+
+Usage: python tests/benchmarks/benchmark_ipa_member_access.py [--members N] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import plistlib
+import tempfile
+import time
+import zipfile
+from typing import Callable
+
+from codemagic.models.application_package import Ipa
+
+APP_FILE_NAMES = ("Info.plist", "embedded.mobileprovision", "Info.plist", "embedded.mobileprovision")
+
+
+def create_synthetic_ipa(path: pathlib.Path, members_count: int) -> pathlib.Path:
+    info_plist = {"CFBundleIdentifier": "io.codemagic.benchmark", "CFBundleVersion": "1"}
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED) as zf:
+        for i in range(members_count):
+            zf.writestr(f"Payload/Benchmark.app/Assets.bundle/{i // 1000}/{i}.png", b"")
+        zf.writestr("Payload/Benchmark.app/Info.plist", plistlib.dumps(info_plist))
+        zf.writestr("Payload/Benchmark.app/embedded.mobileprovision", b"\0" * 16 * 1024)
+    return path
+
+
+def read_app_files_reopening_archive(ipa_path: pathlib.Path):
+    # Approach used before the archive index: archive is reopened and searched for every file
+    for filename in APP_FILE_NAMES:
+        with zipfile.ZipFile(ipa_path) as zf:
+            name = next(n for n in zf.namelist() if pathlib.Path(n).match(f"Payload/*.app/{filename}"))
+            zf.read(name)
+
+
+def read_app_files_using_index(ipa_path: pathlib.Path, use_mmap: bool):
+    ipa = Ipa(ipa_path, use_mmap=use_mmap)
+    for filename in APP_FILE_NAMES:
+        ipa._get_app_file_contents(filename)
+    ipa.close()
+
+
+def measure(name: str, repeat: int, function: Callable[[], None]):
+    durations = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - started_at)
+    print(f"{name:<30} best {min(durations):8.3f}s  mean {sum(durations) / len(durations):8.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--members", type=int, default=100_000, help="Number of members in synthetic archive")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of times each measurement is repeated")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        ipa_path = create_synthetic_ipa(pathlib.Path(temp_dir) / "benchmark.ipa", args.members)
+        print(f"Synthetic archive with {args.members} members, {ipa_path.stat().st_size} bytes")
+        measure("Reopen archive for each file", args.repeat, lambda: read_app_files_reopening_archive(ipa_path))
+        measure("Archive index", args.repeat, lambda: read_app_files_using_index(ipa_path, use_mmap=False))
+        measure("Memory mapped archive index", args.repeat, lambda: read_app_files_using_index(ipa_path, use_mmap=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
 import os
+import pathlib
 import subprocess
+import sys
+import time
 from tempfile import NamedTemporaryFile
+from unittest import mock
 
 import pytest
 
@@ -35,3 +39,78 @@ def test_non_blocking_streams_file_fd():
         assert cli_process._stderr_stream is None
 
         cli_process._process.kill()
+
+
+def test_execute_captures_output_in_chunks():
+    script = "import sys; sys.stdout.write('tööriistad\\n' * 1000); sys.stderr.write('viga')"
+    cli_process = cli.CliProcess([sys.executable, "-c", script], print_streams=False)
+    # Multibyte characters are split between chunks
+    cli_process._buffer_size = 3
+
+    cli_process.execute()
+
+    assert cli_process.returncode == 0
+    assert cli_process.stdout == "tööriistad\n" * 1000
+    assert cli_process.stderr == "viga"
+    assert not cli_process.stdout_capture.is_spilled
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Cannot run on Windows")
+def test_execute_output_pipe_held_by_child_process():
+    cli_process = cli.CliProcess(["sh", "-c", "sleep 5 & echo done"], print_streams=False)
+
+    with mock.patch.object(cli.CliProcess, "EXIT_CHECK_INTERVAL", 0.1):
+        start = time.time()
+        cli_process.execute()
+
+    assert time.time() - start < 4
+    assert cli_process.stdout == "done\n"
+
+
+def test_execute_output_to_file():
+    with NamedTemporaryFile(mode="wb") as tf:
+        cli_process = cli.CliProcess([sys.executable, "-c", "print('output')"], print_streams=False)
+        cli_process.execute(stdout=tf, stderr=tf)
+
+        assert cli_process.returncode == 0
+        assert cli_process.stdout == ""
+        assert pathlib.Path(tf.name).read_text().strip() == "output"
+
+
+def test_execute_spills_output_to_disk():
+    script = "for i in range(10000): print(f'line {i}')"
+    cli_process = cli.CliProcess([sys.executable, "-c", script], print_streams=False, output_memory_limit=1000)
+
+    cli_process.execute()
+
+    expected_output = "".join(f"line {i}\n" for i in range(10000))
+    assert cli_process.stdout_capture.is_spilled
+    assert cli_process.stdout_capture.get_tail() == expected_output[-1000:]
+    assert list(cli_process.stdout_capture.iter_lines()) == expected_output.splitlines(keepends=True)
+    assert cli_process.stdout == expected_output
+    assert (
+        cli_process._get_stdout_log_text()
+        == f"[{len(expected_output) - 1000} characters omitted]\n{expected_output[-1000:]}"
+    )
+
+
+def test_execute_process_output_log_limit(monkeypatch):
+    script = "print('x' * 100)"
+    cli_process = cli.CliProcess([sys.executable, "-c", script], print_streams=False)
+    monkeypatch.setenv("CODEMAGIC_LOG_PROCESS_OUTPUT_LIMIT", "11")
+
+    with mock.patch("codemagic.utilities.log.get_file_logger") as mock_get_file_logger:
+        cli_process.execute()
+
+    mock_get_file_logger.return_value.debug.assert_any_call("STDOUT: %s", f"[90 characters omitted]\n{'x' * 10}\n")
+
+
+def test_execute_process_output_logging_disabled(monkeypatch):
+    cli_process = cli.CliProcess([sys.executable, "-c", "print('output')"], print_streams=False)
+    monkeypatch.setenv("CODEMAGIC_LOG_PROCESS_OUTPUT_LIMIT", "0")
+
+    with mock.patch("codemagic.utilities.log.get_file_logger") as mock_get_file_logger:
+        cli_process.execute()
+
+    mock_get_file_logger.assert_not_called()
+    assert cli_process.stdout == "output\n"
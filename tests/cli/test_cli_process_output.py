@@ -0,0 +1,67 @@
+import os
+from unittest import mock
+
+import pytest
+
+from codemagic.cli import CliProcessOutput
+
+
+def test_output_within_memory_limit():
+    output = CliProcessOutput(memory_limit=100)
+    output.write("first line\n")
+    output.write("")
+    output.write("second line")
+
+    assert not output.is_spilled
+    assert len(output) == 22
+    assert output.getvalue() == "first line\nsecond line"
+    assert list(output.iter_lines()) == ["first line\n", "second line"]
+
+
+def test_output_spilled_to_disk():
+    output = CliProcessOutput(memory_limit=10)
+    output.write("abcdef\n")
+    output.write("ghijklmnopq\n")
+    output.write("rst")
+
+    assert output.is_spilled
+    assert output.spilled_size == 12
+    assert len(output) == 22
+    assert output.get_tail() == "lmnopq\nrst"
+    assert "".join(output.iter_chunks()) == "abcdef\nghijklmnopq\nrst"
+    assert list(output.iter_lines()) == ["abcdef\n", "ghijklmnopq\n", "rst"]
+
+    # Output can be written after reading it
+    output.write("uvw\n")
+    assert output.getvalue() == "abcdef\nghijklmnopq\nrstuvw\n"
+    assert output.get_tail() == "pq\nrstuvw\n"
+
+
+def test_output_iter_lines_across_chunks():
+    output = CliProcessOutput(memory_limit=4)
+    output.READ_CHUNK_SIZE = 3
+    for chunk in ("line", " one\r", "\nline two\n\n", "tail"):
+        output.write(chunk)
+
+    assert list(output.iter_lines()) == ["line one\r\n", "line two\n", "\n", "tail"]
+
+
+def test_output_close():
+    output = CliProcessOutput(memory_limit=1)
+    output.write("spilled")
+    output.close()
+
+    assert len(output) == 0
+    assert output.getvalue() == ""
+
+
+def test_output_memory_limit_from_environment():
+    with mock.patch.dict(os.environ, {CliProcessOutput.MEMORY_LIMIT_ENVIRONMENT_VARIABLE: "1024"}):
+        assert CliProcessOutput().memory_limit == 1024
+    with mock.patch.dict(os.environ, {CliProcessOutput.MEMORY_LIMIT_ENVIRONMENT_VARIABLE: "invalid"}):
+        assert CliProcessOutput().memory_limit == CliProcessOutput.DEFAULT_MEMORY_LIMIT
+
+
+def test_output_invalid_memory_limit():
+    with pytest.raises(ValueError):
+        CliProcessOutput(memory_limit=0)
@@ -1,3 +1,4 @@
+from unittest.mock import ANY
 from unittest.mock import MagicMock
 from unittest.mock import PropertyMock
 from unittest.mock import patch
@@ -5,10 +6,14 @@ from unittest.mock import patch
 import pytest
 
 from codemagic.google import FirebaseClient
+from codemagic.google.errors import GoogleClientError
 from codemagic.google.errors import GoogleCredentialsError
+from codemagic.google.errors import GoogleHttpError
 from codemagic.google.resources.firebase import OrderBy
 from codemagic.google.resources.firebase import Release
 from codemagic.google.services.firebase import ReleasesService
+from codemagic.google.services.streaming_media_upload import RewindingHttp
+from codemagic.google.services.streaming_media_upload import StreamingMediaUpload
 
 
 def test_release(release_response, release):
@@ -105,3 +110,162 @@ def test_list_releases_pagination(release, firebase_client, mock_releases_pagina
     assert len(releases) == 2
     assert releases[0] == release
     assert releases[1].buildVersion == "71"
+
+
+def test_list_releases_fields(firebase_client, mock_releases):
+    firebase_client.releases.list(
+        "firebase-project-number",
+        "firebase-app-id",
+        limit=1,
+        fields="releases(buildVersion)",
+    )
+    mock_releases.return_value.list.assert_called_once_with(
+        orderBy=OrderBy.CREATE_TIME_DESC.value,
+        parent="projects/firebase-project-number/apps/firebase-app-id",
+        pageSize=1,
+        pageToken="",
+        fields="nextPageToken,releases(buildVersion)",
+        filter=None,
+    )
+
+
+def test_list_releases_adaptive_page_size(firebase_client, mock_releases_pagination):
+    releases = firebase_client.releases.list(
+        "firebase-project-number",
+        "firebase-app-id",
+        page_size=10,
+        limit=15,
+    )
+
+    assert len(releases) == 2
+    page_sizes = [call.kwargs["pageSize"] for call in mock_releases_pagination.return_value.list.call_args_list]
+    assert page_sizes == [10, 14]
+    page_tokens = [call.kwargs["pageToken"] for call in mock_releases_pagination.return_value.list.call_args_list]
+    assert page_tokens == ["", "next-page-token"]
+
+
+def test_iterate_releases_is_lazy(firebase_client, release, mock_releases_pagination):
+    releases = firebase_client.releases.iterate("firebase-project-number", "firebase-app-id", page_size=1)
+
+    assert next(releases) == release
+    mock_releases_pagination.return_value.list.assert_called_once()
+    assert next(releases).buildVersion == "71"
+    assert mock_releases_pagination.return_value.list.call_count == 2
+    assert next(releases, None) is None
+
+
+def test_list_releases_with_predicate_stops_early(firebase_client, release, mock_releases_pagination):
+    releases = firebase_client.releases.list(
+        "firebase-project-number",
+        "firebase-app-id",
+        limit=1,
+        page_size=1,
+        predicate=lambda r: r.buildVersion == release.buildVersion,
+    )
+
+    assert releases == [release]
+    mock_releases_pagination.return_value.list.assert_called_once()
+
+
+def test_list_releases_with_predicate_paginates(firebase_client, mock_releases_pagination):
+    releases = firebase_client.releases.list(
+        "firebase-project-number",
+        "firebase-app-id",
+        limit=1,
+        page_size=1,
+        predicate=lambda r: r.buildVersion == "71",
+    )
+
+    assert [r.buildVersion for r in releases] == ["71"]
+    # Limit applies to matching releases, and not to the requested page size
+    page_sizes = [call.kwargs["pageSize"] for call in mock_releases_pagination.return_value.list.call_args_list]
+    assert page_sizes == [1, 2]
+
+
+def test_list_releases_filter(firebase_client, mock_releases):
+    filter_expression = 'releaseNotes.text="*fix*"'
+    firebase_client.releases.list("firebase-project-number", "firebase-app-id", filter_expression=filter_expression)
+
+    assert mock_releases.return_value.list.call_args.kwargs["filter"] == filter_expression
+
+
+@pytest.fixture
+def mock_upload(release_response):
+    upload_request = MagicMock()
+    upload_request.execute.return_value = {"name": "upload-operation"}
+    operation_request = MagicMock()
+    operation_request.execute.side_effect = [
+        {"name": "upload-operation", "done": False},
+        {
+            "name": "upload-operation",
+            "done": True,
+            "response": {"result": "RELEASE_CREATED", "release": release_response},
+        },
+    ]
+    with patch.object(ReleasesService, "_media", new_callable=PropertyMock) as mock_media:
+        with patch.object(ReleasesService, "_operations", new_callable=PropertyMock) as mock_operations:
+            with patch("codemagic.google.services.firebase.releases_service.time.sleep") as mock_sleep:
+                mock_media.return_value.upload.return_value = upload_request
+                mock_operations.return_value.get.return_value = operation_request
+                yield mock_media, mock_operations, mock_sleep
+
+
+def test_upload_release(firebase_client, release, mock_upload, tmp_path):
+    mock_media, mock_operations, mock_sleep = mock_upload
+    binary_path = tmp_path / "app.apk"
+    binary_path.write_bytes(b"binary")
+
+    uploaded_release = firebase_client.releases.upload("firebase-project-number", "firebase-app-id", binary_path)
+
+    assert uploaded_release == release
+    upload_kwargs = mock_media.return_value.upload.call_args.kwargs
+    assert upload_kwargs["app"] == "projects/firebase-project-number/apps/firebase-app-id"
+    assert "body" not in upload_kwargs
+    assert upload_kwargs["media_body"].size() == 6
+    upload_request = mock_media.return_value.upload.return_value
+    upload_request.execute.assert_called_once_with(http=ANY, num_retries=3)
+    assert isinstance(upload_request.execute.call_args.kwargs["http"], RewindingHttp)
+    upload_request.body.close.assert_called_once_with()
+    mock_operations.return_value.get.assert_called_with(name="upload-operation")
+    assert mock_operations.return_value.get.call_count == 2
+    poll_intervals = [call.args[0] for call in mock_sleep.call_args_list]
+    assert poll_intervals == [0.5, 0.75]
+
+
+def test_upload_release_operation_error(firebase_client, mock_upload, tmp_path):
+    _mock_media, mock_operations, _mock_sleep = mock_upload
+    mock_operations.return_value.get.return_value.execute.side_effect = [
+        {"name": "upload-operation", "done": True, "error": {"code": 3, "message": "Invalid binary"}},
+    ]
+    binary_path = tmp_path / "app.apk"
+    binary_path.write_bytes(b"binary")
+
+    with pytest.raises(GoogleHttpError, match="Invalid binary"):
+        firebase_client.releases.upload("firebase-project-number", "firebase-app-id", binary_path)
+
+
+def test_upload_release_operation_timeout(firebase_client, mock_upload, tmp_path):
+    _mock_media, mock_operations, _mock_sleep = mock_upload
+    mock_operations.return_value.get.return_value.execute.side_effect = None
+    mock_operations.return_value.get.return_value.execute.return_value = {"name": "upload-operation"}
+    binary_path = tmp_path / "app.apk"
+    binary_path.write_bytes(b"binary")
+
+    monotonic_mock = patch("codemagic.google.services.firebase.releases_service.time.monotonic")
+    with monotonic_mock as mock_monotonic, pytest.raises(GoogleClientError, match="did not complete"):
+        mock_monotonic.side_effect = [0, 1, 2, 11]
+        firebase_client.releases.upload("firebase-project-number", "firebase-app-id", binary_path, timeout=10)
+
+
+def test_upload_stream_reads_in_chunks(tmp_path):
+    binary_path = tmp_path / "app.ipa"
+    binary_path.write_bytes(b"0123456789")
+
+    stream = StreamingMediaUpload(binary_path, chunk_size=4).getbytes(0, 10)
+
+    assert len(stream) == 10
+    assert [stream.read(), stream.read(), stream.read(), stream.read()] == [b"0123", b"4567", b"89", b""]
+    stream.seek(0)
+    assert stream.read(2) == b"01"
+    assert stream.bytes_read == 12
+    stream.close()
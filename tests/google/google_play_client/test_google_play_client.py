@@ -0,0 +1,165 @@
+from typing import Dict
+from unittest import mock
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
+
+from codemagic.google import GooglePlayClient
+from codemagic.google.errors import GoogleHttpError
+from codemagic.google.resources.google_play import AppEdit
+from codemagic.google.resources.google_play import DeobfuscationFileType
+from codemagic.google.resources.google_play import Track
+from codemagic.google.services.streaming_media_upload import RewindingHttp
+from codemagic.google.services.streaming_media_upload import StreamingMediaUpload
+
+
+class _MockBatchHttpRequest:
+    def __init__(self, callback, responses: Dict[str, object]):
+        self._callback = callback
+        self._responses = responses
+        self.request_ids = []
+
+    def add(self, request, request_id=None):
+        self.request_ids.append(request_id)
+
+    def execute(self):
+        for request_id in reversed(self.request_ids):
+            response = self._responses[request_id]
+            if isinstance(response, Exception):
+                self._callback(request_id, None, response)
+            else:
+                self._callback(request_id, response, None)
+
+
+@pytest.fixture
+def google_play_client() -> GooglePlayClient:
+    return GooglePlayClient({})
+
+
+def _mock_google_resource(google_play_client: GooglePlayClient, responses: Dict[str, object]) -> mock.MagicMock:
+    google_resource = mock.MagicMock()
+    google_resource.new_batch_http_request.side_effect = lambda callback: _MockBatchHttpRequest(callback, responses)
+    google_play_client.__dict__["google_resource"] = google_resource
+    return google_resource
+
+
+def test_list_many_tracks(google_play_client: GooglePlayClient):
+    responses = {
+        "0": {"tracks": [{"track": "alpha", "releases": [{"status": "completed", "versionCodes": ["1"]}]}]},
+        "1": {"tracks": [{"track": "beta"}]},
+    }
+    google_resource = _mock_google_resource(google_play_client, responses)
+
+    packages_tracks = google_play_client.tracks.list_many([("com.example.a", "edit-a"), ("com.example.b", "edit-b")])
+
+    google_resource.new_batch_http_request.assert_called_once()
+    assert [[t.track for t in tracks] for tracks in packages_tracks] == [["alpha"], ["beta"]]
+    assert isinstance(packages_tracks[0][0], Track)
+    assert packages_tracks[0][0].releases[0].versionCodes == ["1"]
+
+
+def test_create_many_edits(google_play_client: GooglePlayClient):
+    responses = {
+        "0": {"id": "edit-a", "expiryTimeSeconds": "10"},
+        "1": {"id": "edit-b", "expiryTimeSeconds": "10"},
+    }
+    _mock_google_resource(google_play_client, responses)
+
+    edits = google_play_client.edits.create_many(["com.example.a", "com.example.b"])
+
+    assert edits == [AppEdit(id="edit-a", expiryTimeSeconds="10"), AppEdit(id="edit-b", expiryTimeSeconds="10")]
+
+
+def test_create_many_edits_partial_failure(google_play_client: GooglePlayClient):
+    http_error = HttpError(mock.MagicMock(status=404, reason="Package not found"), b"")
+    responses = {
+        "0": http_error,
+        "1": {"id": "edit-b", "expiryTimeSeconds": "10"},
+    }
+    _mock_google_resource(google_play_client, responses)
+
+    edits = google_play_client.edits.create_many(["com.example.a", "com.example.b"])
+
+    assert isinstance(edits[0], GoogleHttpError)
+    assert edits[0].__cause__ is http_error
+    assert edits[1] == AppEdit(id="edit-b", expiryTimeSeconds="10")
+
+
+def test_batch_request_error(google_play_client: GooglePlayClient):
+    http_error = HttpError(mock.MagicMock(status=404, reason="Package not found"), b"")
+    responses = {
+        "0": {"tracks": []},
+        "1": http_error,
+    }
+    _mock_google_resource(google_play_client, responses)
+
+    with pytest.raises(GoogleHttpError) as exc_info:
+        google_play_client.tracks.list_many([("com.example.a", "edit-a"), ("com.example.b", "edit-b")])
+
+    assert exc_info.value.__cause__ is http_error
+
+
+def test_list_tracks_with_fields(google_play_client: GooglePlayClient):
+    google_resource = mock.MagicMock()
+    google_resource.edits().tracks().list().execute.return_value = {
+        "tracks": [{"track": "alpha", "releases": [{"status": "draft", "versionCodes": ["5"]}]}],
+    }
+    google_play_client.__dict__["google_resource"] = google_resource
+
+    tracks = google_play_client.tracks.list("com.example.app", "edit-id", fields="tracks(track,releases(status))")
+
+    google_resource.edits().tracks().list.assert_called_with(
+        packageName="com.example.app",
+        editId="edit-id",
+        fields="tracks(track,releases(status))",
+    )
+    assert tracks[0].releases[0].versionCodes == ["5"]
+
+
+def test_upload_deobfuscation_file_is_streamed(google_play_client: GooglePlayClient, tmp_path):
+    google_resource = _mock_google_resource(google_play_client, {})
+    deobfuscation_files = google_resource.edits.return_value.deobfuscationfiles.return_value
+    deobfuscation_files.upload.return_value.execute.return_value = {"deobfuscationFile": {"symbolType": "proguard"}}
+    mapping_path = tmp_path / "mapping.txt"
+    mapping_path.write_text("com.example.A -> a:\n")
+
+    deobfuscation_file = google_play_client.deobfuscation_files.upload(
+        "com.example.app",
+        "edit-id",
+        1,
+        mapping_path,
+        DeobfuscationFileType.PROGUARD,
+    )
+
+    assert deobfuscation_file.symbolType is DeobfuscationFileType.PROGUARD
+    media_body = deobfuscation_files.upload.call_args.kwargs["media_body"]
+    assert isinstance(media_body, StreamingMediaUpload)
+    assert media_body.size() == mapping_path.stat().st_size
+    upload_request = deobfuscation_files.upload.return_value
+    upload_request.execute.assert_called_once_with(http=mock.ANY, num_retries=3)
+    assert isinstance(upload_request.execute.call_args.kwargs["http"], RewindingHttp)
+    upload_request.body.close.assert_called_once_with()
+
+
+def test_retried_streaming_upload_sends_complete_body(tmp_path):
+    class _FlakyHttp:
+        def __init__(self):
+            self.bodies = []
+
+        def request(self, uri, method="GET", body=None, headers=None, **_kwargs):
+            self.bodies.append(b"".join(iter(lambda: body.read(), b"")))
+            status = 503 if len(self.bodies) == 1 else 200
+            return httplib2.Response({"status": status}), b"{}"
+
+    mapping_path = tmp_path / "mapping.txt"
+    mapping_path.write_bytes(b"0123456789")
+    stream = StreamingMediaUpload(mapping_path, chunk_size=4).getbytes(0, 10)
+    http = _FlakyHttp()
+    request = HttpRequest(http, lambda _response, content: content, "https://example.com", "POST", body=stream)
+    request._sleep = lambda _seconds: None
+
+    request.execute(http=RewindingHttp(http), num_retries=1)
+
+    assert http.bodies == [b"0123456789", b"0123456789"]
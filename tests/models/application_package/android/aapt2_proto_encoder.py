@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import Tuple
+from typing import Union
+
+ANDROID_NAMESPACE = "http://schemas.android.com/apk/res/android"
+FieldValue = Union[int, str, bytes]
+
+
+def encode_varint(value: int) -> bytes:
+    value &= 2**64 - 1
+    encoded = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            encoded.append(byte | 0x80)
+        else:
+            encoded.append(byte)
+            return bytes(encoded)
+
+
+def encode_message(*fields: Tuple[int, FieldValue]) -> bytes:
+    encoded = b""
+    for field_number, value in fields:
+        if isinstance(value, int):
+            encoded += encode_varint(field_number << 3) + encode_varint(value)
+        else:
+            data = value.encode() if isinstance(value, str) else value
+            encoded += encode_varint(field_number << 3 | 2) + encode_varint(len(data)) + data
+    return encoded
+
+
+def encode_xml_attribute(name: str, value: str = "", compiled_item: bytes = b"") -> bytes:
+    fields = [(1, ANDROID_NAMESPACE), (2, name)]
+    if value:
+        fields.append((3, value))
+    if compiled_item:
+        fields.append((6, compiled_item))
+    return encode_message(*fields)
+
+
+def encode_xml_element(name: str, attributes=(), children=()) -> bytes:
+    fields = [(3, name), *((4, a) for a in attributes), *((5, encode_message((1, c))) for c in children)]
+    return encode_message(*fields)
+
+
+def encode_manifest(label_item: bytes) -> bytes:
+    application = encode_xml_element("application", [encode_xml_attribute("label", compiled_item=label_item)])
+    uses_sdk = encode_xml_element(
+        "uses-sdk",
+        [encode_xml_attribute("minSdkVersion", "24"), encode_xml_attribute("targetSdkVersion", "35")],
+    )
+    manifest = encode_xml_element(
+        "manifest",
+        [
+            encode_xml_attribute("versionCode", "8"),
+            encode_xml_attribute("versionName", "3.14"),
+            encode_message((2, "package"), (3, "io.codemagic.cli_tools")),
+        ],
+        [uses_sdk, application],
+    )
+    return encode_message((1, manifest))
+
+
+def encode_reference(name: str) -> bytes:
+    return encode_message((1, encode_message((2, 0x7F0A0000), (3, name))))
+
+
+def encode_string_item(value: str) -> bytes:
+    return encode_message((2, encode_message((1, value))))
+
+
+def encode_config_value(item: bytes, locale: str = "") -> bytes:
+    configuration = encode_message((3, locale)) if locale else b""
+    return encode_message((1, configuration), (2, encode_message((4, item))))
+
+
+def encode_resource_table(types) -> bytes:
+    encoded_types = []
+    for type_name, entries in types.items():
+        encoded_entries = [
+            encode_message((2, entry_name), *((6, config_value) for config_value in config_values))
+            for entry_name, config_values in entries.items()
+        ]
+        encoded_types.append(encode_message((2, type_name), *((3, e) for e in encoded_entries)))
+    package = encode_message((2, "io.codemagic.cli_tools"), *((3, t) for t in encoded_types))
+    return encode_message((2, package))
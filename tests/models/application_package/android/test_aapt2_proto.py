@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import struct
+
+import pytest
+
+from codemagic.models.application_package.android import AndroidManifest
+from codemagic.models.application_package.android import AppBundleResources
+from codemagic.models.application_package.android.aapt2_proto import ProtobufMessage
+from codemagic.models.application_package.android.aapt2_proto import decode_xml_node
+from tests.models.application_package.android.aapt2_proto_encoder import ANDROID_NAMESPACE
+from tests.models.application_package.android.aapt2_proto_encoder import encode_config_value
+from tests.models.application_package.android.aapt2_proto_encoder import encode_manifest
+from tests.models.application_package.android.aapt2_proto_encoder import encode_message
+from tests.models.application_package.android.aapt2_proto_encoder import encode_reference
+from tests.models.application_package.android.aapt2_proto_encoder import encode_resource_table
+from tests.models.application_package.android.aapt2_proto_encoder import encode_string_item
+from tests.models.application_package.android.aapt2_proto_encoder import encode_varint
+
+
+@pytest.fixture
+def resource_table() -> bytes:
+    color_item = encode_message((7, encode_message((9, 0xFFFFFFFF))))
+    boolean_item = encode_message((7, encode_message((8, 1))))
+    styleable = encode_message(
+        (1, encode_message((3, encode_message((3, "android:attr/offset"))))),
+        (1, encode_message((3, encode_message((3, "android:attr/color"))))),
+    )
+    return encode_resource_table(
+        {
+            "string": {
+                "app_name": [
+                    encode_config_value(encode_string_item("CLI tööls"), locale="et"),
+                    encode_config_value(encode_string_item("CLI tools test app")),
+                ],
+                "call_notification_answer_action": [encode_config_value(encode_string_item("Answer"), locale="en")],
+            },
+            "color": {"white": [encode_config_value(color_item)]},
+            "bool": {"enabled": [encode_config_value(boolean_item)]},
+            "xml": {"backup_rules": [encode_config_value(encode_message((5, encode_message((1, "res/xml/b.xml")))))]},
+            "styleable": {
+                "GradientColorItem": [encode_message((2, encode_message((5, encode_message((3, styleable))))))],
+            },
+        },
+    )
+
+
+def test_decode_message_fields():
+    float_field = encode_varint(4 << 3 | ProtobufMessage.WIRE_TYPE_I32) + struct.pack("<f", 1.5)
+    message = ProtobufMessage(encode_message((1, 300), (2, "value"), (3, -2)) + float_field)
+
+    assert message.get_int(1) == 300
+    assert message.get_string(2) == "value"
+    assert message.get_signed_int(3) == -2
+    assert message.get_float(4) == 1.5
+    assert message.has_field(5) is False
+    assert message.get_message(5) is None
+    assert message.get_string(5, "default") == "default"
+
+
+@pytest.mark.parametrize("data", (b"\x08", b"\x12\x05abc", b"\x0b"))
+def test_decode_invalid_message(data: bytes):
+    with pytest.raises(ValueError):
+        ProtobufMessage(data)
+
+
+def test_decode_manifest():
+    element = decode_xml_node(encode_manifest(encode_reference("string/app_name")))
+    manifest = AndroidManifest.from_element(element)
+
+    assert manifest.version_code == "8"
+    assert manifest.version_name == "3.14"
+    assert manifest.package_name == "io.codemagic.cli_tools"
+    assert manifest.min_sdk_version == "24"
+    assert manifest.target_sdk_version == "35"
+    assert manifest.app_label == "@string/app_name"
+    assert manifest.debuggable == ""
+    assert element.get(f"{{{ANDROID_NAMESPACE}}}versionCode") == "8"
+
+
+def test_decode_manifest_without_element():
+    with pytest.raises(ValueError):
+        decode_xml_node(encode_message((2, "text")))
+
+
+@pytest.mark.parametrize(
+    ("resource_name", "expected_resource_value"),
+    (
+        ("color/white", "#ffffffff"),
+        ("bool/enabled", "true"),
+        ("string/app_name", "CLI tools test app"),
+        ("string/call_notification_answer_action", "Answer"),
+        ("xml/backup_rules", "res/xml/b.xml"),
+        ("styleable/GradientColorItem", "[@android:attr/offset, @android:attr/color]"),
+        ("string/not_defined", None),
+        ("label/not_defined", None),
+    ),
+)
+def test_get_resources_from_resource_table(resource_name: str, expected_resource_value: str, resource_table: bytes):
+    app_bundle_resources = AppBundleResources.from_resource_table(resource_table)
+    assert app_bundle_resources.get_resource(resource_name) == expected_resource_value
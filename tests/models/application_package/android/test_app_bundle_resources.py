@@ -29,3 +29,89 @@ def test_get_resources(label: str, expected_resource_value: str, app_bundle_reso
 def test_get_resource_missing_value(app_bundle_resources: AppBundleResources):
     resource = app_bundle_resources.get_resource("label/not_defined")
     assert resource is None
+
+
+DUMP_WITH_REFERENCES = """Package 'io.codemagic.cli_tools':
+0x7f090000 - string/label
+	(default) - [REF] @string/title
+0x7f090001 - string/title
+	(default) - [REF] @string/app_name
+0x7f090002 - string/app_name
+	(default) - [STR] "CLI tools test app"
+	locale: "et" - [STR] "CLI tööriistad"
+0x7f090003 - string/loop
+	(default) - [REF] @string/loop
+0x7f090004 - string/unused
+	(default) - [STR] "Unused"
+"""
+
+
+def test_from_bundletool_output_resolves_references():
+    consumed_lines = []
+
+    def iter_lines():
+        for line in DUMP_WITH_REFERENCES.splitlines(keepends=True):
+            consumed_lines.append(line)
+            yield line
+
+    app_bundle_resources = AppBundleResources.from_bundletool_output(iter_lines(), ["string/label"])
+
+    assert app_bundle_resources.get_resource("string/label") == "@string/title"
+    assert app_bundle_resources.get_resolved_resource("string/label") == "CLI tools test app"
+    assert app_bundle_resources.get_resource("string/unused") is None
+    # Parsing stops once the referred resources are found
+    assert consumed_lines[-1] == "0x7f090003 - string/loop\n"
+
+
+DUMP_WITH_BACKWARD_REFERENCES = """Package 'io.codemagic.cli_tools':
+0x7f090000 - string/app_name
+	(default) - [STR] "CLI tools test app"
+0x7f090001 - string/title
+	(default) - [REF] @string/app_name
+0x7f090002 - string/label
+	(default) - [REF] @string/title
+0x7f090003 - string/ok
+	(default) - [REF] @android:string/ok
+0x7f090004 - string/unused
+	(default) - [STR] "Unused"
+"""
+
+
+@pytest.mark.parametrize(
+    ("resource_name", "expected_resolved_value", "expected_last_line"),
+    (
+        ("string/label", "CLI tools test app", "0x7f090003 - string/ok\n"),
+        ("string/ok", "@android:string/ok", "0x7f090004 - string/unused\n"),
+    ),
+)
+def test_from_bundletool_output_resolves_backward_and_framework_references(
+    resource_name: str,
+    expected_resolved_value: str,
+    expected_last_line: str,
+):
+    consumed_lines = []
+
+    def iter_lines():
+        for line in DUMP_WITH_BACKWARD_REFERENCES.splitlines(keepends=True):
+            consumed_lines.append(line)
+            yield line
+
+    app_bundle_resources = AppBundleResources.from_bundletool_output(iter_lines(), [resource_name])
+
+    assert app_bundle_resources.get_resolved_resource(resource_name) == expected_resolved_value
+    # Parsing stops right after the requested resource as its references are already known or not in the dump
+    assert consumed_lines[-1] == expected_last_line
+
+
+def test_from_bundletool_output_missing_resource():
+    lines = DUMP_WITH_REFERENCES.splitlines(keepends=True)
+    app_bundle_resources = AppBundleResources.from_bundletool_output(lines, ["string/not_defined", "string/unused"])
+
+    assert app_bundle_resources.get_resource("string/unused") == "Unused"
+    assert app_bundle_resources.get_resource("string/not_defined") is None
+
+
+def test_get_resolved_resource_with_reference_loop():
+    app_bundle_resources = AppBundleResources(DUMP_WITH_REFERENCES)
+    assert app_bundle_resources.get_resolved_resource("string/loop") == "@string/loop"
+    assert app_bundle_resources.get_resolved_resource("string/title") == "CLI tools test app"
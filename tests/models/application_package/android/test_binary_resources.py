@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import struct
+from typing import Dict
+from typing import List
+from typing import Sequence
+from typing import Tuple
+
+import pytest
+
+from codemagic.models.application_package.android import AndroidManifest
+from codemagic.models.application_package.android.binary_resource_table import BinaryResourceTable
+from codemagic.models.application_package.android.binary_xml import TYPE_INT_BOOLEAN
+from codemagic.models.application_package.android.binary_xml import TYPE_INT_DEC
+from codemagic.models.application_package.android.binary_xml import TYPE_REFERENCE
+from codemagic.models.application_package.android.binary_xml import TYPE_STRING
+from codemagic.models.application_package.android.binary_xml import decode_binary_xml
+
+ANDROID_NAMESPACE = "http://schemas.android.com/apk/res/android"
+NO_INDEX = 0xFFFFFFFF
+
+APP_NAME_RESOURCE_ID = 0x7F010000
+LABEL_RESOURCE_ID = 0x7F010001
+# Typed attribute: name, value type, value data
+Attribute = Tuple[str, int, int]
+
+
+def encode_chunk(chunk_type: int, header: bytes, body: bytes = b"") -> bytes:
+    header_size = 8 + len(header)
+    return struct.pack("<HHL", chunk_type, header_size, header_size + len(body)) + header + body
+
+
+def encode_string_pool(strings: Sequence[str], utf8: bool = False) -> bytes:
+    offsets = []
+    data = b""
+    for string in strings:
+        offsets.append(len(data))
+        if utf8:
+            encoded = string.encode()
+            data += bytes([len(string), len(encoded)]) + encoded + b"\x00"
+        else:
+            data += struct.pack("<H", len(string)) + string.encode("utf-16-le") + b"\x00\x00"
+    data += b"\x00" * (-len(data) % 4)
+    strings_start = 28 + 4 * len(strings)
+    header = struct.pack("<LLLLL", len(strings), 0, 0x100 if utf8 else 0, strings_start, 0)
+    return encode_chunk(0x0001, header, struct.pack(f"<{len(strings)}L", *offsets) + data)
+
+
+class BinaryXmlWriter:
+    def __init__(self):
+        self.strings: List[str] = ["", ANDROID_NAMESPACE, "android"]
+        self.resource_ids: List[int] = [0, 0, 0]
+        self.chunks: List[bytes] = []
+
+    def _get_string_index(self, string: str, resource_id: int = 0) -> int:
+        if string not in self.strings:
+            self.strings.append(string)
+            self.resource_ids.append(resource_id)
+        return self.strings.index(string)
+
+    def start_element(self, name: str, *, attributes: Sequence[Attribute] = (), string_attributes=()):
+        encoded_attributes = b""
+        for attribute_name, value in string_attributes:
+            value_index = self._get_string_index(value)
+            encoded_attributes += struct.pack(
+                "<LLLHBBL",
+                1,
+                self._get_string_index(attribute_name),
+                value_index,
+                8,
+                0,
+                TYPE_STRING,
+                value_index,
+            )
+        for attribute_name, data_type, data in attributes:
+            encoded_attributes += struct.pack(
+                "<LLLHBBL",
+                1,
+                self._get_string_index(attribute_name),
+                NO_INDEX,
+                8,
+                0,
+                data_type,
+                data,
+            )
+
+        attribute_count = len(string_attributes) + len(attributes)
+        extension = struct.pack("<LLHHHHHH", NO_INDEX, self._get_string_index(name), 20, 20, attribute_count, 0, 0, 0)
+        self.chunks.append(encode_chunk(0x0102, struct.pack("<LL", 1, NO_INDEX), extension + encoded_attributes))
+
+    def end_element(self, name: str):
+        extension = struct.pack("<LL", NO_INDEX, self._get_string_index(name))
+        self.chunks.append(encode_chunk(0x0103, struct.pack("<LL", 1, NO_INDEX), extension))
+
+    def add_obfuscated_attribute_name(self, resource_id: int) -> str:
+        # Obfuscated attribute name is empty string that has a resource ID
+        name = f"\x00{resource_id}"
+        self.strings.append(name)
+        self.resource_ids.append(resource_id)
+        return name
+
+    def encode(self) -> bytes:
+        strings = ["" if s.startswith("\x00") else s for s in self.strings]
+        string_pool = encode_string_pool(strings)
+        resource_map = encode_chunk(0x0180, b"", struct.pack(f"<{len(self.resource_ids)}L", *self.resource_ids))
+        return encode_chunk(0x0003, b"", string_pool + resource_map + b"".join(self.chunks))
+
+
+def encode_binary_manifest(label_reference: int = LABEL_RESOURCE_ID, obfuscated: bool = False) -> bytes:
+    writer = BinaryXmlWriter()
+    version_code = writer.add_obfuscated_attribute_name(0x0101021B) if obfuscated else "versionCode"
+    writer.start_element(
+        "manifest",
+        attributes=[(version_code, TYPE_INT_DEC, 8)],
+        string_attributes=[("versionName", "3.14"), ("package", "io.codemagic.cli_tools")],
+    )
+    writer.start_element("uses-sdk", attributes=[("minSdkVersion", TYPE_INT_DEC, 24)])
+    writer.end_element("uses-sdk")
+    writer.start_element(
+        "application",
+        attributes=[("label", TYPE_REFERENCE, label_reference), ("debuggable", TYPE_INT_BOOLEAN, 1)],
+    )
+    writer.end_element("application")
+    writer.end_element("manifest")
+    return writer.encode()
+
+
+def encode_type_chunk(type_id: int, entries: Sequence[Tuple[int, int]], locale: bytes = b"") -> bytes:
+    config = struct.pack("<L", 64) + b"\x00" * 4 + locale.ljust(4, b"\x00") + b"\x00" * 52
+    entries_start = 8 + 12 + len(config) + 4 * len(entries)
+    offsets = struct.pack(f"<{len(entries)}L", *(16 * i for i in range(len(entries))))
+    encoded_entries = b"".join(
+        struct.pack("<HHL", 8, 0, i) + struct.pack("<HBBL", 8, 0, data_type, data)
+        for i, (data_type, data) in enumerate(entries)
+    )
+    header = struct.pack("<BBHLL", type_id, 0, 0, len(entries), entries_start) + config
+    return encode_chunk(0x0201, header, offsets + encoded_entries)
+
+
+def encode_resource_table(localized_app_names: Dict[bytes, str]) -> bytes:
+    strings = [*localized_app_names.values()]
+    type_chunks = b"".join(
+        encode_type_chunk(
+            1,
+            [(TYPE_STRING, i), (TYPE_REFERENCE, APP_NAME_RESOURCE_ID)],
+            locale=locale,
+        )
+        for i, locale in enumerate(localized_app_names.keys())
+    )
+    package_name = "io.codemagic.cli_tools".encode("utf-16-le").ljust(256, b"\x00")
+    type_strings = encode_string_pool(["string"], utf8=True)
+    key_strings = encode_string_pool(["app_name", "label"], utf8=True)
+    package_header = (
+        struct.pack("<L", 0x7F) + package_name + struct.pack("<LLLLL", 288, 1, 288 + len(type_strings), 2, 0)
+    )
+    package = encode_chunk(0x0200, package_header, type_strings + key_strings + type_chunks)
+    return encode_chunk(0x0002, struct.pack("<L", 1), encode_string_pool(strings, utf8=True) + package)
+
+
+@pytest.fixture
+def resource_table() -> bytes:
+    return encode_resource_table({b"et": "CLI tööriistad", b"": "CLI tools test app"})
+
+
+@pytest.mark.parametrize("obfuscated", (False, True))
+def test_decode_binary_manifest(obfuscated: bool):
+    element = decode_binary_xml(encode_binary_manifest(obfuscated=obfuscated))
+    manifest = AndroidManifest.from_element(element)
+
+    assert manifest.version_code == "8"
+    assert manifest.version_name == "3.14"
+    assert manifest.package_name == "io.codemagic.cli_tools"
+    assert manifest.min_sdk_version == "24"
+    assert manifest.app_label == "@0x7f010001"
+    assert manifest.debuggable == "true"
+    assert manifest.get_tag_attribute_value("application", "debuggable") == "true"
+    assert manifest.get_tag_attribute_value("activity", "name") == ""
+
+
+@pytest.mark.parametrize(
+    "data",
+    (
+        b"",
+        b"\x03\x00\x08\x00\x08\x00\x00\x00",
+        encode_binary_manifest()[:100],
+        encode_resource_table({b"": "app"}),
+    ),
+)
+def test_decode_invalid_binary_xml(data: bytes):
+    with pytest.raises(ValueError):
+        decode_binary_xml(data)
+
+
+def test_resource_table_values(resource_table: bytes):
+    table = BinaryResourceTable(resource_table)
+
+    assert table.get_values(APP_NAME_RESOURCE_ID) == [
+        ("et", "STR", "CLI tööriistad"),
+        ("default", "STR", "CLI tools test app"),
+    ]
+    assert table.get_value(APP_NAME_RESOURCE_ID) == "CLI tools test app"
+    assert table.get_value(LABEL_RESOURCE_ID) == "@0x7f010000"
+    assert table.get_value(0x7F010002) is None
+    assert table.get_value(0x7F020000) is None
+
+
+def test_resource_table_without_default_value():
+    table = BinaryResourceTable(encode_resource_table({b"et": "CLI tööriistad"}))
+    assert table.get_value(APP_NAME_RESOURCE_ID) == "CLI tööriistad"
+
+
+def test_invalid_resource_table(resource_table: bytes):
+    with pytest.raises(ValueError):
+        BinaryResourceTable(encode_binary_manifest())
+    with pytest.raises(ValueError):
+        BinaryResourceTable(resource_table[:200])
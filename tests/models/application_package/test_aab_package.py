@@ -0,0 +1,100 @@
+import pathlib
+import subprocess
+import zipfile
+from unittest import mock
+
+import pytest
+
+from codemagic.models.application_package import AabPackage
+from tests.models.application_package.android.aapt2_proto_encoder import encode_config_value
+from tests.models.application_package.android.aapt2_proto_encoder import encode_manifest
+from tests.models.application_package.android.aapt2_proto_encoder import encode_reference
+from tests.models.application_package.android.aapt2_proto_encoder import encode_resource_table
+from tests.models.application_package.android.aapt2_proto_encoder import encode_string_item
+
+
+@pytest.fixture
+def aab_path(tmp_path: pathlib.Path) -> pathlib.Path:
+    path = tmp_path / "app.aab"
+    resource_table = encode_resource_table(
+        {"string": {"app_name": [encode_config_value(encode_string_item("CLI tools test app"))]}},
+    )
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("BundleConfig.pb", b"")
+        zf.writestr("base/manifest/AndroidManifest.xml", encode_manifest(encode_reference("string/app_name")))
+        zf.writestr("base/resources.pb", resource_table)
+    return path
+
+
+@mock.patch("codemagic.shell_tools.bundletool.Bundletool")
+def test_aab_package_without_bundletool(mock_bundletool, aab_path: pathlib.Path):
+    with AabPackage(aab_path) as aab:
+        assert aab.get_summary() == {
+            "app_name": "CLI tools test app",
+            "package_name": "io.codemagic.cli_tools",
+            "min_os_version": "24",
+            "certificate_issuer": None,
+            "certificate_subject": None,
+            "debuggable": False,
+            "version": "3.14",
+            "version_code": "8",
+        }
+        mock_bundletool.assert_not_called()
+
+
+@mock.patch("codemagic.shell_tools.bundletool.Bundletool")
+def test_aab_package_validate_with_bundletool(mock_bundletool, aab_path: pathlib.Path):
+    with AabPackage(aab_path, validate_with_bundletool=True):
+        pass
+    mock_bundletool().validate.assert_called_once_with(bundle=aab_path, show_output=False)
+
+
+@mock.patch("codemagic.shell_tools.bundletool.Bundletool")
+def test_aab_package_bundletool_validation_failure(mock_bundletool, aab_path: pathlib.Path):
+    mock_bundletool().validate.side_effect = subprocess.CalledProcessError(1, "bundletool")
+    with pytest.raises(IOError):
+        AabPackage(aab_path, validate_with_bundletool=True)
+
+
+def test_aab_package_without_manifest(tmp_path: pathlib.Path):
+    path = tmp_path / "app.aab"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("base/resources.pb", b"")
+
+    with pytest.raises(IOError):
+        AabPackage(path)
+
+
+def test_not_aab_package(tmp_path: pathlib.Path):
+    path = tmp_path / "app.aab"
+    path.write_bytes(b"not a zip archive")
+
+    with pytest.raises(IOError):
+        AabPackage(path)
+
+
+@mock.patch("codemagic.shell_tools.bundletool.Bundletool")
+def test_aab_package_resources_dumped_with_bundletool(mock_bundletool, aab_path: pathlib.Path):
+    dump_lines = [
+        "Package 'io.codemagic.cli_tools':\n",
+        "0x7f010000 - string/app_name\n",
+        '\t(default) - [STR] "Dumped app name"\n',
+        "0x7f010001 - string/label\n",
+        "\t(default) - [REF] @string/app_name\n",
+    ]
+    mock_bundletool().iter_dump_resources.return_value = (line for line in dump_lines)
+
+    with mock.patch.object(AabPackage, "_resources", new_callable=mock.PropertyMock) as mock_resources:
+        mock_resources.side_effect = IOError("Invalid resource table")
+        with AabPackage(aab_path) as aab_package:
+            assert aab_package.get_app_name() == "Dumped app name"
+    mock_bundletool().iter_dump_resources.assert_called_once_with(aab_path)
+
+
+def test_close_unread_package_does_not_open_it(tmp_path: pathlib.Path):
+    with mock.patch.object(AabPackage, "_validate_package"):
+        aab_package = AabPackage(tmp_path / "app.aab")
+
+    aab_package.close()
+
+    assert "_archive" not in aab_package.__dict__
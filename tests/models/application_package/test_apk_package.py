@@ -1,9 +1,26 @@
+import datetime
 import pathlib
+import struct
+import zipfile
+from typing import Dict
 from unittest import mock
 
 import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.serialization import Encoding
+from cryptography.hazmat.primitives.serialization import pkcs7
+from cryptography.x509 import load_der_x509_certificate
+from cryptography.x509.oid import NameOID
 
 from codemagic.models.application_package import ApkPackage
+from codemagic.models.application_package.android.apk_signing_block import APK_SIGNATURE_SCHEME_V2_BLOCK_ID
+from codemagic.models.application_package.android.apk_signing_block import APK_SIGNATURE_SCHEME_V3_BLOCK_ID
+from codemagic.models.application_package.android.apk_signing_block import APK_SIGNATURE_SCHEME_V31_BLOCK_ID
+from codemagic.models.application_package.android.apk_signing_block import APK_SIGNING_BLOCK_MAGIC
+from tests.models.application_package.android.test_binary_resources import encode_binary_manifest
+from tests.models.application_package.android.test_binary_resources import encode_resource_table
 
 
 @pytest.fixture
@@ -23,7 +40,165 @@ def mock_apk(certificate_der: bytes):
         yield mock_apk
 
 
+def _length_prefixed(*items: bytes) -> bytes:
+    data = b"".join(items)
+    return struct.pack("<L", len(data)) + data
+
+
+def _create_certificate_der(organization: str) -> bytes:
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.ORGANIZATION_NAME, organization)])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(private_key.public_key())
+        .serial_number(2)
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(private_key, hashes.SHA256())
+    )
+    return certificate.public_bytes(Encoding.DER)
+
+
+def _signature_scheme_block(certificate_der: bytes) -> bytes:
+    signed_data = _length_prefixed() + _length_prefixed(_length_prefixed(certificate_der)) + _length_prefixed()
+    signer = _length_prefixed(signed_data) + _length_prefixed() + _length_prefixed()
+    return _length_prefixed(_length_prefixed(signer))
+
+
+def _add_signing_block(apk_path: pathlib.Path, blocks: Dict[int, bytes]):
+    pairs = b"".join(struct.pack("<QL", 4 + len(value), block_id) + value for block_id, value in blocks.items())
+    block_size = len(pairs) + 24
+    signing_block = struct.pack("<Q", block_size) + pairs + struct.pack("<Q", block_size) + APK_SIGNING_BLOCK_MAGIC
+
+    apk = apk_path.read_bytes()
+    eocd_offset = apk.rfind(b"PK\x05\x06")
+    (central_directory_offset,) = struct.unpack_from("<L", apk, eocd_offset + 16)
+    eocd = bytearray(apk[eocd_offset:])
+    struct.pack_into("<L", eocd, 16, central_directory_offset + len(signing_block))
+    apk_path.write_bytes(
+        apk[:central_directory_offset] + signing_block + apk[central_directory_offset:eocd_offset] + eocd,
+    )
+
+
+def _add_v1_signature(apk_path: pathlib.Path, certificate_der: bytes):
+    certificate = load_der_x509_certificate(certificate_der)
+    with zipfile.ZipFile(apk_path, "a") as zf:
+        zf.writestr("META-INF/CERT.SF", b"")
+        zf.writestr("META-INF/CERT.RSA", pkcs7.serialize_certificates([certificate], Encoding.DER))
+
+
+@pytest.fixture
+def apk_path(tmp_path: pathlib.Path) -> pathlib.Path:
+    path = tmp_path / "app.apk"
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("AndroidManifest.xml", encode_binary_manifest())
+        zf.writestr("classes.dex", b"dex")
+        zf.writestr("resources.arsc", encode_resource_table({b"et": "CLI tööriistad", b"": "CLI tools test app"}))
+    return path
+
+
 def test_certificate(mock_apk: mock.MagicMock):
-    apk = ApkPackage("/path/to/app.apk")
+    apk = ApkPackage("/path/to/app.apk", use_androguard=True)
     assert apk.certificate.subject == {"O": "Codemagic"}
     assert apk.certificate.serial == 1
+
+
+@mock.patch("codemagic.models.application_package.apk_package._get_androguard_apk")
+def test_apk_summary(mock_get_androguard_apk, apk_path: pathlib.Path):
+    with ApkPackage(apk_path) as apk:
+        assert apk.get_summary() == {
+            "app_name": "CLI tools test app",
+            "package_name": "io.codemagic.cli_tools",
+            "min_os_version": "24",
+            "certificate_issuer": None,
+            "certificate_subject": None,
+            "debuggable": True,
+            "version": "3.14",
+            "version_code": "8",
+        }
+        mock_get_androguard_apk.assert_not_called()
+
+
+def test_apk_v2_signature_certificate(apk_path: pathlib.Path, certificate_der: bytes):
+    _add_signing_block(apk_path, {APK_SIGNATURE_SCHEME_V2_BLOCK_ID: _signature_scheme_block(certificate_der)})
+
+    with ApkPackage(apk_path) as apk:
+        assert apk.certificate.subject == {"O": "Codemagic"}
+        assert apk.certificate.serial == 1
+        assert apk.get_package_name() == "io.codemagic.cli_tools"
+
+
+def test_apk_v1_signature_certificate(apk_path: pathlib.Path, certificate_der: bytes):
+    _add_v1_signature(apk_path, certificate_der)
+
+    with ApkPackage(apk_path) as apk:
+        assert apk.certificate.subject == {"O": "Codemagic"}
+
+
+def test_apk_rotated_signing_key_certificate(apk_path: pathlib.Path, certificate_der: bytes):
+    # Original signer is reported for APKs with signing key rotation, same as from v1 JAR signature
+    _add_signing_block(
+        apk_path,
+        {
+            APK_SIGNATURE_SCHEME_V2_BLOCK_ID: _signature_scheme_block(certificate_der),
+            APK_SIGNATURE_SCHEME_V3_BLOCK_ID: _signature_scheme_block(certificate_der),
+            APK_SIGNATURE_SCHEME_V31_BLOCK_ID: _signature_scheme_block(_create_certificate_der("Rotated")),
+        },
+    )
+
+    with ApkPackage(apk_path) as apk:
+        assert apk.certificate.subject == {"O": "Codemagic"}
+
+
+def test_apk_invalid_signing_block_v1_fallback(apk_path: pathlib.Path, certificate_der: bytes):
+    _add_v1_signature(apk_path, certificate_der)
+    _add_signing_block(apk_path, {APK_SIGNATURE_SCHEME_V2_BLOCK_ID: b"\xff\xff\xff\xff"})
+
+    with ApkPackage(apk_path) as apk, mock.patch(
+        "codemagic.models.application_package.apk_package._get_androguard_apk",
+    ) as mock_get_androguard_apk:
+        assert apk.certificate.subject == {"O": "Codemagic"}
+        assert apk.get_summary()["certificate_subject"] == "Organization: Codemagic"
+    mock_get_androguard_apk.assert_not_called()
+
+
+def test_apk_invalid_signing_block_androguard_fallback(apk_path: pathlib.Path, mock_apk: mock.MagicMock):
+    _add_signing_block(apk_path, {APK_SIGNATURE_SCHEME_V2_BLOCK_ID: b"\xff\xff\xff\xff"})
+
+    with ApkPackage(apk_path) as apk:
+        assert apk.certificate.subject == {"O": "Codemagic"}
+        assert apk.get_package_name() == "io.codemagic.cli_tools"
+    mock_apk.get_certificate_der.assert_called_once_with("META-INF/CERT.RSA")
+
+
+def test_apk_androguard_fallback(tmp_path: pathlib.Path, mock_apk: mock.MagicMock):
+    apk_path = tmp_path / "app.apk"
+    with zipfile.ZipFile(apk_path, "w") as zf:
+        zf.writestr("AndroidManifest.xml", b"<manifest/>")
+    mock_apk.get_package.return_value = "io.codemagic.cli_tools"
+
+    with ApkPackage(apk_path) as apk:
+        assert apk.get_package_name() == "io.codemagic.cli_tools"
+        assert apk.certificate.subject == {"O": "Codemagic"}
+
+
+def test_not_apk(tmp_path: pathlib.Path):
+    apk_path = tmp_path / "app.apk"
+    apk_path.write_bytes(b"not a zip archive")
+
+    with pytest.raises(IOError):
+        ApkPackage(apk_path)
+
+
+def test_close_unread_package_does_not_open_it(tmp_path: pathlib.Path):
+    with mock.patch.object(ApkPackage, "_validate_package"):
+        apk_package = ApkPackage(tmp_path / "app.apk")
+
+    with mock.patch("codemagic.models.application_package.apk_package._get_androguard_apk") as mock_get_androguard_apk:
+        apk_package.close()
+
+    assert "_apk" not in apk_package.__dict__
+    mock_get_androguard_apk.assert_not_called()
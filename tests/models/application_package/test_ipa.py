@@ -0,0 +1,265 @@
+import pathlib
+import plistlib
+import struct
+import zipfile
+import zlib
+from unittest import mock
+
+import pytest
+
+from codemagic.models.application_package import Ipa
+from codemagic.models.application_package.zip_archive import ZipArchive
+
+
+@pytest.fixture
+def info_plist() -> dict:
+    return {
+        "CFBundleIdentifier": "io.codemagic.app",
+        "CFBundleName": "Codemagic",
+        "CFBundleShortVersionString": "1.2.3",
+        "CFBundleVersion": "45",
+        "MinimumOSVersion": "15.0",
+        "CFBundleSupportedPlatforms": ["iPhoneOS"],
+    }
+
+
+@pytest.fixture
+def ipa_path(tmp_path: pathlib.Path, info_plist: dict) -> pathlib.Path:
+    path = tmp_path / "app.ipa"
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for i in range(100):
+            zf.writestr(f"Payload/Codemagic.app/Assets/{i}.png", b"")
+        zf.writestr("Payload/Codemagic.app/Frameworks/Framework.framework/Info.plist", plistlib.dumps({}))
+        zf.writestr("Payload/Codemagic.app/Info.plist", plistlib.dumps(info_plist))
+    return path
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_ipa_info(ipa_path: pathlib.Path, use_mmap: bool):
+    with Ipa(ipa_path, use_mmap=use_mmap) as ipa:
+        assert ipa.bundle_identifier == "io.codemagic.app"
+        assert ipa.app_name == "Codemagic"
+        assert ipa.version == "1.2.3"
+        assert ipa.version_code == "45"
+        assert ipa.minimum_os_version == "15.0"
+        assert ipa.embedded_provisioning_profile is None
+
+
+def test_central_directory_is_read_once(ipa_path: pathlib.Path):
+    with mock.patch.object(zipfile, "ZipFile", wraps=zipfile.ZipFile) as mock_zip_file:
+        with Ipa(ipa_path) as ipa:
+            _ = ipa.embedded_provisioning_profile
+            _ = ipa.info_plist
+
+    mock_zip_file.assert_called_once()
+
+
+def test_missing_file(ipa_path: pathlib.Path):
+    with Ipa(ipa_path) as ipa:
+        with pytest.raises(FileNotFoundError):
+            ipa._get_app_file_contents("missing.file")
+
+
+def test_extract_app(ipa_path: pathlib.Path, tmp_path: pathlib.Path):
+    with Ipa(ipa_path) as ipa:
+        app_path = ipa.extract_app(tmp_path / "extracted")
+
+    assert app_path == tmp_path / "extracted" / "Payload" / "Codemagic.app"
+    assert (app_path / "Info.plist").is_file()
+
+
+def test_invalid_ipa(tmp_path: pathlib.Path):
+    ipa_path = tmp_path / "app.ipa"
+    ipa_path.write_bytes(b"not a zip archive")
+
+    with pytest.raises(IOError):
+        Ipa(ipa_path)
+
+
+def test_zip_archive_find_is_memoized(ipa_path: pathlib.Path):
+    app_file_pattern = Ipa._get_app_file_pattern("Info.plist")
+    pattern = mock.Mock(wraps=app_file_pattern, pattern=app_file_pattern.pattern)
+
+    with ZipArchive(ipa_path) as archive:
+        member = archive.find(pattern)
+        fullmatch_calls = pattern.fullmatch.call_count
+        assert archive.find(pattern) is member
+
+    assert member is not None
+    assert member.filename == "Payload/Codemagic.app/Info.plist"
+    assert pattern.fullmatch.call_count == fullmatch_calls
+
+
+def _write_local_file(fd, name: str, contents: bytes) -> zipfile.ZipInfo:
+    zip_info = zipfile.ZipInfo(name)
+    zip_info.compress_type = zipfile.ZIP_DEFLATED
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -zlib.MAX_WBITS)
+    compressed = compressor.compress(contents) + compressor.flush()
+    zip_info.header_offset = fd.tell()
+    zip_info.CRC = zlib.crc32(contents)
+    zip_info.compress_size = len(compressed)
+    zip_info.file_size = len(contents)
+    fd.write(zip_info.FileHeader())
+    fd.write(compressed)
+    return zip_info
+
+
+def _write_central_directory(fd, zip_infos, stored_offset_mask: int = 0xFFFFFFFF):
+    central_directory_offset = fd.tell()
+    for zip_info in zip_infos:
+        extract_version = max(zip_info.extract_version, 20)
+        create_version = max(zip_info.create_version, 20)
+        filename, flag_bits = zip_info._encodeFilenameFlags()
+        fd.write(
+            struct.pack(
+                zipfile.structCentralDir,
+                zipfile.stringCentralDir,
+                create_version,
+                zip_info.create_system,
+                extract_version,
+                zip_info.reserved,
+                flag_bits,
+                zip_info.compress_type,
+                (zip_info.date_time[3] << 11) | (zip_info.date_time[4] << 5) | (zip_info.date_time[5] // 2),
+                ((zip_info.date_time[0] - 1980) << 9) | (zip_info.date_time[1] << 5) | zip_info.date_time[2],
+                zip_info.CRC,
+                zip_info.compress_size,
+                zip_info.file_size,
+                len(filename),
+                0,
+                0,
+                0,
+                0,
+                0,
+                zip_info.header_offset & stored_offset_mask,
+            ),
+        )
+        fd.write(filename)
+    central_directory_size = fd.tell() - central_directory_offset
+    fd.write(
+        struct.pack(
+            zipfile.structEndArchive,
+            zipfile.stringEndArchive,
+            0,
+            0,
+            len(zip_infos),
+            len(zip_infos),
+            central_directory_size,
+            central_directory_offset & stored_offset_mask,
+            0,
+        ),
+    )
+
+
+def test_padded_ipa(tmp_path: pathlib.Path, info_plist: dict):
+    ipa_path = tmp_path / "padded.ipa"
+    with ipa_path.open("wb") as fd:
+        zip_infos = [_write_local_file(fd, "Payload/Codemagic.app/Info.plist", plistlib.dumps(info_plist))]
+        fd.write(b"\0" * 64)  # Padding that is not accounted for by the central directory
+        asset = _write_local_file(fd, "Payload/Codemagic.app/Assets.car", b"assets" * 1000)
+        asset.header_offset -= 64
+        zip_infos.append(asset)
+        _write_central_directory(fd, zip_infos)
+
+    with pytest.raises(zipfile.BadZipFile), zipfile.ZipFile(ipa_path) as zip_file:
+        zip_file.read("Payload/Codemagic.app/Assets.car")
+
+    with Ipa(ipa_path) as ipa:
+        assert ipa.bundle_identifier == "io.codemagic.app"
+        app_path = ipa.extract_app(tmp_path / "extracted")
+        assert (app_path / "Assets.car").read_bytes() == b"assets" * 1000
+
+
+def test_ipa_larger_than_4gb_without_zip64(tmp_path: pathlib.Path, info_plist: dict):
+    ipa_path = tmp_path / "large.ipa"
+    with ipa_path.open("wb") as fd:
+        zip_infos = [_write_local_file(fd, "Payload/Codemagic.app/Info.plist", plistlib.dumps(info_plist))]
+        try:
+            fd.seek(2**32 + 1024)  # Sparse file, no disk space is actually used
+        except (OSError, OverflowError):
+            pytest.skip("Large sparse files are not supported")
+        zip_infos.append(_write_local_file(fd, "Payload/Codemagic.app/Assets.car", b"assets"))
+        _write_central_directory(fd, zip_infos)
+
+    with pytest.raises(zipfile.BadZipFile), zipfile.ZipFile(ipa_path) as zip_file:
+        zip_file.read("Payload/Codemagic.app/Info.plist")
+
+    with mock.patch("subprocess.run") as mock_subprocess_run:
+        with Ipa(ipa_path) as ipa:
+            assert ipa.bundle_identifier == "io.codemagic.app"
+            with ZipArchive(ipa_path) as archive:
+                assert archive.read("Payload/Codemagic.app/Assets.car") == b"assets"
+    mock_subprocess_run.assert_not_called()
+
+
+def test_extract_stored_and_compressed_members(tmp_path: pathlib.Path):
+    archive_path = tmp_path / "archive.zip"
+    stored_contents = bytes(range(256)) * 10_000
+    compressed_contents = b"compressed" * 10_000
+    with zipfile.ZipFile(archive_path, "w") as zf:
+        zf.writestr("directory/", b"")
+        zf.writestr("directory/stored.bin", stored_contents, compress_type=zipfile.ZIP_STORED)
+        zf.writestr("directory/compressed.txt", compressed_contents, compress_type=zipfile.ZIP_DEFLATED)
+
+    with ZipArchive(archive_path) as archive:
+        archive.COPY_CHUNK_SIZE = 1000
+        with mock.patch.object(ZipArchive, "open", wraps=archive.open) as mock_open:
+            extracted_paths = archive.extract_all(archive.members, tmp_path / "extracted", max_workers=2)
+
+    assert extracted_paths == [
+        tmp_path / "extracted" / "directory",
+        tmp_path / "extracted" / "directory" / "stored.bin",
+        tmp_path / "extracted" / "directory" / "compressed.txt",
+    ]
+    assert extracted_paths[1].read_bytes() == stored_contents
+    assert extracted_paths[2].read_bytes() == compressed_contents
+    # Stored members are copied without opening them through zipfile
+    mock_open.assert_called_once()
+
+
+def test_extract_stored_member_with_invalid_crc(tmp_path: pathlib.Path):
+    archive_path = tmp_path / "archive.zip"
+    with zipfile.ZipFile(archive_path, "w") as zf:
+        zf.writestr("stored.bin", b"original", compress_type=zipfile.ZIP_STORED)
+    archive_path.write_bytes(archive_path.read_bytes().replace(b"original", b"modified"))
+
+    with ZipArchive(archive_path) as archive, pytest.raises(zipfile.BadZipFile):
+        archive.extract_file("stored.bin", tmp_path / "stored.bin")
+
+
+def _get_concurrent_extraction_members():
+    return {f"member-{i}.bin": bytes([i]) * 100_000 + f"member {i}".encode() * 5_000 for i in range(24)}
+
+
+def _assert_concurrent_extraction(archive_path: pathlib.Path, members: dict, target_directory: pathlib.Path):
+    for _ in range(20):
+        with ZipArchive(archive_path) as archive:
+            archive.COPY_CHUNK_SIZE = 4096
+            extracted_paths = archive.extract_all(archive.members, target_directory, max_workers=8)
+        assert {path.name: path.read_bytes() for path in extracted_paths} == members
+
+
+def test_extract_all_stored_and_compressed_members_concurrently(tmp_path: pathlib.Path):
+    archive_path = tmp_path / "archive.zip"
+    members = _get_concurrent_extraction_members()
+    with zipfile.ZipFile(archive_path, "w") as zf:
+        for i, (name, contents) in enumerate(members.items()):
+            zf.writestr(name, contents, compress_type=zipfile.ZIP_STORED if i % 2 else zipfile.ZIP_DEFLATED)
+
+    _assert_concurrent_extraction(archive_path, members, tmp_path / "extracted")
+
+
+def test_extract_all_padded_members_concurrently(tmp_path: pathlib.Path):
+    archive_path = tmp_path / "padded.zip"
+    members = _get_concurrent_extraction_members()
+    with archive_path.open("wb") as fd:
+        zip_infos = []
+        for i, (name, contents) in enumerate(members.items()):
+            zip_infos.append(_write_local_file(fd, name, contents))
+            if i % 3 == 0:
+                fd.write(b"\0" * 64)  # Padding that is not accounted for by the central directory
+        for zip_info in zip_infos[1::3]:
+            zip_info.header_offset -= 64
+        _write_central_directory(fd, zip_infos)
+
+    _assert_concurrent_extraction(archive_path, members, tmp_path / "extracted")
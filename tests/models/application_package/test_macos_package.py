@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import bz2
+import hashlib
+import pathlib
+import zlib
+from typing import Dict
+from typing import Tuple
+from xml.etree import ElementTree
+
+import pytest
+
+from codemagic.models.application_package import MacOsPackage
+from codemagic.models.application_package.xar_archive import XAR_HEADER
+from codemagic.models.application_package.xar_archive import XAR_MAGIC
+from codemagic.models.application_package.xar_archive import XarArchive
+
+PACKAGE_INFO = b"""<?xml version="1.0" encoding="utf-8"?>
+<pkg-info format-version="2" identifier="io.codemagic.app.pkg" version="1.2.3" install-location="/Applications">
+    <payload numberOfFiles="12" installKBytes="2048"/>
+    <bundle path="./Codemagic.app" id="io.codemagic.app" CFBundleShortVersionString="1.2.3" CFBundleVersion="45"/>
+</pkg-info>
+"""
+
+# File path -> (contents, encoding)
+XarFiles = Dict[str, Tuple[bytes, str]]
+
+
+def _encode(contents: bytes, encoding: str) -> bytes:
+    if encoding == "application/x-gzip":
+        return zlib.compress(contents)
+    elif encoding == "application/x-bzip2":
+        return bz2.compress(contents)
+    return contents
+
+
+def encode_xar(files: XarFiles, corrupt_checksums: bool = False) -> bytes:
+    xar = ElementTree.Element("xar")
+    toc = ElementTree.SubElement(xar, "toc")
+    directories: Dict[str, ElementTree.Element] = {"": toc}
+    heap = b""
+    file_id = 0
+
+    def add_file(parent: ElementTree.Element, name: str, file_type: str) -> ElementTree.Element:
+        nonlocal file_id
+        file_id += 1
+        file_element = ElementTree.SubElement(parent, "file", id=str(file_id))
+        ElementTree.SubElement(file_element, "name").text = name
+        ElementTree.SubElement(file_element, "type").text = file_type
+        return file_element
+
+    for path, (contents, encoding) in files.items():
+        *directory_names, file_name = path.split("/")
+        parent_path = ""
+        for directory_name in directory_names:
+            directory_path = f"{parent_path}/{directory_name}".lstrip("/")
+            if directory_path not in directories:
+                directories[directory_path] = add_file(directories[parent_path], directory_name, "directory")
+            parent_path = directory_path
+
+        archived_contents = _encode(contents, encoding)
+        checksum = hashlib.sha1(b"corrupt" if corrupt_checksums else archived_contents).hexdigest()
+        data = ElementTree.SubElement(add_file(directories[parent_path], file_name, "file"), "data")
+        ElementTree.SubElement(data, "offset").text = str(len(heap))
+        ElementTree.SubElement(data, "length").text = str(len(archived_contents))
+        ElementTree.SubElement(data, "size").text = str(len(contents))
+        ElementTree.SubElement(data, "encoding", style=encoding)
+        ElementTree.SubElement(data, "archived-checksum", style="sha1").text = checksum
+        heap += archived_contents
+
+    toc_xml = ElementTree.tostring(xar)
+    compressed_toc = zlib.compress(toc_xml)
+    header = XAR_HEADER.pack(XAR_MAGIC, XAR_HEADER.size, 1, len(compressed_toc), len(toc_xml), 1)
+    return header + compressed_toc + heap
+
+
+@pytest.fixture
+def pkg_path(tmp_path: pathlib.Path) -> pathlib.Path:
+    path = tmp_path / "Codemagic.pkg"
+    files = {
+        "Distribution": (b"<installer-gui-script/>", "application/octet-stream"),
+        "Codemagic.pkg/Bom": (b"\x00" * 64, "application/octet-stream"),
+        "Codemagic.pkg/Payload": (b"payload" * 1000, "application/x-bzip2"),
+        "Codemagic.pkg/PackageInfo": (PACKAGE_INFO, "application/x-gzip"),
+    }
+    path.write_bytes(encode_xar(files))
+    return path
+
+
+def test_macos_package(pkg_path: pathlib.Path):
+    package = MacOsPackage(pkg_path)
+
+    assert package.get_summary() == {
+        "bundle_identifier": "io.codemagic.app",
+        "install_size": "2048KB",
+        "version": "1.2.3",
+        "version_code": "45",
+    }
+
+
+def test_invalid_macos_package(tmp_path: pathlib.Path):
+    path = tmp_path / "Invalid.pkg"
+    path.write_bytes(b"not a xar archive" * 10)
+    with pytest.raises(IOError):
+        MacOsPackage(path)
+
+
+def test_macos_package_without_package_info(tmp_path: pathlib.Path):
+    path = tmp_path / "Codemagic.pkg"
+    path.write_bytes(encode_xar({"PackageInfo": (PACKAGE_INFO, "application/x-gzip")}))
+    with pytest.raises(IOError):
+        MacOsPackage(path)
+
+
+def test_xar_archive(pkg_path: pathlib.Path):
+    with XarArchive(pkg_path) as xar_archive:
+        assert xar_archive.namelist() == [
+            "Distribution",
+            "Codemagic.pkg",
+            "Codemagic.pkg/Bom",
+            "Codemagic.pkg/Payload",
+            "Codemagic.pkg/PackageInfo",
+        ]
+        package_info = xar_archive.find("*.pkg/PackageInfo")
+        assert package_info is not None and package_info.name == "Codemagic.pkg/PackageInfo"
+        assert xar_archive.find("PackageInfo") is None
+        assert xar_archive.read(package_info) == PACKAGE_INFO
+        assert xar_archive.read("Codemagic.pkg/Payload") == b"payload" * 1000
+        assert xar_archive.read("Distribution") == b"<installer-gui-script/>"
+        with pytest.raises(IsADirectoryError):
+            xar_archive.read("Codemagic.pkg")
+        with pytest.raises(FileNotFoundError):
+            xar_archive.read("Resources")
+
+
+def test_xar_archive_checksum_mismatch(tmp_path: pathlib.Path):
+    path = tmp_path / "Codemagic.pkg"
+    path.write_bytes(encode_xar({"PackageInfo": (PACKAGE_INFO, "application/x-gzip")}, corrupt_checksums=True))
+    with XarArchive(path) as xar_archive, pytest.raises(ValueError, match="Checksum mismatch"):
+        xar_archive.read("PackageInfo")
+
+
+@pytest.mark.parametrize(
+    "contents",
+    (
+        b"",
+        b"xar!" + b"\x00" * 24,
+        encode_xar({"PackageInfo": (PACKAGE_INFO, "application/x-gzip")})[:40],
+    ),
+)
+def test_invalid_xar_archive(tmp_path: pathlib.Path, contents: bytes):
+    path = tmp_path / "Invalid.pkg"
+    path.write_bytes(contents)
+    with XarArchive(path) as xar_archive, pytest.raises(ValueError):
+        xar_archive.namelist()
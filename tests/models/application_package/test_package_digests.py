@@ -0,0 +1,81 @@
+import hashlib
+import os
+import pathlib
+import plistlib
+import zipfile
+from unittest import mock
+
+import pytest
+
+from codemagic.models.application_package import Ipa
+from codemagic.models.application_package import package_digests
+from codemagic.models.application_package.package_digests import PackageDigests
+from codemagic.models.application_package.package_digests import get_digests
+
+
+@pytest.fixture
+def contents() -> bytes:
+    return os.urandom(3 * package_digests.DIGEST_CHUNK_SIZE + 123)
+
+
+@pytest.fixture
+def file_path(tmp_path: pathlib.Path, contents: bytes) -> pathlib.Path:
+    path = tmp_path / "package.bin"
+    path.write_bytes(contents)
+    return path
+
+
+@pytest.mark.parametrize("use_mmap", (False, True))
+def test_get_digests(file_path: pathlib.Path, contents: bytes, use_mmap: bool):
+    digests = get_digests(file_path, use_mmap=use_mmap, refresh=True)
+
+    assert digests == PackageDigests(
+        sha256=hashlib.sha256(contents).hexdigest(),
+        sha1=hashlib.sha1(contents).hexdigest(),
+        md5=hashlib.md5(contents).hexdigest(),
+    )
+
+
+@pytest.mark.parametrize("use_mmap", (False, True))
+def test_get_digests_empty_file(tmp_path: pathlib.Path, use_mmap: bool):
+    path = tmp_path / "empty"
+    path.touch()
+    assert get_digests(path, use_mmap=use_mmap).sha256 == hashlib.sha256(b"").hexdigest()
+
+
+def test_get_digests_memoized(file_path: pathlib.Path, contents: bytes):
+    with mock.patch.object(package_digests, "_compute_digests", wraps=package_digests._compute_digests) as compute:
+        first_digests = get_digests(file_path)
+        assert get_digests(file_path) is first_digests
+        assert compute.call_count == 1
+
+        get_digests(file_path, refresh=True)
+        assert compute.call_count == 2
+
+        # Modified file is digested again
+        file_path.write_bytes(b"modified" + contents)
+        stat = file_path.stat()
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        modified_digests = get_digests(file_path)
+        assert compute.call_count == 3
+
+    assert modified_digests.sha256 == hashlib.sha256(b"modified" + contents).hexdigest()
+    assert len([identity for identity in package_digests._digests if identity[0] == str(file_path.resolve())]) == 1
+
+
+def test_package_digests(tmp_path: pathlib.Path):
+    ipa_path = tmp_path / "app.ipa"
+    with zipfile.ZipFile(ipa_path, "w") as zf:
+        zf.writestr("Payload/Codemagic.app/Info.plist", plistlib.dumps({"CFBundleIdentifier": "io.codemagic.app"}))
+
+    with Ipa(ipa_path) as ipa, mock.patch.object(
+        package_digests,
+        "_compute_digests",
+        wraps=package_digests._compute_digests,
+    ) as compute:
+        digests = ipa.get_digests()
+        assert ipa.get_digests() == digests
+        assert compute.call_count == 1
+
+    assert digests.md5 == hashlib.md5(ipa_path.read_bytes()).hexdigest()
+    assert digests.dict() == {"sha256": digests.sha256, "sha1": digests.sha1, "md5": digests.md5}
@@ -0,0 +1,104 @@
+import pathlib
+import pickle
+import plistlib
+import zipfile
+from typing import List
+from unittest import mock
+
+import pytest
+
+from codemagic.models.application_package import Ipa
+from codemagic.models.application_package.package_loader import PackageLoader
+from codemagic.utilities import log
+
+
+def _write_ipa(path: pathlib.Path, version: str) -> pathlib.Path:
+    info_plist = {"CFBundleIdentifier": "io.codemagic.app", "CFBundleVersion": version}
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("Payload/Codemagic.app/Info.plist", plistlib.dumps(info_plist))
+    return path
+
+
+class _IpaWithUnreadableSummary(Ipa):
+    def get_summary(self):
+        self._logger.debug("Read summary of %s", self.path.name)
+        if self.path.stem == "unreadable":
+            raise ValueError("Summary is not available")
+        return super().get_summary()
+
+
+def _get_package_type(_path: pathlib.Path):
+    return _IpaWithUnreadableSummary
+
+
+@pytest.fixture
+def package_paths(tmp_path: pathlib.Path) -> List[pathlib.Path]:
+    return [
+        _write_ipa(tmp_path / "first.ipa", "1"),
+        _write_ipa(tmp_path / "unreadable.ipa", "0"),
+        _write_ipa(tmp_path / "second.ipa", "2"),
+        _write_ipa(tmp_path / "third.ipa", "3"),
+    ]
+
+
+@pytest.mark.parametrize("max_workers", (1, 2))
+def test_load_packages(package_paths: List[pathlib.Path], max_workers: int):
+    package_loader = PackageLoader(_get_package_type, max_workers=max_workers)
+
+    results = package_loader.load(package_paths)
+
+    assert [result.path for result in results] == package_paths
+    assert [result.package.version_code if result.package else None for result in results] == ["1", None, "2", "3"]
+    assert [type(result.error) for result in results] == [type(None), ValueError, type(None), type(None)]
+    assert str(results[1].error) == "Summary is not available"
+
+
+def test_worker_processes_log_to_file(package_paths: List[pathlib.Path], tmp_path: pathlib.Path):
+    log_path = tmp_path / "codemagic.log"
+    with mock.patch.object(log, "get_log_path", return_value=log_path):
+        log.LogHandlers.configure_file_handler()
+    try:
+        PackageLoader(_get_package_type, max_workers=2).load(package_paths)
+        log.LogHandlers.stop_file_logging()
+    finally:
+        log.LogHandlers.configure_file_handler()
+
+    log_contents = log_path.read_text()
+    assert all(f"> Read summary of {path.name}" in log_contents for path in package_paths)
+
+
+@pytest.mark.parametrize("max_workers", (1, 2))
+def test_load_invalid_package(package_paths: List[pathlib.Path], tmp_path: pathlib.Path, max_workers: int):
+    invalid_ipa_path = tmp_path / "invalid.ipa"
+    invalid_ipa_path.write_bytes(b"not a zip archive")
+    package_loader = PackageLoader(_get_package_type, max_workers=max_workers)
+
+    # Invalid packages are not skipped, but loading fails altogether
+    with pytest.raises(IOError, match="Not a valid iOS application package"):
+        package_loader.load([*package_paths, invalid_ipa_path])
+
+
+def test_unsupported_package_type(package_paths: List[pathlib.Path]):
+    def get_package_type(path: pathlib.Path):
+        raise ValueError(f"Unsupported package {path}")
+
+    with pytest.raises(ValueError):
+        PackageLoader(get_package_type).load(package_paths)
+
+
+def test_invalid_worker_count():
+    with pytest.raises(ValueError):
+        PackageLoader(lambda _path: Ipa, max_workers=0)
+
+
+def test_pickled_package_keeps_metadata(package_paths: List[pathlib.Path]):
+    ipa = Ipa(package_paths[0], use_mmap=True)
+    summary = ipa.get_summary()
+
+    unpickled_ipa = pickle.loads(pickle.dumps(ipa))
+
+    assert "_archive" not in unpickled_ipa.__dict__
+    assert unpickled_ipa.get_summary() == summary
+    assert unpickled_ipa.version_code == "1"
+    assert unpickled_ipa._use_mmap is True
+    assert "_archive" not in unpickled_ipa.__dict__
@@ -0,0 +1,131 @@
+import os
+import pathlib
+import plistlib
+import stat
+import zipfile
+from unittest import mock
+
+import pytest
+
+from codemagic.models.application_package import Ipa
+from codemagic.models.application_package.abstract_package import AbstractPackage
+from codemagic.models.application_package.package_metadata_cache import PackageMetadataCache
+
+
+@pytest.fixture
+def ipa_path(tmp_path: pathlib.Path) -> pathlib.Path:
+    info_plist = {
+        "CFBundleIdentifier": "io.codemagic.app",
+        "CFBundleName": "Codemagic",
+        "CFBundleShortVersionString": "1.2.3",
+        "CFBundleVersion": "45",
+    }
+    path = tmp_path / "app.ipa"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("Payload/Codemagic.app/Info.plist", plistlib.dumps(info_plist))
+    return path
+
+
+@pytest.fixture
+def metadata_cache(tmp_path: pathlib.Path):
+    cache = PackageMetadataCache(directory=tmp_path / "cache")
+    with mock.patch.object(AbstractPackage, "metadata_cache", cache):
+        yield cache
+
+
+def _load_ipa_without_archive(ipa_path: pathlib.Path) -> Ipa:
+    with mock.patch.object(Ipa, "_archive", new_callable=mock.PropertyMock) as mock_archive:
+        mock_archive.side_effect = AssertionError("Archive should not be accessed")
+        with Ipa(ipa_path) as ipa:
+            summary = ipa.get_summary()
+            assert ipa.bundle_identifier == "io.codemagic.app"
+    assert summary["version"] == "1.2.3"
+    return ipa
+
+
+def _get_summary(ipa_path: pathlib.Path) -> dict:
+    with Ipa(ipa_path) as ipa:
+        return ipa.get_summary()
+
+
+def test_cached_package_metadata(ipa_path: pathlib.Path, metadata_cache: PackageMetadataCache):
+    summary = _get_summary(ipa_path)
+
+    ipa = _load_ipa_without_archive(ipa_path)
+    assert ipa.get_summary() == summary
+    assert ipa.embedded_provisioning_profile is None
+
+
+def test_cache_invalidated_on_modification(ipa_path: pathlib.Path, metadata_cache: PackageMetadataCache):
+    _get_summary(ipa_path)
+    stat = ipa_path.stat()
+    os.utime(ipa_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert metadata_cache.load("Ipa", ipa_path) is None
+    assert _get_summary(ipa_path)["bundle_identifier"] == "io.codemagic.app"
+    _load_ipa_without_archive(ipa_path)
+
+
+def test_cache_content_hash_verification(ipa_path: pathlib.Path, metadata_cache: PackageMetadataCache):
+    metadata_cache.verify_content_hash = True
+    _get_summary(ipa_path)
+    _load_ipa_without_archive(ipa_path)
+
+    # Change contents without changing size or modification time
+    stat = ipa_path.stat()
+    contents = ipa_path.read_bytes()
+    ipa_path.write_bytes(contents.replace(b"Codemagic", b"Codemagix"))
+    os.utime(ipa_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert PackageMetadataCache(metadata_cache._directory, verify_content_hash=False).load("Ipa", ipa_path)
+    assert PackageMetadataCache(metadata_cache._directory, verify_content_hash=True).load("Ipa", ipa_path) is None
+
+
+def test_cache_disabled_by_default(ipa_path: pathlib.Path):
+    with mock.patch.dict(os.environ, {}, clear=True):
+        assert PackageMetadataCache.from_environment() is None
+        with mock.patch.object(PackageMetadataCache, "save") as mock_save:
+            _get_summary(ipa_path)
+        mock_save.assert_not_called()
+
+
+def test_cache_from_environment():
+    environment = {
+        PackageMetadataCache.ENABLE_ENVIRONMENT_VARIABLE: "true",
+        PackageMetadataCache.VERIFY_CONTENT_ENVIRONMENT_VARIABLE: "true",
+    }
+    with mock.patch.dict(os.environ, environment):
+        metadata_cache = PackageMetadataCache.from_environment()
+    assert metadata_cache is not None
+    assert metadata_cache.verify_content_hash is True
+
+
+def test_invalid_cache_file(ipa_path: pathlib.Path, metadata_cache: PackageMetadataCache):
+    _get_summary(ipa_path)
+    for cache_file in metadata_cache._directory.iterdir():
+        cache_file.write_text("{not json")
+
+    assert metadata_cache.load("Ipa", ipa_path) is None
+    assert _get_summary(ipa_path)["bundle_identifier"] == "io.codemagic.app"
+
+
+def test_cache_is_private(ipa_path: pathlib.Path, metadata_cache: PackageMetadataCache):
+    metadata_cache._directory.mkdir(mode=0o777)
+    metadata_cache._directory.chmod(0o777)
+
+    _get_summary(ipa_path)
+
+    assert stat.S_IMODE(metadata_cache._directory.stat().st_mode) == 0o700
+    assert [stat.S_IMODE(path.stat().st_mode) for path in metadata_cache._directory.iterdir()] == [0o600]
+
+
+def test_cache_directory_owned_by_other_user(ipa_path: pathlib.Path, metadata_cache: PackageMetadataCache):
+    _get_summary(ipa_path)
+
+    with mock.patch("os.getuid", return_value=os.getuid() + 1):
+        assert metadata_cache.load("Ipa", ipa_path) is None
+        with mock.patch.object(Ipa, "_validate_package") as mock_validate_package:
+            assert _get_summary(ipa_path)["bundle_identifier"] == "io.codemagic.app"
+        mock_validate_package.assert_called_once()
+
+    assert metadata_cache.load("Ipa", ipa_path) is not None
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import pathlib
+import re
+import sys
+import textwrap
+from typing import Iterator
+from unittest import mock
+
+import pytest
+
+from codemagic.models import XcodebuildCompactFormatter
+from codemagic.models.xcodebuild import Xcodebuild
+from codemagic.models.xcodebuild import XcodebuildCliProcess
+
+XCODEBUILD_OUTPUT = textwrap.dedent(
+    """\
+    Build settings from command line:
+        SDK = iphoneos
+    CompileSwift normal arm64 /project/App/AppDelegate.swift
+    /project/App/AppDelegate.swift:10:5: error: cannot find 'foo' in scope
+        foo()
+        ^~~
+    CompileSwift normal arm64 /project/App/ViewController.swift
+    /project/App/ViewController.swift:3:1: warning: unused variable
+    ** ARCHIVE FAILED **
+
+
+    The following build commands failed:
+    \tCompileSwift normal arm64 /project/App/AppDelegate.swift
+    (1 failure)
+    """,
+)
+
+
+@pytest.fixture
+def xcodebuild_process() -> Iterator[XcodebuildCliProcess]:
+    script = f"import sys; sys.stdout.write({XCODEBUILD_OUTPUT!r})"
+    process = XcodebuildCliProcess([sys.executable, "-c", script], print_streams=False)
+    process.execute()
+    yield process
+    process.log_path.unlink()
+
+
+def test_iter_log_lines(xcodebuild_process: XcodebuildCliProcess):
+    assert list(xcodebuild_process.iter_log_lines()) == XCODEBUILD_OUTPUT.splitlines(keepends=True)
+    assert xcodebuild_process.stdout == XCODEBUILD_OUTPUT
+
+
+def test_tail(xcodebuild_process: XcodebuildCliProcess):
+    assert xcodebuild_process.tail(3) == [
+        "The following build commands failed:",
+        "\tCompileSwift normal arm64 /project/App/AppDelegate.swift",
+        "(1 failure)",
+    ]
+    assert xcodebuild_process.tail(100) == XCODEBUILD_OUTPUT.splitlines()
+    assert xcodebuild_process.tail(0) == []
+
+
+def test_search_log(xcodebuild_process: XcodebuildCliProcess):
+    assert list(xcodebuild_process.search_log(rb"(error|warning): ")) == [
+        "/project/App/AppDelegate.swift:10:5: error: cannot find 'foo' in scope",
+        "/project/App/ViewController.swift:3:1: warning: unused variable",
+    ]
+    # Line is returned once even if the pattern matches it multiple times
+    assert list(xcodebuild_process.search_log(re.compile(rb"App"))) == [
+        line for line in XCODEBUILD_OUTPUT.splitlines() if "App" in line
+    ]
+    assert list(xcodebuild_process.search_log(rb"^\(\d+ failures?\)$")) == ["(1 failure)"]
+    assert list(xcodebuild_process.search_log(rb"not found")) == []
+
+
+def test_search_empty_log(tmp_path: pathlib.Path):
+    process = XcodebuildCliProcess(["true"], print_streams=False)
+    process.log_path = tmp_path / "empty.log"
+    process.log_path.touch()
+
+    assert list(process.search_log(rb"error")) == []
+    assert process.tail(10) == []
+
+
+def test_file_log_text_is_limited(xcodebuild_process: XcodebuildCliProcess):
+    xcodebuild_process.FILE_LOG_TAIL_LINE_COUNT = 1
+    assert xcodebuild_process._get_stdout_log_text() == f"[Last 1 lines of {xcodebuild_process.log_path}]\n(1 failure)"
+
+
+def test_log_is_analyzed_during_execution(xcodebuild_process: XcodebuildCliProcess):
+    log_analyzer = xcodebuild_process.log_analyzer
+
+    assert log_analyzer.lines_count == len(XCODEBUILD_OUTPUT.splitlines())
+    assert log_analyzer.result == "FAILED"
+    assert [str(error) for error in log_analyzer.errors] == [
+        "/project/App/AppDelegate.swift:10:5: error: cannot find 'foo' in scope",
+    ]
+    assert log_analyzer.find_failure_logs() == "\n".join(
+        [
+            "CompileSwift normal arm64 /project/App/AppDelegate.swift",
+            "\t/project/App/AppDelegate.swift:10:5: error: cannot find 'foo' in scope",
+            "\tfoo()",
+            "\t^~~",
+        ],
+    )
+
+
+@pytest.mark.parametrize("with_process", (True, False))
+def test_archive_failure_logs(with_process: bool, xcodebuild_process: XcodebuildCliProcess, tmp_path: pathlib.Path):
+    xcodebuild = Xcodebuild(
+        xcode_project=tmp_path / "App.xcodeproj",
+        scheme_name="App",
+        xcpretty=XcodebuildCompactFormatter(),
+    )
+    process = xcodebuild_process if with_process else None
+
+    with mock.patch("codemagic.models.xcodebuild.CoreSimulatorService"), mock.patch.object(
+        xcodebuild,
+        "_construct_archive_command",
+    ), mock.patch.object(xcodebuild, "_run_command", side_effect=IOError("Failed to archive", process)):
+        with pytest.raises(IOError) as exc_info:
+            xcodebuild.archive(mock.Mock(), tmp_path / "archives", xcode=mock.Mock())
+
+    message, error_process = exc_info.value.args
+    assert error_process is process
+    if with_process:
+        assert message.startswith("Failed to archive. The following build commands failed:\n\n")
+        assert message.endswith(
+            "\t/project/App/AppDelegate.swift:10:5: error: cannot find 'foo' in scope\n\tfoo()\n\t^~~",
+        )
+    else:
+        assert message == "Failed to archive"
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import io
+import pathlib
+import textwrap
+from typing import List
+from xml.etree import ElementTree
+
+import pytest
+
+from codemagic.models import XcodebuildCompactFormatter
+from codemagic.models import XcodebuildJUnitFormatter
+from codemagic.models.xcodebuild_formatter import XcodebuildOutputFormatter
+
+BUILD_OUTPUT = textwrap.dedent(
+    """\
+    Command line invocation:
+        /Applications/Xcode.app/Contents/Developer/usr/bin/xcodebuild -scheme App archive
+
+    SwiftCompile normal arm64 Compiling\\ AppDelegate.swift /p/AppDelegate.swift (in target 'App' from project 'App')
+        cd /project
+        builtin-swiftTaskExecution -- /Applications/Xcode.app/Contents/Developer/usr/bin/swift-frontend -c
+    /project/App/AppDelegate.swift:10:5: error: cannot find 'foo' in scope
+            foo()
+            ^~~
+    CompileC /build/Lib.o /project/Lib/My\\ Lib.m normal arm64 objective-c (in target 'Lib' from project 'App')
+    ld: warning: object file was built for newer iOS version
+    PhaseScriptExecution Run\\ Script /build/Script.sh (in target 'Lib' from project 'App')
+    Ld /build/App.app/App normal (in target 'Lib' from project 'App')
+    ** ARCHIVE FAILED **
+
+
+    The following build commands failed:
+    \tSwiftCompile normal arm64 /project/App/AppDelegate.swift (in target 'App' from project 'App')
+    (1 failure)
+    """,
+)
+
+TEST_OUTPUT = textwrap.dedent(
+    """\
+    Test Suite 'All tests' started at 2023-10-19 10:00:00.000.
+    Test Suite 'AppTests.xctest' started at 2023-10-19 10:00:00.000.
+    Test Suite 'AppTests' started at 2023-10-19 10:00:00.000.
+    Test Case '-[AppTests.AppTests testExample]' started.
+    Test Case '-[AppTests.AppTests testExample]' passed (0.001 seconds).
+    Test Case '-[AppTests.AppTests testFailure]' started.
+    /project/AppTests/AppTests.swift:20: error: -[AppTests.AppTests testFailure] : XCTAssertTrue failed
+    Test Case '-[AppTests.AppTests testFailure]' failed (0.002 seconds).
+    Test Suite 'AppTests' failed at 2023-10-19 10:00:00.003.
+    \t Executed 2 tests, with 1 failure (0 unexpected) in 0.003 (0.003) seconds
+    Test Suite 'UITests' started at 2023-10-19 10:00:00.003.
+    Test case 'UITests.testLaunch()' passed on 'Clone 1 of iPhone 15' (1.500 seconds)
+    Test Suite 'UITests' passed at 2023-10-19 10:00:01.503.
+    \t Executed 1 test, with 0 failures (0 unexpected) in 1.500 (1.500) seconds
+    Test Suite 'AppTests.xctest' failed at 2023-10-19 10:00:01.503.
+    \t Executed 3 tests, with 1 failure (0 unexpected) in 1.503 (1.503) seconds
+    Test Suite 'All tests' failed at 2023-10-19 10:00:01.503.
+    \t Executed 3 tests, with 1 failure (0 unexpected) in 1.503 (1.504) seconds
+    ** TEST FAILED **
+    """,
+)
+
+
+def _format(formatter: XcodebuildOutputFormatter, output: str, chunk_size: int = 7):
+    for i in range(0, len(output), chunk_size):
+        formatter.format(output[i : i + chunk_size])
+    formatter.flush()
+
+
+def test_compact_formatter_build_output():
+    stdout = io.StringIO()
+    _format(XcodebuildCompactFormatter(stdout, colored=False), BUILD_OUTPUT)
+
+    assert stdout.getvalue().splitlines() == [
+        "▸ Building App/App",
+        "▸ Compiling AppDelegate.swift",
+        "❌ /project/App/AppDelegate.swift:10:5: cannot find 'foo' in scope",
+        "        foo()",
+        "        ^~~",
+        "▸ Building App/Lib",
+        "▸ Compiling My Lib.m",
+        "⚠️  ld: object file was built for newer iOS version",
+        "▸ Running script 'Run Script'",
+        "▸ Linking App",
+        "▸ Archive Failed",
+        "The following build commands failed:",
+        "SwiftCompile normal arm64 /project/App/AppDelegate.swift (in target 'App' from project 'App')",
+        "(1 failure)",
+    ]
+
+
+def test_compact_formatter_test_output():
+    stdout = io.StringIO()
+    _format(XcodebuildCompactFormatter.from_options("--no-utf", stdout), TEST_OUTPUT)
+
+    assert stdout.getvalue().splitlines() == [
+        "All tests",
+        "AppTests.xctest",
+        "AppTests",
+        "    . testExample (0.001 seconds)",
+        "    x testFailure, XCTAssertTrue failed",
+        "      /project/AppTests/AppTests.swift:20",
+        "UITests",
+        "    . testLaunch (1.500 seconds)",
+        "Executed 3 tests, with 1 failure (0 unexpected) in 1.503 (1.504) seconds",
+        "> Test Failed",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("options", "expected_colored"),
+    (
+        ("--color", True),
+        ("--color --no-color", False),
+        ("--simple", False),
+    ),
+)
+def test_compact_formatter_options(options: str, expected_colored: bool):
+    assert XcodebuildCompactFormatter.from_options(options).colored is expected_colored
+
+
+@pytest.mark.parametrize(
+    ("options", "expected_unsupported_options"),
+    (
+        ("--color --no-utf", []),
+        ("--simple", []),
+        ("--knock", ["--knock"]),
+        (
+            "--color --report junit --output 'build/report file.xml'",
+            ["--report", "junit", "--output", "build/report file.xml"],
+        ),
+    ),
+)
+def test_compact_formatter_unsupported_options(options: str, expected_unsupported_options: List[str]):
+    assert XcodebuildCompactFormatter.get_unsupported_options(options) == expected_unsupported_options
+
+
+def test_junit_formatter():
+    stdout = io.StringIO()
+    _format(XcodebuildJUnitFormatter(stdout), TEST_OUTPUT)
+
+    test_suites = ElementTree.fromstring(stdout.getvalue())
+    assert test_suites.tag == "testsuites"
+    assert [(suite.get("name"), suite.get("tests"), suite.get("failures")) for suite in test_suites] == [
+        ("AppTests.AppTests", "2", "1"),
+        ("UITests", "1", None),
+    ]
+    failure = test_suites.find("testsuite/testcase[@name='testFailure']/failure")
+    assert failure is not None
+    assert failure.get("message") == "XCTAssertTrue failed"
+    assert failure.text == "/project/AppTests/AppTests.swift:20"
+
+
+def test_junit_formatter_without_tests():
+    stdout = io.StringIO()
+    _format(XcodebuildJUnitFormatter(stdout), BUILD_OUTPUT)
+
+    assert stdout.getvalue() == ""
+
+
+def test_junit_formatter_output_path(tmp_path: pathlib.Path):
+    stdout = io.StringIO()
+    output_path = tmp_path / "results" / "xcodebuild.xml"
+    _format(XcodebuildJUnitFormatter(stdout, output_path=output_path), TEST_OUTPUT)
+
+    assert stdout.getvalue() == ""
+    test_suites = ElementTree.parse(output_path).getroot()
+    assert [suite.get("name") for suite in test_suites] == ["AppTests.AppTests", "UITests"]
+
+
+def test_junit_formatter_multiple_invocations(tmp_path: pathlib.Path):
+    output_path = tmp_path / "xcodebuild.xml"
+    formatter = XcodebuildJUnitFormatter(output_path=output_path)
+
+    _format(formatter, TEST_OUTPUT)
+    _format(formatter, BUILD_OUTPUT)
+    _format(formatter, TEST_OUTPUT)
+
+    test_suites = ElementTree.parse(output_path).getroot()
+    assert [suite.get("name") for suite in test_suites] == ["AppTests.AppTests", "UITests"] * 2
+
+
+def test_junit_formatter_console_output(tmp_path: pathlib.Path):
+    stdout = io.StringIO()
+    console_formatter = XcodebuildCompactFormatter(stdout, colored=False)
+    output_path = tmp_path / "xcodebuild.xml"
+    _format(XcodebuildJUnitFormatter(output_path=output_path, console_formatter=console_formatter), BUILD_OUTPUT)
+
+    assert "❌ /project/App/AppDelegate.swift:10:5: cannot find 'foo' in scope" in stdout.getvalue()
+    assert "▸ Archive Failed" in stdout.getvalue()
+    assert not output_path.exists()
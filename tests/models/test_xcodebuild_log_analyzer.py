@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import pathlib
+import textwrap
+
+import pytest
+
+from codemagic.models.xcodebuild_log_analyzer import XcodebuildIssue
+from codemagic.models.xcodebuild_log_analyzer import XcodebuildLogAnalyzer
+
+XCODEBUILD_LOG_LINES = [
+    ("Command line invocation:\n", 0.0),
+    ("    xcodebuild -scheme App archive\n", 0.0),
+    ("CompileSwift normal arm64 /project/App/AppDelegate.swift (in target 'App' from project 'App')\n", 1.0),
+    ("    cd /project\n", 1.0),
+    ("/project/App/AppDelegate.swift:10:5: error: cannot find 'foo' in scope\n", 1.5),
+    ("    foo()\n", 1.5),
+    ("    ^~~\n", 1.5),
+    ("CompileSwift normal arm64 /project/App/ViewController.swift (in target 'App' from project 'App')\n", 4.0),
+    ("/project/App/ViewController.swift:3:1: warning: unused variable\n", 4.0),
+    ("/project/App/ViewController.swift:3:1: warning: unused variable\n", 4.0),
+    ("CompileC /build/Lib.o /project/Lib/Lib.m normal arm64 objective-c (in target 'Lib' from project 'App')\n", 4.5),
+    ("ld: warning: object file was built for newer iOS version\n", 5.0),
+    ("\n", 5.0),
+    ("Build Timing Summary\n", 5.5),
+    ("CompileSwiftSources (1 task) | 3.250 seconds\n", 5.5),
+    ("** ARCHIVE FAILED **\n", 6.0),
+    ("\n", 6.0),
+    ("The following build commands failed:\n", 6.0),
+    ("\tCompileSwift normal arm64 /project/App/AppDelegate.swift (in target 'App' from project 'App')\n", 6.0),
+    ("(1 failure)\n", 6.0),
+]
+
+
+@pytest.fixture
+def analyzer() -> XcodebuildLogAnalyzer:
+    log_analyzer = XcodebuildLogAnalyzer()
+    for line, timestamp in XCODEBUILD_LOG_LINES:
+        # Feed lines in two parts to simulate chunks that end in the middle of a line
+        middle = len(line) // 2
+        log_analyzer.feed(line[:middle], timestamp)
+        log_analyzer.feed(line[middle:], timestamp)
+    log_analyzer.finish(7.0)
+    return log_analyzer
+
+
+def test_issues(analyzer: XcodebuildLogAnalyzer):
+    assert analyzer.errors == [
+        XcodebuildIssue("error", "cannot find 'foo' in scope", "/project/App/AppDelegate.swift:10:5", 5),
+    ]
+    assert analyzer.warnings == [
+        XcodebuildIssue("warning", "unused variable", "/project/App/ViewController.swift:3:1", 9),
+        XcodebuildIssue("warning", "object file was built for newer iOS version", "ld", 12),
+    ]
+    assert analyzer.errors[0].step == (
+        "CompileSwift normal arm64 /project/App/AppDelegate.swift (in target 'App' from project 'App')"
+    )
+
+
+def test_steps(analyzer: XcodebuildLogAnalyzer):
+    assert [(step.step_type, step.target, step.duration) for step in analyzer.steps] == [
+        ("CompileSwift", "App", 3.0),
+        ("CompileSwift", "App", 0.5),
+        ("CompileC", "Lib", 1.5),
+    ]
+    assert analyzer.targets["App"].step_counts == {"CompileSwift": 2}
+    assert analyzer.targets["App"].duration == 3.5
+    assert analyzer.targets["Lib"].step_counts == {"CompileC": 1}
+    assert analyzer.timing_summary == {"CompileSwiftSources": 3.25}
+    assert analyzer.result == "FAILED"
+    assert [step.step_type for step in analyzer.get_slowest_compile_steps(2)] == ["CompileSwift", "CompileC"]
+
+
+def test_find_failure_logs(analyzer: XcodebuildLogAnalyzer):
+    assert analyzer.failed_commands == [
+        "CompileSwift normal arm64 /project/App/AppDelegate.swift (in target 'App' from project 'App')",
+    ]
+    assert analyzer.find_failure_logs() == "\n".join(
+        [
+            "CompileSwift normal arm64 /project/App/AppDelegate.swift (in target 'App' from project 'App')",
+            "\tcd /project",
+            "\t/project/App/AppDelegate.swift:10:5: error: cannot find 'foo' in scope",
+            "\tfoo()",
+            "\t^~~",
+        ],
+    )
+
+
+def test_find_failure_logs_truncated(tmp_path: pathlib.Path):
+    log_path = tmp_path / "xcodebuild.log"
+    log_path.write_text(
+        textwrap.dedent(
+            """\
+            PhaseScriptExecution Run\\ Script /build/Script.sh (in target 'App' from project 'App')
+                line 1
+                line 2
+                line 3
+                Command PhaseScriptExecution failed with a nonzero exit code
+            ** BUILD FAILED **
+
+            The following build commands failed:
+            \tPhaseScriptExecution Run\\ Script /build/Script.sh (in target 'App' from project 'App')
+            (1 failure)""",
+        ),
+    )
+
+    analyzer = XcodebuildLogAnalyzer.from_log(log_path, failure_log_line_count=2)
+
+    assert analyzer.find_failure_logs() == "\n".join(
+        [
+            "PhaseScriptExecution Run\\ Script /build/Script.sh (in target 'App' from project 'App')",
+            "\t...",
+            "\tline 3",
+            "\tCommand PhaseScriptExecution failed with a nonzero exit code",
+        ],
+    )
+
+
+def test_successful_build_report(tmp_path: pathlib.Path):
+    log_path = tmp_path / "xcodebuild.log"
+    log_path.write_text(
+        "=== BUILD TARGET App OF PROJECT App WITH CONFIGURATION Release ===\nLd /build/App\n** BUILD SUCCEEDED **\n",
+    )
+
+    analyzer = XcodebuildLogAnalyzer.from_log(log_path)
+
+    assert analyzer.find_failure_logs() is None
+    assert analyzer.steps[0].target == "App"
+    assert analyzer.get_report().splitlines()[:2] == [
+        "Build result: SUCCEEDED",
+        "Errors: 0, warnings: 0, build steps: 1",
+    ]
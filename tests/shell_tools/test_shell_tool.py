@@ -0,0 +1,67 @@
+import subprocess
+import sys
+import time
+from typing import List
+from unittest import mock
+
+import pytest
+
+from codemagic.cli import CliProcess
+from codemagic.shell_tools.shell_tool import ShellTool
+
+
+class _ShellTool(ShellTool):
+    pass
+
+
+def test_iter_stdout_lines():
+    command = (sys.executable, "-c", "for i in range(3): print(i)")
+    assert list(_ShellTool()._iter_stdout_lines(command)) == ["0\n", "1\n", "2\n"]
+
+
+def test_iter_stdout_lines_stopped_early():
+    command = (sys.executable, "-u", "-c", "import time\nprint('ready')\ntime.sleep(60)")
+    processes: List[subprocess.Popen] = []
+    popen = subprocess.Popen
+
+    def create_process(*args, **kwargs) -> subprocess.Popen:
+        processes.append(popen(*args, **kwargs))
+        return processes[-1]
+
+    with mock.patch("subprocess.Popen", side_effect=create_process):
+        lines = _ShellTool()._iter_stdout_lines(command)
+        assert next(lines) == "ready\n"
+
+    # Closing the iterator terminates the process instead of waiting for it to finish
+    started_at = time.monotonic()
+    lines.close()
+
+    assert time.monotonic() - started_at < 10
+    assert len(processes) == 1
+    assert processes[0].returncode is not None
+    if sys.platform != "win32":
+        assert processes[0].returncode < 0
+
+
+def test_iter_stdout_lines_is_logged():
+    command = (sys.executable, "-c", "import sys; print('output'); sys.stderr.write('warning')")
+    with mock.patch.object(CliProcess, "_log_exec_started", autospec=True) as mock_log_exec_started, mock.patch.object(
+        CliProcess,
+        "_log_exec_completed",
+        autospec=True,
+    ) as mock_log_exec_completed:
+        assert list(_ShellTool()._iter_stdout_lines(command)) == ["output\n"]
+
+    mock_log_exec_started.assert_called_once()
+    mock_log_exec_completed.assert_called_once()
+    process = mock_log_exec_completed.call_args[0][0]
+    assert process.returncode == 0
+    assert process.stderr == "warning"
+
+
+def test_iter_stdout_lines_failure():
+    command = (sys.executable, "-c", "import sys; print('output'); sys.exit('error message')")
+    with pytest.raises(subprocess.CalledProcessError) as error_info:
+        list(_ShellTool()._iter_stdout_lines(command))
+    assert error_info.value.returncode == 1
+    assert error_info.value.stderr == "error message\n"
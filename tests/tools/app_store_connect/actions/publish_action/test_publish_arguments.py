@@ -108,7 +108,7 @@ def test_publish_action_with_username_and_password(_mock_altool, publishing_name
             apple_id="name@example.com",
             app_specific_password=Types.AppSpecificPassword("xxxx-yyyy-zzzz-wwww"),
         )
-        mock_get_packages.assert_called_with(patterns)
+        mock_get_packages.assert_called_with(patterns, max_workers=None)
 
 
 def test_publish_action_testflight_with_localization(publishing_namespace_kwargs):
@@ -161,7 +161,7 @@ def test_publish_action_testflight_with_localization(publishing_namespace_kwargs
             whats_new=whats_new,
         )
 
-        mock_get_packages.assert_called_with(patterns)
+        mock_get_packages.assert_called_with(patterns, max_workers=None)
         mock_validate.assert_not_called()
         mock_upload.assert_called()
         mock_wait_until_build_is_processed.assert_called_with(build, Types.MaxBuildProcessingWait.default_value)
@@ -229,7 +229,7 @@ def test_publish_action_app_store_submit(publishing_namespace_kwargs):
             release_type=ReleaseType.AFTER_APPROVAL,
         )
 
-        mock_get_packages.assert_called_with(patterns)
+        mock_get_packages.assert_called_with(patterns, max_workers=None)
         mock_validate.assert_not_called()
         mock_upload.assert_called()
         mock_wait_until_build_is_processed.assert_called_with(build, 5)
@@ -376,7 +376,7 @@ def test_add_build_to_beta_groups(publishing_namespace_kwargs):
             beta_group_names=beta_group_names,
         )
 
-        mock_get_packages.assert_called_with(patterns)
+        mock_get_packages.assert_called_with(patterns, max_workers=None)
         mock_validate.assert_not_called()
         mock_upload.assert_called()
         mock_wait_until_build_is_processed.assert_called_with(build, Types.MaxBuildProcessingWait.default_value)
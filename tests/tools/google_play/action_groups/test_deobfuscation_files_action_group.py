@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import pathlib
+import zipfile
+from unittest import mock
+
+import pytest
+
+from codemagic.google.resources.google_play import AppEdit
+from codemagic.google.resources.google_play import DeobfuscationFile
+from codemagic.google.resources.google_play import DeobfuscationFileType
+from codemagic.tools import GooglePlay
+
+
+@pytest.fixture
+def google_play() -> GooglePlay:
+    return GooglePlay({"type": "service_account"})
+
+
+def _upload_deobfuscation_file(
+    google_play: GooglePlay,
+    deobfuscation_file_path: pathlib.Path,
+    deobfuscation_file_type: DeobfuscationFileType,
+) -> zipfile.ZipFile | bytes:
+    uploaded_contents = []
+
+    def upload(*_args, deobfuscation_file_path: pathlib.Path, **_kwargs):
+        if zipfile.is_zipfile(deobfuscation_file_path):
+            with zipfile.ZipFile(deobfuscation_file_path) as archive:
+                uploaded_contents.append({name: archive.read(name) for name in archive.namelist()})
+        else:
+            uploaded_contents.append(deobfuscation_file_path.read_bytes())
+        return DeobfuscationFile(symbolType=deobfuscation_file_type.value)
+
+    edit = AppEdit(id="edit-id", expiryTimeSeconds="0")
+    with mock.patch.object(google_play, "client") as mock_google_play_client:
+        mock_google_play_client.deobfuscation_files.upload.side_effect = upload
+        google_play.upload_deobfuscation_file(
+            "com.example.app",
+            deobfuscation_file_path,
+            1,
+            deobfuscation_file_type,
+            edit=edit,
+            should_print=False,
+        )
+
+    assert len(uploaded_contents) == 1
+    return uploaded_contents[0]
+
+
+def test_upload_proguard_mapping_as_is(google_play: GooglePlay, tmp_path: pathlib.Path):
+    mapping_path = tmp_path / "mapping.txt"
+    mapping_path.write_text("com.example.A -> a:\n")
+
+    uploaded_contents = _upload_deobfuscation_file(google_play, mapping_path, DeobfuscationFileType.PROGUARD)
+
+    assert uploaded_contents == b"com.example.A -> a:\n"
+
+
+def test_upload_native_debug_symbols_archive_as_is(google_play: GooglePlay, tmp_path: pathlib.Path):
+    archive_path = tmp_path / "native-debug-symbols.zip"
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        archive.writestr("arm64-v8a/libapp.so", b"symbols")
+
+    uploaded_contents = _upload_deobfuscation_file(google_play, archive_path, DeobfuscationFileType.NATIVE_CODE)
+
+    assert uploaded_contents == {"arm64-v8a/libapp.so": b"symbols"}
+
+
+def test_upload_native_debug_symbols_directory(google_play: GooglePlay, tmp_path: pathlib.Path):
+    symbols_directory = tmp_path / "symbols"
+    for abi in ("arm64-v8a", "x86_64"):
+        (symbols_directory / abi).mkdir(parents=True)
+        (symbols_directory / abi / "libapp.so").write_bytes(abi.encode() * 1000)
+
+    uploaded_contents = _upload_deobfuscation_file(google_play, symbols_directory, DeobfuscationFileType.NATIVE_CODE)
+
+    assert uploaded_contents == {
+        "arm64-v8a/libapp.so": b"arm64-v8a" * 1000,
+        "x86_64/libapp.so": b"x86_64" * 1000,
+    }
+
+
+def test_upload_native_debug_symbols_file(google_play: GooglePlay, tmp_path: pathlib.Path):
+    symbols_path = tmp_path / "libapp.so.sym"
+    symbols_path.write_bytes(b"symbols")
+
+    uploaded_contents = _upload_deobfuscation_file(google_play, symbols_path, DeobfuscationFileType.NATIVE_CODE)
+
+    assert uploaded_contents == {"libapp.so.sym": b"symbols"}
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import pathlib
+import stat
+import time
+from unittest import mock
+
+import pytest
+
+from codemagic.google.errors import GoogleHttpError
+from codemagic.google.resources.google_play import AppEdit
+from codemagic.google.resources.google_play import Release
+from codemagic.google.resources.google_play import Status
+from codemagic.google.resources.google_play import Track
+from codemagic.tools import GooglePlay
+from codemagic.tools.google_play.app_edit_session import AppEditSession
+from codemagic.tools.google_play.errors import GooglePlayError
+
+CLIENT_EMAIL = "cli-tools@example.iam.gserviceaccount.com"
+
+
+@pytest.fixture(autouse=True)
+def edit_sessions_directory(tmp_path: pathlib.Path):
+    with mock.patch.object(AppEditSession, "DEFAULT_DIRECTORY", tmp_path):
+        yield tmp_path
+
+
+@pytest.fixture
+def google_play() -> GooglePlay:
+    return GooglePlay({"type": "service_account", "client_email": CLIENT_EMAIL})
+
+
+@pytest.fixture
+def session_edit() -> AppEdit:
+    return AppEdit(id="session-edit-id", expiryTimeSeconds=str(int(time.time()) + 3600))
+
+
+def test_start_edit_session(google_play: GooglePlay, session_edit: AppEdit):
+    with mock.patch.object(google_play, "client") as mock_google_play_client:
+        mock_google_play_client.edits.create.return_value = session_edit
+        edit = google_play.start_edit_session("com.example.app", should_print=False)
+
+    assert edit == session_edit
+    assert AppEditSession("com.example.app", CLIENT_EMAIL).load() == session_edit
+
+
+def test_session_edit_is_reused(google_play: GooglePlay, session_edit: AppEdit):
+    AppEditSession("com.example.app", CLIENT_EMAIL).save(session_edit)
+    track = Track(track="alpha")
+
+    with mock.patch.object(google_play, "client") as mock_google_play_client:
+        mock_google_play_client.edits.get.return_value = session_edit
+        google_play.set_track_release("com.example.app", "alpha", ["1"], should_print=False)
+        mock_google_play_client.tracks.list.return_value = [track]
+        google_play.list_tracks("com.example.app", should_print=False)
+
+    mock_google_play_client.edits.create.assert_not_called()
+    mock_google_play_client.edits.commit.assert_not_called()
+    mock_google_play_client.edits.delete.assert_not_called()
+    mock_google_play_client.tracks.list.assert_called_once_with("com.example.app", "session-edit-id", fields=None)
+
+
+@pytest.mark.parametrize("expiry_time_seconds", ["0", "invalid"])
+def test_expired_session_edit_is_recreated(expiry_time_seconds: str, google_play: GooglePlay, session_edit: AppEdit):
+    AppEditSession("com.example.app", CLIENT_EMAIL).save(
+        AppEdit(id="stale-edit-id", expiryTimeSeconds=expiry_time_seconds),
+    )
+
+    with mock.patch.object(google_play, "client") as mock_google_play_client:
+        mock_google_play_client.edits.create.return_value = session_edit
+        edit = google_play.get_session_edit("com.example.app")
+
+    mock_google_play_client.edits.get.assert_not_called()
+    assert edit == session_edit
+    assert AppEditSession("com.example.app", CLIENT_EMAIL).load() == session_edit
+
+
+def test_invalidated_session_edit_is_recreated(google_play: GooglePlay, session_edit: AppEdit):
+    stale_edit = AppEdit(id="stale-edit-id", expiryTimeSeconds=session_edit.expiryTimeSeconds)
+    AppEditSession("com.example.app", CLIENT_EMAIL).save(stale_edit)
+
+    with mock.patch.object(google_play, "client") as mock_google_play_client:
+        mock_google_play_client.edits.get.side_effect = GoogleHttpError("This Edit has been deleted.")
+        mock_google_play_client.edits.create.return_value = session_edit
+        edit = google_play.get_session_edit("com.example.app")
+
+    mock_google_play_client.edits.get.assert_called_once_with(stale_edit, "com.example.app")
+    assert edit == session_edit
+    assert AppEditSession("com.example.app", CLIENT_EMAIL).load() == session_edit
+
+
+def test_commit_edit_session(google_play: GooglePlay, session_edit: AppEdit):
+    AppEditSession("com.example.app", CLIENT_EMAIL).save(session_edit)
+
+    with mock.patch.object(google_play, "client") as mock_google_play_client:
+        mock_google_play_client.edits.commit.return_value = session_edit
+        google_play.commit_edit_session("com.example.app", changes_not_sent_for_review=True, should_print=False)
+
+    mock_google_play_client.edits.commit.assert_called_once_with(
+        session_edit,
+        "com.example.app",
+        changes_not_sent_for_review=True,
+    )
+    assert not AppEditSession("com.example.app", CLIENT_EMAIL).is_active()
+
+
+def test_commit_edit_session_not_started(google_play: GooglePlay):
+    with pytest.raises(GooglePlayError) as exc_info:
+        google_play.commit_edit_session("com.example.app")
+    assert str(exc_info.value) == 'No edit session is active for package "com.example.app"'
+
+
+def test_discard_edit_session(google_play: GooglePlay, session_edit: AppEdit):
+    AppEditSession("com.example.app", CLIENT_EMAIL).save(session_edit)
+
+    with mock.patch.object(google_play, "client") as mock_google_play_client:
+        google_play.discard_edit_session("com.example.app")
+
+    mock_google_play_client.edits.delete.assert_called_once_with(session_edit, package_name="com.example.app")
+    assert not AppEditSession("com.example.app", CLIENT_EMAIL).is_active()
+
+
+def test_edit_session_is_private(edit_sessions_directory: pathlib.Path, session_edit: AppEdit):
+    session = AppEditSession("com.example.app", CLIENT_EMAIL)
+    session.save(session_edit)
+
+    assert stat.S_IMODE(session.path.parent.stat().st_mode) == 0o700
+    assert stat.S_IMODE(session.path.stat().st_mode) == 0o600
+    assert [path.name for path in session.path.parent.iterdir()] == [session.path.name]
+
+
+def test_edit_session_is_not_shared_between_service_accounts(session_edit: AppEdit):
+    AppEditSession("com.example.app", CLIENT_EMAIL).save(session_edit)
+    other_google_play = GooglePlay({"type": "service_account", "client_email": "other@example.com"})
+
+    with mock.patch.object(other_google_play, "client") as mock_google_play_client:
+        assert other_google_play.get_session_edit("com.example.app") is None
+
+    mock_google_play_client.edits.get.assert_not_called()
+    assert AppEditSession("com.example.app", CLIENT_EMAIL).load() == session_edit
+
+
+def test_batch_edits_use_session_edit(google_play: GooglePlay, session_edit: AppEdit):
+    AppEditSession("com.example.app", CLIENT_EMAIL).save(session_edit)
+    created_edit = AppEdit(id="created-edit-id", expiryTimeSeconds=session_edit.expiryTimeSeconds)
+    package_names = ["com.example.app", "com.example.other_app"]
+
+    with mock.patch.object(google_play, "client") as mock_google_play_client:
+        mock_google_play_client.edits.get.return_value = session_edit
+        mock_google_play_client.edits.create_many.return_value = [created_edit]
+        mock_google_play_client.tracks.list_many.return_value = [
+            [Track(track="beta", releases=[Release(status=Status.COMPLETED, versionCodes=["12"])])],
+            [Track(track="beta", releases=[Release(status=Status.COMPLETED, versionCodes=["21"])])],
+        ]
+        build_numbers = google_play.get_latest_build_number(package_names, should_print=False)
+
+    mock_google_play_client.edits.create_many.assert_called_once_with(["com.example.other_app"])
+    mock_google_play_client.tracks.list_many.assert_called_once_with(
+        [("com.example.app", "session-edit-id"), ("com.example.other_app", "created-edit-id")],
+        fields=GooglePlay.TRACK_LIST_FIELDS,
+    )
+    mock_google_play_client.edits.delete_many.assert_called_once_with([(created_edit, "com.example.other_app")])
+    mock_google_play_client.edits.delete.assert_not_called()
+    assert build_numbers == {"com.example.app": 12, "com.example.other_app": 21}
@@ -69,7 +69,7 @@ def test_list_tracks(tracks: List[Track]):
         tracks = google_play.list_tracks("com.example.app")
 
     mock_google_play_client.edits.create.assert_called_once_with(package_name="com.example.app")
-    mock_google_play_client.tracks.list.assert_called_once_with("com.example.app", "mock-edit-id")
+    mock_google_play_client.tracks.list.assert_called_once_with("com.example.app", "mock-edit-id", fields=None)
     mock_google_play_client.edits.delete.assert_called_once_with(edit, package_name="com.example.app")
 
     assert tracks == tracks
@@ -78,7 +78,7 @@ def test_list_tracks(tracks: List[Track]):
 @pytest.mark.parametrize("empty_releases", (None, [], ()))
 def test_promote_release_no_source_releases(empty_releases):
     google_play = GooglePlay({"type": "service_account"})
-    with mock.patch.object(google_play, "get_track") as mock_get_track:
+    with mock.patch.object(google_play, "client"), mock.patch.object(google_play, "get_track") as mock_get_track:
         mock_get_track.side_effect = [
             Track(track="alpha", releases=empty_releases),
             Track(track="beta"),
@@ -142,6 +142,14 @@ def test_promote_release():
         )
 
     mock_google_play_client.edits.create.assert_called_once_with("com.example.app")
+    assert mock_get_track.call_args_list == [
+        mock.call("com.example.app", "alpha", edit=edit, should_print=False),
+        mock.call("com.example.app", "beta", edit=edit, should_print=False),
+    ]
     mock_google_play_client.tracks.update.assert_called_once_with(expected_updated_track, "com.example.app", edit.id)
-    mock_google_play_client.edits.commit.assert_called_once_with(edit, "com.example.app")
+    mock_google_play_client.edits.commit.assert_called_once_with(
+        edit,
+        "com.example.app",
+        changes_not_sent_for_review=None,
+    )
     assert updated_track == expected_updated_track
@@ -7,6 +7,7 @@ from unittest import mock
 
 import pytest
 
+from codemagic.google.errors import GoogleHttpError
 from codemagic.google.resources.google_play import AppEdit
 from codemagic.google.resources.google_play import Release
 from codemagic.google.resources.google_play import Status
@@ -67,7 +68,11 @@ def test_get_latest_build_number(
         build_number = google_play.get_latest_build_number("com.example.app", track_names)
 
     mock_google_play_client.edits.create.assert_called_once_with(package_name="com.example.app")
-    mock_google_play_client.tracks.list.assert_called_once_with("com.example.app", "mock-edit-id")
+    mock_google_play_client.tracks.list.assert_called_once_with(
+        "com.example.app",
+        "mock-edit-id",
+        fields=GooglePlay.TRACK_LIST_FIELDS,
+    )
     mock_google_play_client.edits.delete.assert_called_once_with(mock_edit, package_name="com.example.app")
 
     assert build_number == expected_version_code
@@ -85,7 +90,11 @@ def test_get_latest_build_number_no_tracks(google_play: GooglePlay):
 
     assert str(exc_info.value) == 'Version code info is missing from all tracks for package "com.example.app"'
     mock_google_play_client.edits.create.assert_called_once_with(package_name="com.example.app")
-    mock_google_play_client.tracks.list.assert_called_once_with("com.example.app", "mock-edit-id")
+    mock_google_play_client.tracks.list.assert_called_once_with(
+        "com.example.app",
+        "mock-edit-id",
+        fields=GooglePlay.TRACK_LIST_FIELDS,
+    )
     mock_google_play_client.edits.delete.assert_called_once_with(edit, package_name="com.example.app")
 
 
@@ -102,7 +111,11 @@ def test_get_latest_build_number_no_releases(track_releases, google_play: Google
 
     assert str(exc_info.value) == 'Version code info is missing from all tracks for package "com.example.app"'
     mock_google_play_client.edits.create.assert_called_once_with(package_name="com.example.app")
-    mock_google_play_client.tracks.list.assert_called_once_with("com.example.app", "mock-edit-id")
+    mock_google_play_client.tracks.list.assert_called_once_with(
+        "com.example.app",
+        "mock-edit-id",
+        fields=GooglePlay.TRACK_LIST_FIELDS,
+    )
     mock_google_play_client.edits.delete.assert_called_once_with(edit, package_name="com.example.app")
 
 
@@ -119,10 +132,53 @@ def test_get_latest_build_number_no_version_codes(google_play: GooglePlay):
 
         assert str(exc_info.value) == 'Version code info is missing from all tracks for package "com.example.app"'
         mock_google_play_client.edits.create.assert_called_once_with(package_name="com.example.app")
-        mock_google_play_client.tracks.list.assert_called_once_with("com.example.app", "mock-edit-id")
+        mock_google_play_client.tracks.list.assert_called_once_with(
+            "com.example.app",
+            "mock-edit-id",
+            fields=GooglePlay.TRACK_LIST_FIELDS,
+        )
         mock_google_play_client.edits.delete.assert_called_once_with(edit, package_name="com.example.app")
 
 
+def test_get_latest_build_number_multiple_packages(google_play: GooglePlay, tracks: List[Track]):
+    edits = [
+        AppEdit(id="mock-edit-id-1", expiryTimeSeconds="10"),
+        AppEdit(id="mock-edit-id-2", expiryTimeSeconds="10"),
+    ]
+    package_names = ["com.example.app", "com.example.other_app"]
+    other_app_tracks = [Track(track="beta", releases=[Release(status=Status.COMPLETED, versionCodes=["12"])])]
+
+    with mock.patch.object(google_play, "client") as mock_google_play_client:
+        mock_google_play_client.edits.create_many.return_value = edits
+        mock_google_play_client.tracks.list_many.return_value = [tracks, other_app_tracks]
+        build_numbers = google_play.get_latest_build_number(package_names, ("beta",))
+
+    mock_google_play_client.edits.create_many.assert_called_once_with(package_names)
+    mock_google_play_client.tracks.list_many.assert_called_once_with(
+        [("com.example.app", "mock-edit-id-1"), ("com.example.other_app", "mock-edit-id-2")],
+        fields=GooglePlay.TRACK_LIST_FIELDS,
+    )
+    mock_google_play_client.edits.delete_many.assert_called_once_with(
+        [(edits[0], "com.example.app"), (edits[1], "com.example.other_app")],
+    )
+    mock_google_play_client.edits.create.assert_not_called()
+    assert build_numbers == {"com.example.app": 66, "com.example.other_app": 12}
+
+
+def test_get_latest_build_number_multiple_packages_edit_creation_fails(google_play: GooglePlay):
+    edit = AppEdit(id="mock-edit-id-1", expiryTimeSeconds="10")
+    package_names = ["com.example.app", "com.example.other_app"]
+
+    with mock.patch.object(google_play, "client") as mock_google_play_client:
+        mock_google_play_client.edits.create_many.return_value = [edit, GoogleHttpError("Package not found")]
+        with pytest.raises(GooglePlayError) as exc_info:
+            google_play.get_latest_build_number(package_names)
+
+    assert "Package not found" in str(exc_info.value)
+    mock_google_play_client.tracks.list_many.assert_not_called()
+    mock_google_play_client.edits.delete_many.assert_called_once_with([(edit, "com.example.app")])
+
+
 def test_get_max_version_code(google_play: GooglePlay, version_codes_track: Track):
     max_version_code = google_play.get_max_version_code(version_codes_track)
     assert max_version_code == 29
@@ -7,12 +7,16 @@ from unittest import mock
 
 import pytest
 
+from codemagic.models.application_package.package_digests import PackageDigests
 from codemagic.tools.google_play import GooglePlay
 from codemagic.tools.google_play.argument_types import CredentialsArgument
+from codemagic.tools.google_play.argument_types import TrackCacheTtlArgument
 from codemagic.tools.google_play.arguments import GooglePlayArgument
+from codemagic.tools.google_play.errors import GooglePlayError
 
 credentials_argument = GooglePlayArgument.GOOGLE_PLAY_SERVICE_ACCOUNT_CREDENTIALS
 json_output_argument = GooglePlayArgument.JSON_OUTPUT
+track_cache_ttl_argument = GooglePlayArgument.TRACK_CACHE_TTL
 
 
 @pytest.fixture(autouse=True)
@@ -26,6 +30,7 @@ def namespace_kwargs():
     ns_kwargs = {
         credentials_argument.key: CredentialsArgument('{"type":"service_account"}'),
         json_output_argument.key: None,
+        track_cache_ttl_argument.key: None,
     }
     for arg in GooglePlay.CLASS_ARGUMENTS:
         if environment_variable_key := getattr(arg.type, "environment_variable_key", None):
@@ -117,3 +122,35 @@ def test_private_key_env_arg(mock_google_play_api_client, configure_variable, na
 
     _ = GooglePlay.from_cli_args(argparse.Namespace(**namespace_kwargs))
     mock_google_play_api_client.assert_called_once_with({"type": "service_account"})
+
+
+@mock.patch("codemagic.tools.google_play.google_play.GooglePlayClient")
+def test_track_cache_ttl_from_env(_mock_google_play_client, namespace_kwargs):
+    os.environ[TrackCacheTtlArgument.environment_variable_key] = "300"
+    google_play = GooglePlay.from_cli_args(argparse.Namespace(**namespace_kwargs))
+    assert google_play.track_cache_ttl == 300
+
+
+@mock.patch("codemagic.tools.google_play.google_play.GooglePlayClient")
+def test_track_cache_disabled_by_default(_mock_google_play_client, namespace_kwargs):
+    google_play = GooglePlay.from_cli_args(argparse.Namespace(**namespace_kwargs))
+    assert google_play.track_cache_ttl is None
+
+
+def test_verify_uploaded_package():
+    google_play = GooglePlay({"type": "service_account"})
+    package = mock.Mock(path="app.aab")
+    package.get_digests.return_value = PackageDigests(sha256="ab" * 32, sha1="cd" * 20, md5="ef" * 16)
+
+    google_play.verify_uploaded_package(package, "AB" * 32)
+    with pytest.raises(GooglePlayError, match="does not match"):
+        google_play.verify_uploaded_package(package, "00" * 32)
+
+
+def test_verify_uploaded_package_without_digest():
+    google_play = GooglePlay({"type": "service_account"})
+    package = mock.Mock(path="app.aab")
+
+    google_play.verify_uploaded_package(package, None)
+
+    package.get_digests.assert_not_called()
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import stat
+import time
+from unittest import mock
+
+import pytest
+
+from codemagic.google.resources.google_play import AppEdit
+from codemagic.google.resources.google_play import Release
+from codemagic.google.resources.google_play import Status
+from codemagic.google.resources.google_play import Track
+from codemagic.tools import GooglePlay
+from codemagic.tools.google_play.app_edit_session import AppEditSession
+from codemagic.tools.google_play.track_cache import TrackCache
+
+CLIENT_EMAIL = "cli-tools@example.iam.gserviceaccount.com"
+
+
+@pytest.fixture(autouse=True)
+def cache_directory(tmp_path: pathlib.Path):
+    with mock.patch.object(TrackCache, "DEFAULT_DIRECTORY", tmp_path / "tracks"):
+        with mock.patch.object(AppEditSession, "DEFAULT_DIRECTORY", tmp_path / "sessions"):
+            yield tmp_path
+
+
+@pytest.fixture
+def tracks():
+    return [
+        Track(track="alpha", releases=[Release(status=Status.COMPLETED, versionCodes=["11"])]),
+        Track(track="beta", releases=[Release(status=Status.DRAFT, versionCodes=["12"])]),
+    ]
+
+
+@pytest.fixture
+def google_play() -> GooglePlay:
+    return GooglePlay({"type": "service_account", "client_email": CLIENT_EMAIL}, track_cache_ttl=60)
+
+
+def test_track_cache(tracks):
+    cache = TrackCache("com.example.app", CLIENT_EMAIL)
+    cache.save(tracks)
+
+    assert cache.load(ttl=60) == tracks
+    cache.clear()
+    assert cache.load(ttl=60) is None
+
+
+def test_track_cache_expired(tracks):
+    cache = TrackCache("com.example.app", CLIENT_EMAIL)
+    cache.save(tracks)
+    cache_contents = json.loads(cache.path.read_text())
+    cache_contents["cached_at"] = time.time() - 120
+    cache.path.write_text(json.dumps(cache_contents))
+
+    assert cache.load(ttl=60) is None
+
+
+def test_track_cache_is_not_shared_between_service_accounts(tracks):
+    TrackCache("com.example.app", CLIENT_EMAIL).save(tracks)
+
+    assert TrackCache("com.example.app", "other@example.iam.gserviceaccount.com").load(ttl=60) is None
+
+
+def test_track_cache_permissions(tracks, cache_directory: pathlib.Path):
+    cache = TrackCache("com.example.app", CLIENT_EMAIL)
+    cache.save(tracks)
+
+    assert stat.S_IMODE((cache_directory / "tracks").stat().st_mode) == 0o700
+    assert stat.S_IMODE(cache.path.parent.stat().st_mode) == 0o700
+    assert stat.S_IMODE(cache.path.stat().st_mode) == 0o600
+
+
+def test_track_cache_restricts_existing_directory_permissions(tracks, cache_directory: pathlib.Path):
+    (cache_directory / "tracks").mkdir(mode=0o777)
+    (cache_directory / "tracks").chmod(0o777)
+
+    TrackCache("com.example.app", CLIENT_EMAIL).save(tracks)
+
+    assert stat.S_IMODE((cache_directory / "tracks").stat().st_mode) == 0o700
+
+
+def test_track_cache_directory_owned_by_other_user(tracks):
+    cache = TrackCache("com.example.app", CLIENT_EMAIL)
+    cache.save(tracks)
+
+    with mock.patch("os.getuid", return_value=os.getuid() + 1):
+        assert cache.load(ttl=60) is None
+        cache.save(tracks[:1])
+
+    assert cache.load(ttl=60) == tracks
+
+
+def test_clear_package_track_caches(tracks):
+    caches = [TrackCache("com.example.app", email) for email in (CLIENT_EMAIL, "other@example.com")]
+    other_package_cache = TrackCache("com.example.app.other", CLIENT_EMAIL)
+    for cache in (*caches, other_package_cache):
+        cache.save(tracks)
+
+    TrackCache.clear_package("com.example.app")
+
+    assert [cache.load(ttl=60) for cache in caches] == [None, None]
+    assert other_package_cache.load(ttl=60) == tracks
+
+
+def test_track_cache_invalid():
+    cache = TrackCache("com.example.app", CLIENT_EMAIL)
+    cache.path.parent.mkdir(parents=True)
+    cache.path.write_text("invalid")
+
+    assert cache.load(ttl=60) is None
+    assert not cache.path.exists()
+
+
+def test_list_tracks_uses_cache(google_play: GooglePlay, tracks):
+    with mock.patch.object(google_play, "client") as mock_google_play_client:
+        mock_google_play_client.tracks.list.return_value = tracks
+        assert google_play.list_tracks("com.example.app", should_print=False) == tracks
+        assert google_play.get_latest_build_number("com.example.app", should_print=False) == 12
+        assert google_play.get_track("com.example.app", "beta", should_print=False) == tracks[1]
+
+    mock_google_play_client.tracks.list.assert_called_once_with("com.example.app", mock.ANY, fields=None)
+    mock_google_play_client.tracks.get.assert_not_called()
+
+
+def test_get_latest_build_numbers_uses_cache(google_play: GooglePlay, tracks):
+    TrackCache("com.example.a", CLIENT_EMAIL).save(tracks)
+
+    with mock.patch.object(google_play, "client") as mock_google_play_client:
+        mock_google_play_client.edits.create_many.return_value = [AppEdit(id="edit-b", expiryTimeSeconds="0")]
+        mock_google_play_client.tracks.list_many.return_value = [tracks[:1]]
+        build_numbers = google_play.get_latest_build_number(["com.example.a", "com.example.b"], should_print=False)
+
+    assert build_numbers == {"com.example.a": 12, "com.example.b": 11}
+    mock_google_play_client.tracks.list_many.assert_called_once_with([("com.example.b", "edit-b")], fields=None)
+    assert TrackCache("com.example.b", CLIENT_EMAIL).load(ttl=60) == tracks[:1]
+
+
+def test_commit_invalidates_cache(google_play: GooglePlay, tracks):
+    TrackCache("com.example.app", CLIENT_EMAIL).save(tracks)
+
+    with mock.patch.object(google_play, "client") as mock_google_play_client:
+        mock_google_play_client.tracks.get.return_value = Track(track="alpha")
+        google_play.set_track_release("com.example.app", "alpha", ["13"], should_print=False)
+
+    mock_google_play_client.edits.commit.assert_called_once()
+    assert TrackCache("com.example.app", CLIENT_EMAIL).load(ttl=60) is None
+
+
+def test_cache_is_not_used_by_default(tracks):
+    TrackCache("com.example.app", CLIENT_EMAIL).save(tracks)
+    google_play = GooglePlay({"type": "service_account"})
+
+    with mock.patch.object(google_play, "client") as mock_google_play_client:
+        mock_google_play_client.tracks.list.return_value = []
+        assert google_play.list_tracks("com.example.app", should_print=False) == []
+
+
+def test_promote_release_does_not_use_cache(google_play: GooglePlay):
+    stale_tracks = [
+        Track(track="alpha", releases=[Release(status=Status.COMPLETED, name="old", versionCodes=["11"])]),
+        Track(track="beta", releases=[Release(status=Status.COMPLETED, name="older", versionCodes=["10"])]),
+    ]
+    fresh_tracks = {
+        "alpha": Track(track="alpha", releases=[Release(status=Status.COMPLETED, name="new", versionCodes=["12"])]),
+        "beta": Track(track="beta", releases=[Release(status=Status.COMPLETED, name="old", versionCodes=["11"])]),
+    }
+    TrackCache("com.example.app", CLIENT_EMAIL).save(stale_tracks)
+    edit = AppEdit(id="edit", expiryTimeSeconds="0")
+
+    with mock.patch.object(google_play, "client") as mock_google_play_client:
+        mock_google_play_client.edits.create.return_value = edit
+        mock_google_play_client.tracks.get.side_effect = lambda _package_name, track_name, _edit_id: fresh_tracks[
+            track_name
+        ]
+        google_play.promote_release("com.example.app", "alpha", "beta", should_print=False)
+
+    assert mock_google_play_client.tracks.get.call_args_list == [
+        mock.call("com.example.app", "alpha", "edit"),
+        mock.call("com.example.app", "beta", "edit"),
+    ]
+    update_track = mock_google_play_client.tracks.update.call_args[0][0]
+    assert [release.versionCodes for release in update_track.releases] == [["12"]]
+    mock_google_play_client.edits.commit.assert_called_once()
@@ -12,6 +12,7 @@ import pytest
 from googleapiclient import discovery
 from oauth2client.service_account import ServiceAccountCredentials
 
+from codemagic.google.errors import GoogleHttpError
 from codemagic.google.resources.firebase import OrderBy
 from codemagic.google.resources.firebase import Release
 from codemagic.google.services.firebase import ReleasesService
@@ -177,10 +178,28 @@ def test_list_releases(
         "firebase-app-id",
         OrderBy.CREATE_TIME_DESC,
         25,
+        predicate=None,
     )
     assert releases == result
 
 
+def test_list_releases_with_build_version(firebase_app_distribution, mock_releases_list, releases):
+    firebase_app_distribution.list_releases("firebase-app-id", build_version=releases[0].buildVersion)
+    mock_releases_list.assert_called_once_with(
+        firebase_app_distribution.project_number,
+        "firebase-app-id",
+        OrderBy.CREATE_TIME_DESC,
+        25,
+        predicate=mock.ANY,
+    )
+
+    predicate = mock_releases_list.call_args.kwargs["predicate"]
+    assert [predicate(release) for release in releases] == [
+        r.buildVersion == releases[0].buildVersion for r in releases
+    ]
+    assert predicate(releases[0]) is True
+
+
 def test_list_releases_with_limit(firebase_app_distribution, mock_releases_list):
     firebase_app_distribution.list_releases("firebase-app-id", limit=1)
     mock_releases_list.assert_called_once_with(
@@ -188,6 +207,7 @@ def test_list_releases_with_limit(firebase_app_distribution, mock_releases_list)
         "firebase-app-id",
         OrderBy.CREATE_TIME_DESC,
         1,
+        predicate=None,
     )
 
 
@@ -197,6 +217,7 @@ def test_get_latest_build_version(firebase_app_distribution, mock_releases_list)
         firebase_app_distribution.project_number,
         "firebase-app-id",
         limit=1,
+        fields=FirebaseAppDistribution.RELEASE_LIST_FIELDS,
     )
     assert build_number == "71"
 
@@ -209,4 +230,25 @@ def test_get_latest_build_version_no_releases(firebase_app_distribution: Firebas
         firebase_app_distribution.project_number,
         "firebase-app-id",
         limit=1,
+        fields=FirebaseAppDistribution.RELEASE_LIST_FIELDS,
+    )
+
+
+def test_upload_release(firebase_app_distribution, releases, tmp_path):
+    binary_path = tmp_path / "app.apk"
+    with mock.patch.object(ReleasesService, "upload", return_value=releases[0]) as mock_releases_upload:
+        release = firebase_app_distribution.upload_release("firebase-app-id", binary_path, upload_timeout=60)
+    mock_releases_upload.assert_called_once_with(
+        firebase_app_distribution.project_number,
+        "firebase-app-id",
+        binary_path,
+        timeout=60,
     )
+    assert release == releases[0]
+
+
+def test_upload_release_failure(firebase_app_distribution, tmp_path):
+    binary_path = tmp_path / "app.apk"
+    with mock.patch.object(ReleasesService, "upload", side_effect=GoogleHttpError("Invalid binary")):
+        with pytest.raises(FirebaseAppDistributionError, match="Invalid binary"):
+            firebase_app_distribution.upload_release("firebase-app-id", binary_path)
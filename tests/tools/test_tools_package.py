@@ -0,0 +1,36 @@
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+import codemagic
+from codemagic import tools
+from codemagic.cli import CliApp
+
+
+def test_get_tools():
+    tool_classes = tools.get_tools()
+
+    assert len(tool_classes) == len(tools.__all__) - 1
+    assert all(issubclass(tool_class, CliApp) for tool_class in tool_classes)
+    assert tool_classes == sorted(tool_classes, key=lambda tool_class: tool_class.get_executable_name())
+    assert tools.GitChangelog in tool_classes
+
+
+def test_missing_tool():
+    with pytest.raises(AttributeError, match="has no attribute 'MissingTool'"):
+        tools.MissingTool  # noqa: B018
+
+
+def test_tools_are_imported_lazily():
+    code = (
+        "import sys\n"
+        "from codemagic.tools import GitChangelog\n"
+        "print(' '.join(sorted(name for name in sys.modules if name.startswith(('codemagic.tools.', 'google')))))\n"
+    )
+    env = {**os.environ, "PYTHONPATH": str(pathlib.Path(codemagic.__file__).parents[1])}
+    process = subprocess.run((sys.executable, "-c", code), capture_output=True, check=True, text=True, env=env)
+
+    assert process.stdout.split() == ["codemagic.tools.git_changelog"]
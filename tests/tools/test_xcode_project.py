@@ -0,0 +1,55 @@
+import pathlib
+from typing import Optional
+from unittest import mock
+
+import pytest
+
+from codemagic.models import XcodebuildCompactFormatter
+from codemagic.models import XcodebuildJUnitFormatter
+from codemagic.models import XcodebuildOutputFormat
+from codemagic.models import Xcpretty
+from codemagic.tools.xcode_project import XcodeProject
+
+
+@pytest.mark.parametrize(
+    ("xcpretty_options", "xcodebuild_formatter", "xcpretty_available", "expected_formatter_type"),
+    (
+        ("--color", None, True, XcodebuildCompactFormatter),
+        ("--no-color --no-utf", None, True, XcodebuildCompactFormatter),
+        ("--simple --no-utf", None, True, XcodebuildCompactFormatter),
+        ("--color --report junit", None, True, Xcpretty),
+        ("--color --report junit", None, False, XcodebuildCompactFormatter),
+        ("--color --report junit", XcodebuildOutputFormat.COMPACT, True, XcodebuildCompactFormatter),
+        ("--color", XcodebuildOutputFormat.XCPRETTY, True, Xcpretty),
+        ("--color", XcodebuildOutputFormat.XCPRETTY, False, XcodebuildCompactFormatter),
+        ("--color --report junit", XcodebuildOutputFormat.JUNIT, True, XcodebuildJUnitFormatter),
+    ),
+)
+def test_get_xcodebuild_formatter(
+    xcpretty_options: str,
+    xcodebuild_formatter: Optional[XcodebuildOutputFormat],
+    xcpretty_available: bool,
+    expected_formatter_type: type,
+):
+    with mock.patch.object(Xcpretty, "is_available", return_value=xcpretty_available):
+        formatter = XcodeProject()._get_xcodebuild_formatter(False, xcpretty_options, xcodebuild_formatter)
+
+    assert isinstance(formatter, expected_formatter_type)
+
+
+def test_get_xcodebuild_formatter_warns_about_ignored_options():
+    xcode_project = XcodeProject()
+    with mock.patch.object(xcode_project, "logger") as mock_logger:
+        xcode_project._get_xcodebuild_formatter(False, "--color --report junit", XcodebuildOutputFormat.COMPACT)
+
+    mock_logger.warning.assert_called_once()
+    assert "--report junit" in mock_logger.warning.call_args[0][0]
+
+
+def test_get_xcodebuild_junit_formatter_output_path():
+    output_path = pathlib.Path("/tmp/xcodebuild.xml")
+    formatter = XcodeProject()._get_xcodebuild_formatter(False, "", XcodebuildOutputFormat.JUNIT, output_path)
+
+    assert isinstance(formatter, XcodebuildJUnitFormatter)
+    assert formatter.output_path == output_path
+    assert isinstance(formatter.console_formatter, XcodebuildCompactFormatter)
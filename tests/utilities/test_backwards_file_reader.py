@@ -2,9 +2,11 @@ import io
 import random
 import string
 import tempfile
+from unittest import mock
 
 import pytest
 
+from codemagic.utilities.backwards_file_reader import _BackwardsMmapIterator
 from codemagic.utilities.backwards_file_reader import iter_backwards
 
 
@@ -70,3 +72,53 @@ def test_backwards_file_reader_with_binaryio(buffer_size, random_lines):
     backwards_lines = list(iterator)
 
     assert list(reversed(backwards_lines)) == random_lines
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_backwards_file_reader_mmap(use_mmap, random_lines, tmp_path):
+    file_path = tmp_path / "lines.txt"
+    file_path.write_bytes(b"\n".join(line.encode() for line in random_lines))
+
+    backwards_lines = list(iter_backwards(file_path, use_mmap=use_mmap))
+
+    assert list(reversed(backwards_lines)) == random_lines
+
+
+@pytest.mark.parametrize(
+    ("contents", "expected_lines"),
+    (
+        (b"", []),
+        (b"\n", ["", ""]),
+        (b"first", ["first"]),
+        (b"first\r\nsecond\r\n", ["", "second", "first"]),
+        ("üks\nkaks\n".encode(), ["", "kaks", "üks"]),
+    ),
+)
+def test_backwards_file_reader_mmap_line_boundaries(contents, expected_lines, tmp_path):
+    file_path = tmp_path / "lines.txt"
+    file_path.write_bytes(contents)
+
+    assert list(iter_backwards(file_path)) == expected_lines
+    assert list(iter_backwards(file_path, use_mmap=False)) == expected_lines
+
+
+def test_backwards_file_reader_mmap_partial_iteration(tmp_path):
+    file_path = tmp_path / "lines.txt"
+    file_path.write_bytes(b"first\nsecond\nthird")
+
+    iterator = iter(iter_backwards(file_path))
+    assert next(iterator) == "third"
+    assert next(iterator) == "second"
+    # Memory map is released and the file is closed without errors
+    iterator.close()
+
+
+@pytest.mark.parametrize("block_size", [1, 64, 4096])
+def test_backwards_file_reader_mmap_block_size(block_size, random_lines, tmp_path):
+    file_path = tmp_path / "lines.txt"
+    file_path.write_bytes(b"\r\n".join(line.encode() for line in random_lines))
+
+    with mock.patch.object(_BackwardsMmapIterator, "block_size", block_size):
+        backwards_lines = list(iter_backwards(file_path))
+
+    assert list(reversed(backwards_lines)) == random_lines
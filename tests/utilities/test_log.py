@@ -0,0 +1,117 @@
+import gzip
+import logging
+import pathlib
+from unittest import mock
+
+import pytest
+
+from codemagic.utilities import log
+from codemagic.utilities.log import LogHandlers
+
+
+@pytest.fixture
+def log_path(tmp_path: pathlib.Path):
+    log_path = tmp_path / "codemagic.log"
+    with mock.patch.object(log, "get_log_path", return_value=log_path):
+        yield log_path
+    LogHandlers.configure_file_handler()
+
+
+def _get_test_logger(handler: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger("CodemagicLogTestLogger")
+    logger.handlers = [handler]
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    return logger
+
+
+def test_file_logging(log_path: pathlib.Path):
+    file_handler = LogHandlers.configure_file_handler()
+    logger = _get_test_logger(file_handler)
+
+    logger.debug("First message")
+    try:
+        raise ValueError("Error message")
+    except ValueError:
+        logger.exception("Second message")
+    LogHandlers.stop_file_logging()
+
+    log_contents = log_path.read_text()
+    assert "DEBUG test_log.py:" in log_contents
+    assert "> First message" in log_contents
+    assert "> Second message" in log_contents
+    assert "ValueError: Error message" in log_contents
+    # Loggers keep using the same handler when file logging is reconfigured
+    assert LogHandlers.configure_file_handler() is file_handler
+
+
+def test_file_logging_shared_log_file(log_path: pathlib.Path, monkeypatch):
+    monkeypatch.delenv(LogHandlers.file_max_bytes_variable, raising=False)
+    # Each CLI invocation appends to the same log file using a handler of its own
+    file_formatter = logging.Formatter(LogHandlers.file_fmt)
+    handlers = [LogHandlers._create_rotating_file_handler(), LogHandlers._create_rotating_file_handler()]
+    for handler in handlers:
+        handler.setFormatter(file_formatter)
+
+    message = "x" * 1024
+    for i in range(200):
+        for handler_index, handler in enumerate(handlers):
+            handler.emit(logging.makeLogRecord({"msg": "Message %d-%d %s", "args": (handler_index, i, message)}))
+    for handler in handlers:
+        handler.close()
+
+    assert [path.name for path in log_path.parent.iterdir()] == ["codemagic.log"]
+    log_lines = log_path.read_text().splitlines()
+    assert len(log_lines) == 400
+    assert all(
+        f"> Message {handler_index}-{i} " in log_lines[2 * i + handler_index]
+        for i in range(200)
+        for handler_index in (0, 1)
+    )
+
+
+@pytest.mark.parametrize(
+    ("compress", "expected_backup_name"),
+    (
+        ("true", "codemagic.log.1.gz"),
+        ("false", "codemagic.log.1"),
+    ),
+)
+def test_file_logging_rotation(compress: str, expected_backup_name: str, log_path: pathlib.Path, monkeypatch):
+    monkeypatch.setenv(LogHandlers.file_max_bytes_variable, "1000")
+    monkeypatch.setenv(LogHandlers.file_backup_count_variable, "2")
+    monkeypatch.setenv(LogHandlers.file_compress_variable, compress)
+    logger = _get_test_logger(LogHandlers.configure_file_handler())
+
+    for i in range(100):
+        logger.info("Message %d", i)
+    LogHandlers.stop_file_logging()
+
+    assert sorted(path.name for path in log_path.parent.iterdir()) == [
+        "codemagic.log",
+        expected_backup_name,
+        expected_backup_name.replace(".1", ".2"),
+    ]
+    assert log_path.stat().st_size <= 1000
+    backup_path = log_path.parent / expected_backup_name
+    backup_contents = gzip.decompress(backup_path.read_bytes()) if compress == "true" else backup_path.read_bytes()
+    assert b"> Message " in backup_contents
+    assert "> Message 99" in log_path.read_text()
+
+
+@pytest.mark.parametrize(
+    ("value", "expected_limit"),
+    (
+        (None, None),
+        ("0", 0),
+        ("1000", 1000),
+        ("-1", None),
+        ("invalid", None),
+    ),
+)
+def test_get_process_output_log_limit(value, expected_limit, monkeypatch):
+    if value is None:
+        monkeypatch.delenv("CODEMAGIC_LOG_PROCESS_OUTPUT_LIMIT", raising=False)
+    else:
+        monkeypatch.setenv("CODEMAGIC_LOG_PROCESS_OUTPUT_LIMIT", value)
+    assert log.get_process_output_log_limit() == expected_limit
@@ -0,0 +1,56 @@
+import os
+import pathlib
+import stat
+from unittest import mock
+
+import pytest
+
+from codemagic.utilities.private_files import ensure_private_directory
+from codemagic.utilities.private_files import write_private_file
+
+
+def test_ensure_private_directory_creates_directory(tmp_path: pathlib.Path):
+    directory = tmp_path / "cache" / "private"
+    ensure_private_directory(directory)
+    assert stat.S_IMODE(directory.stat().st_mode) == 0o700
+
+
+def test_ensure_private_directory_restricts_existing_directory(tmp_path: pathlib.Path):
+    directory = tmp_path / "shared"
+    directory.mkdir()
+    directory.chmod(0o777)
+
+    ensure_private_directory(directory)
+
+    assert stat.S_IMODE(directory.stat().st_mode) == 0o700
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="File ownership is not available")
+def test_ensure_private_directory_owned_by_other_user(tmp_path: pathlib.Path):
+    directory = tmp_path / "shared"
+    directory.mkdir(mode=0o777)
+
+    with mock.patch("os.getuid", return_value=os.getuid() + 1), pytest.raises(PermissionError):
+        ensure_private_directory(directory)
+
+
+def test_ensure_private_directory_symlink(tmp_path: pathlib.Path):
+    target = tmp_path / "target"
+    target.mkdir()
+    directory = tmp_path / "link"
+    directory.symlink_to(target)
+
+    with pytest.raises(PermissionError):
+        ensure_private_directory(directory)
+
+
+def test_write_private_file(tmp_path: pathlib.Path):
+    path = tmp_path / "file.json"
+    path.write_text("old contents")
+    path.chmod(0o644)
+
+    write_private_file(path, "new contents")
+
+    assert path.read_text() == "new contents"
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert list(tmp_path.iterdir()) == [path]